@@ -23,6 +23,12 @@ from datetime import datetime
 from linkedin_cat.config import LinkedinCatConfig
 from linkedin_cat.cache import ContactCache
 from linkedin_cat.wrapper import LinkedInClient, SendResult
+from linkedin_cat.wrapper.client import SearchClient
+from linkedin_cat.core.profile import resolve_sections
+from linkedin_cat.core.profile_store import ProfileStore
+from linkedin_cat.core.orchestrator import ScrapeOrchestrator
+from linkedin_cat.core.html_archive import reparse_profiles
+from linkedin_cat.core.profile_index import ProfileIndex
 from linkedin_cat.utils import replace_template_variables, normalize_url
 
 # 创建 Typer 应用
@@ -244,7 +250,9 @@ def send(
                 headless=headless,
                 button_class=button_class,
                 max_retries=config.retry.max_retries,
-                retry_delays=tuple(config.retry.delays)
+                retry_delays=tuple(config.retry.delays),
+                user_data_root=config.browser.user_data_root,
+                profile_max_mb=config.browser.profile_max_mb
             ) as client:
                 
                 for idx, url in enumerate(url_list):
@@ -340,6 +348,239 @@ def send(
     console.print(f"\n[dim]日志已保存: {log_file}[/dim]")
 
 
+@app.command()
+def scrape(
+    cookies: Path = typer.Argument(
+        ...,
+        help="LinkedIn cookies JSON 文件",
+        exists=True, readable=True
+    ),
+    urls: Path = typer.Argument(
+        ...,
+        help="URL 列表文件",
+        exists=True, readable=True
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o",
+        help="JSON 输出目录，默认 ./linkedin"
+    ),
+    store: Optional[Path] = typer.Option(
+        None, "--store", "-s",
+        help="档案数据库路径（可选），代替逐个 JSON 文件"
+    ),
+    sections: Optional[str] = typer.Option(
+        None, "--sections",
+        help="只抓取指定部分，逗号分隔，如 intro,experience"
+    ),
+    ttl_days: Optional[int] = typer.Option(
+        None, "--ttl-days",
+        help="配合 --store：超过天数的档案重新抓取"
+    ),
+    tabs: int = typer.Option(
+        1, "--tabs", "-t",
+        help="同时加载的标签页数，大于 1 时预加载后续档案"
+    ),
+    workers: int = typer.Option(
+        1, "--workers", "-w",
+        help="配合 --store：并行 worker 进程数，每个进程一个浏览器"
+    ),
+    archive: Optional[Path] = typer.Option(
+        None, "--archive",
+        help="原始 HTML 归档数据库路径（可选），用于 reparse 离线重新解析"
+    ),
+    index: Optional[Path] = typer.Option(
+        None, "--index",
+        help="全文索引数据库路径（可选），保存档案时同步更新，供 find 查询"
+    ),
+    headless: bool = typer.Option(
+        False, "--headless",
+        help="无头模式（不显示浏览器窗口）"
+    ),
+    max_contacts: int = typer.Option(
+        100, "--max", "-m",
+        help="最大处理数量"
+    )
+):
+    """
+    🔍 批量抓取 LinkedIn 个人档案
+    
+    [yellow]示例：[/yellow]
+    
+    • linkedincat scrape cookies.json urls.txt --sections intro,experience
+    
+    • linkedincat scrape cookies.json urls.txt --store ./linkedin/profiles.db --ttl-days 7
+    """
+    try:
+        section_list = resolve_sections(sections)
+    except ValueError as e:
+        console.print(f"[red]✗ {e}[/red]")
+        raise typer.Exit(1)
+    
+    url_list = [
+        line.strip() for line in urls.read_text(encoding='utf-8').splitlines()
+        if line.strip() and not line.startswith('#')
+    ][:max_contacts]
+    
+    console.print(f"[cyan]抓取 {len(url_list)} 个档案，部分: {', '.join(section_list)}[/cyan]")
+    
+    search_kwargs = {}
+    if archive:
+        search_kwargs["html_archive"] = str(archive)
+    if index:
+        search_kwargs["profile_index"] = str(index)
+    
+    if workers > 1:
+        if not store:
+            console.print("[red]✗ --workers 需要同时指定 --store[/red]")
+            raise typer.Exit(1)
+        if output or tabs > 1:
+            console.print("[red]✗ --workers 不支持 --output / --tabs，结果保存到 --store[/red]")
+            raise typer.Exit(1)
+        orchestrator = ScrapeOrchestrator(
+            str(cookies), workers=workers,
+            queue_path=str(store.with_name(store.stem + "_queue.db")),
+            store_path=str(store), headless=headless, sections=section_list,
+            skip_saved=True, ttl_days=ttl_days,
+            **search_kwargs
+        )
+        stats = orchestrator.run(url_list)
+        console.print(f"[green]✓ 完成: {stats['done']} 成功, {stats['failed']} 失败[/green]")
+        return
+    
+    output = output or Path("./linkedin")
+    profile_store = ProfileStore(str(store)) if store else None
+    try:
+        with SearchClient(cookies_path=str(cookies), headless=headless, **search_kwargs) as client:
+            if tabs > 1:
+                client.search_profile_list(
+                    url_list, save_folder=str(output), store=profile_store,
+                    sections=section_list, tabs=tabs, ttl_days=ttl_days
+                )
+            else:
+                for idx, url in enumerate(url_list):
+                    console.print(f"[blue]→[/blue] [{idx+1}/{len(url_list)}] {url[:50]}...")
+                    client.search_profile(
+                        url, save_folder=str(output), store=profile_store,
+                        sections=section_list, ttl_days=ttl_days
+                    )
+    finally:
+        if profile_store:
+            profile_store.close()
+    
+    console.print(f"[green]✓ 完成，结果保存到: {store or output}[/green]")
+
+
+@app.command()
+def reparse(
+    archive: Path = typer.Argument(
+        ...,
+        help="HTML 归档数据库（scrape --archive 生成）",
+        exists=True, readable=True
+    ),
+    store: Path = typer.Argument(
+        ...,
+        help="档案数据库路径"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-w",
+        help="进程数，默认使用全部 CPU 核心"
+    ),
+    all_profiles: bool = typer.Option(
+        False, "--all",
+        help="包括已用当前解析器版本解析过的档案"
+    )
+):
+    """
+    ♻️ 用当前解析器离线重新解析归档的 HTML
+    
+    每个进程用一个无头浏览器加载归档页面，结果写入档案数据库并标记解析器版本。
+    """
+    report = reparse_profiles(str(archive), str(store), workers=workers, only_outdated=not all_profiles)
+    
+    console.print(Panel.fit(
+        f"已解析: [green]{report['parsed']}[/green]\n"
+        f"已更新: [cyan]{report['updated']}[/cyan]\n"
+        f"跳过: [dim]{report['skipped']}[/dim]\n"
+        f"失败: [red]{len(report['failed'])}[/red]",
+        title="♻️ Reparse",
+        border_style="blue"
+    ))
+
+
+@app.command()
+def find(
+    query: Optional[str] = typer.Argument(
+        None,
+        help="任意字段中匹配的关键词"
+    ),
+    index: Path = typer.Option(
+        "./linkedin/index.db", "--index", "-i",
+        help="全文索引数据库路径"
+    ),
+    title: Optional[str] = typer.Option(None, "--title", help="职位（工作经历）"),
+    company: Optional[str] = typer.Option(None, "--company", help="公司（工作经历）"),
+    school: Optional[str] = typer.Option(None, "--school", help="学校或专业"),
+    skill: Optional[str] = typer.Option(None, "--skill", help="技能"),
+    location: Optional[str] = typer.Option(None, "--location", help="地区"),
+    from_store: Optional[Path] = typer.Option(
+        None, "--from-store",
+        help="查询前先索引档案数据库中的档案",
+        exists=True, readable=True
+    ),
+    from_folder: Optional[Path] = typer.Option(
+        None, "--from-folder",
+        help="查询前先索引目录中的 JSON 档案",
+        exists=True, file_okay=False
+    ),
+    limit: int = typer.Option(20, "--limit", "-n", help="最多显示条数"),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o",
+        help="将匹配的档案 URL 写入文件，可直接用于 send / scrape"
+    )
+):
+    """
+    🔎 在已抓取的档案中全文检索
+    
+    本地 SQLite FTS5 查询，不打开浏览器。
+    
+    [yellow]示例：[/yellow]
+    
+    • linkedincat find --company acme --title engineer
+    
+    • linkedincat find python --from-store ./linkedin/profiles.db -o urls.txt
+    """
+    with ProfileIndex(str(index)) as profile_index:
+        if from_store:
+            with ProfileStore(str(from_store)) as profile_store:
+                count = profile_index.index_store(profile_store)
+            console.print(f"[cyan]已索引 {count} 个新的或更新的档案[/cyan]")
+        if from_folder:
+            count = profile_index.index_folder(str(from_folder))
+            console.print(f"[cyan]已索引 {count} 个新的或更新的档案[/cyan]")
+        
+        try:
+            results = profile_index.search(
+                query, limit=limit, title=title, company=company,
+                school=school, skill=skill, location=location
+            )
+        except ValueError as e:
+            console.print(f"[red]✗ {e}[/red]")
+            raise typer.Exit(1)
+    
+    table = Table(title=f"🔎 匹配 {len(results)} 个档案", show_header=True, header_style="bold")
+    table.add_column("姓名")
+    table.add_column("头衔", max_width=50)
+    table.add_column("地区")
+    table.add_column("URL", no_wrap=True)
+    for result in results:
+        table.add_row(result["name"], result["headline"], result["location"], result["profile_url"])
+    console.print(table)
+    
+    if output:
+        output.write_text("\n".join(result["profile_url"] for result in results), encoding='utf-8')
+        console.print(f"[green]✓ URL 已保存到: {output}[/green]")
+
+
 @app.command()
 def status(
     urls: Optional[Path] = typer.Option(None, "--urls", "-u", help="检查特定 URL 列表状态")
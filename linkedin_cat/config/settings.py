@@ -35,6 +35,8 @@ class BrowserConfig(BaseModel):
     headless: bool = False
     timeout: int = 30
     window_size: Tuple[int, int] = (1920, 1080)
+    user_data_root: Optional[str] = None  # 持久化 Chrome 用户目录，None 表示每次全新启动
+    profile_max_mb: int = 500  # 单个持久化目录的大小上限，超过后清理缓存
 
 
 class LinkedinCatConfig(BaseModel):
@@ -6,7 +6,20 @@ LinkedIn Cat Core Engine
 from .base import LinkedinBase
 from .message import LinkedinMessage
 from .search import LinkedinSearch
+from .selector_registry import SelectorRegistry, registry as selector_registry
+from .query_planner import SearchQueryPlanner, canonicalize_query
+from .profile_store import ProfileStore
+from .profile_index import ProfileIndex
+from .urn_cache import UrnCache
+from .response_cache import ResponseCache
+from .single_flight import SingleFlight
+from .response_schema import ResponseSchema, Field
+from .work_queue import WorkQueue
+from .orchestrator import ScrapeOrchestrator
+from .html_archive import HtmlArchive, reparse_profiles, reparse_search_pages
+from .pipeline import Pipeline, Stage, Checkpoint
 from .api import LinkedIn, Profile, Network, Invitation, Message, Post, Event, Company
+from .fixture_server import FixtureServer
 from .helper import (
     scroll_and_load,
     get_object,
@@ -15,6 +28,8 @@ from .helper import (
     extract_element_attribute,
     extract_many_element_text,
     extract_many_element_attribute,
+    extract_fields,
+    extract_items,
     save_to_json,
     extract_and_decode_username
 )
@@ -40,6 +55,29 @@ __all__ = [
     "LinkedinMessage",
     # Search
     "LinkedinSearch",
+    # Selectors
+    "SelectorRegistry",
+    "selector_registry",
+    # Search planning
+    "SearchQueryPlanner",
+    "canonicalize_query",
+    # Storage
+    "ProfileStore",
+    "ProfileIndex",
+    "UrnCache",
+    "ResponseCache",
+    "SingleFlight",
+    "ResponseSchema",
+    "Field",
+    "WorkQueue",
+    "ScrapeOrchestrator",
+    "HtmlArchive",
+    "reparse_profiles",
+    "reparse_search_pages",
+    # Streaming pipeline
+    "Pipeline",
+    "Stage",
+    "Checkpoint",
     # API
     "LinkedIn",
     "Profile",
@@ -49,6 +87,7 @@ __all__ = [
     "Post",
     "Event",
     "Company",
+    "FixtureServer",
     # Profile extraction
     "extract_profile",
     "extract_profile_thread_pool",
@@ -57,5 +96,7 @@ __all__ = [
     "get_object",
     "get_objects",
     "extract_element_text",
+    "extract_fields",
+    "extract_items",
     "save_to_json",
 ]
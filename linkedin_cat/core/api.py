@@ -1,1655 +1,2364 @@
-import pandas as pd
-import requests
-import time
-import urllib
-from datetime import datetime
-import secrets
-import pydash as _pd
-import json
-# pydash
-# pandas
-
-
-LINKEDIN_API = "https://3hz1hdpnlf.execute-api.eu-west-1.amazonaws.com/prod"
-
-RELEASE_MESSAGE = (
-    "Feature not release yet."
-    "Please create or comment issue on Jupyter Naas Github: "
-    "https://github.com/orgs/jupyter-naas/projects/4"
-)
-DATE_FORMAT = "%Y-%m-%d"
-DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
-TIME_SLEEP = secrets.randbelow(5) + 5
-HEADERS = {"Content-Type": "application/json"}
-EMAIL_COOKIES = "⚠️ Naas.ai - Update your Linkedin cookies"
-
-
-class LinkedIn:
-    deprecated = True
-
-    @staticmethod
-    def email_linkedin_limit(email):
-        email_content = """
-            "Hi there,<br><br>"
-                "Your LinkedIn cookies needs to be renewed.<br><br>"
-                "Please update them in your notebook 'Setup LinkedIn'.<br>"
-        """
-        return email_content
-
-    # @staticmethod
-    # def send_email_renewed_cookies():
-    #     email = LinkedIn.get_user_email()
-    #     email_content = LinkedIn.email_linkedin_limit(email)
-    #     naas.notification.send(
-    #         email_to=email, subject=EMAIL_COOKIES, html=email_content
-    #     )
-
-    @staticmethod
-    def manage_api_error(res):
-        if res.status_code != 200:
-            if int(res.status_code) == 302:
-                # LinkedIn.send_email_renewed_cookies()
-                raise requests.TooManyRedirects(res.status_code, res.text)
-            else:
-                raise BaseException(res.status_code, res.text)
-
-    @staticmethod
-    def get_activity_id(url):
-        if "-activity-" in url:
-            return url.split("-activity-")[-1].split("-")[0]
-        if ":activity:" in url:
-            return url.split(":activity:")[-1].split("/")[0]
-
-    @staticmethod
-    def get_profile_id(url):
-        return url.rsplit("/in/")[-1].rsplit("/")[0]
-
-    def print_deprecated(self, new_funct):
-        if self.deprected:
-            print(f"This function is deprecated, please use {new_funct}")
-
-    def get_profile_urn(self, url):
-        lk_id = LinkedIn.get_profile_id(url)
-        res = requests.get(
-            f"https://www.linkedin.com/voyager/api/identity/profiles/{lk_id}",
-            cookies=self.cookies,
-            headers=self.headers,
-        )
-        # Check if requests is successful
-        try:
-            res.raise_for_status()
-            res_json = res.json()
-            return (
-                res_json.get("data", {})
-                .get("entityUrn")
-                .replace("urn:li:fs_profile:", "")
-            )
-        except requests.HTTPError as e:
-            return e
-
-    def get_birthdate(self, bd):
-        if bd is None:
-            return "No birthdate"
-        bd_day = bd.get("day", "Day Unknown")
-        bd_month = bd.get("month", "Month Unknown")
-        bd_year = bd.get("year", "Year Unknown")
-        return f"{bd_day}/{bd_month}/{bd_year}"
-
-    def clear_occupation(self, occupation):
-        if occupation is not None:
-            occupation = occupation.strip().replace("\n", " ")
-        return occupation
-
-    def connect(
-            self,
-            li_at: str = None,
-            jessionid: str = None,
-    ):
-        # Init lk attribute
-        self.li_at = li_at
-        self.jessionid = jessionid.replace('"', '')
-
-        # Init cookies
-        self.cookies = {"li_at": self.li_at, "JSESSIONID": f'"{self.jessionid}"'}
-
-        # Init headers
-        self.headers = {
-            "X-Li-Lang": "en_US",
-            "Accept": "application/vnd.linkedin.normalized+json+2.1",
-            "Cache-Control": "no-cache",
-            "csrf-Token": self.jessionid,
-            "X-Requested-With": "XMLHttpRequest",
-            "X-Restli-Protocol-Version": "2.0.0",
-        }
-
-        # Init end point
-        self.profile = Profile(self.cookies, self.headers)
-        self.network = Network(self.cookies, self.headers)
-        self.invitation = Invitation(self.cookies, self.headers)
-        self.message = Message(self.cookies, self.headers)
-        self.post = Post(self.cookies, self.headers)
-        self.event = Event(self.cookies, self.headers)
-        self.company = Company(self.cookies, self.headers)
-
-        # Set connexion to active
-        self.connected = True
-        return self
-
-
-class Profile(LinkedIn):
-    def __init__(self, cookies, headers):
-        LinkedIn.__init__(self)
-        self.cookies = cookies
-        self.headers = headers
-
-    def get_identity(self, profile_url=None, sleep=True):
-        """
-        Return an dataframe object with 15 columns:
-        - FIRSTNAME
-        - LASTNAME
-        - SUMMARY
-        - OCCUPATION
-        - INDUSTRY_NAME
-        - ADDRESS
-        - REGION
-        - COUNTRY
-        - LOCATION
-        - BIRTHDATE
-        - PROFILE_ID
-        - PROFILE_URL
-        - PUBLIC_ID
-        - BACKGROUND_PICTURE
-        - PROFILE_PICTURE
-
-        Parameters
-        ----------
-        profile_url: str:
-            Profile URL from LinkedIn.
-            Example : "https://www.linkedin.com/in/florent-ravenel/"
-        """
-        res_json = {}
-        if profile_url is None:
-            print("❌ No profile URL. Please enter a profile URL from LinkedIn")
-            return res_json
-        result = {}
-        lk_public_id = LinkedIn.get_profile_id(profile_url)
-        req_url = (
-            f"https://www.linkedin.com/voyager/api/identity/profiles/{lk_public_id}"
-        )
-        res = requests.get(req_url, cookies=self.cookies, headers=self.headers)
-        # Raise error
-        res.raise_for_status()
-        # Parse json
-        res_json = res.json()
-        data = res_json.get("data", {})
-        included = res_json.get("included", {})
-
-        # Init var
-        bg_pic_url = None
-        profile_pic_url = None
-
-        # Get data from included json
-        if len(included) > 0:
-            included = included[0]
-
-            # Get background picture
-            if included.get("backgroundImage"):
-                background_url_end = None
-                background_root = None
-                background_artifacts = _pd.get(included, "backgroundImage.artifacts")
-                if len(background_artifacts) > 0:
-                    background_url_end = background_artifacts[
-                        len(background_artifacts) - 1
-                        ].get("fileIdentifyingUrlPathSegment")
-                background_root = _pd.get(included, "backgroundImage.rootUrl")
-                if background_url_end and background_root:
-                    bg_pic_url = f"{background_root}{background_url_end}"
-            # Get profile picture
-            if included.get("picture"):
-                profile_url_end = None
-                profile_root = None
-                profile_artifacts = _pd.get(included, "picture.artifacts")
-                if len(profile_artifacts) > 0:
-                    profile_url_end = profile_artifacts[len(profile_artifacts) - 1].get(
-                        "fileIdentifyingUrlPathSegment"
-                    )
-                profile_root = _pd.get(included, "picture.rootUrl")
-                if profile_root and profile_url_end:
-                    profile_pic_url = f"{profile_root}{profile_url_end}"
-        lk_id = data.get("entityUrn", "").replace("urn:li:fs_profile:", "")
-        result = {
-            "PROFILE_ID": lk_id,
-            "PROFILE_URL": f"https://www.linkedin.com/in/{lk_id}",
-            "PUBLIC_ID": data.get("publicIdentifier"),
-            "FIRSTNAME": data.get("firstName"),
-            "LASTNAME": data.get("lastName"),
-            "SUMMARY": data.get("summary"),
-            "OCCUPATION": data.get("headline"),
-            "INDUSTRY_NAME": data.get("industryName"),
-            "ADDRESS": data.get("address"),
-            "REGION": data.get("geoLocationName"),
-            "COUNTRY": data.get("geoCountryName"),
-            "LOCATION": data.get("locationName"),
-            "BIRTHDATE": self.get_birthdate(data.get("birthDateOn")),
-            "BACKGROUND_PICTURE": bg_pic_url,
-            "PROFILE_PICTURE": profile_pic_url,
-        }
-        if sleep:
-            time.sleep(TIME_SLEEP)
-        return pd.DataFrame([result])
-
-    def get_network(self, profile_url=None, sleep=True):
-        """
-        Return an dataframe object with 7 columns:
-        - PROFILE_ID
-        - PROFILE_URL
-        - DISTANCE
-        - FOLLOWING
-        - FOLLOWABLE
-        - FOLLOWERS_COUNT
-
-        Parameters
-        ----------
-        profile_url: str:
-            Profile URL from LinkedIn.
-            Example : "https://www.linkedin.com/in/florent-ravenel/"
-        """
-        res_json = {}
-        if profile_url is None:
-            print("❌ No profile URL. Please enter a profile URL from LinkedIn")
-            return res_json
-        result = {}
-        lk_id = LinkedIn.get_profile_id(profile_url)
-        req_url = f"https://www.linkedin.com/voyager/api/identity/profiles/{lk_id}/networkinfo"
-        res = requests.get(req_url, cookies=self.cookies, headers=self.headers)
-        # Raise error
-        res.raise_for_status()
-        # Parse json
-        res_json = res.json()
-        data = res_json.get("data", {})
-        profile_id = data.get("entityUrn", "").replace(
-            "urn:li:fs_profileNetworkInfo:", ""
-        )
-        result = {
-            "PROFILE_ID": profile_id,
-            "PROFILE_URL": f"https://www.linkedin.com/in/{profile_id}",
-            "DISTANCE": data.get("distance", {}).get("value"),
-            "FOLLOWING": data.get("following"),
-            "FOLLOWABLE": data.get("followable"),
-            "FOLLOWERS_COUNT": data.get("followersCount"),
-        }
-        if sleep:
-            time.sleep(TIME_SLEEP)
-        return pd.DataFrame([result])
-
-    def get_contact(self, profile_url=None, sleep=True):
-        """
-        Return an dataframe object with 11 columns:
-        - PROFILE_ID
-        - PROFILE_URL
-        - EMAIL
-        - CONNECTED_AT
-        - BIRTHDATE
-        - ADDRESS
-        - TWITTER
-        - PHONENUMBER
-        - WEBSITES
-        - INTERESTS
-
-        Parameters
-        ----------
-        profile_url: str:
-            Profile URL from LinkedIn.
-            Example : "https://www.linkedin.com/in/florent-ravenel/"
-        """
-        res_json = {}
-        if profile_url is None:
-            print("❌ No profile URL. Please enter a profile URL from LinkedIn")
-            return res_json
-        result = {}
-        lk_id = LinkedIn.get_profile_id(profile_url)
-        req_url = f"https://www.linkedin.com/voyager/api/identity/profiles/{lk_id}/profileContactInfo"
-        res = requests.get(req_url, cookies=self.cookies, headers=self.headers)
-        res.raise_for_status()
-        # Parse json
-        res_json = res.json()
-        data = res_json.get("data", {})
-
-        # Specific
-        connected_at = data.get("connectedAt")
-        if connected_at is not None:
-            connected_at = datetime.fromtimestamp(int(str(connected_at)[:-3])).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
-        lk_phone = None
-        lk_phones = data.get("phoneNumbers")
-        if lk_phones is not None:
-            for rows in lk_phones:
-                if rows["type"] == "MOBILE":
-                    lk_phone = rows["number"]
-                    break
-        lk_twiter = None
-        lk_twiters = data.get("twitterHandles")
-        if lk_twiters is not None:
-            for rows in lk_twiters:
-                lk_twiter = rows["name"]
-                break
-        lk_urls = ""
-        lk_websites = data.get("websites")
-        if lk_websites is not None:
-            for rows in lk_websites:
-                lk_url = rows["url"]
-                lk_urls = f"{lk_urls}{lk_url}, "
-        profile_id = data.get("entityUrn", "").replace("urn:li:fs_contactinfo:", "")
-        result = {
-            "PROFILE_ID": profile_id,
-            "PROFILE_URL": f"https://www.linkedin.com/in/{profile_id}",
-            "EMAIL": data.get("emailAddress"),
-            "CONNECTED_AT": connected_at,
-            "BIRTHDATE": self.get_birthdate(data.get("birthDateOn")),
-            "ADDRESS": data.get("address"),
-            "TWITTER": lk_twiter,
-            "PHONENUMBER": lk_phone,
-            "WEBSITES": lk_urls,
-            #             "INTERESTS": data.get("interests"),
-        }
-        if sleep:
-            time.sleep(TIME_SLEEP)
-        return pd.DataFrame([result])
-
-    def get_resume(self, profile_url=None, profile_urn=None):
-        """
-        Return an dataframe object with 13 columns:
-        - PROFILE_ID                    object
-        - PROFILE_URL                   object
-        - FULL_NAME                     object
-        - CATEGORY                      object
-        - TITLE                         object
-        - DATE_START                    object
-        - DATE_END                      object
-        - PLACE_ID                      object
-        - PLACE                         object
-        - FIELD                         object
-        - LOCATION                      object
-        - DESCRIPTION                   object
-        - DATE_EXTRACT                  object
-
-        Parameters
-        ----------
-        profile_url: str:
-            Profile URL from LinkedIn.
-            Example : "https://www.linkedin.com/in/florent-ravenel/"
-        """
-        res_json = {}
-        if profile_url is None:
-            print("❌ No profile URL. Please enter a profile URL from LinkedIn")
-            return res_json
-        if profile_urn is None:
-            profile_urn = LinkedIn.get_profile_urn(self, profile_url)
-            if profile_urn is None:
-                return "Please enter a valid profile_url or profile_urn"
-        req_url = f"{LINKEDIN_API}/profile/getResume?profile_urn={profile_urn}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-        res.raise_for_status()
-
-        # Manage LinkedIn API errors
-        LinkedIn.manage_api_error(res)
-
-        # Get json result
-        res_json = res.json()
-        df = pd.DataFrame(res_json)
-        return df.reset_index(drop=True)
-
-    def get_top_card(self, profile_url=None):
-        """
-        Return an dataframe object with 18 columns:
-        - PROFILE_ID
-        - PROFILE_URL
-        - FIRSTNAME
-        - LASTNAME
-        - LASTNAME
-        - OCCUPATION
-        - CONNECTIONS
-        - HASHTAGS
-        - LOCATION
-        - COMPANY_NAME
-        - COMPANY_URL
-        - DATE_START
-        - DATE_END
-        - SCHOOL_NAME
-        - SCHOOL_URL
-        - FOLLOWER_COUNT
-        - DATE_EXTRACT
-
-        Parameters
-        ----------
-        profile_url: str:
-            Profile URL from LinkedIn.
-            Example : "https://www.linkedin.com/in/florent-ravenel/"
-        """
-        res_json = {}
-        if profile_url is None:
-            print("❌ No profile URL. Please enter a profile URL from LinkedIn")
-            return res_json
-        profile_id = LinkedIn.get_profile_id(profile_url)
-        if profile_id is None:
-            return "Please enter a valid profile_url. It must follow this pattern: 'https://*.linkedin.com/in/*' "
-        req_url = f"{LINKEDIN_API}/profile/getTopCard?profile_id={profile_id}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-        res.raise_for_status()
-
-        # Manage LinkedIn API errors
-        LinkedIn.manage_api_error(res)
-
-        # Get json result
-        res_json = res.json()
-        df = pd.DataFrame(res_json)
-        return df.reset_index(drop=True)
-
-    def get_posts_feed(
-            self,
-            profile_url,
-            profile_id=None,
-            count=1,
-            limit=10,
-            until={},
-            sleep=True,
-            pagination_token=None,
-    ):
-        """
-        Return an dataframe object with 32 columns:
-        - ACTIVITY_ID                   object
-        - PAGINATION_TOKEN              object
-        - PUBLISHED_DATE                object
-        - AUTHOR_NAME                   object
-        - AUTHOR_URL                    object
-        - SUBDESCRIPTION                object
-        - TITLE                         object
-        - TEXT                          object
-        - CHARACTER_COUNT               int64
-        - TAGS                          object
-        - TAGS_COUNT                    int64
-        - EMOJIS                        object
-        - EMOJIS_COUNT                  int64
-        - LINKS                         object
-        - LINKS_COUNT                   int64
-        - PROFILE_MENTION               object
-        - COMPANY_MENTION               object
-        - CONTENT                       object
-        - CONTENT_TITLE                 object
-        - CONTENT_URL                   object
-        - CONTENT_ID                    object
-        - IMAGE_URL                     object
-        - POLL_ID                       object
-        - POLL_QUESTION                 object
-        - POLL_RESULTS                  object
-        - POST_URL                      object
-        - VIEWS                         int64
-        - COMMENTS                      int64
-        - LIKES                         int64
-        - SHARES                        int64
-        - ENGAGEMENT_SCORE              float64
-        - DATE_EXTRACT                  object
-
-        Parameters
-        ----------
-        profile_url: str:
-            Profile url from Linkedin.
-            Example : "https://www.linkedin.com/in/florent-ravenel/"
-
-        profile_id: str (default None):
-            Linkedin unique profile id identifier
-            Example : "ACoAABCNSioBW3YZHc2lBHVG0E_TXYWitQkmwog"
-
-        count: int (default 1, max 100):
-            Number of requests sent to LinkedIn API.
-            (!) If count > 1, published date will not be returned.
-
-        limit: int (default 10, unlimited=-1):
-            Number of posts return by function. It will start with the most recent post.
-
-        until: dict (default {})
-            Dict to be set by end user to limit function:
-            - key must a columns of the dataframe
-            - value must exists in key columns
-            Example : "{"POST_URL": "https://www.linkedin.com/posts/naas-ai_opensource-data-activity-6890025972754710529-akfv"
-
-        sleep: boolean (default True):
-            Sleeping time between function will be randomly between 3 to 5 seconds.
-
-        pagination_token: str (default None):
-            Token related to post used to start function from this post.
-            If None, function starts from the last post.
-
-        """
-        # Get profile
-        if profile_id is None:
-            profile_id = LinkedIn.get_profile_urn(self, profile_url)
-            if profile_id is None:
-                return "Please enter a valid profile_url or profile_urn"
-        # Until init
-        until_check = False
-        keys = []
-        if isinstance(until, dict) and len(until) > 0:
-            keys = [k for k, v in until.items()]
-        # Loop init
-        start = 0
-        df = pd.DataFrame()
-        if limit != -1 and count > limit:
-            limit = count
-        while True:
-            if pagination_token is not None:
-                req_url = f"{LINKEDIN_API}/profile/getPostsFeed?profile_id={profile_id}&count={count}&pagination_token={pagination_token}"
-            else:
-                req_url = f"{LINKEDIN_API}/profile/getPostsFeed?profile_id={profile_id}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
-
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            # Get response in dataframe
-            tmp_df = pd.DataFrame(res_json)
-
-            # Check until limit
-            for k in keys:
-                v = until.get(k)
-                if k in tmp_df.columns:
-                    values = tmp_df[k].astype(str).unique().tolist()
-                    if str(v) in values:
-                        until_check = True
-                        break
-            # Get pagination token + update start
-            pagination_token = tmp_df.loc[0, "PAGINATION_TOKEN"]
-
-            # Concat dataframe
-            df = pd.concat([df, tmp_df], axis=0)
-
-            # Break if until condition is True
-            if until_check:
-                break
-            # Time sleep to avoid linkedin ban
-            if sleep:
-                time.sleep(TIME_SLEEP)
-            start += count
-            if limit != -1 and start >= limit:
-                break
-        return df.reset_index(drop=True)
-
-
-class Network(LinkedIn):
-    def __init__(self, cookies, headers):
-        LinkedIn.__init__(self)
-        self.cookies = cookies
-        self.headers = headers
-
-    def get_followers(self, start=0, count=100, limit=1000):
-        """
-        Return an dataframe object with 13 columns:
-        - PROFILE_ID                    object
-        - PROFILE_URL                   object
-        - PUBLIC_ID                     object
-        - FIRSTNAME                     object
-        - LASTNAME                      object
-        - FULLNAME                      object
-        - OCCUPATION                    object
-        - PROFILE_PICTURE               object
-        - BACKGROUND_PICTURE            object
-        - FOLLOWER_COUNT                int64
-        - FOLLOWING                     bool
-        - INFLUENCER                    bool
-        - DATE_EXTRACT                  object
-
-        Parameters
-        ----------
-        start: int (default 0):
-            Starting requests to LinkedIn API.
-
-        count: int (default 100, max 100):
-            Number of requests sent to LinkedIn API.
-
-        limit: int (default 1000, unlimited=-1):
-            Number of result return by function.
-
-        """
-        limit_init = limit
-        df_followers = pd.DataFrame()
-        if limit != -1 and limit < count:
-            count = limit
-        while True:
-            req_url = f"{LINKEDIN_API}/network/getFollowers?start={start}&count={count}&limit={limit}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
-
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            df = pd.DataFrame(res_json)
-            df_followers = pd.concat([df_followers, df], axis=0)
-            start += count
-            if limit != -1 and start >= limit:
-                break
-            time.sleep(TIME_SLEEP)
-        if len(df_followers) > 0:
-            df_followers = df_followers.drop_duplicates("PROFILE_ID").reset_index(
-                drop=True
-            )
-            if limit != -1:
-                df_followers = df_followers[:limit_init]
-        return df_followers.reset_index(drop=True)
-
-    def get_connections(self, start=0, count=100, limit=1000):
-        """
-        Return an dataframe object with 9 columns:
-        - FIRSTNAME                     object
-        - LASTNAME                      object
-        - OCCUPATION                    object
-        - CREATED_AT                    object
-        - PROFILE_URL                   object
-        - PROFILE_PICTURE               object
-        - PROFILE_ID                    object
-        - PUBLIC_ID                     object
-        - DATE_EXTRACT                  object
-
-        Parameters
-        ----------
-        start: int (default 0):
-            Starting requests to LinkedIn API.
-
-        count: int (default 100, max 100):
-            Number of requests sent to LinkedIn API.
-
-        limit: int (default 1000, unlimited=-1):
-            Number of result return by function.
-
-        """
-        df_connections = pd.DataFrame()
-        if limit != -1 and limit < count:
-            count = limit
-        while True:
-            req_url = f"{LINKEDIN_API}/network/getConnections?start={start}&count={count}&limit={limit}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
-
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            df = pd.DataFrame(res_json)
-            df_connections = pd.concat([df_connections, df], axis=0)
-            start += count
-            if limit != -1 and start >= limit:
-                break
-            time.sleep(TIME_SLEEP)
-        df_connections = (
-            df_connections.drop_duplicates()
-            .sort_values(by="CREATED_AT", ascending=False)
-            .astype(str)
-        )
-        return df_connections.reset_index(drop=True)
-
-
-class Invitation(LinkedIn):
-    def __init__(self, cookies, headers):
-        LinkedIn.__init__(self)
-        self.cookies = cookies
-        self.headers = headers
-
-    def get_received(self, start=0, count=100, limit=-1):
-        """
-        Return an dataframe object with 16 columns:
-        - PROFILE_ID
-        - PROFILE_URL
-        - PUBLIC_ID
-        - FIRSTNAME
-        - LASTNAME
-        - FULLNAME
-        - OCCUPATION
-        - PROFILE_PICTURE
-        - MESSAGE
-        - UNSEEN
-        - SENT_AT
-        - INVITATION_TYPE
-        - INVITATION_DESC
-        - INVITATION_STATUS
-        - INVITATION_ID
-        - SHARED_SECRET
-
-        Parameters
-        ----------
-        start: int (default 0):
-            Starting requests to LinkedIn API.
-
-        count: int (default 100, max 100):
-            Number of requests sent to LinkedIn API.
-
-        limit: int (default -1, unlimited=-1):
-            Number of result return by function.
-
-        """
-        df = pd.DataFrame()
-        while True:
-            if limit != -1 and limit < count:
-                count = limit
-            req_url = f"{LINKEDIN_API}/invitation/get?start={start}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
-
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            tmp_df = pd.DataFrame(res_json)
-            df = pd.concat([df, tmp_df], axis=0)
-            start += count
-            if limit != -1:
-                limit -= count
-            time.sleep(TIME_SLEEP)
-        return df.reset_index(drop=True)
-
-    def get_sent(self, start=0, count=100, limit=-1):
-        """
-        Return an dataframe object with 15 columns:
-        - PROFILE_ID                    object
-        - PROFILE_URL                   object
-        - PUBLIC_ID                     object
-        - FIRSTNAME                     object
-        - LASTNAME                      object
-        - FULLNAME                      object
-        - OCCUPATION                    object
-        - PROFILE_PICTURE               object
-        - MESSAGE                       object
-        - SENT_AT                       object
-        - INVITATION_TYPE               object
-        - INVITATION_DESC               object
-        - INVITATION_STATUS             object
-        - INVITATION_ID                 object
-        - DATE_EXTRACT                  object
-
-        Parameters
-        ----------
-        start: int (default 0):
-            Starting requests to LinkedIn API.
-
-        count: int (default 100, max 100):
-            Number of requests sent to LinkedIn API.
-
-        limit: int (default -1, unlimited=-1):
-            Number of result return by function.
-
-        """
-        df = pd.DataFrame()
-        while True:
-            if limit != -1 and limit < count:
-                count = limit
-            req_url = f"{LINKEDIN_API}/invitation/getSent?start={start}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
-
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            tmp_df = pd.DataFrame(res_json)
-            df = pd.concat([df, tmp_df], axis=0)
-            start += count
-            if limit != -1:
-                limit -= count
-            time.sleep(TIME_SLEEP)
-        return df.reset_index(drop=True)
-
-    def response(
-            self,
-            action="accept",
-            invitation_id=None,
-            invitation_shared_secret=None,
-            is_generic=False,
-    ):
-        """
-        Print result : "Accept" or "Ignore"
-        Return dataframe profile if invitation type = "Profile"
-
-        Parameters
-        ----------
-        action: str (default 'accept')
-            "accept" or "ignore"
-
-        invitation_id: str (default None)
-            Argument given in invitations.get : "INVITATION_ID"
-
-        invitation_shared_secret: str (default None)
-            Argument given in invitations.get : "SHARED_SECRET"
-
-        is_generic: boolean (default False):
-            Must be True for generic invitation, if "INVITATION_TYPE" != "Profile"
-        """
-        params = {
-            "action": action,
-            "invitation_id": invitation_id,
-            "invitation_shared_secret": invitation_shared_secret,
-            "is_generic": is_generic,
-        }
-        req_url = f"{LINKEDIN_API}/invitation/response?{urllib.parse.urlencode(params, safe='(),')}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-        res.raise_for_status()
-        res_json = res.json()
-        if action == "accept":
-            print("🤝 Invitation accepted !")
-        elif action == "ignore":
-            print("❌ Invitation ignored !")
-        return pd.DataFrame(res_json)
-
-    def accept(
-            self, invitation_id=None, invitation_shared_secret=None, is_generic=False
-    ):
-        """
-        Return dataframe profile if invitation type = "Profile"
-
-        Parameters
-        ----------
-        invitation_id: str (default None)
-            Argument given in invitations.get : "INVITATION_ID"
-
-        invitation_shared_secret: str (default None)
-            Argument given in invitations.get : "SHARED_SECRET"
-
-        is_generic: boolean (default False):
-            Must be True for generic invitation, if "INVITATION_TYPE" != "Profile"
-        """
-        return self.response(
-            "accept", invitation_id, invitation_shared_secret, is_generic
-        )
-
-    def ignore(
-            self, invitation_id=None, invitation_shared_secret=None, is_generic=False
-    ):
-        """
-        Return dataframe profile if invitation type = "Profile"
-
-        Parameters
-        ----------
-        invitation_id: str (default None)
-            Argument given in invitations.get : "INVITATION_ID"
-
-        invitation_shared_secret: str (default None)
-            Argument given in invitations.get : "SHARED_SECRET"
-
-        is_generic: boolean (default False):
-            Must be True for generic invitation, if "INVITATION_TYPE" != "Profile"
-        """
-        return self.response(
-            "ignore", invitation_id, invitation_shared_secret, is_generic
-        )
-
-    def send(self, recipient_url=None, message=None):
-        """
-        Return res.json()
-
-        Parameters
-        ----------
-        recipient_url: str: (default None)
-            Profile url from Linkedin.
-            Example : "https://www.linkedin.com/in/florent-ravenel/"
-
-        message: str: (default None)
-            Message send with invitation. Must not exceed characters 300 characters.
-            Example : "Hi, \nI will be happy to connect with you."
-        """
-        if recipient_url is not None:
-            recipient_id = self.get_profile_urn(recipient_url)
-        # Set payload
-        payload = {"inviteeProfileUrn": f"urn:li:fsd_profile:{recipient_id}"}
-        # Add message in your invitations
-        if message:
-            # Validating message length (max size is 300 characters)
-            if len(message) < 300:
-                payload["customMessage"] = message
-            else:
-                raise BaseException(
-                    f"Message too long ({len(message)} characters). Max size is 300 characters"
-                )
-        # Post request
-        req_url = "https://www.linkedin.com/voyager/api/voyagerRelationshipsDashMemberRelationships?action=verifyQuotaAndCreate"
-        res = requests.post(
-            req_url,
-            data=json.dumps(payload),
-            cookies=self.cookies,
-            headers=self.headers,
-        )
-        res.raise_for_status()
-        time.sleep(TIME_SLEEP)
-        return "✉️ Invitation successfully sent !"
-
-
-class Message(LinkedIn):
-    def __init__(self, cookies, headers):
-        LinkedIn.__init__(self)
-        self.cookies = cookies
-        self.headers = headers
-
-    def get_conversations(
-            self,
-            limit=20,
-            sleep=True,
-    ):
-        """
-        Fetches the conversations from LinkedIn API.
-
-        This function sends a POST request to Naas LinkedIn's API endpoint to retrieve conversation data.
-        It retrieves the data in batches (default batch size is 20) and concatenates the results into a pandas DataFrame.
-        The function continues to fetch data until the specified limit is reached, or until there are no more conversations to fetch.
-        An optional sleep parameter can be used to introduce a delay between requests to avoid hitting API rate limits.
-
-        Parameters:
-        limit (int): The maximum number of conversations to fetch. If not specified, defaults to 20. The maximum allowed limit is 600.
-        sleep (bool): Whether to introduce a delay between requests. If not specified, defaults to True.
-
-        Returns:
-        df (pandas.DataFrame): A DataFrame containing the conversation data. The DataFrame consists of the following columns:
-            1. CONVERSATION_ID: The unique identifier for the conversation.
-            2. CONVERSATION_TYPE: The type of conversation (e.g., MEMBER_TO_MEMBER).
-            3. MESSAGE_COUNT: The total number of messages in the conversation.
-            4. UNREAD_MESSAGE_COUNT: The number of unread messages in the conversation.
-            5. FULLNAME: The full name of the other participant in the conversation.
-            6. PROFILE_URL: The LinkedIn profile URL of the other participant.
-            7. PUBLIC_ID: The public identifier of the other participant.
-            8. PROFILE_ID: The profile ID of the other participant.
-            9. FIRSTNAME: The first name of the other participant.
-            10. LASTNAME: The last name of the other participant.
-            11. OCCUPATION: The occupation of the other participant.
-            12. LAST_MESSAGE: The content of the last message in the conversation.
-            13. LAST_MESSAGE_SENT_AT: The timestamp of when the last message was sent.
-            14. LAST_READ_AT: The timestamp of when the last message was read.
-            15. LAST_SENDER_ID: The ID of the last sender.
-            16. LAST_SENDER: The full name of the last sender.
-            17. DATE_EXTRACT: The timestamp of when the conversation data was extracted.
-        """
-
-        # Init
-        df = pd.DataFrame()
-        count = 20
-        limit_max = 600
-
-        # Set count and limit
-        if limit < count:
-            count = limit
-        if limit > limit_max:
-            limit = limit_max
-
-        params = {"count": count}
-        while True:
-            req_url = f"{LINKEDIN_API}/message/getConversations?{urllib.parse.urlencode(params, safe='(),')}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
-
-            # Get json result
-            res_json = res.json()
-            tmp_df = pd.DataFrame(res_json)
-            df = pd.concat([df, tmp_df])
-
-            # Check if result is not empty else break
-            if len(tmp_df) == 0:
-                break
-            if len(df) >= limit:
-                break
-            # Set created before params
-            last_message_sent_at = tmp_df["LAST_MESSAGE_SENT_AT"].iloc[-1]
-            created_before = int(datetime.strptime(last_message_sent_at, DATETIME_FORMAT).strftime("%s") + "000")
-            params["created_before"] = created_before
-            if sleep:
-                time.sleep(TIME_SLEEP)
-        return df.reset_index(drop=True)
-
-    def get_messages(
-            self,
-            conversation_url=None,
-            count=20,
-            limit=20,
-            sleep=False,
-    ):
-        # Init
-        df = pd.DataFrame()
-        start = 0
-        count = 20
-        limit_max = 100
-
-        # Get conversation ID
-        conversation_id = conversation_url.split(
-            "https://www.linkedin.com/messaging/thread/"
-        )[-1].split("/")[0]
-
-        # Set count and limit
-        if limit < count:
-            count = limit
-        if limit > limit_max:
-            limit = limit_max
-        while True:
-            params = {
-                "conversation_id": conversation_id,
-                "start": start,
-                "count": count,
-            }
-            req_url = f"{LINKEDIN_API}/message/getMessages?{urllib.parse.urlencode(params, safe='(),')}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
-
-            # Get json result
-            res_json = res.json()
-            if len(res_json) > 0:
-                tmp_df = pd.DataFrame(res_json)
-                df = pd.concat([df, tmp_df])
-            # Check if result is not empty else break
-            if len(res_json) == 0 or len(res_json) < count:
-                break
-            if len(df) >= limit:
-                break
-            start += count
-            if sleep:
-                time.sleep(TIME_SLEEP)
-        return df.reset_index(drop=True)
-
-    def send(self, content, recipients_url=None, recipients_urn=None):
-        recipient_errors = []
-        params = {"action": "create"}
-        message_event = {
-            "eventCreate": {
-                "value": {
-                    "com.linkedin.voyager.messaging.create.MessageCreate": {
-                        "body": content,
-                        "attachments": [],
-                        "attributedBody": {
-                            "text": content,
-                            "attributes": [],
-                        },
-                        "mediaAttachments": [],
-                    }
-                }
-            }
-        }
-        if type(recipients_url) is str:
-            recipients_url = [recipients_url]
-        if type(recipients_urn) is str:
-            recipients_urn = [recipients_urn]
-        if type(recipients_url) is list:
-            recipients_urn = []
-            for recipient in recipients_url:
-                recipient_urn = LinkedIn.get_profile_urn(self, recipient)
-                if type(recipient_urn) is requests.exceptions.HTTPError:
-                    recipient_errors.append(recipient_urn)
-                recipients_urn.append(recipient_urn)
-        if len(recipient_errors) > 0:
-            return recipient_errors
-        message_event["recipients"] = recipients_urn
-        message_event["subtype"] = "MEMBER_TO_MEMBER"
-        payload = {
-            "keyVersion": "LEGACY_INBOX",
-            "conversationCreate": message_event,
-        }
-        res = requests.post(
-            "https://www.linkedin.com/voyager/api/messaging/conversations",
-            params=params,
-            json=payload,
-            cookies=self.cookies,
-            headers=self.headers,
-        )
-        time.sleep(TIME_SLEEP)
-        try:
-            res.raise_for_status()
-            return "💬 Message successfully sent !"
-        except requests.HTTPError as e:
-            return e
-
-
-class Post(LinkedIn):
-    def __init__(self, cookies, headers):
-        LinkedIn.__init__(self)
-        self.cookies = cookies
-        self.headers = headers
-
-    def get_stats(self, post_url=None, activity_id=None):
-        """
-        Return an dataframe object with 30 columns:
-        - ACTIVITY_ID                   object
-        - AUTHOR_NAME                   object
-        - AUTHOR_URL                    object
-        - SUBDESCRIPTION                object
-        - TITLE                         object
-        - TEXT                          object
-        - CHARACTER_COUNT               int64
-        - TAGS                          object
-        - TAGS_COUNT                    int64
-        - EMOJIS                        object
-        - EMOJIS_COUNT                  int64
-        - LINKS                         object
-        - LINKS_COUNT                   int64
-        - PROFILE_MENTION               object
-        - COMPANY_MENTION               object
-        - CONTENT                       object
-        - CONTENT_TITLE                 object
-        - CONTENT_URL                   object
-        - CONTENT_ID                    object
-        - IMAGE_URL                     object
-        - POLL_ID                       object
-        - POLL_QUESTION                 object
-        - POLL_RESULTS                  object
-        - POST_URL                      object
-        - VIEWS                         int64
-        - COMMENTS                      int64
-        - LIKES                         int64
-        - SHARES                        int64
-        - ENGAGEMENT_SCORE              int64
-        - DATE_EXTRACT                  object
-
-        Parameters
-        ----------
-        post_url: str:
-            Post url from Linkedin.
-            Example : "https://www.linkedin.com/posts/j%C3%A9r%C3%A9my-ravenel-8a396910_"
-                      "thoughts-monday-work-activity-6891437034473426945-OOOg"
-
-        activity_id: str (default None):
-            Linkedin unique post id identifier
-            Example : "6891437034473426945"
-
-        """
-        # Get profile
-        if activity_id is None:
-            activity_id = LinkedIn.get_activity_id(post_url)
-            if activity_id is None:
-                return "Please enter a valid post_url or activity_id"
-        req_url = f"{LINKEDIN_API}/post/getStats?activity_id={activity_id}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-        res.raise_for_status()
-
-        # Manage LinkedIn API errors
-        LinkedIn.manage_api_error(res)
-
-        # Get json result
-        return pd.DataFrame(res.json()).reset_index(drop=True)
-
-    def get_polls(self, post_url=None, activity_id=None):
-        """
-        Return an dataframe object with 14 columns:
-        - PROFILE_ID                    object
-        - PROFILE_URL                   object
-        - PUBLIC_ID                     object
-        - FIRSTNAME                     object
-        - LASTNAME                      object
-        - FULLNAME                      object
-        - OCCUPATION                    object
-        - PROFILE_PICTURE               object
-        - BACKGROUND_PICTURE            object
-        - POLL_ID                       object
-        - POLL_QUESTION                 object
-        - POLL_RESULT                   object
-        - POST_URL                      object
-        - DATE_EXTRACT                  object
-
-        Parameters
-        ----------
-        post_url: str:
-            Post url from Linkedin.
-            Example : "https://www.linkedin.com/posts/j%C3%A9r%C3%A9my-ravenel-8a396910_"
-                      "thoughts-monday-work-activity-6891437034473426945-OOOg"
-
-        activity_id: str (default None):
-            Linkedin unique post id identifier
-            Example : "6891437034473426945"
-
-        """
-        # Get profile
-        if activity_id is None:
-            activity_id = LinkedIn.get_activity_id(post_url)
-            if activity_id is None:
-                return "Please enter a valid post_url or activity_id"
-        req_url = f"{LINKEDIN_API}/post/getPolls?activity_id={activity_id}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-        res.raise_for_status()
-
-        # Manage LinkedIn API errors
-        LinkedIn.manage_api_error(res)
-
-        # Get json result
-        return pd.DataFrame(res.json()).reset_index(drop=True)
-
-    def get_comments(
-            self, post_url=None, activity_id=None, start=0, count=100, limit=-1, sleep=True
-    ):
-        """
-        Return an dataframe object with 18 columns:
-        - PROFILE_ID                    object
-        - PROFILE_URL                   object
-        - PUBLIC_ID                     object
-        - FIRSTNAME                     object
-        - LASTNAME                      object
-        - FULLNAME                      object
-        - OCCUPATION                    object
-        - PROFILE_PICTURE               object
-        - BACKGROUND_PICTURE            object
-        - PROFILE_TYPE                  object
-        - TEXT                          object
-        - CREATED_TIME                  object
-        - LANGUAGE                      object
-        - DISTANCE                      object
-        - COMMENTS                      int64
-        - LIKES                         int64
-        - POST_URL                      object
-        - DATE_EXTRACT                  object
-
-        Parameters
-        ----------
-        post_url: str:
-            Post url from Linkedin.
-            Example : "https://www.linkedin.com/posts/j%C3%A9r%C3%A9my-ravenel-8a396910_"
-                      "thoughts-monday-work-activity-6891437034473426945-OOOg"
-
-        activity_id: str (default None):
-            Linkedin unique post id identifier
-            Example : "6891437034473426945"
-
-        start: int (default 0):
-            Number of requests sent to LinkedIn API.
-            (!) If count > 1, published date will not be returned.
-
-        count: int (default 1, max 100):
-            Number of requests sent to LinkedIn API.
-            (!) If count > 1, followed at will not be returned.
-
-        limit: int (default 10, unlimited=-1):
-            Number of followers return by function. It will start with the most recent followers.
-
-        sleep: boolean (default True):
-            Sleeping time between function will be randomly between 3 to 5 seconds.
-
-        """
-        # Get profile
-        if activity_id is None:
-            activity_id = LinkedIn.get_activity_id(post_url)
-            if activity_id is None:
-                return "Please enter a valid post_url or activity_id"
-        df = pd.DataFrame()
-        while True:
-            if limit != -1 and limit < count:
-                count = limit
-            req_url = f"{LINKEDIN_API}/post/getComments?activity_id={activity_id}&start={start}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
-
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            tmp_df = pd.DataFrame(res_json)
-            df = pd.concat([df, tmp_df], axis=0)
-            start += count
-            if limit != -1:
-                limit -= count
-            if sleep:
-                time.sleep(TIME_SLEEP)
-        return df.reset_index(drop=True)
-
-    def get_likes(
-            self, post_url=None, activity_id=None, start=0, count=100, limit=-1, sleep=True
-    ):
-        """
-        Return an dataframe object with 13 columns:
-        - PROFILE_ID                    object
-        - PROFILE_URL                   object
-        - PUBLIC_ID                     object
-        - FIRSTNAME                     object
-        - LASTNAME                      object
-        - FULLNAME                      object
-        - OCCUPATION                    object
-        - PROFILE_PICTURE               object
-        - BACKGROUND_PICTURE            object
-        - PROFILE_TYPE                  object
-        - REACTION_TYPE                 object
-        - POST_URL                      object
-        - DATE_EXTRACT                  object
-
-        Parameters
-        ----------
-        post_url: str:
-            Post url from Linkedin.
-            Example : "https://www.linkedin.com/posts/j%C3%A9r%C3%A9my-ravenel-8a396910_"
-                      "thoughts-monday-work-activity-6891437034473426945-OOOg"
-
-        activity_id: str (default None):
-            Linkedin unique post id identifier
-            Example : "6891437034473426945"
-
-        start: int (default 0):
-            Number of requests sent to LinkedIn API.
-            (!) If count > 1, published date will not be returned.
-
-        count: int (default 1, max 100):
-            Number of requests sent to LinkedIn API.
-            (!) If count > 1, followed at will not be returned.
-
-        limit: int (default 10, unlimited=-1):
-            Number of followers return by function. It will start with the most recent followers.
-
-        sleep: boolean (default True):
-            Sleeping time between function will be randomly between 3 to 5 seconds.
-
-        """
-        # Get profile
-        if activity_id is None:
-            activity_id = LinkedIn.get_activity_id(post_url)
-            if activity_id is None:
-                return "Please enter a valid post_url or activity_id"
-        df = pd.DataFrame()
-        while True:
-            if limit != -1 and limit < count:
-                count = limit
-            req_url = f"{LINKEDIN_API}/post/getLikes?activity_id={activity_id}&start={start}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
-
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            tmp_df = pd.DataFrame(res_json)
-            df = pd.concat([df, tmp_df], axis=0)
-            start += count
-            if limit != -1:
-                limit -= count
-            if sleep:
-                time.sleep(TIME_SLEEP)
-        return df.reset_index(drop=True)
-
-
-class Event(LinkedIn):
-    def __init__(self, cookies, headers):
-        LinkedIn.__init__(self)
-        self.cookies = cookies
-        self.headers = headers
-
-    def get_guests(
-            self, event_url="https://www.linkedin.com/events/6762355783188525056/"
-    ):
-        """
-        Return an dataframe object with 8 columns:
-        - FULLNAME                      object
-        - PROFILE_ID                    object
-        - PROFILE_URL                   object
-        - PUBLIC_ID                     object
-        - OCCUPATION                    object
-        - LOCATION                      object
-        - DISTANCE                      object
-        - DATE_EXTRACT                  object
-
-        Parameters
-        ----------
-        event_url: str:
-            Event url from Linkedin.
-            Example : "https://www.linkedin.com/events/6762355783188525056/"
-
-        """
-        req_url = f"{LINKEDIN_API}/event/getGuests?event_link={event_url}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-        res.raise_for_status()
-        return pd.DataFrame(res.json()).reset_index(drop=True)
-
-
-class Company(LinkedIn):
-    def __init__(self, cookies, headers):
-        LinkedIn.__init__(self)
-        self.cookies = cookies
-        self.headers = headers
-
-    def get_info(self, company_url="https://www.linkedin.com/company/naas-ai/"):
-        """
-        Return an dataframe object with 18 columns:
-        - COMPANY_ID                    object
-        - COMPANY_URL                   object
-        - COMPANY_NAME                  object
-        - UNIVERSAL_NAME                object
-        - LOGO_URL                      object
-        - INDUSTRY_ID                   object
-        - INDUSTRY                      object
-        - WEBSITE                       object
-        - TAGLINE                       object
-        - SPECIALITIES                  object
-        - DESCRIPTION                   object
-        - COUNTRY                       object
-        - REGION                        object
-        - CITY                          object
-        - STAFF_COUNT                   object
-        - STAFF_RANGE                   object
-        - FOLLOWER_COUNT                object
-        - DATE_EXTRACT                  object
-
-        Parameters
-        ----------
-        company_url: str:
-            Company url from Linkedin.
-            Example : "https://www.linkedin.com/company/naas-ai/"
-
-        """
-        df = pd.DataFrame()
-        req_url = f"{LINKEDIN_API}/company/getInfo?company_url={company_url}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-        res.raise_for_status()
-
-        # Manage LinkedIn API errors
-        LinkedIn.manage_api_error(res)
-
-        # Get json result
-        df = pd.DataFrame(res.json())
-        return df.reset_index(drop=True)
-
-    def get_followers(
-            self,
-            company_url="https://www.linkedin.com/company/naas-ai/",
-            start=0,
-            count=1,
-            limit=10,
-            sleep=True,
-    ):
-        """
-        Return an dataframe object with 11 columns:
-        - FIRSTNAME                     object
-        - LASTNAME                      object
-        - OCCUPATION                    object
-        - PROFILE_PICTURE               object
-        - PROFILE_URL                   object
-        - PROFILE_ID                    object
-        - PUBLIC_ID                     object
-        - FOLLOWED_AT                   object
-        - DISTANCE                      object
-        - DATE_EXTRACT                  object
-
-        Parameters
-        ----------
-        company_url: str:
-            Company url from Linkedin.
-            Example : "https://www.linkedin.com/company/naas-ai/"
-
-        start: int (default 0):
-            Number of requests sent to LinkedIn API.
-            (!) If count > 1, published date will not be returned.
-
-        count: int (default 1, max 100):
-            Number of requests sent to LinkedIn API.
-            (!) If count > 1, followed at will not be returned.
-
-        limit: int (default 10, unlimited=-1):
-            Number of followers return by function. It will start with the most recent followers.
-
-        sleep: boolean (default True):
-            Sleeping time between function will be randomly between 3 to 5 seconds.
-
-        """
-        df = pd.DataFrame()
-        while True:
-            if limit != -1 and limit < count:
-                count = limit
-            req_url = f"{LINKEDIN_API}/company/getFollowers?company_url={company_url}&start={start}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
-
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            tmp_df = pd.DataFrame(res_json)
-            df = pd.concat([df, tmp_df], axis=0)
-            start += count
-            if limit != -1:
-                limit -= count
-            if sleep:
-                time.sleep(TIME_SLEEP)
-        if len(df) > 0:
-            df = df.sort_values(by="FOLLOWED_AT", ascending=False)
-        return df.reset_index(drop=True)
-
-    def __get_posts_views(self, activity_id):
-        views = 0
-        req_url = f"{LINKEDIN_API}/company/getPostsViews?activity_id={activity_id}"
-        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-        res.raise_for_status()
-
-        # Manage LinkedIn API errors
-        LinkedIn.manage_api_error(res)
-
-        # Get result
-        views = res.json().get("VIEWS")
-        time.sleep(3)
-        return views
-
-    def get_posts_feed(
-            self,
-            company_url,
-            start=0,
-            count=100,
-            limit=-1,
-            sleep=True,
-    ):
-        """
-        Return an dataframe object with 31 columns:
-        - ACTIVITY_ID                   object
-        - PUBLISHED_DATE                object
-        - AUTHOR_NAME                   object
-        - AUTHOR_URL                    object
-        - SUBDESCRIPTION                object
-        - TITLE                         object
-        - TEXT                          object
-        - CHARACTER_COUNT               int64
-        - TAGS                          object
-        - TAGS_COUNT                    int64
-        - EMOJIS                        object
-        - EMOJIS_COUNT                  int64
-        - LINKS                         object
-        - LINKS_COUNT                   int64
-        - PROFILE_MENTION               object
-        - COMPANY_MENTION               object
-        - CONTENT                       object
-        - CONTENT_TITLE                 object
-        - CONTENT_URL                   object
-        - CONTENT_ID                    object
-        - IMAGE_URL                     object
-        - POLL_ID                       object
-        - POLL_QUESTION                 object
-        - POLL_RESULTS                  object
-        - POST_URL                      object
-        - VIEWS                         int64
-        - COMMENTS                      int64
-        - LIKES                         int64
-        - SHARES                        int64
-        - ENGAGEMENT_SCORE              float64
-        - DATE_EXTRACT                  object
-
-        Parameters
-        ----------
-        company_url: str:
-            Company url from Linkedin.
-            Example : "https://www.linkedin.com/company/naas-ai/"
-
-        start: int (default 0):
-            Starting request sent to LinkedIn API.
-
-        count: int (default 1, max 100):
-            Number of requests sent to LinkedIn API.
-            (!) If count > 1, published date will not be returned.
-
-        limit: int (default 10, unlimited=-1):
-            Number of posts return by function. It will start with the most recent post.
-
-        sleep: boolean (default True):
-            Sleeping time between function will be randomly between 5 to 10 seconds.
-
-        """
-        # Loop init
-        df = pd.DataFrame()
-        if limit != -1 and count > limit:
-            count = limit
-        while True:
-            req_url = f"{LINKEDIN_API}/company/getPostsFeed?company_url={company_url}&start={start}&count={count}"
-            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
-            res.raise_for_status()
-
-            # Manage LinkedIn API errors
-            LinkedIn.manage_api_error(res)
-
-            # Get json result
-            res_json = res.json()
-            if len(res_json) == 0:
-                break
-            # Get response in dataframe
-            tmp_df = pd.DataFrame(res_json)
-
-            # Concat dataframe
-            df = pd.concat([df, tmp_df], axis=0)
-
-            # Time sleep to avoid linkedin ban
-            if sleep:
-                time.sleep(TIME_SLEEP)
-            start += count
-            if limit != -1 and start >= limit:
-                break
-        # Cleaning
-        if len(df) > 0:
-            # Add views + engagement score
-            df["VIEWS"] = df.apply(
-                lambda row: self.__get_posts_views(row.ACTIVITY_ID), axis=1
-            )
-            df["ENGAGEMENT_SCORE"] = 0
-            df.loc[df["VIEWS"] != 0, "ENGAGEMENT_SCORE"] = (
-                                                                   df["COMMENTS"] + df["LIKES"]
-                                                           ) / df["VIEWS"]
-        return df.reset_index(drop=True)
-
+import pandas as pd
+import requests
+import time
+import urllib
+from datetime import datetime
+import secrets
+import json
+import os
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from linkedin_cat.core.rate_budget import RateBudget
+from linkedin_cat.core.urn_cache import UrnCache, normalize_vanity
+from linkedin_cat.core.response_cache import ResponseCache, cache_key
+from linkedin_cat.core.single_flight import SingleFlight
+from linkedin_cat.core.response_schema import ResponseSchema, Field
+from linkedin_cat.core.helper import save_to_json, extract_and_decode_username
+from linkedin_cat.core.voyager import (
+    VOYAGER_API,
+    PROFILE_SECTION_ENDPOINTS,
+    get_elements,
+    build_profile_data,
+)
+# pydash
+# pandas
+
+
+LINKEDIN_API = "https://3hz1hdpnlf.execute-api.eu-west-1.amazonaws.com/prod"
+
+RELEASE_MESSAGE = (
+    "Feature not release yet."
+    "Please create or comment issue on Jupyter Naas Github: "
+    "https://github.com/orgs/jupyter-naas/projects/4"
+)
+DATE_FORMAT = "%Y-%m-%d"
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+TIME_SLEEP = secrets.randbelow(5) + 5
+HEADERS = {"Content-Type": "application/json"}
+EMAIL_COOKIES = "⚠️ Naas.ai - Update your Linkedin cookies"
+
+# Shared by every thread calling LinkedIn lookups
+RATE_BUDGET = RateBudget(rate=2, burst=5)
+# Identical requests in flight at the same time are sent once, see LinkedIn._single_flight
+SINGLE_FLIGHT = SingleFlight()
+VIEWS_TTL = 6 * 3600
+
+
+class LinkedIn:
+    deprecated = True
+    # Vanity name <-> profile URN map, shared by the endpoints of one connection
+    urn_cache = None
+    # Optional ResponseCache of read-only requests, see _get_json
+    response_cache = None
+    # Roots of the requests, see connect(base_url=...)
+    api_url = LINKEDIN_API
+    voyager_url = VOYAGER_API
+
+    @staticmethod
+    def email_linkedin_limit(email):
+        email_content = """
+            "Hi there,<br><br>"
+                "Your LinkedIn cookies needs to be renewed.<br><br>"
+                "Please update them in your notebook 'Setup LinkedIn'.<br>"
+        """
+        return email_content
+
+    # @staticmethod
+    # def send_email_renewed_cookies():
+    #     email = LinkedIn.get_user_email()
+    #     email_content = LinkedIn.email_linkedin_limit(email)
+    #     naas.notification.send(
+    #         email_to=email, subject=EMAIL_COOKIES, html=email_content
+    #     )
+
+    @staticmethod
+    def manage_api_error(res):
+        if res.status_code != 200:
+            if int(res.status_code) == 302:
+                # LinkedIn.send_email_renewed_cookies()
+                raise requests.TooManyRedirects(res.status_code, res.text)
+            else:
+                raise BaseException(res.status_code, res.text)
+
+    @staticmethod
+    def get_activity_id(url):
+        if "-activity-" in url:
+            return url.split("-activity-")[-1].split("-")[0]
+        if ":activity:" in url:
+            return url.split(":activity:")[-1].split("/")[0]
+
+    @staticmethod
+    def get_profile_id(url):
+        return url.rsplit("/in/")[-1].rsplit("/")[0]
+
+    @staticmethod
+    def _cache_profile_id(lk_id):
+        lk_id = lk_id.split("?")[0]
+        return lk_id if lk_id.startswith("ACo") else normalize_vanity(lk_id)
+
+    def _account(self):
+        """
+        Return the li_at cookie identifying the connected account, None if unset.
+        """
+        return self.cookies.get("li_at") if isinstance(self.cookies, dict) else None
+
+    def _single_flight(self, endpoint, params, fetch):
+        """
+        Return fetch(), sent once for all the threads making the same request
+        (same account, endpoint and params) at the same time. They share the
+        parsed result, which must not be modified.
+        """
+        return SINGLE_FLIGHT.do((self._account(), cache_key(endpoint, params)), fetch)
+
+    def _get_json(self, endpoint, params, fetch, bypass_cache=False):
+        """
+        Return fetch(), the parsed JSON of a read-only request, through
+        response_cache when one is set. Concurrent identical requests are
+        coalesced, see _single_flight. Viewer-dependent responses are cached
+        per account, see response_cache.ACCOUNT_SCOPED_ENDPOINTS.
+        """
+        def fetch_once():
+            return self._single_flight(endpoint, params, fetch)
+
+        if self.response_cache is None:
+            return fetch_once()
+        return self.response_cache.fetch(endpoint, params, fetch_once, bypass=bypass_cache,
+                                         account=self._account())
+
+    async def run_async(self, method, *args, **kwargs):
+        """
+        Await an endpoint method from asyncio code, eg:
+            df = await linkedin.profile.run_async("get_identity", url, sleep=False)
+
+        The method runs in the default executor, so identical requests made by
+        tasks and threads at the same time are still sent once.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(getattr(self, method), *args, **kwargs))
+
+    @staticmethod
+    def export(df, to="pandas", path=None, schema=None):
+        """
+        Return df in the format asked by the `to` argument of the DataFrame methods:
+        - "pandas": df as is
+        - "arrow": a pyarrow.Table with the stable schema of the endpoint (columns
+          in order and typed even when empty, repeated strings dictionary-encoded)
+        - "parquet": the same table written to the Parquet file path, returns path
+
+        See core.columnar.write_dataset to store pulls as a partitioned dataset.
+        """
+        if to == "pandas":
+            return df
+        if to not in ("arrow", "parquet"):
+            raise ValueError(f"Unknown output: {to}, expected pandas, arrow or parquet")
+        if to == "parquet" and path is None:
+            raise ValueError("A path is required with to='parquet'")
+        # pyarrow is only imported when columnar output is asked
+        from linkedin_cat.core.columnar import to_arrow, write_parquet
+
+        table = to_arrow(df, schema)
+        if to == "arrow":
+            return table
+        return write_parquet(table, path)
+
+    @staticmethod
+    def single_flight_stats():
+        """
+        Return {"calls", "executed", "coalesced", "in_flight"} of the shared request coalescing.
+        """
+        return SINGLE_FLIGHT.stats()
+
+    def print_deprecated(self, new_funct):
+        if self.deprected:
+            print(f"This function is deprecated, please use {new_funct}")
+
+    def _get_urn_cache(self):
+        if self.urn_cache is None:
+            self.urn_cache = UrnCache(None)
+        return self.urn_cache
+
+    def get_profile_urn(self, url):
+        """
+        Return the profile URN of a profile url, eg: "ACoAABCNSioBW3YZHc2lBHVG0E_TXYWitQkmwog".
+
+        Resolved URNs are kept in urn_cache, a profile is only requested once.
+        On error, the requests.HTTPError is returned.
+        """
+        lk_id = LinkedIn.get_profile_id(url)
+        if lk_id.startswith("ACo"):
+            return lk_id
+        return self._get_urn_cache().resolve(lk_id, self._fetch_profile_urn)
+
+    def get_profile_urns(self, urls, workers=8):
+        """
+        Return a dict {url: profile URN}, resolving `workers` profiles at a time.
+        Profiles already in urn_cache, or repeated in urls, are not requested again.
+        """
+        ids = {url: LinkedIn.get_profile_id(url) for url in urls}
+        vanities = [lk_id for lk_id in ids.values() if not lk_id.startswith("ACo")]
+        urns = self._get_urn_cache().resolve_many(vanities, self._fetch_profile_urn, workers=workers)
+        return {url: urns.get(lk_id, lk_id) for url, lk_id in ids.items()}
+
+    def _fetch_profile_urn(self, lk_id):
+        def fetch():
+            RATE_BUDGET.acquire()
+            res = requests.get(
+                f"{self.voyager_url}/identity/profiles/{lk_id}",
+                cookies=self.cookies,
+                headers=self.headers,
+            )
+            # Check if requests is successful
+            try:
+                res.raise_for_status()
+                res_json = res.json()
+                return (
+                    res_json.get("data", {})
+                    .get("entityUrn")
+                    .replace("urn:li:fs_profile:", "")
+                )
+            except requests.HTTPError as e:
+                return e
+
+        return self._single_flight("profile.urn", {"profile_id": LinkedIn._cache_profile_id(lk_id)}, fetch)
+
+    def get_birthdate(self, bd):
+        if bd is None:
+            return "No birthdate"
+        return format_birthdate(bd)
+
+    def clear_occupation(self, occupation):
+        if occupation is not None:
+            occupation = occupation.strip().replace("\n", " ")
+        return occupation
+
+    def connect(
+            self,
+            li_at: str = None,
+            jessionid: str = None,
+            urn_cache=None,
+            response_cache=None,
+            base_url=None,
+    ):
+        """
+        urn_cache: UrnCache, or the path of its SQLite file to keep resolved
+            profile URNs across runs. In memory by default.
+        response_cache: ResponseCache, or the path of its SQLite file, caching
+            read-only requests (get_identity, get_network ...). Disabled by default.
+        base_url: root URL replacing LINKEDIN_API and www.linkedin.com, the Voyager
+            API being served under {base_url}/voyager/api, eg: the url of a
+            core.fixture_server.FixtureServer to run offline.
+        """
+        # Init lk attribute
+        self.li_at = li_at
+        self.jessionid = jessionid.replace('"', '')
+
+        # Init cookies
+        self.cookies = {"li_at": self.li_at, "JSESSIONID": f'"{self.jessionid}"'}
+
+        # Init headers
+        self.headers = {
+            "X-Li-Lang": "en_US",
+            "Accept": "application/vnd.linkedin.normalized+json+2.1",
+            "Cache-Control": "no-cache",
+            "csrf-Token": self.jessionid,
+            "X-Requested-With": "XMLHttpRequest",
+            "X-Restli-Protocol-Version": "2.0.0",
+        }
+
+        # Init request roots
+        if base_url is not None:
+            self.api_url = base_url.rstrip("/")
+            self.voyager_url = f"{self.api_url}/voyager/api"
+
+        # Init end point
+        self.profile = Profile(self.cookies, self.headers)
+        self.network = Network(self.cookies, self.headers)
+        self.invitation = Invitation(self.cookies, self.headers)
+        self.message = Message(self.cookies, self.headers)
+        self.post = Post(self.cookies, self.headers)
+        self.event = Event(self.cookies, self.headers)
+        self.company = Company(self.cookies, self.headers)
+
+        # One vanity <-> URN map and response cache for every endpoint
+        self.urn_cache = UrnCache(urn_cache) if isinstance(urn_cache, str) else (urn_cache or UrnCache(None))
+        self.response_cache = ResponseCache(response_cache) if isinstance(response_cache, str) else response_cache
+        for endpoint in (self.profile, self.network, self.invitation, self.message,
+                         self.post, self.event, self.company):
+            endpoint.urn_cache = self.urn_cache
+            endpoint.response_cache = self.response_cache
+            endpoint.api_url = self.api_url
+            endpoint.voyager_url = self.voyager_url
+
+        # Set connexion to active
+        self.connected = True
+        return self
+
+    def connect_from_cookies_json(self, linkedin_cookies_json, **kwargs):
+        """
+        Connects with the cookies file exported for the Selenium driver (list of cookie dicts).
+        kwargs are passed to connect, eg: urn_cache.
+        """
+        with open(linkedin_cookies_json, "r") as file:
+            cookies = json.loads(file.read())
+        values = {cookie.get("name"): cookie.get("value") for cookie in cookies}
+        return self.connect(li_at=values.get("li_at"), jessionid=values.get("JSESSIONID", ""), **kwargs)
+
+
+def format_birthdate(bd):
+    bd_day = bd.get("day", "Day Unknown")
+    bd_month = bd.get("month", "Month Unknown")
+    bd_year = bd.get("year", "Year Unknown")
+    return f"{bd_day}/{bd_month}/{bd_year}"
+
+
+def image_url(image):
+    """
+    Returns the URL of the largest artifact of a Voyager vector image, None if incomplete.
+    """
+    artifacts = image.get("artifacts") or []
+    root = image.get("rootUrl")
+    url_end = artifacts[-1].get("fileIdentifyingUrlPathSegment") if artifacts else None
+    if root and url_end:
+        return f"{root}{url_end}"
+    return None
+
+
+def urn_id(prefix):
+    return lambda urn: urn.replace(prefix, "")
+
+
+def urn_profile_url(prefix):
+    return lambda urn: f"https://www.linkedin.com/in/{urn.replace(prefix, '')}"
+
+
+def format_connected_at(timestamp):
+    return datetime.fromtimestamp(int(str(timestamp)[:-3])).strftime(DATETIME_FORMAT)
+
+
+def mobile_phone(phones):
+    return next((phone["number"] for phone in phones if phone["type"] == "MOBILE"), None)
+
+
+def join_websites(websites):
+    return "".join(f"{website['url']}, " for website in websites)
+
+
+# Voyager responses of the Profile methods
+IDENTITY_SCHEMA = ResponseSchema("profile.identity", [
+    Field("PROFILE_ID", "data.entityUrn", transform=urn_id("urn:li:fs_profile:")),
+    Field("PROFILE_URL", "data.entityUrn", transform=urn_profile_url("urn:li:fs_profile:")),
+    Field("PUBLIC_ID", "data.publicIdentifier"),
+    Field("FIRSTNAME", "data.firstName"),
+    Field("LASTNAME", "data.lastName"),
+    Field("SUMMARY", "data.summary"),
+    Field("OCCUPATION", "data.headline"),
+    Field("INDUSTRY_NAME", "data.industryName", "category"),
+    Field("ADDRESS", "data.address"),
+    Field("REGION", "data.geoLocationName", "category"),
+    Field("COUNTRY", "data.geoCountryName", "category"),
+    Field("LOCATION", "data.locationName", "category"),
+    Field("BIRTHDATE", "data.birthDateOn", default="No birthdate", transform=format_birthdate),
+    Field("BACKGROUND_PICTURE", "included.0.backgroundImage", transform=image_url),
+    Field("PROFILE_PICTURE", "included.0.picture", transform=image_url),
+])
+NETWORK_SCHEMA = ResponseSchema("profile.network", [
+    Field("PROFILE_ID", "data.entityUrn", transform=urn_id("urn:li:fs_profileNetworkInfo:")),
+    Field("PROFILE_URL", "data.entityUrn", transform=urn_profile_url("urn:li:fs_profileNetworkInfo:")),
+    Field("DISTANCE", "data.distance.value", "category"),
+    Field("FOLLOWING", "data.following", "boolean"),
+    Field("FOLLOWABLE", "data.followable", "boolean"),
+    Field("FOLLOWERS_COUNT", "data.followersCount", "Int64"),
+])
+CONTACT_SCHEMA = ResponseSchema("profile.contact", [
+    Field("PROFILE_ID", "data.entityUrn", transform=urn_id("urn:li:fs_contactinfo:")),
+    Field("PROFILE_URL", "data.entityUrn", transform=urn_profile_url("urn:li:fs_contactinfo:")),
+    Field("EMAIL", "data.emailAddress"),
+    Field("CONNECTED_AT", "data.connectedAt", transform=format_connected_at),
+    Field("BIRTHDATE", "data.birthDateOn", default="No birthdate", transform=format_birthdate),
+    Field("ADDRESS", "data.address"),
+    Field("TWITTER", "data.twitterHandles.0.name"),
+    Field("PHONENUMBER", "data.phoneNumbers", transform=mobile_phone),
+    Field("WEBSITES", "data.websites", default="", transform=join_websites),
+])
+
+
+def _people_fields(*columns):
+    """
+    Fields of the person columns shared by the LINKEDIN_API list endpoints.
+    """
+    return [Field(column) for column in columns]
+
+
+PEOPLE_COLUMNS = (
+    "PROFILE_ID", "PROFILE_URL", "PUBLIC_ID", "FIRSTNAME", "LASTNAME", "FULLNAME", "OCCUPATION",
+    "PROFILE_PICTURE",
+)
+
+# Flat records of the LINKEDIN_API list endpoints
+FOLLOWERS_SCHEMA = ResponseSchema("network.followers", _people_fields(*PEOPLE_COLUMNS) + [
+    Field("BACKGROUND_PICTURE"),
+    Field("FOLLOWER_COUNT", dtype="Int64"),
+    Field("FOLLOWING", dtype="boolean"),
+    Field("INFLUENCER", dtype="boolean"),
+    Field("DATE_EXTRACT", dtype="category"),
+])
+CONNECTIONS_SCHEMA = ResponseSchema("network.connections", _people_fields(
+    "FIRSTNAME", "LASTNAME", "OCCUPATION", "CREATED_AT", "PROFILE_URL", "PROFILE_PICTURE", "PROFILE_ID",
+    "PUBLIC_ID",
+) + [Field("DATE_EXTRACT", dtype="category")])
+INVITATIONS_RECEIVED_SCHEMA = ResponseSchema("invitation.received", _people_fields(*PEOPLE_COLUMNS) + [
+    Field("MESSAGE"),
+    Field("UNSEEN", dtype="boolean"),
+    Field("SENT_AT"),
+    Field("INVITATION_TYPE", dtype="category"),
+    Field("INVITATION_DESC"),
+    Field("INVITATION_STATUS", dtype="category"),
+    Field("INVITATION_ID"),
+    Field("SHARED_SECRET"),
+])
+INVITATIONS_SENT_SCHEMA = ResponseSchema("invitation.sent", _people_fields(*PEOPLE_COLUMNS) + [
+    Field("MESSAGE"),
+    Field("SENT_AT"),
+    Field("INVITATION_TYPE", dtype="category"),
+    Field("INVITATION_DESC"),
+    Field("INVITATION_STATUS", dtype="category"),
+    Field("INVITATION_ID"),
+    Field("DATE_EXTRACT", dtype="category"),
+])
+CONVERSATIONS_SCHEMA = ResponseSchema("message.conversations", [
+    Field("CONVERSATION_ID"),
+    Field("CONVERSATION_TYPE", dtype="category"),
+    Field("MESSAGE_COUNT", dtype="Int64"),
+    Field("UNREAD_MESSAGE_COUNT", dtype="Int64"),
+    Field("FULLNAME"),
+    Field("PROFILE_URL"),
+    Field("PUBLIC_ID"),
+    Field("PROFILE_ID"),
+    Field("FIRSTNAME"),
+    Field("LASTNAME"),
+    Field("OCCUPATION"),
+    Field("LAST_MESSAGE"),
+    Field("LAST_MESSAGE_SENT_AT"),
+    Field("LAST_READ_AT"),
+    Field("LAST_SENDER_ID", dtype="category"),
+    Field("LAST_SENDER", dtype="category"),
+    Field("DATE_EXTRACT", dtype="category"),
+])
+COMMENTS_SCHEMA = ResponseSchema("post.comments", _people_fields(*PEOPLE_COLUMNS) + [
+    Field("BACKGROUND_PICTURE"),
+    Field("PROFILE_TYPE", dtype="category"),
+    Field("TEXT"),
+    Field("CREATED_TIME"),
+    Field("LANGUAGE", dtype="category"),
+    Field("DISTANCE", dtype="category"),
+    Field("COMMENTS", dtype="Int64"),
+    Field("LIKES", dtype="Int64"),
+    Field("POST_URL", dtype="category"),
+    Field("DATE_EXTRACT", dtype="category"),
+])
+LIKES_SCHEMA = ResponseSchema("post.likes", _people_fields(*PEOPLE_COLUMNS) + [
+    Field("BACKGROUND_PICTURE"),
+    Field("PROFILE_TYPE", dtype="category"),
+    Field("REACTION_TYPE", dtype="category"),
+    Field("POST_URL", dtype="category"),
+    Field("DATE_EXTRACT", dtype="category"),
+])
+COMPANY_FOLLOWERS_SCHEMA = ResponseSchema("company.followers", _people_fields(
+    "FIRSTNAME", "LASTNAME", "OCCUPATION", "PROFILE_PICTURE", "PROFILE_URL", "PROFILE_ID", "PUBLIC_ID",
+    "FOLLOWED_AT",
+) + [Field("DISTANCE", dtype="category"), Field("DATE_EXTRACT", dtype="category")])
+RESUME_SCHEMA = ResponseSchema("profile.resume", [
+    Field("PROFILE_ID"),
+    Field("PROFILE_URL"),
+    Field("FULL_NAME"),
+    Field("CATEGORY", dtype="category"),
+    Field("TITLE"),
+    Field("DATE_START"),
+    Field("DATE_END"),
+    Field("PLACE_ID"),
+    Field("PLACE"),
+    Field("FIELD"),
+    Field("LOCATION", dtype="category"),
+    Field("DESCRIPTION"),
+    Field("DATE_EXTRACT", dtype="category"),
+])
+TOP_CARD_SCHEMA = ResponseSchema("profile.top_card", _people_fields(
+    "PROFILE_ID", "PROFILE_URL", "FIRSTNAME", "LASTNAME", "OCCUPATION", "CONNECTIONS",
+) + [Field("HASHTAGS", dtype="object")] + _people_fields(
+    "LOCATION", "COMPANY_NAME", "COMPANY_URL", "DATE_START", "DATE_END", "SCHOOL_NAME", "SCHOOL_URL",
+) + [Field("FOLLOWER_COUNT", dtype="Int64"), Field("DATE_EXTRACT", dtype="category")])
+
+
+def _post_fields(*first):
+    """
+    Fields of the posts returned by the LINKEDIN_API feed and stats endpoints,
+    after the `first` columns.
+    """
+    return [Field(column) for column in ("ACTIVITY_ID",) + first] + [
+        Field("AUTHOR_NAME", dtype="category"),
+        Field("AUTHOR_URL", dtype="category"),
+        Field("SUBDESCRIPTION"),
+        Field("TITLE"),
+        Field("TEXT"),
+        Field("CHARACTER_COUNT", dtype="Int64"),
+        Field("TAGS", dtype="object"),
+        Field("TAGS_COUNT", dtype="Int64"),
+        Field("EMOJIS", dtype="object"),
+        Field("EMOJIS_COUNT", dtype="Int64"),
+        Field("LINKS", dtype="object"),
+        Field("LINKS_COUNT", dtype="Int64"),
+        Field("PROFILE_MENTION", dtype="object"),
+        Field("COMPANY_MENTION", dtype="object"),
+        Field("CONTENT", dtype="category"),
+        Field("CONTENT_TITLE"),
+        Field("CONTENT_URL"),
+        Field("CONTENT_ID"),
+        Field("IMAGE_URL"),
+        Field("POLL_ID"),
+        Field("POLL_QUESTION"),
+        Field("POLL_RESULTS", dtype="object"),
+        Field("POST_URL"),
+        Field("VIEWS", dtype="Int64"),
+        Field("COMMENTS", dtype="Int64"),
+        Field("LIKES", dtype="Int64"),
+        Field("SHARES", dtype="Int64"),
+        Field("ENGAGEMENT_SCORE", dtype="Float64"),
+        Field("DATE_EXTRACT", dtype="category"),
+    ]
+
+
+PROFILE_POSTS_SCHEMA = ResponseSchema("profile.posts_feed", _post_fields("PAGINATION_TOKEN", "PUBLISHED_DATE"))
+COMPANY_POSTS_SCHEMA = ResponseSchema("company.posts_feed", _post_fields("PUBLISHED_DATE"))
+POST_STATS_SCHEMA = ResponseSchema("post.stats", _post_fields())
+POLLS_SCHEMA = ResponseSchema("post.polls", _people_fields(*PEOPLE_COLUMNS) + [
+    Field("BACKGROUND_PICTURE"),
+    Field("POLL_ID", dtype="category"),
+    Field("POLL_QUESTION", dtype="category"),
+    Field("POLL_RESULT", dtype="category"),
+    Field("POST_URL", dtype="category"),
+    Field("DATE_EXTRACT", dtype="category"),
+])
+GUESTS_SCHEMA = ResponseSchema("event.guests", _people_fields(
+    "FULLNAME", "PROFILE_ID", "PROFILE_URL", "PUBLIC_ID", "OCCUPATION",
+) + [
+    Field("LOCATION", dtype="category"),
+    Field("DISTANCE", dtype="category"),
+    Field("DATE_EXTRACT", dtype="category"),
+])
+COMPANY_INFO_SCHEMA = ResponseSchema("company.info", [
+    Field("COMPANY_ID"),
+    Field("COMPANY_URL"),
+    Field("COMPANY_NAME"),
+    Field("UNIVERSAL_NAME"),
+    Field("LOGO_URL"),
+    Field("INDUSTRY_ID"),
+    Field("INDUSTRY", dtype="category"),
+    Field("WEBSITE"),
+    Field("TAGLINE"),
+    Field("SPECIALITIES", dtype="object"),
+    Field("DESCRIPTION"),
+    Field("COUNTRY", dtype="category"),
+    Field("REGION", dtype="category"),
+    Field("CITY", dtype="category"),
+    Field("STAFF_COUNT", dtype="Int64"),
+    Field("STAFF_RANGE", dtype="category"),
+    Field("FOLLOWER_COUNT", dtype="Int64"),
+    Field("DATE_EXTRACT", dtype="category"),
+])
+
+
+class Profile(LinkedIn):
+    def __init__(self, cookies, headers):
+        LinkedIn.__init__(self)
+        self.cookies = cookies
+        self.headers = headers
+
+    def get_identity(self, profile_url=None, sleep=True, bypass_cache=False, to="pandas", path=None):
+        """
+        Return an dataframe object with 15 columns:
+        - FIRSTNAME
+        - LASTNAME
+        - SUMMARY
+        - OCCUPATION
+        - INDUSTRY_NAME
+        - ADDRESS
+        - REGION
+        - COUNTRY
+        - LOCATION
+        - BIRTHDATE
+        - PROFILE_ID
+        - PROFILE_URL
+        - PUBLIC_ID
+        - BACKGROUND_PICTURE
+        - PROFILE_PICTURE
+
+        Parameters
+        ----------
+        profile_url: str:
+            Profile URL from LinkedIn.
+            Example : "https://www.linkedin.com/in/florent-ravenel/"
+
+        bypass_cache: boolean (default False):
+            Ignore the cached response when a response_cache is set.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+        """
+        res_json = {}
+        if profile_url is None:
+            print("❌ No profile URL. Please enter a profile URL from LinkedIn")
+            return res_json
+        pace = (lambda: time.sleep(TIME_SLEEP)) if sleep else None
+        df = IDENTITY_SCHEMA.frame([self._identity_record(profile_url, bypass_cache=bypass_cache, pace=pace)])
+        return self.export(df, to, path, IDENTITY_SCHEMA)
+
+    def _identity_record(self, profile_url, bypass_cache=False, pace=None):
+        """
+        Return the identity row of a profile as a dict, pace() is called before the request.
+        """
+        lk_public_id = LinkedIn.get_profile_id(profile_url)
+        req_url = (
+            f"{self.voyager_url}/identity/profiles/{lk_public_id}"
+        )
+
+        def fetch():
+            if pace is not None:
+                pace()
+            res = requests.get(req_url, cookies=self.cookies, headers=self.headers)
+            # Raise error
+            res.raise_for_status()
+            return res.json()
+
+        # Parse json
+        res_json = self._get_json(
+            "profile.identity", {"profile_id": LinkedIn._cache_profile_id(lk_public_id)}, fetch, bypass_cache
+        )
+        result = IDENTITY_SCHEMA.extract(res_json)
+        if result["PROFILE_ID"] and result["PUBLIC_ID"]:
+            self._get_urn_cache().put(result["PUBLIC_ID"], result["PROFILE_ID"])
+        return result
+
+    def get_profile_data(self, profile_url=None, sleep=True):
+        """
+        Return the profile as the dict produced by core.profile.extract_profile
+        (filename, profile_url, intro, about, experience, education, certificate,
+        projects, volunteering, skills, honor, organizations), using Voyager HTTP
+        requests only, no browser.
+
+        Parameters
+        ----------
+        profile_url: str:
+            Profile URL from LinkedIn.
+            Example : "https://www.linkedin.com/in/florent-ravenel/"
+        """
+        if profile_url is None:
+            print("❌ No profile URL. Please enter a profile URL from LinkedIn")
+            return None
+        lk_public_id = LinkedIn.get_profile_id(profile_url)
+        base_url = f"{self.voyager_url}/identity/profiles/{lk_public_id}"
+
+        res = requests.get(base_url, cookies=self.cookies, headers=self.headers)
+        res.raise_for_status()
+        identity = res.json().get("data", {})
+
+        # Network info is optional (followers / connections)
+        network = {}
+        res = requests.get(f"{base_url}/networkinfo", cookies=self.cookies, headers=self.headers)
+        if res.status_code == 200:
+            network = res.json().get("data", {})
+
+        sections = {}
+        for key, endpoint in PROFILE_SECTION_ENDPOINTS.items():
+            res = requests.get(
+                f"{base_url}/{endpoint}",
+                params={"count": 100},
+                cookies=self.cookies,
+                headers=self.headers,
+            )
+            if res.status_code != 200:
+                sections[key] = []
+                continue
+            sections[key] = get_elements(res.json())
+
+        if sleep:
+            time.sleep(TIME_SLEEP)
+        return build_profile_data(profile_url, identity, network, sections)
+
+    def save_profile_list(self, url_list, save_folder="./linkedin", sleep=True, store=None):
+        """
+        Browserless counterpart of LinkedinSearch.search_linkedin_profile_list:
+        fetches each profile with get_profile_data and saves it to {save_folder}/{username}.json,
+        or to store (a ProfileStore) when given.
+        Profiles already saved are skipped.
+
+        Return the list of saved file paths (profile urls when saving to a store).
+        """
+        if store is None:
+            os.makedirs(save_folder, exist_ok=True)
+        saved = []
+        for url in url_list:
+            file_path = os.path.join(save_folder, f"{extract_and_decode_username(url)}.json")
+            if store.has(url) if store is not None else os.path.exists(file_path):
+                print(f"Profile {url} already exists")
+                continue
+            try:
+                profile_data = self.get_profile_data(url, sleep=sleep)
+            except requests.HTTPError as e:
+                print(f"❌ Could not fetch profile {url}: {e}")
+                continue
+            if store is not None:
+                store.save(profile_data)
+                saved.append(url)
+            else:
+                save_to_json(profile_data, file_path)
+                saved.append(file_path)
+        return saved
+
+    def get_network(self, profile_url=None, sleep=True, bypass_cache=False, to="pandas", path=None):
+        """
+        Return an dataframe object with 7 columns:
+        - PROFILE_ID
+        - PROFILE_URL
+        - DISTANCE
+        - FOLLOWING
+        - FOLLOWABLE
+        - FOLLOWERS_COUNT
+
+        Parameters
+        ----------
+        profile_url: str:
+            Profile URL from LinkedIn.
+            Example : "https://www.linkedin.com/in/florent-ravenel/"
+
+        bypass_cache: boolean (default False):
+            Ignore the cached response when a response_cache is set.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+        """
+        res_json = {}
+        if profile_url is None:
+            print("❌ No profile URL. Please enter a profile URL from LinkedIn")
+            return res_json
+        pace = (lambda: time.sleep(TIME_SLEEP)) if sleep else None
+        df = NETWORK_SCHEMA.frame([self._network_record(profile_url, bypass_cache=bypass_cache, pace=pace)])
+        return self.export(df, to, path, NETWORK_SCHEMA)
+
+    def _network_record(self, profile_url, bypass_cache=False, pace=None):
+        """
+        Return the network row of a profile as a dict, pace() is called before the request.
+        """
+        lk_id = LinkedIn.get_profile_id(profile_url)
+        req_url = f"{self.voyager_url}/identity/profiles/{lk_id}/networkinfo"
+
+        def fetch():
+            if pace is not None:
+                pace()
+            res = requests.get(req_url, cookies=self.cookies, headers=self.headers)
+            # Raise error
+            res.raise_for_status()
+            return res.json()
+
+        # Parse json
+        res_json = self._get_json(
+            "profile.network", {"profile_id": LinkedIn._cache_profile_id(lk_id)}, fetch, bypass_cache
+        )
+        return NETWORK_SCHEMA.extract(res_json)
+
+    def get_contact(self, profile_url=None, sleep=True, bypass_cache=False, to="pandas", path=None):
+        """
+        Return an dataframe object with 11 columns:
+        - PROFILE_ID
+        - PROFILE_URL
+        - EMAIL
+        - CONNECTED_AT
+        - BIRTHDATE
+        - ADDRESS
+        - TWITTER
+        - PHONENUMBER
+        - WEBSITES
+        - INTERESTS
+
+        Parameters
+        ----------
+        profile_url: str:
+            Profile URL from LinkedIn.
+            Example : "https://www.linkedin.com/in/florent-ravenel/"
+
+        bypass_cache: boolean (default False):
+            Ignore the cached response when a response_cache is set.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+        """
+        res_json = {}
+        if profile_url is None:
+            print("❌ No profile URL. Please enter a profile URL from LinkedIn")
+            return res_json
+        pace = (lambda: time.sleep(TIME_SLEEP)) if sleep else None
+        df = CONTACT_SCHEMA.frame([self._contact_record(profile_url, bypass_cache=bypass_cache, pace=pace)])
+        return self.export(df, to, path, CONTACT_SCHEMA)
+
+    def _contact_record(self, profile_url, bypass_cache=False, pace=None):
+        """
+        Return the contact row of a profile as a dict, pace() is called before the request.
+        """
+        lk_id = LinkedIn.get_profile_id(profile_url)
+        req_url = f"{self.voyager_url}/identity/profiles/{lk_id}/profileContactInfo"
+
+        def fetch():
+            if pace is not None:
+                pace()
+            res = requests.get(req_url, cookies=self.cookies, headers=self.headers)
+            res.raise_for_status()
+            return res.json()
+
+        # Parse json
+        res_json = self._get_json(
+            "profile.contact", {"profile_id": LinkedIn._cache_profile_id(lk_id)}, fetch, bypass_cache
+        )
+        return CONTACT_SCHEMA.extract(res_json)
+
+    def _get_many(self, record, schema, profile_urls, workers, bypass_cache, to="pandas", path=None):
+        """
+        Fetch record(profile_url) for every url with `workers` threads paced by
+        RATE_BUDGET, and build one DataFrame typed by schema. A failed profile
+        gives a row with only INPUT_URL and ERROR set.
+        """
+        def fetch(profile_url):
+            try:
+                row = record(profile_url, bypass_cache=bypass_cache, pace=RATE_BUDGET.acquire)
+                error = None
+            except Exception as e:
+                row = {}
+                error = f"{type(e).__name__}: {e}"
+            return dict(row, INPUT_URL=profile_url, ERROR=error)
+
+        profile_urls = list(profile_urls)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            records = list(executor.map(fetch, profile_urls))
+        schema = ResponseSchema(schema.name, [Field("INPUT_URL")] + schema.fields + [Field("ERROR")])
+        return self.export(schema.frame(records), to, path, schema)
+
+    def get_identities(self, profile_urls, workers=4, bypass_cache=False, to="pandas", path=None):
+        """
+        Return one dataframe with the get_identity columns for every profile url,
+        in input order, plus:
+        - INPUT_URL                     string
+        - ERROR                         string (None when the profile was fetched)
+
+        Parameters
+        ----------
+        profile_urls: list:
+            Profile URLs from LinkedIn.
+
+        workers: int (default 4):
+            Number of concurrent requests, paced by the shared RATE_BUDGET.
+
+        bypass_cache: boolean (default False):
+            Ignore the cached responses when a response_cache is set.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+        """
+        return self._get_many(self._identity_record, IDENTITY_SCHEMA, profile_urls, workers, bypass_cache, to, path)
+
+    def get_networks(self, profile_urls, workers=4, bypass_cache=False, to="pandas", path=None):
+        """
+        Return one dataframe with the get_network columns for every profile url,
+        see get_identities.
+        """
+        return self._get_many(self._network_record, NETWORK_SCHEMA, profile_urls, workers, bypass_cache, to, path)
+
+    def get_contacts(self, profile_urls, workers=4, bypass_cache=False, to="pandas", path=None):
+        """
+        Return one dataframe with the get_contact columns for every profile url,
+        see get_identities.
+        """
+        return self._get_many(self._contact_record, CONTACT_SCHEMA, profile_urls, workers, bypass_cache, to, path)
+
+    def get_resume(self, profile_url=None, profile_urn=None, bypass_cache=False, to="pandas", path=None):
+        """
+        Return an dataframe object with 13 columns:
+        - PROFILE_ID                    object
+        - PROFILE_URL                   object
+        - FULL_NAME                     object
+        - CATEGORY                      object
+        - TITLE                         object
+        - DATE_START                    object
+        - DATE_END                      object
+        - PLACE_ID                      object
+        - PLACE                         object
+        - FIELD                         object
+        - LOCATION                      object
+        - DESCRIPTION                   object
+        - DATE_EXTRACT                  object
+
+        Parameters
+        ----------
+        profile_url: str:
+            Profile URL from LinkedIn.
+            Example : "https://www.linkedin.com/in/florent-ravenel/"
+
+        bypass_cache: boolean (default False):
+            Ignore the cached response when a response_cache is set.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+        """
+        res_json = {}
+        if profile_url is None:
+            print("❌ No profile URL. Please enter a profile URL from LinkedIn")
+            return res_json
+        if profile_urn is None:
+            profile_urn = LinkedIn.get_profile_urn(self, profile_url)
+            if profile_urn is None:
+                return "Please enter a valid profile_url or profile_urn"
+        req_url = f"{self.api_url}/profile/getResume?profile_urn={profile_urn}"
+
+        def fetch():
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+            return res.json()
+
+        # Get json result
+        res_json = self._get_json("profile.resume", {"profile_urn": profile_urn}, fetch, bypass_cache)
+        df = pd.DataFrame(res_json)
+        return self.export(df.reset_index(drop=True), to, path, RESUME_SCHEMA)
+
+    def get_top_card(self, profile_url=None, bypass_cache=False, to="pandas", path=None):
+        """
+        Return an dataframe object with 18 columns:
+        - PROFILE_ID
+        - PROFILE_URL
+        - FIRSTNAME
+        - LASTNAME
+        - LASTNAME
+        - OCCUPATION
+        - CONNECTIONS
+        - HASHTAGS
+        - LOCATION
+        - COMPANY_NAME
+        - COMPANY_URL
+        - DATE_START
+        - DATE_END
+        - SCHOOL_NAME
+        - SCHOOL_URL
+        - FOLLOWER_COUNT
+        - DATE_EXTRACT
+
+        Parameters
+        ----------
+        profile_url: str:
+            Profile URL from LinkedIn.
+            Example : "https://www.linkedin.com/in/florent-ravenel/"
+
+        bypass_cache: boolean (default False):
+            Ignore the cached response when a response_cache is set.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+        """
+        res_json = {}
+        if profile_url is None:
+            print("❌ No profile URL. Please enter a profile URL from LinkedIn")
+            return res_json
+        profile_id = LinkedIn.get_profile_id(profile_url)
+        if profile_id is None:
+            return "Please enter a valid profile_url. It must follow this pattern: 'https://*.linkedin.com/in/*' "
+        req_url = f"{self.api_url}/profile/getTopCard?profile_id={profile_id}"
+
+        def fetch():
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+            return res.json()
+
+        # Get json result
+        res_json = self._get_json(
+            "profile.top_card", {"profile_id": LinkedIn._cache_profile_id(profile_id)}, fetch, bypass_cache
+        )
+        df = pd.DataFrame(res_json)
+        return self.export(df.reset_index(drop=True), to, path, TOP_CARD_SCHEMA)
+
+    def get_posts_feed(
+            self,
+            profile_url,
+            profile_id=None,
+            count=1,
+            limit=10,
+            until={},
+            sleep=True,
+            pagination_token=None,
+            to="pandas",
+            path=None,
+    ):
+        """
+        Return an dataframe object with 32 columns:
+        - ACTIVITY_ID                   object
+        - PAGINATION_TOKEN              object
+        - PUBLISHED_DATE                object
+        - AUTHOR_NAME                   object
+        - AUTHOR_URL                    object
+        - SUBDESCRIPTION                object
+        - TITLE                         object
+        - TEXT                          object
+        - CHARACTER_COUNT               int64
+        - TAGS                          object
+        - TAGS_COUNT                    int64
+        - EMOJIS                        object
+        - EMOJIS_COUNT                  int64
+        - LINKS                         object
+        - LINKS_COUNT                   int64
+        - PROFILE_MENTION               object
+        - COMPANY_MENTION               object
+        - CONTENT                       object
+        - CONTENT_TITLE                 object
+        - CONTENT_URL                   object
+        - CONTENT_ID                    object
+        - IMAGE_URL                     object
+        - POLL_ID                       object
+        - POLL_QUESTION                 object
+        - POLL_RESULTS                  object
+        - POST_URL                      object
+        - VIEWS                         int64
+        - COMMENTS                      int64
+        - LIKES                         int64
+        - SHARES                        int64
+        - ENGAGEMENT_SCORE              float64
+        - DATE_EXTRACT                  object
+
+        Parameters
+        ----------
+        profile_url: str:
+            Profile url from Linkedin.
+            Example : "https://www.linkedin.com/in/florent-ravenel/"
+
+        profile_id: str (default None):
+            Linkedin unique profile id identifier
+            Example : "ACoAABCNSioBW3YZHc2lBHVG0E_TXYWitQkmwog"
+
+        count: int (default 1, max 100):
+            Number of requests sent to LinkedIn API.
+            (!) If count > 1, published date will not be returned.
+
+        limit: int (default 10, unlimited=-1):
+            Number of posts return by function. It will start with the most recent post.
+
+        until: dict (default {})
+            Dict to be set by end user to limit function:
+            - key must a columns of the dataframe
+            - value must exists in key columns
+            Example : "{"POST_URL": "https://www.linkedin.com/posts/naas-ai_opensource-data-activity-6890025972754710529-akfv"
+
+        sleep: boolean (default True):
+            Sleeping time between function will be randomly between 3 to 5 seconds.
+
+        pagination_token: str (default None):
+            Token related to post used to start function from this post.
+            If None, function starts from the last post.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+
+        """
+        # Get profile
+        if profile_id is None:
+            profile_id = LinkedIn.get_profile_urn(self, profile_url)
+            if profile_id is None:
+                return "Please enter a valid profile_url or profile_urn"
+        # Until init
+        until_check = False
+        keys = []
+        if isinstance(until, dict) and len(until) > 0:
+            keys = [k for k, v in until.items()]
+        # Loop init
+        start = 0
+        df = pd.DataFrame()
+        if limit != -1 and count > limit:
+            limit = count
+        while True:
+            if pagination_token is not None:
+                req_url = f"{self.api_url}/profile/getPostsFeed?profile_id={profile_id}&count={count}&pagination_token={pagination_token}"
+            else:
+                req_url = f"{self.api_url}/profile/getPostsFeed?profile_id={profile_id}&count={count}"
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+
+            # Get json result
+            res_json = res.json()
+            if len(res_json) == 0:
+                break
+            # Get response in dataframe
+            tmp_df = pd.DataFrame(res_json)
+
+            # Check until limit
+            for k in keys:
+                v = until.get(k)
+                if k in tmp_df.columns:
+                    values = tmp_df[k].astype(str).unique().tolist()
+                    if str(v) in values:
+                        until_check = True
+                        break
+            # Get pagination token + update start
+            pagination_token = tmp_df.loc[0, "PAGINATION_TOKEN"]
+
+            # Concat dataframe
+            df = pd.concat([df, tmp_df], axis=0)
+
+            # Break if until condition is True
+            if until_check:
+                break
+            # Time sleep to avoid linkedin ban
+            if sleep:
+                time.sleep(TIME_SLEEP)
+            start += count
+            if limit != -1 and start >= limit:
+                break
+        return self.export(df.reset_index(drop=True), to, path, PROFILE_POSTS_SCHEMA)
+
+
+class Network(LinkedIn):
+    def __init__(self, cookies, headers):
+        LinkedIn.__init__(self)
+        self.cookies = cookies
+        self.headers = headers
+
+    def get_followers(self, start=0, count=100, limit=1000, to="pandas", path=None):
+        """
+        Return an dataframe object with 13 columns:
+        - PROFILE_ID                    string
+        - PROFILE_URL                   string
+        - PUBLIC_ID                     string
+        - FIRSTNAME                     string
+        - LASTNAME                      string
+        - FULLNAME                      string
+        - OCCUPATION                    string
+        - PROFILE_PICTURE               string
+        - BACKGROUND_PICTURE            string
+        - FOLLOWER_COUNT                Int64
+        - FOLLOWING                     boolean
+        - INFLUENCER                    boolean
+        - DATE_EXTRACT                  category
+
+        Parameters
+        ----------
+        start: int (default 0):
+            Starting requests to LinkedIn API.
+
+        count: int (default 100, max 100):
+            Number of requests sent to LinkedIn API.
+
+        limit: int (default 1000, unlimited=-1):
+            Number of result return by function.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+
+        """
+        limit_init = limit
+        records = []
+        if limit != -1 and limit < count:
+            count = limit
+        while True:
+            req_url = f"{self.api_url}/network/getFollowers?start={start}&count={count}&limit={limit}"
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+
+            # Get json result
+            res_json = res.json()
+            if len(res_json) == 0:
+                break
+            records.extend(res_json)
+            start += count
+            if limit != -1 and start >= limit:
+                break
+            time.sleep(TIME_SLEEP)
+        df_followers = FOLLOWERS_SCHEMA.frame(records)
+        if len(df_followers) > 0:
+            df_followers = df_followers.drop_duplicates("PROFILE_ID").reset_index(
+                drop=True
+            )
+            if limit != -1:
+                df_followers = df_followers[:limit_init]
+        return self.export(df_followers.reset_index(drop=True), to, path, FOLLOWERS_SCHEMA)
+
+    def get_connections(self, start=0, count=100, limit=1000, to="pandas", path=None):
+        """
+        Return an dataframe object with 9 columns:
+        - FIRSTNAME                     string
+        - LASTNAME                      string
+        - OCCUPATION                    string
+        - CREATED_AT                    string
+        - PROFILE_URL                   string
+        - PROFILE_PICTURE               string
+        - PROFILE_ID                    string
+        - PUBLIC_ID                     string
+        - DATE_EXTRACT                  category
+
+        Parameters
+        ----------
+        start: int (default 0):
+            Starting requests to LinkedIn API.
+
+        count: int (default 100, max 100):
+            Number of requests sent to LinkedIn API.
+
+        limit: int (default 1000, unlimited=-1):
+            Number of result return by function.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+
+        """
+        records = []
+        if limit != -1 and limit < count:
+            count = limit
+        while True:
+            req_url = f"{self.api_url}/network/getConnections?start={start}&count={count}&limit={limit}"
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+
+            # Get json result
+            res_json = res.json()
+            if len(res_json) == 0:
+                break
+            records.extend(res_json)
+            start += count
+            if limit != -1 and start >= limit:
+                break
+            time.sleep(TIME_SLEEP)
+        df_connections = (
+            CONNECTIONS_SCHEMA.frame(records)
+            .drop_duplicates()
+            .sort_values(by="CREATED_AT", ascending=False)
+        )
+        return self.export(df_connections.reset_index(drop=True), to, path, CONNECTIONS_SCHEMA)
+
+
+class Invitation(LinkedIn):
+    def __init__(self, cookies, headers):
+        LinkedIn.__init__(self)
+        self.cookies = cookies
+        self.headers = headers
+
+    def get_received(self, start=0, count=100, limit=-1, to="pandas", path=None):
+        """
+        Return an dataframe object with 16 columns:
+        - PROFILE_ID
+        - PROFILE_URL
+        - PUBLIC_ID
+        - FIRSTNAME
+        - LASTNAME
+        - FULLNAME
+        - OCCUPATION
+        - PROFILE_PICTURE
+        - MESSAGE
+        - UNSEEN
+        - SENT_AT
+        - INVITATION_TYPE
+        - INVITATION_DESC
+        - INVITATION_STATUS
+        - INVITATION_ID
+        - SHARED_SECRET
+
+        Parameters
+        ----------
+        start: int (default 0):
+            Starting requests to LinkedIn API.
+
+        count: int (default 100, max 100):
+            Number of requests sent to LinkedIn API.
+
+        limit: int (default -1, unlimited=-1):
+            Number of result return by function.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+
+        """
+        records = []
+        while True:
+            if limit != -1 and limit < count:
+                count = limit
+            req_url = f"{self.api_url}/invitation/get?start={start}&count={count}"
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+
+            # Get json result
+            res_json = res.json()
+            if len(res_json) == 0:
+                break
+            records.extend(res_json)
+            start += count
+            if limit != -1:
+                limit -= count
+            time.sleep(TIME_SLEEP)
+        return self.export(INVITATIONS_RECEIVED_SCHEMA.frame(records), to, path, INVITATIONS_RECEIVED_SCHEMA)
+
+    def get_sent(self, start=0, count=100, limit=-1, to="pandas", path=None):
+        """
+        Return an dataframe object with 15 columns:
+        - PROFILE_ID                    string
+        - PROFILE_URL                   string
+        - PUBLIC_ID                     string
+        - FIRSTNAME                     string
+        - LASTNAME                      string
+        - FULLNAME                      string
+        - OCCUPATION                    string
+        - PROFILE_PICTURE               string
+        - MESSAGE                       string
+        - SENT_AT                       string
+        - INVITATION_TYPE               category
+        - INVITATION_DESC               string
+        - INVITATION_STATUS             category
+        - INVITATION_ID                 string
+        - DATE_EXTRACT                  category
+
+        Parameters
+        ----------
+        start: int (default 0):
+            Starting requests to LinkedIn API.
+
+        count: int (default 100, max 100):
+            Number of requests sent to LinkedIn API.
+
+        limit: int (default -1, unlimited=-1):
+            Number of result return by function.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+
+        """
+        records = []
+        while True:
+            if limit != -1 and limit < count:
+                count = limit
+            req_url = f"{self.api_url}/invitation/getSent?start={start}&count={count}"
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+
+            # Get json result
+            res_json = res.json()
+            if len(res_json) == 0:
+                break
+            records.extend(res_json)
+            start += count
+            if limit != -1:
+                limit -= count
+            time.sleep(TIME_SLEEP)
+        return self.export(INVITATIONS_SENT_SCHEMA.frame(records), to, path, INVITATIONS_SENT_SCHEMA)
+
+    def response(
+            self,
+            action="accept",
+            invitation_id=None,
+            invitation_shared_secret=None,
+            is_generic=False,
+    ):
+        """
+        Print result : "Accept" or "Ignore"
+        Return dataframe profile if invitation type = "Profile"
+
+        Parameters
+        ----------
+        action: str (default 'accept')
+            "accept" or "ignore"
+
+        invitation_id: str (default None)
+            Argument given in invitations.get : "INVITATION_ID"
+
+        invitation_shared_secret: str (default None)
+            Argument given in invitations.get : "SHARED_SECRET"
+
+        is_generic: boolean (default False):
+            Must be True for generic invitation, if "INVITATION_TYPE" != "Profile"
+        """
+        params = {
+            "action": action,
+            "invitation_id": invitation_id,
+            "invitation_shared_secret": invitation_shared_secret,
+            "is_generic": is_generic,
+        }
+        req_url = f"{self.api_url}/invitation/response?{urllib.parse.urlencode(params, safe='(),')}"
+        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+        res.raise_for_status()
+        res_json = res.json()
+        if action == "accept":
+            print("🤝 Invitation accepted !")
+        elif action == "ignore":
+            print("❌ Invitation ignored !")
+        return pd.DataFrame(res_json)
+
+    def accept(
+            self, invitation_id=None, invitation_shared_secret=None, is_generic=False
+    ):
+        """
+        Return dataframe profile if invitation type = "Profile"
+
+        Parameters
+        ----------
+        invitation_id: str (default None)
+            Argument given in invitations.get : "INVITATION_ID"
+
+        invitation_shared_secret: str (default None)
+            Argument given in invitations.get : "SHARED_SECRET"
+
+        is_generic: boolean (default False):
+            Must be True for generic invitation, if "INVITATION_TYPE" != "Profile"
+        """
+        return self.response(
+            "accept", invitation_id, invitation_shared_secret, is_generic
+        )
+
+    def ignore(
+            self, invitation_id=None, invitation_shared_secret=None, is_generic=False
+    ):
+        """
+        Return dataframe profile if invitation type = "Profile"
+
+        Parameters
+        ----------
+        invitation_id: str (default None)
+            Argument given in invitations.get : "INVITATION_ID"
+
+        invitation_shared_secret: str (default None)
+            Argument given in invitations.get : "SHARED_SECRET"
+
+        is_generic: boolean (default False):
+            Must be True for generic invitation, if "INVITATION_TYPE" != "Profile"
+        """
+        return self.response(
+            "ignore", invitation_id, invitation_shared_secret, is_generic
+        )
+
+    def send(self, recipient_url=None, message=None):
+        """
+        Return res.json()
+
+        Parameters
+        ----------
+        recipient_url: str: (default None)
+            Profile url from Linkedin.
+            Example : "https://www.linkedin.com/in/florent-ravenel/"
+
+        message: str: (default None)
+            Message send with invitation. Must not exceed characters 300 characters.
+            Example : "Hi, \nI will be happy to connect with you."
+        """
+        if recipient_url is not None:
+            recipient_id = self.get_profile_urn(recipient_url)
+        # Set payload
+        payload = {"inviteeProfileUrn": f"urn:li:fsd_profile:{recipient_id}"}
+        # Add message in your invitations
+        if message:
+            # Validating message length (max size is 300 characters)
+            if len(message) < 300:
+                payload["customMessage"] = message
+            else:
+                raise BaseException(
+                    f"Message too long ({len(message)} characters). Max size is 300 characters"
+                )
+        # Post request
+        req_url = f"{self.voyager_url}/voyagerRelationshipsDashMemberRelationships?action=verifyQuotaAndCreate"
+        res = requests.post(
+            req_url,
+            data=json.dumps(payload),
+            cookies=self.cookies,
+            headers=self.headers,
+        )
+        res.raise_for_status()
+        time.sleep(TIME_SLEEP)
+        return "✉️ Invitation successfully sent !"
+
+
+class Message(LinkedIn):
+    def __init__(self, cookies, headers):
+        LinkedIn.__init__(self)
+        self.cookies = cookies
+        self.headers = headers
+
+    def get_conversations(
+            self,
+            limit=20,
+            sleep=True,
+            to="pandas",
+            path=None,
+    ):
+        """
+        Fetches the conversations from LinkedIn API.
+
+        This function sends a POST request to Naas LinkedIn's API endpoint to retrieve conversation data.
+        It retrieves the data in batches (default batch size is 20) and concatenates the results into a pandas DataFrame.
+        The function continues to fetch data until the specified limit is reached, or until there are no more conversations to fetch.
+        An optional sleep parameter can be used to introduce a delay between requests to avoid hitting API rate limits.
+
+        Parameters:
+        limit (int): The maximum number of conversations to fetch. If not specified, defaults to 20. The maximum allowed limit is 600.
+        sleep (bool): Whether to introduce a delay between requests. If not specified, defaults to True.
+        to (str): "pandas" by default, "arrow" for a pyarrow.Table or "parquet" to write it to path, see LinkedIn.export.
+        path (str): Parquet file written when to="parquet".
+
+        Returns:
+        df (pandas.DataFrame): A DataFrame containing the conversation data. The DataFrame consists of the following columns:
+            1. CONVERSATION_ID: The unique identifier for the conversation.
+            2. CONVERSATION_TYPE: The type of conversation (e.g., MEMBER_TO_MEMBER).
+            3. MESSAGE_COUNT: The total number of messages in the conversation.
+            4. UNREAD_MESSAGE_COUNT: The number of unread messages in the conversation.
+            5. FULLNAME: The full name of the other participant in the conversation.
+            6. PROFILE_URL: The LinkedIn profile URL of the other participant.
+            7. PUBLIC_ID: The public identifier of the other participant.
+            8. PROFILE_ID: The profile ID of the other participant.
+            9. FIRSTNAME: The first name of the other participant.
+            10. LASTNAME: The last name of the other participant.
+            11. OCCUPATION: The occupation of the other participant.
+            12. LAST_MESSAGE: The content of the last message in the conversation.
+            13. LAST_MESSAGE_SENT_AT: The timestamp of when the last message was sent.
+            14. LAST_READ_AT: The timestamp of when the last message was read.
+            15. LAST_SENDER_ID: The ID of the last sender.
+            16. LAST_SENDER: The full name of the last sender.
+            17. DATE_EXTRACT: The timestamp of when the conversation data was extracted.
+        """
+
+        # Init
+        records = []
+        count = 20
+        limit_max = 600
+
+        # Set count and limit
+        if limit < count:
+            count = limit
+        if limit > limit_max:
+            limit = limit_max
+
+        params = {"count": count}
+        while True:
+            req_url = f"{self.api_url}/message/getConversations?{urllib.parse.urlencode(params, safe='(),')}"
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+
+            # Get json result
+            res_json = res.json()
+            records.extend(res_json)
+
+            # Check if result is not empty else break
+            if len(res_json) == 0:
+                break
+            if len(records) >= limit:
+                break
+            # Set created before params
+            last_message_sent_at = res_json[-1]["LAST_MESSAGE_SENT_AT"]
+            created_before = int(datetime.strptime(last_message_sent_at, DATETIME_FORMAT).strftime("%s") + "000")
+            params["created_before"] = created_before
+            if sleep:
+                time.sleep(TIME_SLEEP)
+        return self.export(CONVERSATIONS_SCHEMA.frame(records), to, path, CONVERSATIONS_SCHEMA)
+
+    def get_messages(
+            self,
+            conversation_url=None,
+            count=20,
+            limit=20,
+            sleep=False,
+            to="pandas",
+            path=None,
+    ):
+        # Init
+        df = pd.DataFrame()
+        start = 0
+        count = 20
+        limit_max = 100
+
+        # Get conversation ID
+        conversation_id = conversation_url.split(
+            "https://www.linkedin.com/messaging/thread/"
+        )[-1].split("/")[0]
+
+        # Set count and limit
+        if limit < count:
+            count = limit
+        if limit > limit_max:
+            limit = limit_max
+        while True:
+            params = {
+                "conversation_id": conversation_id,
+                "start": start,
+                "count": count,
+            }
+            req_url = f"{self.api_url}/message/getMessages?{urllib.parse.urlencode(params, safe='(),')}"
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+
+            # Get json result
+            res_json = res.json()
+            if len(res_json) > 0:
+                tmp_df = pd.DataFrame(res_json)
+                df = pd.concat([df, tmp_df])
+            # Check if result is not empty else break
+            if len(res_json) == 0 or len(res_json) < count:
+                break
+            if len(df) >= limit:
+                break
+            start += count
+            if sleep:
+                time.sleep(TIME_SLEEP)
+        return self.export(df.reset_index(drop=True), to, path)
+
+    def send(self, content, recipients_url=None, recipients_urn=None):
+        recipient_errors = []
+        params = {"action": "create"}
+        message_event = {
+            "eventCreate": {
+                "value": {
+                    "com.linkedin.voyager.messaging.create.MessageCreate": {
+                        "body": content,
+                        "attachments": [],
+                        "attributedBody": {
+                            "text": content,
+                            "attributes": [],
+                        },
+                        "mediaAttachments": [],
+                    }
+                }
+            }
+        }
+        if type(recipients_url) is str:
+            recipients_url = [recipients_url]
+        if type(recipients_urn) is str:
+            recipients_urn = [recipients_urn]
+        if type(recipients_url) is list:
+            # Recipients are resolved concurrently, see get_profile_urns
+            urns = self.get_profile_urns(recipients_url)
+            recipients_urn = [urns[recipient] for recipient in recipients_url]
+            recipient_errors = [
+                urn for urn in recipients_urn if type(urn) is requests.exceptions.HTTPError
+            ]
+        if len(recipient_errors) > 0:
+            return recipient_errors
+        message_event["recipients"] = recipients_urn
+        message_event["subtype"] = "MEMBER_TO_MEMBER"
+        payload = {
+            "keyVersion": "LEGACY_INBOX",
+            "conversationCreate": message_event,
+        }
+        res = requests.post(
+            f"{self.voyager_url}/messaging/conversations",
+            params=params,
+            json=payload,
+            cookies=self.cookies,
+            headers=self.headers,
+        )
+        time.sleep(TIME_SLEEP)
+        try:
+            res.raise_for_status()
+            return "💬 Message successfully sent !"
+        except requests.HTTPError as e:
+            return e
+
+
+class Post(LinkedIn):
+    def __init__(self, cookies, headers):
+        LinkedIn.__init__(self)
+        self.cookies = cookies
+        self.headers = headers
+
+    def get_stats(self, post_url=None, activity_id=None, bypass_cache=False, to="pandas", path=None):
+        """
+        Return an dataframe object with 30 columns:
+        - ACTIVITY_ID                   object
+        - AUTHOR_NAME                   object
+        - AUTHOR_URL                    object
+        - SUBDESCRIPTION                object
+        - TITLE                         object
+        - TEXT                          object
+        - CHARACTER_COUNT               int64
+        - TAGS                          object
+        - TAGS_COUNT                    int64
+        - EMOJIS                        object
+        - EMOJIS_COUNT                  int64
+        - LINKS                         object
+        - LINKS_COUNT                   int64
+        - PROFILE_MENTION               object
+        - COMPANY_MENTION               object
+        - CONTENT                       object
+        - CONTENT_TITLE                 object
+        - CONTENT_URL                   object
+        - CONTENT_ID                    object
+        - IMAGE_URL                     object
+        - POLL_ID                       object
+        - POLL_QUESTION                 object
+        - POLL_RESULTS                  object
+        - POST_URL                      object
+        - VIEWS                         int64
+        - COMMENTS                      int64
+        - LIKES                         int64
+        - SHARES                        int64
+        - ENGAGEMENT_SCORE              int64
+        - DATE_EXTRACT                  object
+
+        Parameters
+        ----------
+        post_url: str:
+            Post url from Linkedin.
+            Example : "https://www.linkedin.com/posts/j%C3%A9r%C3%A9my-ravenel-8a396910_"
+                      "thoughts-monday-work-activity-6891437034473426945-OOOg"
+
+        activity_id: str (default None):
+            Linkedin unique post id identifier
+            Example : "6891437034473426945"
+
+        bypass_cache: boolean (default False):
+            Ignore the cached response when a response_cache is set.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+
+        """
+        # Get profile
+        if activity_id is None:
+            activity_id = LinkedIn.get_activity_id(post_url)
+            if activity_id is None:
+                return "Please enter a valid post_url or activity_id"
+        req_url = f"{self.api_url}/post/getStats?activity_id={activity_id}"
+
+        def fetch():
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+            return res.json()
+
+        # Get json result
+        res_json = self._get_json("post.stats", {"activity_id": str(activity_id)}, fetch, bypass_cache)
+        return self.export(pd.DataFrame(res_json).reset_index(drop=True), to, path, POST_STATS_SCHEMA)
+
+    def get_polls(self, post_url=None, activity_id=None, to="pandas", path=None):
+        """
+        Return an dataframe object with 14 columns:
+        - PROFILE_ID                    object
+        - PROFILE_URL                   object
+        - PUBLIC_ID                     object
+        - FIRSTNAME                     object
+        - LASTNAME                      object
+        - FULLNAME                      object
+        - OCCUPATION                    object
+        - PROFILE_PICTURE               object
+        - BACKGROUND_PICTURE            object
+        - POLL_ID                       object
+        - POLL_QUESTION                 object
+        - POLL_RESULT                   object
+        - POST_URL                      object
+        - DATE_EXTRACT                  object
+
+        Parameters
+        ----------
+        post_url: str:
+            Post url from Linkedin.
+            Example : "https://www.linkedin.com/posts/j%C3%A9r%C3%A9my-ravenel-8a396910_"
+                      "thoughts-monday-work-activity-6891437034473426945-OOOg"
+
+        activity_id: str (default None):
+            Linkedin unique post id identifier
+            Example : "6891437034473426945"
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+
+        """
+        # Get profile
+        if activity_id is None:
+            activity_id = LinkedIn.get_activity_id(post_url)
+            if activity_id is None:
+                return "Please enter a valid post_url or activity_id"
+        req_url = f"{self.api_url}/post/getPolls?activity_id={activity_id}"
+        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+        res.raise_for_status()
+
+        # Manage LinkedIn API errors
+        LinkedIn.manage_api_error(res)
+
+        # Get json result
+        return self.export(pd.DataFrame(res.json()).reset_index(drop=True), to, path, POLLS_SCHEMA)
+
+    def get_comments(
+            self, post_url=None, activity_id=None, start=0, count=100, limit=-1, sleep=True, to="pandas",
+            path=None,
+    ):
+        """
+        Return an dataframe object with 18 columns:
+        - PROFILE_ID                    string
+        - PROFILE_URL                   string
+        - PUBLIC_ID                     string
+        - FIRSTNAME                     string
+        - LASTNAME                      string
+        - FULLNAME                      string
+        - OCCUPATION                    string
+        - PROFILE_PICTURE               string
+        - BACKGROUND_PICTURE            string
+        - PROFILE_TYPE                  category
+        - TEXT                          string
+        - CREATED_TIME                  string
+        - LANGUAGE                      category
+        - DISTANCE                      category
+        - COMMENTS                      Int64
+        - LIKES                         Int64
+        - POST_URL                      category
+        - DATE_EXTRACT                  category
+
+        Parameters
+        ----------
+        post_url: str:
+            Post url from Linkedin.
+            Example : "https://www.linkedin.com/posts/j%C3%A9r%C3%A9my-ravenel-8a396910_"
+                      "thoughts-monday-work-activity-6891437034473426945-OOOg"
+
+        activity_id: str (default None):
+            Linkedin unique post id identifier
+            Example : "6891437034473426945"
+
+        start: int (default 0):
+            Number of requests sent to LinkedIn API.
+            (!) If count > 1, published date will not be returned.
+
+        count: int (default 1, max 100):
+            Number of requests sent to LinkedIn API.
+            (!) If count > 1, followed at will not be returned.
+
+        limit: int (default 10, unlimited=-1):
+            Number of followers return by function. It will start with the most recent followers.
+
+        sleep: boolean (default True):
+            Sleeping time between function will be randomly between 3 to 5 seconds.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+
+        """
+        # Get profile
+        if activity_id is None:
+            activity_id = LinkedIn.get_activity_id(post_url)
+            if activity_id is None:
+                return "Please enter a valid post_url or activity_id"
+        records = []
+        while True:
+            if limit != -1 and limit < count:
+                count = limit
+            req_url = f"{self.api_url}/post/getComments?activity_id={activity_id}&start={start}&count={count}"
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+
+            # Get json result
+            res_json = res.json()
+            if len(res_json) == 0:
+                break
+            records.extend(res_json)
+            start += count
+            if limit != -1:
+                limit -= count
+            if sleep:
+                time.sleep(TIME_SLEEP)
+        return self.export(COMMENTS_SCHEMA.frame(records), to, path, COMMENTS_SCHEMA)
+
+    def get_likes(
+            self, post_url=None, activity_id=None, start=0, count=100, limit=-1, sleep=True, to="pandas",
+            path=None,
+    ):
+        """
+        Return an dataframe object with 13 columns:
+        - PROFILE_ID                    string
+        - PROFILE_URL                   string
+        - PUBLIC_ID                     string
+        - FIRSTNAME                     string
+        - LASTNAME                      string
+        - FULLNAME                      string
+        - OCCUPATION                    string
+        - PROFILE_PICTURE               string
+        - BACKGROUND_PICTURE            string
+        - PROFILE_TYPE                  category
+        - REACTION_TYPE                 category
+        - POST_URL                      category
+        - DATE_EXTRACT                  category
+
+        Parameters
+        ----------
+        post_url: str:
+            Post url from Linkedin.
+            Example : "https://www.linkedin.com/posts/j%C3%A9r%C3%A9my-ravenel-8a396910_"
+                      "thoughts-monday-work-activity-6891437034473426945-OOOg"
+
+        activity_id: str (default None):
+            Linkedin unique post id identifier
+            Example : "6891437034473426945"
+
+        start: int (default 0):
+            Number of requests sent to LinkedIn API.
+            (!) If count > 1, published date will not be returned.
+
+        count: int (default 1, max 100):
+            Number of requests sent to LinkedIn API.
+            (!) If count > 1, followed at will not be returned.
+
+        limit: int (default 10, unlimited=-1):
+            Number of followers return by function. It will start with the most recent followers.
+
+        sleep: boolean (default True):
+            Sleeping time between function will be randomly between 3 to 5 seconds.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+
+        """
+        # Get profile
+        if activity_id is None:
+            activity_id = LinkedIn.get_activity_id(post_url)
+            if activity_id is None:
+                return "Please enter a valid post_url or activity_id"
+        records = []
+        while True:
+            if limit != -1 and limit < count:
+                count = limit
+            req_url = f"{self.api_url}/post/getLikes?activity_id={activity_id}&start={start}&count={count}"
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+
+            # Get json result
+            res_json = res.json()
+            if len(res_json) == 0:
+                break
+            records.extend(res_json)
+            start += count
+            if limit != -1:
+                limit -= count
+            if sleep:
+                time.sleep(TIME_SLEEP)
+        return self.export(LIKES_SCHEMA.frame(records), to, path, LIKES_SCHEMA)
+
+
+class Event(LinkedIn):
+    def __init__(self, cookies, headers):
+        LinkedIn.__init__(self)
+        self.cookies = cookies
+        self.headers = headers
+
+    def get_guests(
+            self, event_url="https://www.linkedin.com/events/6762355783188525056/", bypass_cache=False,
+            to="pandas", path=None,
+    ):
+        """
+        Return an dataframe object with 8 columns:
+        - FULLNAME                      object
+        - PROFILE_ID                    object
+        - PROFILE_URL                   object
+        - PUBLIC_ID                     object
+        - OCCUPATION                    object
+        - LOCATION                      object
+        - DISTANCE                      object
+        - DATE_EXTRACT                  object
+
+        Parameters
+        ----------
+        event_url: str:
+            Event url from Linkedin.
+            Example : "https://www.linkedin.com/events/6762355783188525056/"
+
+        bypass_cache: boolean (default False):
+            Ignore the cached response when a response_cache is set.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+
+        """
+        req_url = f"{self.api_url}/event/getGuests?event_link={event_url}"
+
+        def fetch():
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+            return res.json()
+
+        res_json = self._get_json("event.guests", {"event_url": event_url.rstrip("/")}, fetch, bypass_cache)
+        return self.export(pd.DataFrame(res_json).reset_index(drop=True), to, path, GUESTS_SCHEMA)
+
+
+class Company(LinkedIn):
+    def __init__(self, cookies, headers, views_cache=None, views_ttl=VIEWS_TTL):
+        """
+        views_cache: dict-like cache of post views per activity id, eg: a
+            diskcache.Cache to keep them across runs. In memory by default.
+        views_ttl: seconds a cached views count is used.
+        """
+        LinkedIn.__init__(self)
+        self.cookies = cookies
+        self.headers = headers
+        self.views_cache = {} if views_cache is None else views_cache
+        self.views_ttl = views_ttl
+
+    def get_info(
+            self, company_url="https://www.linkedin.com/company/naas-ai/", bypass_cache=False, to="pandas", path=None
+    ):
+        """
+        Return an dataframe object with 18 columns:
+        - COMPANY_ID                    object
+        - COMPANY_URL                   object
+        - COMPANY_NAME                  object
+        - UNIVERSAL_NAME                object
+        - LOGO_URL                      object
+        - INDUSTRY_ID                   object
+        - INDUSTRY                      object
+        - WEBSITE                       object
+        - TAGLINE                       object
+        - SPECIALITIES                  object
+        - DESCRIPTION                   object
+        - COUNTRY                       object
+        - REGION                        object
+        - CITY                          object
+        - STAFF_COUNT                   object
+        - STAFF_RANGE                   object
+        - FOLLOWER_COUNT                object
+        - DATE_EXTRACT                  object
+
+        Parameters
+        ----------
+        company_url: str:
+            Company url from Linkedin.
+            Example : "https://www.linkedin.com/company/naas-ai/"
+
+        bypass_cache: boolean (default False):
+            Ignore the cached response when a response_cache is set.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+
+        """
+        df = pd.DataFrame()
+        req_url = f"{self.api_url}/company/getInfo?company_url={company_url}"
+
+        def fetch():
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+            return res.json()
+
+        # Get json result
+        res_json = self._get_json("company.info", {"company_url": company_url.rstrip("/").lower()}, fetch, bypass_cache)
+        df = pd.DataFrame(res_json)
+        return self.export(df.reset_index(drop=True), to, path, COMPANY_INFO_SCHEMA)
+
+    def get_followers(
+            self,
+            company_url="https://www.linkedin.com/company/naas-ai/",
+            start=0,
+            count=1,
+            limit=10,
+            sleep=True,
+            to="pandas",
+            path=None,
+    ):
+        """
+        Return an dataframe object with 11 columns:
+        - FIRSTNAME                     string
+        - LASTNAME                      string
+        - OCCUPATION                    string
+        - PROFILE_PICTURE               string
+        - PROFILE_URL                   string
+        - PROFILE_ID                    string
+        - PUBLIC_ID                     string
+        - FOLLOWED_AT                   string
+        - DISTANCE                      category
+        - DATE_EXTRACT                  category
+
+        Parameters
+        ----------
+        company_url: str:
+            Company url from Linkedin.
+            Example : "https://www.linkedin.com/company/naas-ai/"
+
+        start: int (default 0):
+            Number of requests sent to LinkedIn API.
+            (!) If count > 1, published date will not be returned.
+
+        count: int (default 1, max 100):
+            Number of requests sent to LinkedIn API.
+            (!) If count > 1, followed at will not be returned.
+
+        limit: int (default 10, unlimited=-1):
+            Number of followers return by function. It will start with the most recent followers.
+
+        sleep: boolean (default True):
+            Sleeping time between function will be randomly between 3 to 5 seconds.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+
+        """
+        records = []
+        while True:
+            if limit != -1 and limit < count:
+                count = limit
+            req_url = f"{self.api_url}/company/getFollowers?company_url={company_url}&start={start}&count={count}"
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+
+            # Get json result
+            res_json = res.json()
+            if len(res_json) == 0:
+                break
+            records.extend(res_json)
+            start += count
+            if limit != -1:
+                limit -= count
+            if sleep:
+                time.sleep(TIME_SLEEP)
+        df = COMPANY_FOLLOWERS_SCHEMA.frame(records)
+        if len(df) > 0:
+            df = df.sort_values(by="FOLLOWED_AT", ascending=False)
+        return self.export(df.reset_index(drop=True), to, path, COMPANY_FOLLOWERS_SCHEMA)
+
+    def __get_posts_views(self, activity_id):
+        RATE_BUDGET.acquire()
+        req_url = f"{self.api_url}/company/getPostsViews?activity_id={activity_id}"
+        res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+        res.raise_for_status()
+
+        # Manage LinkedIn API errors
+        LinkedIn.manage_api_error(res)
+
+        # Get result
+        views = res.json().get("VIEWS") or 0
+        self.views_cache[str(activity_id)] = (time.time(), views)
+        return views
+
+    def get_posts_views(self, activity_ids, workers=4):
+        """
+        Return a dict {activity_id: views}.
+
+        Views cached less than views_ttl seconds ago are reused, the others are
+        fetched by `workers` threads within the shared RATE_BUDGET.
+
+        Parameters
+        ----------
+        activity_ids: list:
+            Activity ids of the posts, duplicates are fetched once.
+
+        workers: int (default 4):
+            Number of concurrent requests.
+
+        """
+        views = {}
+        missing = []
+        now = time.time()
+        for activity_id in dict.fromkeys(str(a) for a in activity_ids):
+            cached = self.views_cache.get(activity_id)
+            if cached is not None and now - cached[0] < self.views_ttl:
+                views[activity_id] = cached[1]
+            else:
+                missing.append(activity_id)
+        if missing:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                views.update(zip(missing, executor.map(self.__get_posts_views, missing)))
+        return views
+
+    def get_posts_feed(
+            self,
+            company_url,
+            start=0,
+            count=100,
+            limit=-1,
+            sleep=True,
+            views_workers=4,
+            to="pandas",
+            path=None,
+    ):
+        """
+        Return an dataframe object with 31 columns:
+        - ACTIVITY_ID                   object
+        - PUBLISHED_DATE                object
+        - AUTHOR_NAME                   object
+        - AUTHOR_URL                    object
+        - SUBDESCRIPTION                object
+        - TITLE                         object
+        - TEXT                          object
+        - CHARACTER_COUNT               int64
+        - TAGS                          object
+        - TAGS_COUNT                    int64
+        - EMOJIS                        object
+        - EMOJIS_COUNT                  int64
+        - LINKS                         object
+        - LINKS_COUNT                   int64
+        - PROFILE_MENTION               object
+        - COMPANY_MENTION               object
+        - CONTENT                       object
+        - CONTENT_TITLE                 object
+        - CONTENT_URL                   object
+        - CONTENT_ID                    object
+        - IMAGE_URL                     object
+        - POLL_ID                       object
+        - POLL_QUESTION                 object
+        - POLL_RESULTS                  object
+        - POST_URL                      object
+        - VIEWS                         int64
+        - COMMENTS                      int64
+        - LIKES                         int64
+        - SHARES                        int64
+        - ENGAGEMENT_SCORE              float64
+        - DATE_EXTRACT                  object
+
+        Parameters
+        ----------
+        company_url: str:
+            Company url from Linkedin.
+            Example : "https://www.linkedin.com/company/naas-ai/"
+
+        start: int (default 0):
+            Starting request sent to LinkedIn API.
+
+        count: int (default 1, max 100):
+            Number of requests sent to LinkedIn API.
+            (!) If count > 1, published date will not be returned.
+
+        limit: int (default 10, unlimited=-1):
+            Number of posts return by function. It will start with the most recent post.
+
+        sleep: boolean (default True):
+            Sleeping time between function will be randomly between 5 to 10 seconds.
+
+        views_workers: int (default 4):
+            Number of concurrent views requests, see get_posts_views.
+
+        to: str (default "pandas"):
+            "arrow" returns a pyarrow.Table, "parquet" writes it to path, see LinkedIn.export.
+
+        path: str (default None):
+            Parquet file written when to="parquet".
+
+        """
+        # Loop init
+        df = pd.DataFrame()
+        if limit != -1 and count > limit:
+            count = limit
+        while True:
+            req_url = f"{self.api_url}/company/getPostsFeed?company_url={company_url}&start={start}&count={count}"
+            res = requests.post(req_url, json=self.cookies, headers=HEADERS)
+            res.raise_for_status()
+
+            # Manage LinkedIn API errors
+            LinkedIn.manage_api_error(res)
+
+            # Get json result
+            res_json = res.json()
+            if len(res_json) == 0:
+                break
+            # Get response in dataframe
+            tmp_df = pd.DataFrame(res_json)
+
+            # Concat dataframe
+            df = pd.concat([df, tmp_df], axis=0)
+
+            # Time sleep to avoid linkedin ban
+            if sleep:
+                time.sleep(TIME_SLEEP)
+            start += count
+            if limit != -1 and start >= limit:
+                break
+        # Cleaning
+        if len(df) > 0:
+            # Add views + engagement score
+            views = self.get_posts_views(df["ACTIVITY_ID"], workers=views_workers)
+            df["VIEWS"] = df["ACTIVITY_ID"].astype(str).map(views).fillna(0).astype("int64")
+            df["ENGAGEMENT_SCORE"] = (
+                (df["COMMENTS"] + df["LIKES"]) / df["VIEWS"].where(df["VIEWS"] != 0)
+            ).fillna(0.0)
+        return self.export(df.reset_index(drop=True), to, path, COMPANY_POSTS_SCHEMA)
+
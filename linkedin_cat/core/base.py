@@ -1,106 +1,211 @@
-import time
-import random
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-import json
-import os
-from colorama import Fore, Style
-
-
-class LinkedinBase():
-    def __init__(self,linkedin_cookies_json:str,headless = False,**kwargs):
-        """
-        Initializes the Linkedin Driver.
-        """
-        try:
-            print(Fore.BLACK + "="*30 + " Initializing Linkedin Driver "+ "="*30 + Style.RESET_ALL)
-            # use local selenium driver
-            self.options = Options()
-            # headless mode
-            if headless:
-                self.options.add_argument("--headless")
-
-            # 禁用 GPU 加速
-            self.options.add_argument("--disable-gpu")
-
-            # 禁止沙箱模式
-            self.options.add_argument("--no-sandbox")
-
-            # 禁用软件光栅化
-            self.options.add_argument("--disable-software-rasterizer")
-
-            self.driver = webdriver.Chrome(options=self.options)
-
-            # use docker selenium/standalone-chrome
-            # selenium_grid_url = 'http://localhost:4444/wd/hub'
-            # option = Options()
-            # option.set_capability("browserName", "chrome")
-            # option.set_capability("platformName", "Linux")
-            # print('Initialize selenium')
-            # self.driver = webdriver.Remote(command_executor=selenium_grid_url, options=option)
-
-
-            self.driver.maximize_window()
-            print(Fore.GREEN + "Opening Linkedin page" + Style.RESET_ALL)
-            self.driver.get("https://www.linkedin.com")
-            self.medium_wait()
-
-            if not os.path.exists(linkedin_cookies_json):
-                print(Fore.RED + "No cookies file found, please login first, default: linkedin_cookies.json " + Style.RESET_ALL)
-
-            with open(linkedin_cookies_json, 'r') as file:
-                cookies = json.loads(file.read())
-
-            for cookie in cookies:
-                cookie['sameSite'] = "None"
-                self.driver.add_cookie(cookie)
-
-            print(Fore.GREEN + "Refreshing the page to apply cookies" + Style.RESET_ALL)
-            self.driver.refresh()
-            self.medium_wait()
-        except Exception as e:
-            print(Fore.RED + f'Error: {e}' + Style.RESET_ALL)
-
-
-    def scroll_to_bottom(self):
-        """
-        Scrolls to the bottom of the page.
-        """
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-
-    def scroll_to_top(self):
-        """
-        Scrolls to the top of the page.
-        """
-        self.driver.execute_script("window.scrollTo(0, 0);")
-
-    def scroll_to_middle(self):
-        """
-        Scrolls to the middle of the page.
-        """
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-
-    def scroll_to_random(self):
-        """
-        Scrolls to a random position of the page.
-        """
-        self.driver.execute_script("window.scrollTo(0, Math.floor(Math.random() * 10000000));")
-
-    def short_wait(self):
-        """
-        Sleeps for a random amount of time between 1 and 3 seconds.
-        """
-        time.sleep(random.randint(1, 3))
-
-    def medium_wait(self):
-        """
-        Sleeps for a random amount of time between 3 and 5 seconds.
-        """
-        time.sleep(random.randint(3, 5))
-
-    def long_wait(self):
-        """
-        Sleeps for a random amount of time between 5 and 10 seconds.
-        """
-        time.sleep(random.randint(5, 10))
-
+import time
+import random
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+import json
+import os
+import base64
+from colorama import Fore, Style
+from linkedin_cat.core.user_data import acquire_profile_dir, release_lock
+from linkedin_cat.core.selector_registry import registry
+
+
+class LinkedinBase():
+    def __init__(self,linkedin_cookies_json:str,headless = False,**kwargs):
+        """
+        Initializes the Linkedin Driver.
+
+        Optional kwargs:
+            user_data_root (str): enables a persistent Chrome profile per cookies file
+                under this folder, so disk cache and storage survive between runs.
+            profile_max_mb (int): size cap of a persistent profile, cache is pruned above it.
+            profile_slots (int): max parallel profiles per cookies file.
+            selector_registry (SelectorRegistry): selectors used by this driver,
+                defaults to the shared registry. The driver works on an overlay
+                of it, so its overrides do not leak into other drivers.
+            capture_network (bool): enables the Chrome performance log so Voyager XHR
+                responses can be read with drain_voyager_responses.
+        """
+        self.capture_network = kwargs.get('capture_network', False)
+        self.selectors = (kwargs.get('selector_registry') or registry).overlay()
+        self.user_data_dir = None
+        self._profile_lock = None
+        try:
+            print(Fore.BLACK + "="*30 + " Initializing Linkedin Driver "+ "="*30 + Style.RESET_ALL)
+            # use local selenium driver
+            self.options = Options()
+            # headless mode
+            if headless:
+                self.options.add_argument("--headless")
+
+            # 禁用 GPU 加速
+            self.options.add_argument("--disable-gpu")
+
+            # 禁止沙箱模式
+            self.options.add_argument("--no-sandbox")
+
+            # 禁用软件光栅化
+            self.options.add_argument("--disable-software-rasterizer")
+
+            # 记录网络日志，用于读取 Voyager XHR 响应
+            if self.capture_network:
+                self.options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+            # 持久化用户目录，复用磁盘缓存和 localStorage
+            user_data_root = kwargs.get('user_data_root')
+            if user_data_root:
+                profile_max_mb = kwargs.get('profile_max_mb', 500)
+                self.user_data_dir, self._profile_lock = acquire_profile_dir(
+                    user_data_root,
+                    linkedin_cookies_json,
+                    max_slots=kwargs.get('profile_slots', 4),
+                    max_mb=profile_max_mb,
+                )
+                if self.user_data_dir:
+                    print(Fore.GREEN + f"Using persistent profile: {self.user_data_dir}" + Style.RESET_ALL)
+                    self.options.add_argument(f"--user-data-dir={os.path.abspath(self.user_data_dir)}")
+                    self.options.add_argument(f"--disk-cache-size={int(profile_max_mb) * 1024 * 1024 // 2}")
+                else:
+                    print(Fore.YELLOW + "All persistent profiles are in use, starting with an empty profile" + Style.RESET_ALL)
+
+            self.driver = webdriver.Chrome(options=self.options)
+
+            # use docker selenium/standalone-chrome
+            # selenium_grid_url = 'http://localhost:4444/wd/hub'
+            # option = Options()
+            # option.set_capability("browserName", "chrome")
+            # option.set_capability("platformName", "Linux")
+            # print('Initialize selenium')
+            # self.driver = webdriver.Remote(command_executor=selenium_grid_url, options=option)
+
+
+            self.driver.maximize_window()
+            print(Fore.GREEN + "Opening Linkedin page" + Style.RESET_ALL)
+            self.driver.get("https://www.linkedin.com")
+            self.medium_wait()
+
+            if not os.path.exists(linkedin_cookies_json):
+                print(Fore.RED + "No cookies file found, please login first, default: linkedin_cookies.json " + Style.RESET_ALL)
+
+            with open(linkedin_cookies_json, 'r') as file:
+                cookies = json.loads(file.read())
+
+            for cookie in cookies:
+                cookie['sameSite'] = "None"
+                self.driver.add_cookie(cookie)
+
+            print(Fore.GREEN + "Refreshing the page to apply cookies" + Style.RESET_ALL)
+            self.driver.refresh()
+            self.medium_wait()
+        except Exception as e:
+            print(Fore.RED + f'Error: {e}' + Style.RESET_ALL)
+            if not hasattr(self, 'driver'):
+                self.release_user_data_dir()
+
+
+    def release_user_data_dir(self):
+        """
+        Releases the lock on the persistent profile directory, if any.
+        """
+        release_lock(self._profile_lock)
+        self._profile_lock = None
+
+    def close_driver(self):
+        """
+        Quits the driver and releases the persistent profile directory.
+        """
+        try:
+            self.driver.quit()
+        finally:
+            self.release_user_data_dir()
+
+    def drain_voyager_responses(self, url_filter="/voyager/api/"):
+        """
+        Reads the performance log and returns the JSON bodies of the Voyager
+        responses finished since the last call, as a list of {"url", "status", "json"}.
+        Calling it before a navigation discards older entries.
+        """
+        if not self.capture_network:
+            return []
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            print(Fore.RED + f'Error reading performance log: {e}' + Style.RESET_ALL)
+            return []
+
+        received = {}
+        finished = set()
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            params = message.get("params", {})
+            if message.get("method") == "Network.responseReceived":
+                response = params.get("response", {})
+                if url_filter in response.get("url", "") and "json" in response.get("mimeType", "json"):
+                    received[params.get("requestId")] = response
+            elif message.get("method") == "Network.loadingFinished":
+                finished.add(params.get("requestId"))
+
+        responses = []
+        for request_id, response in received.items():
+            if request_id not in finished:
+                continue
+            try:
+                body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            except Exception:
+                # Body already evicted from the browser buffer
+                continue
+            text = body.get("body", "")
+            if body.get("base64Encoded"):
+                text = base64.b64decode(text).decode("utf-8", "replace")
+            try:
+                data = json.loads(text)
+            except ValueError:
+                continue
+            responses.append({"url": response.get("url"), "status": response.get("status"), "json": data})
+        return responses
+
+    def scroll_to_bottom(self):
+        """
+        Scrolls to the bottom of the page.
+        """
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+
+    def scroll_to_top(self):
+        """
+        Scrolls to the top of the page.
+        """
+        self.driver.execute_script("window.scrollTo(0, 0);")
+
+    def scroll_to_middle(self):
+        """
+        Scrolls to the middle of the page.
+        """
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
+
+    def scroll_to_random(self):
+        """
+        Scrolls to a random position of the page.
+        """
+        self.driver.execute_script("window.scrollTo(0, Math.floor(Math.random() * 10000000));")
+
+    def short_wait(self):
+        """
+        Sleeps for a random amount of time between 1 and 3 seconds.
+        """
+        time.sleep(random.randint(1, 3))
+
+    def medium_wait(self):
+        """
+        Sleeps for a random amount of time between 3 and 5 seconds.
+        """
+        time.sleep(random.randint(3, 5))
+
+    def long_wait(self):
+        """
+        Sleeps for a random amount of time between 5 and 10 seconds.
+        """
+        time.sleep(random.randint(5, 10))
+
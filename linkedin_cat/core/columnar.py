@@ -0,0 +1,103 @@
+import os
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+# ResponseSchema dtype -> Arrow type
+ARROW_TYPES = {
+    "string": pa.string(),
+    "category": pa.dictionary(pa.int32(), pa.string()),
+    "Int64": pa.int64(),
+    "int64": pa.int64(),
+    "Float64": pa.float64(),
+    "float64": pa.float64(),
+    "boolean": pa.bool_(),
+}
+
+
+def arrow_schema(schema, df=None):
+    """
+    Returns the Arrow schema of a ResponseSchema: one nullable field per
+    declared column, category columns dictionary-encoded. The endpoint name is
+    kept in the schema metadata.
+
+    "object" columns (lists, dicts) have no fixed type, it is inferred from
+    their values in df (null without df or values).
+    """
+    fields = []
+    for field in schema.fields:
+        arrow_type = ARROW_TYPES.get(field.dtype)
+        if arrow_type is None:
+            arrow_type = pa.array(df[field.column], from_pandas=True).type if df is not None else pa.null()
+        fields.append(pa.field(field.column, arrow_type))
+    return pa.schema(fields, metadata={"endpoint": schema.name})
+
+
+def to_arrow(df, schema=None):
+    """
+    Returns df as a pyarrow.Table.
+
+    With a ResponseSchema the declared columns come first, typed by
+    arrow_schema(schema) whatever the rows (an empty pull has the same schema
+    as a full one), followed by any undeclared column. Without one the types
+    are inferred from df.
+    """
+    if schema is None:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    df = schema.frame(df)
+    table = pa.Table.from_pandas(df[schema.columns], schema=arrow_schema(schema, df), preserve_index=False)
+    for column in df.columns[len(schema.columns):]:
+        table = table.append_column(column, pa.array(df[column], from_pandas=True))
+    return table
+
+
+def write_parquet(data, path, schema=None, compression="zstd"):
+    """
+    Writes a DataFrame or a pyarrow.Table to one Parquet file.
+
+    Returns: path.
+    """
+    table = data if isinstance(data, pa.Table) else to_arrow(data, schema)
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    pq.write_table(table, path, compression=compression)
+    return path
+
+
+def write_dataset(data, path, partition_by=None, schema=None, compression="zstd"):
+    """
+    Writes a DataFrame or a pyarrow.Table to a Parquet dataset directory,
+    hive-partitioned by the partition_by columns (eg: path/DATE_EXTRACT=2024-05-01/part-0.parquet).
+    Files already in a partition are replaced, other partitions are kept, so
+    daily pulls can be added to the same dataset.
+
+    Returns: path.
+
+    Usage:
+        df = linkedin.post.get_comments(post_url, to="arrow")
+        write_dataset(df, "./linkedin/comments", partition_by="DATE_EXTRACT")
+        read_dataset("./linkedin/comments").to_pandas()
+    """
+    table = data if isinstance(data, pa.Table) else to_arrow(data, schema)
+    if isinstance(partition_by, str):
+        partition_by = [partition_by]
+    ds.write_dataset(
+        table,
+        path,
+        format="parquet",
+        file_options=ds.ParquetFileFormat().make_write_options(compression=compression),
+        partitioning=partition_by or None,
+        partitioning_flavor="hive" if partition_by else None,
+        existing_data_behavior="delete_matching",
+    )
+    return path
+
+
+def read_dataset(path, columns=None, filter=None):
+    """
+    Returns a Parquet file or dataset directory as a pyarrow.Table, reading only
+    the given columns and the rows matching filter (a pyarrow.compute expression).
+    """
+    dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    return dataset.to_table(columns=columns, filter=filter)
@@ -0,0 +1,374 @@
+import re
+import json
+import time
+import zlib
+import random
+import threading
+import urllib.parse
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from linkedin_cat.core import api
+from linkedin_cat.core.response_schema import ResponseSchema, Field
+from linkedin_cat.core.voyager import PROFILE_SECTION_ENDPOINTS
+
+# Messages of a conversation, core.api does not declare their columns
+MESSAGES_SCHEMA = ResponseSchema("message.messages", [
+    Field("MESSAGE_ID"),
+    Field("PROFILE_ID"),
+    Field("FULLNAME"),
+    Field("TEXT"),
+    Field("SENT_AT"),
+    Field("DATE_EXTRACT", dtype="category"),
+])
+
+# LINKEDIN_API route -> (schema of the synthetic rows, paging)
+# paging: "start" (start/count), "token" (pagination_token), "created_before", "all" or "one"
+GATEWAY_ROUTES = {
+    "/profile/getResume": (api.RESUME_SCHEMA, "all"),
+    "/profile/getTopCard": (api.TOP_CARD_SCHEMA, "one"),
+    "/profile/getPostsFeed": (api.PROFILE_POSTS_SCHEMA, "token"),
+    "/network/getFollowers": (api.FOLLOWERS_SCHEMA, "start"),
+    "/network/getConnections": (api.CONNECTIONS_SCHEMA, "start"),
+    "/invitation/get": (api.INVITATIONS_RECEIVED_SCHEMA, "start"),
+    "/invitation/getSent": (api.INVITATIONS_SENT_SCHEMA, "start"),
+    "/invitation/response": (api.INVITATIONS_RECEIVED_SCHEMA, "one"),
+    "/message/getConversations": (api.CONVERSATIONS_SCHEMA, "created_before"),
+    "/message/getMessages": (MESSAGES_SCHEMA, "start"),
+    "/post/getStats": (api.POST_STATS_SCHEMA, "one"),
+    "/post/getPolls": (api.POLLS_SCHEMA, "all"),
+    "/post/getComments": (api.COMMENTS_SCHEMA, "start"),
+    "/post/getLikes": (api.LIKES_SCHEMA, "start"),
+    "/event/getGuests": (api.GUESTS_SCHEMA, "all"),
+    "/company/getInfo": (api.COMPANY_INFO_SCHEMA, "one"),
+    "/company/getFollowers": (api.COMPANY_FOLLOWERS_SCHEMA, "start"),
+    "/company/getPostsFeed": (api.COMPANY_POSTS_SCHEMA, "start"),
+}
+
+PROFILE_PATH = re.compile(r"^/voyager/api/identity/profiles/([^/]+)(?:/(\w+))?$")
+
+LOGIN_PAGE = b"<html><head><title>LinkedIn Login</title></head><body>Sign in</body></html>"
+
+
+def profile_urn(profile_id):
+    """
+    Returns the synthetic URN of a profile id, the same for a vanity name on every run.
+    """
+    if profile_id.startswith("ACo"):
+        return profile_id
+    return f"ACoAAA{zlib.crc32(profile_id.lower().encode('utf-8')):010d}"
+
+
+class FixtureServer():
+    """
+    Local stand-in for LINKEDIN_API and the Voyager API, to test and benchmark
+    core.api without a network. Responses are synthetic rows built from the
+    endpoint schemas, or recorded responses given in fixtures.
+
+    - latency, jitter: seconds added to every response (latency + uniform(0, jitter))
+    - error_rate: share of requests answered with error_status
+    - page_size: maximum rows per page, whatever count is asked
+    - total: rows of every list endpoint (followers, comments...)
+    - expire_after: number of requests after which the cookies expire: LINKEDIN_API
+      answers 302 and Voyager redirects to the login page, as with expired li_at
+    - fixtures: {path: response}, or the path of a JSON file of them, replacing
+      the synthetic response of a path (eg: "/company/getInfo"). A response may
+      be a callable(params) returning the JSON. Lists of paged endpoints are paged.
+
+    Usage:
+        with FixtureServer(latency=0.05, error_rate=0.01, total=100000) as server:
+            linkedin = LinkedIn().connect(li_at="x", jessionid="y", base_url=server.url)
+            df = linkedin.network.get_connections(limit=-1)
+            print(server.stats())
+    """
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, error_rate=0.0, error_status=429,
+                 page_size=100, total=1000, expire_after=None, fixtures=None, seed=None):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.page_size = page_size
+        self.total = total
+        self.expire_after = expire_after
+        if isinstance(fixtures, str):
+            with open(fixtures, "r", encoding="utf-8") as f:
+                fixtures = json.load(f)
+        self.fixtures = dict(fixtures or {})
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._expired = set()
+        self._expire_all = False
+        self._started_at = int(time.time()) // 60 * 60
+        self._httpd = None
+        self._thread = None
+        self.reset_stats()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fixture = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def expire(self, li_at=None):
+        """
+        Expires the cookies of li_at, or every cookie.
+        """
+        with self._lock:
+            if li_at is None:
+                self._expire_all = True
+            else:
+                self._expired.add(li_at)
+
+    def renew(self):
+        with self._lock:
+            self._expired.clear()
+            self._expire_all = False
+            self.expire_after = None
+
+    def stats(self):
+        """
+        Returns {"requests", "errors", "redirects", "rows", "bytes", "routes": {route: requests}}.
+        """
+        with self._lock:
+            return dict(self._stats, routes=dict(self._stats["routes"]))
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {"requests": 0, "errors": 0, "redirects": 0, "rows": 0, "bytes": 0, "routes": {}}
+
+    def _count(self, route, **counters):
+        with self._lock:
+            for field, value in counters.items():
+                self._stats[field] += value
+            self._stats["routes"][route] = self._stats["routes"].get(route, 0) + 1
+
+    def _outcome(self, li_at):
+        """
+        Returns "expired", "error" or None for a new request, after its latency.
+        """
+        with self._lock:
+            self._stats["requests"] += 1
+            expired = (self._expire_all or li_at in self._expired
+                       or (self.expire_after is not None and self._stats["requests"] > self.expire_after))
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        if expired:
+            return "expired"
+        return "error" if failed else None
+
+    # Synthetic data
+
+    def _value(self, field, i):
+        column = field.column
+        urn = f"ACoAAA{i:010d}"
+        if column == "PROFILE_ID":
+            return urn
+        if column == "PROFILE_URL":
+            return f"https://www.linkedin.com/in/{urn}"
+        if column == "PUBLIC_ID":
+            return f"member-{i}"
+        if column == "ACTIVITY_ID":
+            return str(7000000000000000000 + i)
+        if column == "POST_URL":
+            return "https://www.linkedin.com/feed/update/urn:li:activity:7000000000000000000"
+        if column == "DATE_EXTRACT":
+            return datetime.fromtimestamp(self._started_at).strftime(api.DATETIME_FORMAT)
+        if column.endswith("_AT") or column.endswith("_TIME") or column.endswith("_DATE"):
+            return datetime.fromtimestamp(self._started_at - i * 60).strftime(api.DATETIME_FORMAT)
+        if field.dtype == "category":
+            return f"{column}_{i % 3}"
+        if field.dtype in ("Int64", "int64"):
+            return i % 997
+        if field.dtype in ("Float64", "float64"):
+            return round(i % 100 / 100, 2)
+        if field.dtype == "boolean":
+            return i % 2 == 0
+        if field.dtype == "object":
+            return [f"{column.title()} {i}"]
+        return f"{column.title()} {i}"
+
+    def rows(self, schema, start, stop):
+        """
+        Returns the synthetic rows start to stop of an endpoint.
+        """
+        stop = min(stop, self.total)
+        return [{field.column: self._value(field, i) for field in schema.fields} for i in range(start, stop)]
+
+    def _page(self, schema, paging, params, recorded=None):
+        count = min(int(params.get("count", self.page_size)), self.page_size)
+        if paging == "one":
+            return recorded if recorded is not None else self.rows(schema, 0, 1)
+        if paging == "all":
+            return recorded if recorded is not None else self.rows(schema, 0, self.total)
+        if paging == "token":
+            start = int(params.get("pagination_token") or 0)
+        elif paging == "created_before":
+            created_before = params.get("created_before")
+            start = 0 if created_before is None else (self._started_at - int(created_before) // 1000) // 60 + 1
+        else:
+            start = int(params.get("start", 0))
+        if recorded is not None:
+            return recorded[start:start + count] if isinstance(recorded, list) else recorded
+        page = self.rows(schema, start, start + count)
+        if paging == "token":
+            for row in page:
+                row["PAGINATION_TOKEN"] = str(start + len(page))
+        return page
+
+    def gateway_response(self, route, params):
+        recorded = self.fixtures.get(route)
+        if callable(recorded):
+            return recorded(params)
+        if route == "/company/getPostsViews":
+            return recorded if recorded is not None else {"VIEWS": int(params.get("activity_id", 0)) % 997}
+        if route not in GATEWAY_ROUTES:
+            return recorded
+        schema, paging = GATEWAY_ROUTES[route]
+        return self._page(schema, paging, params, recorded)
+
+    def voyager_response(self, profile_id, resource):
+        urn = profile_urn(profile_id)
+        vanity = profile_id.lower()
+        if resource is None:
+            return {
+                "data": {
+                    "entityUrn": f"urn:li:fs_profile:{urn}",
+                    "publicIdentifier": vanity,
+                    "firstName": vanity.split("-")[0].title(),
+                    "lastName": "Doe",
+                    "headline": "Data Engineer",
+                    "summary": f"Summary of {vanity}",
+                    "industryName": "Software Development",
+                    "geoLocationName": "Paris, Île-de-France",
+                    "geoCountryName": "France",
+                    "locationName": "France",
+                },
+                "included": [{"picture": {"rootUrl": "https://media.licdn.com/dms/image/",
+                                          "artifacts": [{"fileIdentifyingUrlPathSegment": f"{urn}_800"}]}}],
+            }
+        if resource == "networkinfo":
+            return {"data": {"entityUrn": f"urn:li:fs_profileNetworkInfo:{urn}", "distance": {"value": "DISTANCE_2"},
+                             "following": False, "followable": True, "followersCount": len(vanity) * 100,
+                             "connectionsCount": 500}}
+        if resource == "profileContactInfo":
+            return {"data": {"entityUrn": f"urn:li:fs_contactinfo:{urn}", "emailAddress": f"{vanity}@example.com",
+                             "connectedAt": self._started_at * 1000,
+                             "phoneNumbers": [{"type": "MOBILE", "number": "+33 6 00 00 00 00"}],
+                             "twitterHandles": [{"name": vanity}],
+                             "websites": [{"url": f"https://{vanity}.example.com"}]}}
+        if resource in PROFILE_SECTION_ENDPOINTS.values():
+            return {"elements": []}
+        return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b"", content_type="application/json", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+        return len(body)
+
+    def _send_json(self, status, value):
+        return self._send(status, json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+    def _li_at(self, body):
+        if isinstance(body, dict) and body.get("li_at"):
+            return body["li_at"]
+        for cookie in self.headers.get("Cookie", "").split(";"):
+            name, _, value = cookie.strip().partition("=")
+            if name == "li_at":
+                return value
+        return None
+
+    def _handle(self, method):
+        fixture = self.server.fixture
+        url = urllib.parse.urlsplit(self.path)
+        params = dict(urllib.parse.parse_qsl(url.query))
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            body = None
+
+        route = url.path
+        if route == "/uas/login":
+            fixture._count(route)
+            return self._send(200, LOGIN_PAGE, "text/html; charset=utf-8")
+
+        voyager = route.startswith("/voyager/api/")
+        match = PROFILE_PATH.match(route)
+        if match:
+            route = "/voyager/api/identity/profiles/{id}" + (f"/{match.group(2)}" if match.group(2) else "")
+        elif not voyager and route not in GATEWAY_ROUTES and route not in fixture.fixtures \
+                and route != "/company/getPostsViews":
+            fixture._count(route)
+            return self._send_json(404, {"error": f"Unknown route {url.path}"})
+
+        outcome = fixture._outcome(self._li_at(body))
+        if outcome == "expired":
+            fixture._count(route, redirects=1)
+            if voyager:
+                location = f"{fixture.url}/uas/login?session_redirect={urllib.parse.quote(self.path)}"
+                return self._send(302, headers={"Location": location})
+            return self._send_json(302, {"error": "Cookies expired, please renew li_at and JSESSIONID"})
+        if outcome == "error":
+            fixture._count(route, errors=1)
+            return self._send_json(fixture.error_status, {"error": "Synthetic error"})
+
+        recorded = fixture.fixtures.get(url.path)
+        if voyager and recorded is not None:
+            response = recorded(params) if callable(recorded) else recorded
+        elif match:
+            response = fixture.voyager_response(match.group(1), match.group(2))
+        elif voyager and method == "POST":
+            response = {"value": {"status": "OK"}}
+        elif voyager:
+            response = None
+        else:
+            response = fixture.gateway_response(url.path, params)
+        if response is None:
+            fixture._count(route)
+            return self._send_json(404, {"error": f"Unknown route {url.path}"})
+
+        size = self._send_json(201 if voyager and method == "POST" else 200, response)
+        fixture._count(route, rows=len(response) if isinstance(response, list) else 1, bytes=size)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
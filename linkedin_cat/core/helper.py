@@ -1,138 +1,294 @@
-import time
-import json
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.support import expected_conditions as EC
-
-timeout = 2
-# Login & Scroll
-
-def scroll_and_load(driver):
-    last_height = driver.execute_script("return document.body.scrollHeight")
-
-    while True:
-        # Scroll to the bottom of the page
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)  # Pause to allow loading
-
-        # Try to click the "Show more results" button if it exists
-        try:
-            show_more_button = driver.find_element(
-                By.XPATH,
-                "//button[contains(@class, 'scaffold-finite-scroll__load-button')]",
-            )
-            if show_more_button:
-                show_more_button.click()
-                time.sleep(2)  # Give some time for new results to load
-        except NoSuchElementException:
-            pass  # Continue if no button is found
-
-        # Check if the page height has stopped increasing
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
-            break
-        last_height = new_height
-
-    # Scroll to the middle of the page
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-    time.sleep(2)
-    # Scroll to a random position
-    driver.execute_script("window.scrollTo(0, Math.floor(Math.random() * 10000000));")
-    time.sleep(2)
-    # Scroll back to the top
-    driver.execute_script("window.scrollTo(0, 0);")
-
-
-# Getter setter
-
-def wait_element(driver, by, element, timeout=timeout) -> None:
-    WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, element)))
-
-
-def get_element(driver, by, element, timeout=timeout):
-    return driver.find_element(by, element)
-
-
-def get_elements(driver, by, element, timeout=timeout):
-    return driver.find_elements(by, element)
-
-
-def get_object(driver, by, element, timeout=timeout):
-    wait_element(driver, by, element, timeout)
-    return get_element(driver, by, element)
-
-
-def get_objects(driver, by, element, timeout=timeout):
-    wait_element(driver, by, element, timeout)
-    return get_elements(driver, by, element)
-
-
-# Extractor
-
-def extract_element_text(driver, by, element, timeout=timeout):
-    try:
-        return get_object(driver, by, element, timeout=timeout).text.strip()
-    except NoSuchElementException:
-        return "Not available"
-
-
-def extract_many_element_text(driver, by, element, timeout=timeout):
-    try:
-        items = get_objects(driver, by, element, timeout=timeout)
-        temp = []
-        for i in items:
-            temp.append(i.text.strip())
-
-        return temp
-    except NoSuchElementException:
-        return "Not available"
-
-
-def extract_element_attribute(driver, by, element, attribute):
-    try:
-        return get_object(driver, by, element, timeout=timeout).get_attribute(attribute)
-    except NoSuchElementException:
-        return "Not available"
-
-
-def extract_many_element_attribute(driver, by, element, attribute):
-    try:
-        items = get_objects(driver, by, element, timeout=timeout)
-        temp = []
-        for i in items:
-            temp.append(i.get_attribute(attribute))
-        return temp
-    except NoSuchElementException:
-        return "Not available"
-
-
-def save_to_json(data, filename="profile.json"):
-    """Saves the extracted profile data to a JSON file."""
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
-
-
-from urllib.parse import unquote
-def extract_and_decode_username(url):
-    """
-    从 LinkedIn 个人资料 URL 中提取用户名并将其解码为汉字。
-
-    参数:
-        url (str): LinkedIn 个人资料的 URL。
-
-    返回:
-        str: 解码后的用户名。
-    """
-    # 去除结尾的 "/"
-    url = url.rstrip('/')
-
-    # 提取用户名部分
-    username_encoded = url.split('/')[-1]
-
-    # 解码为汉字
-    username_decoded = unquote(username_encoded)
-
-    return username_decoded
-
-
+import time
+import json
+import threading
+from contextlib import contextmanager
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+
+timeout = 2
+
+# Static DOM mode, per thread: the page is a complete snapshot (eg: archived
+# HTML), nothing more will load so scrolling and wait timeouts are skipped
+_dom_mode = threading.local()
+
+
+@contextmanager
+def static_dom():
+    """
+    Within the block, scroll_and_load is a no-op and element waits of this thread
+    check the page once instead of polling until their timeout.
+    """
+    previous = is_static_dom()
+    _dom_mode.static = True
+    try:
+        yield
+    finally:
+        _dom_mode.static = previous
+
+
+def is_static_dom():
+    return getattr(_dom_mode, "static", False)
+
+# Login & Scroll
+
+def scroll_and_load(driver):
+    if is_static_dom():
+        return
+    last_height = driver.execute_script("return document.body.scrollHeight")
+
+    while True:
+        # Scroll to the bottom of the page
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        time.sleep(2)  # Pause to allow loading
+
+        # Try to click the "Show more results" button if it exists
+        try:
+            show_more_button = driver.find_element(
+                By.XPATH,
+                "//button[contains(@class, 'scaffold-finite-scroll__load-button')]",
+            )
+            if show_more_button:
+                show_more_button.click()
+                time.sleep(2)  # Give some time for new results to load
+        except NoSuchElementException:
+            pass  # Continue if no button is found
+
+        # Check if the page height has stopped increasing
+        new_height = driver.execute_script("return document.body.scrollHeight")
+        if new_height == last_height:
+            break
+        last_height = new_height
+
+    # Scroll to the middle of the page
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
+    time.sleep(2)
+    # Scroll to a random position
+    driver.execute_script("window.scrollTo(0, Math.floor(Math.random() * 10000000));")
+    time.sleep(2)
+    # Scroll back to the top
+    driver.execute_script("window.scrollTo(0, 0);")
+
+
+# Getter setter
+
+def wait_element(driver, by, element, timeout=timeout) -> None:
+    if is_static_dom():
+        # Same exception as an expired wait, callers handle both modes alike
+        if not driver.find_elements(by, element):
+            raise TimeoutException(f"{element} not in static page")
+        return
+    WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, element)))
+
+
+def get_element(driver, by, element, timeout=timeout):
+    return driver.find_element(by, element)
+
+
+def get_elements(driver, by, element, timeout=timeout):
+    return driver.find_elements(by, element)
+
+
+def get_object(driver, by, element, timeout=timeout):
+    wait_element(driver, by, element, timeout)
+    return get_element(driver, by, element)
+
+
+def get_objects(driver, by, element, timeout=timeout):
+    wait_element(driver, by, element, timeout)
+    return get_elements(driver, by, element)
+
+
+# Extractor
+
+def extract_element_text(driver, by, element, timeout=timeout):
+    try:
+        return get_object(driver, by, element, timeout=timeout).text.strip()
+    except NoSuchElementException:
+        return "Not available"
+
+
+def extract_many_element_text(driver, by, element, timeout=timeout):
+    try:
+        items = get_objects(driver, by, element, timeout=timeout)
+        temp = []
+        for i in items:
+            temp.append(i.text.strip())
+
+        return temp
+    except NoSuchElementException:
+        return "Not available"
+
+
+def extract_element_attribute(driver, by, element, attribute):
+    try:
+        return get_object(driver, by, element, timeout=timeout).get_attribute(attribute)
+    except NoSuchElementException:
+        return "Not available"
+
+
+def extract_many_element_attribute(driver, by, element, attribute):
+    try:
+        items = get_objects(driver, by, element, timeout=timeout)
+        temp = []
+        for i in items:
+            temp.append(i.get_attribute(attribute))
+        return temp
+    except NoSuchElementException:
+        return "Not available"
+
+
+# Section probe
+
+SECTION_PROBE_JS = """
+const ids = arguments[0];
+const present = {};
+for (const id of ids) {
+    present[id] = document.getElementById(id) !== null;
+}
+return present;
+"""
+
+
+def probe_sections(driver, section_ids):
+    """
+    Checks which section anchors (eg: 'experience', 'honors_and_awards') exist on the
+    current page with one execute_script call, so absent sections cost no wait timeout.
+
+    Returns: {section_id: bool}. If the probe itself fails every section is reported
+    present, falling back to the regular waits.
+    """
+    try:
+        present = driver.execute_script(SECTION_PROBE_JS, list(section_ids)) or {}
+        return {section_id: bool(present.get(section_id)) for section_id in section_ids}
+    except Exception:
+        return {section_id: True for section_id in section_ids}
+
+
+# Batched extractor
+# One execute_script call instead of one chromedriver round-trip per element/attribute
+
+BATCH_EXTRACT_JS = """
+const root = arguments[0] || document;
+const itemSelector = arguments[1];
+const fields = arguments[2];
+const byCss = arguments[3];
+
+function findAll(ctx, selector) {
+    if (byCss) {
+        return Array.from(ctx.querySelectorAll(selector));
+    }
+    const snapshot = document.evaluate(selector, ctx, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const nodes = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) {
+        nodes.push(snapshot.snapshotItem(i));
+    }
+    return nodes;
+}
+
+function valueOf(node, attribute) {
+    if (!attribute) {
+        return (node.innerText || node.textContent || "").trim();
+    }
+    const prop = node[attribute];
+    if (prop !== undefined && prop !== null && typeof prop !== "object" && typeof prop !== "function") {
+        return String(prop);
+    }
+    return node.getAttribute(attribute);
+}
+
+function extract(ctx) {
+    const out = {};
+    for (const field of fields) {
+        const nodes = findAll(ctx, field.selector);
+        if (field.many) {
+            out[field.name] = nodes.map(n => valueOf(n, field.attribute));
+        } else {
+            out[field.name] = nodes.length ? valueOf(nodes[0], field.attribute) : null;
+        }
+    }
+    return out;
+}
+
+if (itemSelector) {
+    return findAll(root, itemSelector).map(extract);
+}
+return extract(root);
+"""
+
+
+def _normalize_fields(fields):
+    """
+    Turns {name: selector | (selector, attribute) | (selector, attribute, many)}
+    into the list of dicts consumed by BATCH_EXTRACT_JS.
+    """
+    specs = []
+    for name, spec in fields.items():
+        if isinstance(spec, str):
+            spec = (spec,)
+        selector = spec[0]
+        attribute = spec[1] if len(spec) > 1 else None
+        many = bool(spec[2]) if len(spec) > 2 else False
+        specs.append({"name": name, "selector": selector, "attribute": attribute, "many": many})
+    return specs
+
+
+def extract_fields(driver, fields, root=None, by=By.XPATH):
+    """
+    Extracts several named fields with a single execute_script call.
+
+    fields: {name: selector} for the text of the first match,
+            {name: (selector, attribute)} for an attribute of the first match,
+            {name: (selector, attribute_or_None, True)} for every match.
+    root: optional WebElement, selectors are evaluated relative to it.
+    by: By.XPATH or By.CSS_SELECTOR, applies to every selector.
+
+    Returns: {name: value}, missing fields are None ([] for many).
+    """
+    return driver.execute_script(
+        BATCH_EXTRACT_JS, root, None, _normalize_fields(fields), by == By.CSS_SELECTOR
+    ) or {}
+
+
+def extract_items(driver, item_selector, fields, root=None, by=By.XPATH):
+    """
+    Finds every element matching item_selector and extracts the named fields
+    relative to each of them, all in one execute_script call.
+
+    Returns: list of {name: value}, one dict per item in document order.
+    """
+    return driver.execute_script(
+        BATCH_EXTRACT_JS, root, item_selector, _normalize_fields(fields), by == By.CSS_SELECTOR
+    ) or []
+
+
+def save_to_json(data, filename="profile.json"):
+    """Saves the extracted profile data to a JSON file."""
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+
+
+from urllib.parse import unquote
+def extract_and_decode_username(url):
+    """
+    从 LinkedIn 个人资料 URL 中提取用户名并将其解码为汉字。
+
+    参数:
+        url (str): LinkedIn 个人资料的 URL。
+
+    返回:
+        str: 解码后的用户名。
+    """
+    # 去除结尾的 "/"
+    url = url.rstrip('/')
+
+    # 提取用户名部分
+    username_encoded = url.split('/')[-1]
+
+    # 解码为汉字
+    username_decoded = unquote(username_encoded)
+
+    return username_decoded
+
+
@@ -0,0 +1,269 @@
+import os
+import re
+import json
+import time
+import zlib
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from colorama import Fore, Style
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from linkedin_cat.core.profile import EXTRACTOR_VERSION, PROFILE_SECTIONS, extract_profile
+from linkedin_cat.core.profile_store import ProfileStore
+from linkedin_cat.core.voyager import extract_embedded_responses
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    kind       TEXT NOT NULL,
+    url        TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    html       BLOB NOT NULL,
+    responses  BLOB,
+    PRIMARY KEY (kind, url)
+);
+"""
+
+PROFILE = "profile"
+SEARCH = "search"
+
+# A stored profile scraped this long after its snapshot comes from a newer
+# scrape that was not archived, re-parsing the snapshot would roll it back
+SNAPSHOT_TOLERANCE = 3600
+
+# Page scripts would re-render (or redirect) the archived DOM
+SCRIPT_TAG = re.compile(r"<script\b[^>]*>.*?</script\s*>", re.IGNORECASE | re.DOTALL)
+
+
+def _pack(data):
+    return zlib.compress(data.encode("utf-8"))
+
+
+def _unpack(blob):
+    return zlib.decompress(blob).decode("utf-8") if blob is not None else None
+
+
+class HtmlArchive():
+    """
+    Keeps the raw HTML (and captured Voyager responses) of scraped pages,
+    zlib-compressed in one SQLite file, so extractors can be re-run offline.
+
+    The latest snapshot of every (kind, url) is kept, kind is "profile" or "search".
+    """
+    def __init__(self, db_path="./linkedin/archive.db"):
+        folder = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(folder, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def save(self, kind, url, html, responses=None, fetched_at=None):
+        """
+        Archives a page, replacing the previous snapshot of the same url.
+        """
+        packed_responses = _pack(json.dumps(responses, ensure_ascii=False)) if responses else None
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (kind, url, fetched_at, html, responses) VALUES (?, ?, ?, ?, ?)",
+                (kind, url, fetched_at or time.time(), _pack(html or ""), packed_responses),
+            )
+            self.conn.commit()
+
+    def get(self, kind, url):
+        """
+        Returns {"kind", "url", "fetched_at", "html", "responses"}, None if not archived.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT kind, url, fetched_at, html, responses FROM pages WHERE kind = ? AND url = ?",
+                (kind, url),
+            ).fetchone()
+        if row is None:
+            return None
+        responses = _unpack(row[4])
+        return {
+            "kind": row[0],
+            "url": row[1],
+            "fetched_at": row[2],
+            "html": _unpack(row[3]),
+            "responses": json.loads(responses) if responses else [],
+        }
+
+    def urls(self, kind=PROFILE):
+        """
+        Returns the archived urls of a kind.
+        """
+        with self._lock:
+            return [row[0] for row in self.conn.execute(
+                "SELECT url FROM pages WHERE kind = ? ORDER BY url", (kind,)
+            )]
+
+
+def snapshot_driver():
+    """
+    Returns a headless Chrome used to load archived pages, images disabled.
+    """
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    return webdriver.Chrome(options=options)
+
+
+def load_snapshot(driver, html):
+    """
+    Loads archived HTML in driver from a temporary file, without its scripts,
+    so the DOM extractors see the page as it was saved.
+    """
+    fd, path = tempfile.mkstemp(suffix=".html")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(SCRIPT_TAG.sub("", html or ""))
+        driver.get("file://" + path)
+    finally:
+        os.remove(path)
+
+
+def parse_archived_profile(driver, page):
+    """
+    Re-runs the current core.profile extractors on an archived page loaded in
+    driver (see load_snapshot). The snapshot is complete, so they run in
+    static mode: no scrolling, no wait for missing elements.
+
+    Only sections that were found are listed in captured_sections, so storing
+    the result never erases a section the snapshot did not contain.
+
+    Returns: the profile dict, None if the page did not contain the profile.
+    """
+    load_snapshot(driver, page.get("html"))
+    profile_data = extract_profile(driver, page["url"], navigate=False, static=True)
+    if not profile_data or not profile_data.get("intro"):
+        return None
+    found = [key for key in PROFILE_SECTIONS
+             if key in ("intro", "about") or profile_data.get(key)]
+    parsed = {"filename": profile_data["filename"], "profile_url": profile_data["profile_url"],
+              "captured_sections": found}
+    parsed.update((key, profile_data[key]) for key in found)
+    return parsed
+
+
+def _reparse_profile_chunk(archive_path, urls):
+    """
+    ProcessPoolExecutor task: parses a chunk of archived profiles with one
+    headless driver.
+
+    Returns: list of (url, fetched_at, profile_data or None).
+    """
+    results = []
+    driver = snapshot_driver()
+    try:
+        with HtmlArchive(archive_path) as archive:
+            for url in urls:
+                page = archive.get(PROFILE, url)
+                try:
+                    profile_data = parse_archived_profile(driver, page) if page else None
+                except Exception as e:
+                    print(Fore.RED + f"Error parsing {url}: {e}" + Style.RESET_ALL)
+                    profile_data = None
+                results.append((url, page["fetched_at"] if page else None, profile_data))
+    finally:
+        driver.quit()
+    return results
+
+
+def reparse_profiles(archive_path, store_path, workers=None, chunk_size=100, only_outdated=True):
+    """
+    Re-parses every archived profile with the current DOM extractors across
+    `workers` processes, each loading the snapshots in its own headless Chrome,
+    and writes the results to the ProfileStore, tagged with EXTRACTOR_VERSION.
+    The store is written from this process only.
+
+    only_outdated: skip profiles already stored with the current EXTRACTOR_VERSION.
+
+    Profiles scraped again after their snapshot are skipped.
+
+    Returns: {"parsed": n, "updated": n, "failed": [urls], "skipped": n}
+    """
+    with HtmlArchive(archive_path) as archive:
+        urls = archive.urls(PROFILE)
+
+    report = {"parsed": 0, "updated": 0, "failed": [], "skipped": 0}
+    with ProfileStore(store_path) as store:
+        if only_outdated:
+            todo = []
+            for url in urls:
+                meta = store.metadata(url)
+                if meta and meta["extractor_version"] == EXTRACTOR_VERSION:
+                    report["skipped"] += 1
+                else:
+                    todo.append(url)
+            urls = todo
+
+        scraped_at = {url: (store.metadata(url) or {}).get("scraped_at") for url in urls}
+        chunks = [urls[i:i + chunk_size] for i in range(0, len(urls), chunk_size)]
+        print(Fore.GREEN + f"Re-parsing {len(urls)} archived profiles in {len(chunks)} chunks" + Style.RESET_ALL)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for results in executor.map(_reparse_profile_chunk, [archive_path] * len(chunks), chunks):
+                for url, fetched_at, profile_data in results:
+                    if profile_data is None:
+                        report["failed"].append(url)
+                        continue
+                    report["parsed"] += 1
+                    if scraped_at[url] and scraped_at[url] > fetched_at + SNAPSHOT_TOLERANCE:
+                        report["skipped"] += 1
+                        continue
+                    # Data age stays the snapshot time, not the re-parse time
+                    if store.save(profile_data, scraped_at=fetched_at, extractor_version=EXTRACTOR_VERSION):
+                        report["updated"] += 1
+    return report
+
+
+def _reparse_search_chunk(archive_path, urls):
+    # Imported here, core.search imports this module
+    from linkedin_cat.core.search import parse_search_html
+    from linkedin_cat.core.voyager import parse_search_responses
+
+    results = []
+    with HtmlArchive(archive_path) as archive:
+        for url in urls:
+            page = archive.get(SEARCH, url)
+            responses = list(page.get("responses") or []) + extract_embedded_responses(page["html"])
+            results.append((url, parse_search_responses(responses) or parse_search_html(page["html"])))
+    return results
+
+
+def reparse_search_pages(archive_path, workers=None, chunk_size=100):
+    """
+    Re-parses every archived search page across `workers` processes.
+
+    Returns: {search url: list of results as returned by search_keywords}
+    """
+    with HtmlArchive(archive_path) as archive:
+        urls = archive.urls(SEARCH)
+    chunks = [urls[i:i + chunk_size] for i in range(0, len(urls), chunk_size)]
+    pages = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for results in executor.map(_reparse_search_chunk, [archive_path] * len(chunks), chunks):
+            pages.update(results)
+    return pages
@@ -0,0 +1,183 @@
+import os
+import time
+import multiprocessing
+
+from colorama import Fore, Style
+
+from linkedin_cat.core.work_queue import WorkQueue
+from linkedin_cat.core.profile_store import ProfileStore
+
+
+def scrape_worker(worker_id, cookies_json, queue_path, store_path, options):
+    """
+    Worker process: owns one LinkedinSearch session and scrapes leased URLs
+    until the queue is empty. Results are upserted into the shared ProfileStore,
+    so an item retried after a crash does not create a duplicate. With
+    skip_saved, URLs already in the store (fresh if ttl_days, with every
+    requested section) are acked without scraping.
+    """
+    # Imported here so the orchestrator process never loads selenium drivers
+    from linkedin_cat.core.search import LinkedinSearch
+    from linkedin_cat.core.profile import EXTRACTOR_VERSION, resolve_sections
+
+    sections = resolve_sections(options.get("sections"))
+    ttl_days = options.get("ttl_days")
+
+    queue = WorkQueue(queue_path, visibility_timeout=options.get("visibility_timeout", 600),
+                      max_attempts=options.get("max_attempts", 3))
+    store = ProfileStore(store_path)
+    searcher = None
+    try:
+        while True:
+            url = queue.lease(worker_id)
+            if url is None:
+                break
+            if (options.get("skip_saved") and store.has(url) and store.has_sections(url, sections)
+                    and (ttl_days is None or store.is_fresh(url, ttl_days))):
+                queue.ack(url, worker_id)
+                print(Fore.YELLOW + f"[{worker_id}] {url} already saved" + Style.RESET_ALL)
+                continue
+            try:
+                # Chrome is only started once there is work
+                if searcher is None:
+                    searcher = LinkedinSearch(cookies_json, headless=options.get("headless", True),
+                                              **options.get("search_kwargs", {}))
+                profile_data = searcher.scrape_profile(url, sections=options.get("sections"),
+                                                       thread_pool=options.get("thread_pool", True))
+            except Exception as e:
+                queue.fail(url, worker_id, str(e))
+                continue
+            if not profile_data:
+                queue.fail(url, worker_id, "Could not extract profile")
+                continue
+            store.save_sections(profile_data, extractor_version=EXTRACTOR_VERSION)
+            searcher.index_profile(profile_data, store)
+            queue.ack(url, worker_id)
+            print(Fore.GREEN + f"[{worker_id}] Saved {url}" + Style.RESET_ALL)
+    finally:
+        if searcher is not None:
+            searcher.close_driver()
+        store.close()
+        queue.close()
+
+
+class ScrapeOrchestrator():
+    """
+    Scrapes profiles with N worker processes, each with its own Chrome session.
+
+    URLs go through a durable WorkQueue (SQLite), so a run can be stopped and
+    resumed, and items of a crashed worker are retried once their lease expires.
+    Crashed workers are replaced while work remains.
+
+    Usage:
+        orchestrator = ScrapeOrchestrator("linkedin_cookies.json", workers=4)
+        stats = orchestrator.run(url_list)
+    """
+    def __init__(self, linkedin_cookies_json, workers=None, queue_path="./linkedin/queue.db",
+                 store_path="./linkedin/profiles.db", headless=True, sections=None,
+                 visibility_timeout=600, max_attempts=3, max_respawns=None, worker=scrape_worker,
+                 skip_saved=False, ttl_days=None, **search_kwargs):
+        """
+        linkedin_cookies_json: one cookies file, or a list used round-robin by the workers.
+        workers: number of processes, defaults to the number of cores.
+        worker: process target (worker_id, cookies_json, queue_path, store_path, options).
+        skip_saved: do not re-scrape profiles already in the store, like
+            LinkedinSearch.search_linkedin_profile with a store.
+        ttl_days: with skip_saved, profiles scraped ttl_days ago or more are re-scraped.
+        search_kwargs: passed to every LinkedinSearch, eg: user_data_root, or
+            html_archive / profile_index as a path (each worker opens it).
+        """
+        if isinstance(linkedin_cookies_json, str):
+            linkedin_cookies_json = [linkedin_cookies_json]
+        self.cookies = list(linkedin_cookies_json)
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_path = queue_path
+        self.store_path = store_path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.max_respawns = self.workers * max_attempts if max_respawns is None else max_respawns
+        self.worker = worker
+        self.options = {
+            "headless": headless,
+            "sections": sections,
+            "visibility_timeout": visibility_timeout,
+            "max_attempts": max_attempts,
+            "skip_saved": skip_saved,
+            "ttl_days": ttl_days,
+            "search_kwargs": search_kwargs,
+        }
+        # spawn: a fresh interpreter per worker, nothing inherited from the parent's driver state
+        self._context = multiprocessing.get_context("spawn")
+
+    def _queue(self):
+        return WorkQueue(self.queue_path, visibility_timeout=self.visibility_timeout,
+                         max_attempts=self.max_attempts)
+
+    def enqueue(self, url_list):
+        """
+        Adds URLs to the queue, already queued URLs are ignored.
+
+        Returns: number of URLs added.
+        """
+        with self._queue() as queue:
+            return queue.enqueue(url_list)
+
+    def _start(self, index):
+        worker_id = f"worker-{index}"
+        process = self._context.Process(
+            target=self.worker,
+            args=(worker_id, self.cookies[index % len(self.cookies)], self.queue_path, self.store_path, self.options),
+            name=worker_id,
+            daemon=False,
+        )
+        process.start()
+        return process
+
+    def run(self, url_list=None, poll=5):
+        """
+        Enqueues url_list (optional, to resume a previous run) and runs workers
+        until every item is done or failed.
+
+        Returns: the queue stats, eg: {"pending": 0, "leased": 0, "done": 98, "failed": 2}
+        """
+        if url_list:
+            added = self.enqueue(url_list)
+            print(Fore.GREEN + f"Queued {added} new URLs" + Style.RESET_ALL)
+
+        queue = self._queue()
+        try:
+            processes = {}
+            starts = 0
+            while True:
+                for index, process in list(processes.items()):
+                    if not process.is_alive():
+                        process.join()
+                        del processes[index]
+                        if process.exitcode != 0:
+                            print(Fore.RED + f"{process.name} exited with code {process.exitcode}" + Style.RESET_ALL)
+
+                if not processes and not queue.remaining():
+                    break
+                # Start workers while there is leasable work: pending items, or
+                # items whose lease expired because their worker crashed
+                available = queue.available()
+                for index in range(self.workers):
+                    if available <= 0:
+                        break
+                    if index in processes:
+                        continue
+                    if starts >= self.workers + self.max_respawns:
+                        break
+                    processes[index] = self._start(index)
+                    starts += 1
+                    available -= 1
+                if not processes and starts >= self.workers + self.max_respawns:
+                    print(Fore.RED + "Too many worker restarts, stopping" + Style.RESET_ALL)
+                    break
+                time.sleep(poll)
+            stats = queue.stats()
+        finally:
+            queue.close()
+
+        print(Fore.GREEN + f"Scrape finished: {stats}" + Style.RESET_ALL)
+        return stats
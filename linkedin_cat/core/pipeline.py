@@ -0,0 +1,394 @@
+import os
+import json
+import time
+import queue
+import threading
+
+from colorama import Fore, Style
+
+from linkedin_cat.utils import normalize_url
+from linkedin_cat.core.profile import EXTRACTOR_VERSION
+from linkedin_cat.core.profile_store import canonical_profile_id
+
+# End of stream marker passed down the queues
+_DONE = object()
+
+
+def item_url(item):
+    """
+    Returns the profile URL of a pipeline item: a URL, a search result
+    (linkedin_url) or a dict produced by a stage (url).
+    """
+    if isinstance(item, dict):
+        return item.get("url") or item.get("linkedin_url") or item.get("profile_url")
+    return item
+
+
+def item_key(item):
+    """
+    Returns the checkpoint key of a pipeline item, its canonical profile id.
+    """
+    return canonical_profile_id(item_url(item))
+
+
+class Stage():
+    """
+    One pipeline step: func(item) returns the item to pass on, or None to drop it.
+
+    workers > 1 runs func in several threads, only for thread-safe funcs
+    (a Selenium driver must stay in one thread).
+    """
+    def __init__(self, name, func, workers=1):
+        self.name = name
+        self.func = func
+        self.workers = workers
+
+
+class Checkpoint():
+    """
+    Keys of the items a pipeline has finished, kept in a JSON file so an
+    interrupted run resumes where it stopped. Written every flush_every items
+    and when the run ends.
+    """
+    def __init__(self, path, flush_every=20):
+        self.path = path
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.done = set()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.done = set(json.load(f).get("done", []))
+
+    def __contains__(self, key):
+        return key in self.done
+
+    def __len__(self):
+        return len(self.done)
+
+    def add(self, key):
+        with self._lock:
+            if key in self.done:
+                return
+            self.done.add(key)
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._write()
+
+    def flush(self):
+        with self._lock:
+            self._write()
+
+    def _write(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"done": sorted(self.done), "updated_at": time.time()}, f, ensure_ascii=False)
+        # Atomic, a crash while writing never leaves a truncated checkpoint
+        os.replace(temp_path, self.path)
+        self._pending = 0
+
+
+class Pipeline():
+    """
+    Streams items from a source through stages to a sink. The source and every
+    stage run in their own threads, connected by bounded queues: a slow stage
+    (profile scraping) blocks the ones before it once its queue holds maxsize
+    items, so discovery runs ahead of enrichment by at most maxsize items per stage.
+
+    Items whose key is in the checkpoint are skipped at the source, and an item
+    is checkpointed once the sink handled it. With a checkpoint, items without
+    a URL (eg: search results without linkedin_url) are skipped at the source.
+
+    Usage:
+        pipeline = Pipeline(
+            search_source(searcher, ["data scientist"], max_pages=5),
+            [dedupe_stage(), store_filter_stage(store), scrape_stage(scraper)],
+            sink=store_sink(store),
+            checkpoint=Checkpoint("./linkedin/pipeline.json"),
+        )
+        stats = pipeline.run()
+
+    Iterating over a pipeline yields the items leaving the last stage, without a sink.
+    """
+    def __init__(self, source, stages=(), sink=None, maxsize=32, checkpoint=None, key=item_key):
+        self.source = source
+        self.stages = [stage if isinstance(stage, Stage) else Stage(getattr(stage, "__name__", f"stage-{index}"), stage)
+                       for index, stage in enumerate(stages)]
+        self.sink = sink
+        self.maxsize = maxsize
+        self.checkpoint = checkpoint
+        self.key = key
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._error = None
+        self.stats = {}
+
+    def _reset_stats(self):
+        self.stats = {
+            "source": 0,
+            "skipped": 0,
+            "stages": {stage.name: {"in": 0, "out": 0, "dropped": 0, "errors": 0} for stage in self.stages},
+            "sink": 0,
+            "sink_errors": 0,
+        }
+
+    def _count(self, stage_name, field):
+        with self._lock:
+            self.stats["stages"][stage_name][field] += 1
+
+    def _put(self, q, item):
+        """
+        Blocks while q is full. Returns False if the pipeline was stopped.
+        """
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q):
+        while True:
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return _DONE
+
+    def _run_source(self, outbox):
+        try:
+            for item in self.source:
+                if self._stop.is_set():
+                    break
+                with self._lock:
+                    self.stats["source"] += 1
+                if self.checkpoint is not None and (not item_url(item) or self.key(item) in self.checkpoint):
+                    with self._lock:
+                        self.stats["skipped"] += 1
+                    continue
+                if not self._put(outbox, item):
+                    break
+        except Exception as e:
+            print(Fore.RED + f"Pipeline source failed: {e}" + Style.RESET_ALL)
+            self._error = e
+        finally:
+            self._put(outbox, _DONE)
+
+    def _run_stage(self, stage, inbox, outbox, finished):
+        while True:
+            item = self._get(inbox)
+            if item is _DONE:
+                # Hand the marker to the other workers of this stage, the last one passes it on
+                self._put(inbox, _DONE)
+                with self._lock:
+                    finished[0] += 1
+                    last = finished[0] == stage.workers
+                if last:
+                    self._put(outbox, _DONE)
+                return
+            self._count(stage.name, "in")
+            try:
+                result = stage.func(item)
+            except Exception as e:
+                print(Fore.RED + f"Stage {stage.name} failed on {item_url(item)}: {e}" + Style.RESET_ALL)
+                self._count(stage.name, "errors")
+                continue
+            if result is None:
+                self._count(stage.name, "dropped")
+                continue
+            self._count(stage.name, "out")
+            if not self._put(outbox, result):
+                return
+
+    def __iter__(self):
+        self._reset_stats()
+        self._stop.clear()
+        self._error = None
+        queues = [queue.Queue(maxsize=self.maxsize) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._run_source, args=(queues[0],), name="pipeline-source", daemon=True)]
+        for index, stage in enumerate(self.stages):
+            finished = [0]
+            for worker in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._run_stage, args=(stage, queues[index], queues[index + 1], finished),
+                    name=f"pipeline-{stage.name}-{worker}", daemon=True,
+                ))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = self._get(queues[-1])
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            # Also reached when the consumer stops early: stages finish their current item and exit
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def stop(self):
+        """
+        Stops a running pipeline, items in flight are not passed on.
+        """
+        self._stop.set()
+
+    def run(self, sink=None):
+        """
+        Runs the pipeline until the source is exhausted, passing every item to sink.
+
+        Returns: the stats, eg: {"source": 120, "skipped": 10, "stages": {name: {"in", "out",
+            "dropped", "errors"}}, "sink": 40, "sink_errors": 0}
+        """
+        sink = sink or self.sink
+        try:
+            for item in self:
+                try:
+                    if sink is not None:
+                        sink(item)
+                except Exception as e:
+                    print(Fore.RED + f"Sink failed on {item_url(item)}: {e}" + Style.RESET_ALL)
+                    self.stats["sink_errors"] += 1
+                    continue
+                self.stats["sink"] += 1
+                if self.checkpoint is not None and item_url(item):
+                    self.checkpoint.add(self.key(item))
+        finally:
+            if self.checkpoint is not None:
+                self.checkpoint.flush()
+        print(Fore.GREEN + f"Pipeline finished: {self.stats}" + Style.RESET_ALL)
+        return self.stats
+
+
+# Sources
+
+def search_source(searcher, queries, max_pages=10, planner=None):
+    """
+    Yields the search results of every query as result pages come in.
+
+    queries: keywords strings or parameter dicts ({"keywords", "company", "title", ...}).
+    planner: optional SearchQueryPlanner, serves repeated queries from its cache,
+        so a resumed run does not search again.
+    """
+    params_list = [{"keywords": q} if isinstance(q, str) else q for q in queries]
+    if planner is not None:
+        yield from planner.iter_run(searcher, params_list, max_pages=max_pages)
+        return
+    for params in params_list:
+        filters = {k: v for k, v in params.items() if k != "keywords"}
+        for page in searcher.iter_search(params.get("keywords"), filters=filters, max_pages=max_pages):
+            yield from page
+
+
+# Stages
+
+def dedupe_stage():
+    """
+    Canonicalizes item URLs (item["url"]) and drops profiles already seen in this run.
+    """
+    seen = set()
+    lock = threading.Lock()
+
+    def dedupe(item):
+        url = item_url(item)
+        if not url:
+            return None
+        key = canonical_profile_id(url)
+        with lock:
+            if key in seen:
+                return None
+            seen.add(key)
+        item = dict(item) if isinstance(item, dict) else {}
+        item["url"] = normalize_url(url)
+        return item
+
+    return Stage("dedupe", dedupe)
+
+
+def store_filter_stage(store, ttl_days=None, sections=None):
+    """
+    Drops profiles already in a ProfileStore: fresher than ttl_days (when given)
+    and holding every requested section.
+    """
+    def store_filter(item):
+        url = item_url(item)
+        saved = (store.has(url) and (ttl_days is None or store.is_fresh(url, ttl_days))
+                 and store.has_sections(url, sections or []))
+        return None if saved else item
+
+    return Stage("store_filter", store_filter)
+
+
+def cache_filter_stage(cache):
+    """
+    Drops contacts a ContactCache does not allow to message (already sent, cooldown, blocked).
+    """
+    def cache_filter(item):
+        return item if cache.check(item_url(item))["can_send"] else None
+
+    return Stage("cache_filter", cache_filter)
+
+
+def scrape_stage(searcher, sections=None, thread_pool=True):
+    """
+    Scrapes the profile of every item into item["profile"] with LinkedinSearch.scrape_profile.
+
+    searcher must not be used by another stage, eg: the search source needs its own session.
+    """
+    def scrape(item):
+        profile_data = searcher.scrape_profile(item_url(item), sections=sections, thread_pool=thread_pool)
+        if not profile_data:
+            return None
+        item = dict(item) if isinstance(item, dict) else {"url": item}
+        item["profile"] = profile_data
+        return item
+
+    return Stage("scrape", scrape)
+
+
+# Sinks
+
+def store_sink(store, index=None):
+    """
+    Saves item["profile"] to a ProfileStore, and updates a ProfileIndex when given.
+    """
+    def sink(item):
+        store.save_sections(item["profile"], extractor_version=EXTRACTOR_VERSION)
+        if index is not None:
+            index.index(store.get(item["profile"]["profile_url"]))
+
+    return sink
+
+
+def jsonl_sink(path):
+    """
+    Appends every item as one JSON line to path.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def sink(item):
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    return sink
+
+
+def send_sink(messenger, message, cache=None):
+    """
+    Sends message to every item with LinkedinMessage.send_single_request and
+    records the attempt in a ContactCache.
+    """
+    def sink(item):
+        url = item_url(item)
+        result = messenger.send_single_request(url, message)
+        if cache is not None:
+            cache.mark_sent(url, success=result["success"], metadata={"status": result["status"]})
+        if not result["success"]:
+            raise RuntimeError(result["message"])
+
+    return sink
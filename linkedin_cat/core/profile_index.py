@@ -0,0 +1,243 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+
+from linkedin_cat.core.profile_store import canonical_profile_id, content_hash
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id           INTEGER PRIMARY KEY,
+    profile_id   TEXT NOT NULL UNIQUE,
+    profile_url  TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    indexed_at   REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS profile_fts USING fts5(
+    name, headline, location, about, titles, companies, education, skills,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# Indexed columns, also the column filters accepted by ProfileIndex.search
+INDEX_COLUMNS = ("name", "headline", "location", "about", "titles", "companies", "education", "skills")
+
+# search() keyword arguments -> FTS5 column
+FILTER_COLUMNS = {
+    "name": "name",
+    "headline": "headline",
+    "location": "location",
+    "title": "titles",
+    "company": "companies",
+    "school": "education",
+    "skill": "skills",
+}
+
+
+def _join(values):
+    return "\n".join(str(value) for value in values if value and value != "Not available")
+
+
+def profile_document(profile_data):
+    """
+    Returns the indexed text of a profile dict, one string per INDEX_COLUMNS entry.
+    """
+    intro = profile_data.get("intro") or {}
+    about = profile_data.get("about") or {}
+    experience = profile_data.get("experience") or []
+    education = profile_data.get("education") or []
+    skills = profile_data.get("skills") or []
+    return {
+        "name": _join([intro.get("name")]),
+        "headline": _join([intro.get("works_at")]),
+        "location": _join([intro.get("location")]),
+        "about": _join([about.get("about_description")]),
+        "titles": _join(job.get("job_title") for job in experience),
+        "companies": _join(job.get("company_name") for job in experience),
+        "education": _join(value for school in education
+                           for value in (school.get("university"), school.get("degree_field"))),
+        "skills": _join(skill.get("title") for skill in skills),
+    }
+
+
+def _phrase(text):
+    """
+    Quotes every term of user input, so characters like - + : or " are not read as FTS5 syntax.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in str(text).split())
+
+
+def build_match(query=None, **filters):
+    """
+    Builds an FTS5 MATCH expression: every term of query in any column, and every
+    term of a filter in its column. Filters are the keys of FILTER_COLUMNS.
+
+    eg: build_match("python", company="Acme Corp", title="engineer")
+        -> '"python" AND companies : ("Acme" "Corp") AND titles : ("engineer")'
+    """
+    parts = [_phrase(query)] if query and query.strip() else []
+    for field, value in filters.items():
+        if field not in FILTER_COLUMNS:
+            raise ValueError(f"Unknown filter: {field}, expected one of {', '.join(FILTER_COLUMNS)}")
+        if value and str(value).strip():
+            parts.append(f"{FILTER_COLUMNS[field]} : ({_phrase(value)})")
+    return " AND ".join(parts)
+
+
+class ProfileIndex():
+    """
+    Full-text index (SQLite FTS5) of scraped profiles: name, headline, location,
+    about, experience titles and companies, education and skills.
+
+    Profiles are indexed one by one as they are saved, a profile whose content
+    did not change is not rewritten. Queries run locally and never open a browser.
+
+    Usage:
+        with ProfileIndex("./linkedin/index.db") as index:
+            index.index_store(store)
+            index.search(company="acme", title="engineer")
+    """
+    def __init__(self, db_path="./linkedin/index.db"):
+        folder = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(folder, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def __contains__(self, profile_url):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM documents WHERE profile_id = ?", (canonical_profile_id(profile_url),)
+            ).fetchone()
+        return row is not None
+
+    def _index(self, profile_data):
+        profile_url = profile_data["profile_url"]
+        profile_id = canonical_profile_id(profile_url)
+        document = profile_document(profile_data)
+        digest = content_hash(document)
+        row = self.conn.execute(
+            "SELECT id, content_hash FROM documents WHERE profile_id = ?", (profile_id,)
+        ).fetchone()
+        if row and row[1] == digest:
+            return False
+        if row:
+            doc_id = row[0]
+            self.conn.execute("DELETE FROM profile_fts WHERE rowid = ?", (doc_id,))
+            self.conn.execute(
+                "UPDATE documents SET profile_url = ?, content_hash = ?, indexed_at = ? WHERE id = ?",
+                (profile_url, digest, time.time(), doc_id),
+            )
+        else:
+            doc_id = self.conn.execute(
+                "INSERT INTO documents (profile_id, profile_url, content_hash, indexed_at) VALUES (?, ?, ?, ?)",
+                (profile_id, profile_url, digest, time.time()),
+            ).lastrowid
+        self.conn.execute(
+            f"INSERT INTO profile_fts (rowid, {', '.join(INDEX_COLUMNS)}) "
+            f"VALUES (?, {', '.join('?' * len(INDEX_COLUMNS))})",
+            (doc_id, *[document[column] for column in INDEX_COLUMNS]),
+        )
+        return True
+
+    def index(self, profile_data):
+        """
+        Indexes or re-indexes a profile dict as produced by extract_profile.
+
+        Returns: True if the indexed content changed (or the profile is new).
+        """
+        with self._lock:
+            changed = self._index(profile_data)
+            self.conn.commit()
+        return changed
+
+    def index_many(self, profiles):
+        """
+        Indexes profile dicts in one transaction.
+
+        Returns: number of profiles (re)indexed.
+        """
+        count = 0
+        with self._lock:
+            for profile_data in profiles:
+                if isinstance(profile_data, dict) and profile_data.get("profile_url"):
+                    count += self._index(profile_data)
+            self.conn.commit()
+        return count
+
+    def index_store(self, store):
+        """
+        Indexes every profile of a ProfileStore.
+        """
+        return self.index_many(store.iter_profiles())
+
+    def index_folder(self, save_folder="./linkedin"):
+        """
+        Indexes the {username}.json files written by save_to_json.
+        """
+        def profiles():
+            for name in sorted(os.listdir(save_folder)):
+                if name.endswith(".json"):
+                    with open(os.path.join(save_folder, name), "r", encoding="utf-8") as f:
+                        yield json.load(f)
+
+        return self.index_many(profiles())
+
+    def remove(self, profile_url):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT id FROM documents WHERE profile_id = ?", (canonical_profile_id(profile_url),)
+            ).fetchone()
+            if row:
+                self.conn.execute("DELETE FROM profile_fts WHERE rowid = ?", (row[0],))
+                self.conn.execute("DELETE FROM documents WHERE id = ?", (row[0],))
+            self.conn.commit()
+
+    def search(self, query=None, limit=50, match=None, **filters):
+        """
+        Searches indexed profiles, best matches first (bm25).
+
+        Parameters:
+        - query: str, terms matched in any column.
+        - filters: title, company, school, skill, location, name, headline: terms
+          matched in that column only.
+        - match: str, a raw FTS5 expression used instead of query and filters,
+          eg: 'titles : "engineer" NOT companies : "acme"'.
+        - limit: int, maximum number of results.
+
+        Returns:
+        - list of {"profile_url", "name", "headline", "location", "rank"}.
+        """
+        expression = match or build_match(query, **filters)
+        if not expression:
+            raise ValueError("Empty search, give a query, a filter or a match expression")
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT documents.profile_url, profile_fts.name, profile_fts.headline, "
+                "profile_fts.location, bm25(profile_fts) AS rank "
+                "FROM profile_fts JOIN documents ON documents.id = profile_fts.rowid "
+                "WHERE profile_fts MATCH ? ORDER BY rank LIMIT ?",
+                (expression, limit),
+            ).fetchall()
+        return [
+            {"profile_url": url, "name": name, "headline": headline, "location": location, "rank": rank}
+            for url, name, headline, location, rank in rows
+        ]
@@ -0,0 +1,340 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+
+from linkedin_cat.core.helper import save_to_json, extract_and_decode_username
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    profile_id   TEXT PRIMARY KEY,
+    profile_url  TEXT NOT NULL,
+    scraped_at   REAL NOT NULL,
+    content_hash TEXT NOT NULL,
+    data         BLOB NOT NULL,
+    extractor_version TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_profiles_scraped_at ON profiles (scraped_at);
+CREATE TABLE IF NOT EXISTS profile_sections (
+    profile_id   TEXT NOT NULL,
+    section      TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    updated_at   REAL NOT NULL,
+    data         BLOB NOT NULL,
+    PRIMARY KEY (profile_id, section)
+);
+"""
+
+# Top-level keys of a profile dict that are not sections
+META_KEYS = ("filename", "profile_url", "captured_sections")
+
+
+def canonical_profile_id(profile_url):
+    """
+    Returns the canonical id of a profile URL, the decoded, lower-cased username.
+
+    eg: https://www.linkedin.com/in/John-Doe/?trk=x -> john-doe
+    """
+    return extract_and_decode_username(profile_url.split("?")[0]).lower()
+
+
+def content_hash(data):
+    """
+    Returns a sha256 of the JSON content, independent of key order.
+    """
+    payload = json.dumps(data, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _pack(data):
+    return zlib.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+
+def _unpack(blob):
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+class ProfileStore():
+    """
+    Stores scraped profiles in one SQLite file instead of one JSON file per profile.
+
+    Records are zlib-compressed JSON indexed by canonical profile id, with the
+    scrape timestamp and a content hash. Every section (intro, experience ...) is
+    its own row with its own hash, so a re-scrape only rewrites the sections that
+    changed. Lookups ("already scraped?") are a primary key hit, and export_json
+    writes the same {username}.json files as save_to_json.
+    """
+    def __init__(self, db_path="./linkedin/profiles.db"):
+        folder = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(folder, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # Worker processes of ScrapeOrchestrator write concurrently, wait for the lock
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        # Stores created before extractor versions were recorded
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(profiles)")]
+        if "extractor_version" not in columns:
+            self.conn.execute("ALTER TABLE profiles ADD COLUMN extractor_version TEXT")
+        self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def __contains__(self, profile_url):
+        return self.has(profile_url)
+
+    def has(self, profile_url):
+        """
+        Returns True if the profile has already been scraped.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM profiles WHERE profile_id = ?", (canonical_profile_id(profile_url),)
+            ).fetchone()
+        return row is not None
+
+    def save(self, profile_data, scraped_at=None, extractor_version=None):
+        """
+        Inserts or updates a profile dict as produced by extract_profile.
+
+        Returns: True if the content changed (or the profile is new).
+        """
+        diff = self.save_sections(profile_data, scraped_at=scraped_at, extractor_version=extractor_version)
+        return diff["new"] or bool(diff["added"] or diff["changed"] or diff["removed"])
+
+    def save_sections(self, profile_data, scraped_at=None, extractor_version=None):
+        """
+        Saves a profile, rewriting only the sections whose content hash changed.
+        The profile scrape timestamp is only moved by a full scrape, a partial
+        one (captured_sections) leaves the other sections as old as they were.
+        extractor_version tags the extractors that produced the data, see
+        profile.EXTRACTOR_VERSION, and is kept as is when not given.
+
+        Returns: {"new": bool, "added": [...], "changed": [...], "removed": [...], "unchanged": [...]}
+        """
+        profile_url = profile_data["profile_url"]
+        profile_id = canonical_profile_id(profile_url)
+        scraped_at = scraped_at or time.time()
+        meta = {key: profile_data[key] for key in META_KEYS if key in profile_data}
+        sections = {key: value for key, value in profile_data.items() if key not in META_KEYS}
+        # A partial scrape (captured_sections) leaves the other sections untouched
+        captured = profile_data.get("captured_sections")
+        diff = {"new": False, "added": [], "changed": [], "removed": [], "unchanged": []}
+
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT data FROM profiles WHERE profile_id = ?", (profile_id,)
+            ).fetchone()
+            diff["new"] = row is None
+            old_meta = _unpack(row[0]) if row else {}
+            stored = dict(self.conn.execute(
+                "SELECT section, content_hash FROM profile_sections WHERE profile_id = ?", (profile_id,)
+            ).fetchall())
+            # Profiles saved before per-section rows existed keep everything in data,
+            # move those sections to their own rows first
+            for key in [k for k in old_meta if k not in META_KEYS and k != "_section_order"]:
+                value = old_meta.pop(key)
+                if key not in stored:
+                    stored[key] = content_hash(value)
+                    self._write_section(profile_id, key, value, stored[key], scraped_at)
+
+            for section, value in sections.items():
+                digest = content_hash(value)
+                if stored.get(section) == digest:
+                    diff["unchanged"].append(section)
+                    continue
+                diff["changed" if section in stored else "added"].append(section)
+                stored[section] = digest
+                self._write_section(profile_id, section, value, digest, scraped_at)
+            for section in list(stored):
+                if section not in sections and (captured is None or section in captured):
+                    diff["removed"].append(section)
+                    del stored[section]
+                    self.conn.execute(
+                        "DELETE FROM profile_sections WHERE profile_id = ? AND section = ?", (profile_id, section)
+                    )
+
+            # Keeps the key order of extract_profile when the profile is reassembled
+            old_order = old_meta.get("_section_order", [])
+            if captured is None:
+                order = list(sections) + [k for k in old_order if k in stored and k not in sections]
+            else:
+                order = [k for k in old_order if k in stored] + [k for k in sections if k not in old_order]
+            meta["_section_order"] = order
+            if captured is not None:
+                meta["captured_sections"] = list(order)
+
+            self.conn.execute(
+                "INSERT INTO profiles "
+                "(profile_id, profile_url, scraped_at, content_hash, data, extractor_version) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (profile_id) DO UPDATE SET "
+                "profile_url = excluded.profile_url, "
+                "scraped_at = CASE WHEN ? THEN profiles.scraped_at ELSE excluded.scraped_at END, "
+                "content_hash = excluded.content_hash, data = excluded.data, "
+                "extractor_version = COALESCE(excluded.extractor_version, profiles.extractor_version)",
+                (profile_id, profile_url, scraped_at, content_hash(stored), _pack(meta), extractor_version,
+                 captured is not None),
+            )
+            self.conn.commit()
+        return diff
+
+    def _write_section(self, profile_id, section, value, digest, updated_at):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO profile_sections (profile_id, section, content_hash, updated_at, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (profile_id, section, digest, updated_at, _pack(value)),
+        )
+
+    def _assemble(self, profile_id, blob):
+        profile_data = _unpack(blob)
+        order = profile_data.pop("_section_order", [])
+        sections = dict(self.conn.execute(
+            "SELECT section, data FROM profile_sections WHERE profile_id = ?", (profile_id,)
+        ).fetchall())
+        for section in order + sorted(set(sections) - set(order)):
+            if section in sections:
+                profile_data[section] = _unpack(sections[section])
+        return profile_data
+
+    def get(self, profile_url):
+        """
+        Returns the stored profile dict, None if missing.
+        """
+        profile_id = canonical_profile_id(profile_url)
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT data FROM profiles WHERE profile_id = ?", (profile_id,)
+            ).fetchone()
+            return self._assemble(profile_id, row[0]) if row else None
+
+    def section_metadata(self, profile_url):
+        """
+        Returns {section: {"content_hash", "updated_at"}} of a stored profile.
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT section, content_hash, updated_at FROM profile_sections WHERE profile_id = ?",
+                (canonical_profile_id(profile_url),),
+            ).fetchall()
+        return {section: {"content_hash": digest, "updated_at": updated_at} for section, digest, updated_at in rows}
+
+    def has_sections(self, profile_url, sections):
+        """
+        True if the stored profile holds every section in sections. Profiles
+        saved from a full scrape hold every section.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT data FROM profiles WHERE profile_id = ?", (canonical_profile_id(profile_url),)
+            ).fetchone()
+        if row is None:
+            return False
+        captured = _unpack(row[0]).get("captured_sections")
+        return captured is None or set(sections) <= set(captured)
+
+    # Freshness
+
+    def is_fresh(self, profile_url, ttl_days=7):
+        """
+        True if the profile was scraped less than ttl_days ago.
+        """
+        meta = self.metadata(profile_url)
+        return meta is not None and time.time() - meta["scraped_at"] < ttl_days * 86400
+
+    def stale_profiles(self, ttl_days=7, limit=None):
+        """
+        Returns the urls of profiles scraped ttl_days ago or more, oldest first.
+        """
+        query = "SELECT profile_url FROM profiles WHERE scraped_at < ? ORDER BY scraped_at"
+        params = [time.time() - ttl_days * 86400]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [row[0] for row in self.conn.execute(query, params).fetchall()]
+
+    def metadata(self, profile_url):
+        """
+        Returns {"profile_id", "profile_url", "scraped_at", "content_hash", "extractor_version"},
+        None if missing.
+        """
+        fields = ["profile_id", "profile_url", "scraped_at", "content_hash", "extractor_version"]
+        with self._lock:
+            row = self.conn.execute(
+                f"SELECT {', '.join(fields)} FROM profiles WHERE profile_id = ?",
+                (canonical_profile_id(profile_url),),
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(fields, row))
+
+    def delete(self, profile_url):
+        profile_id = canonical_profile_id(profile_url)
+        with self._lock:
+            self.conn.execute("DELETE FROM profiles WHERE profile_id = ?", (profile_id,))
+            self.conn.execute("DELETE FROM profile_sections WHERE profile_id = ?", (profile_id,))
+            self.conn.commit()
+
+    def iter_profiles(self):
+        """
+        Yields every stored profile dict.
+        """
+        with self._lock:
+            ids = [row[0] for row in self.conn.execute("SELECT profile_id FROM profiles ORDER BY profile_id")]
+        for profile_id in ids:
+            with self._lock:
+                row = self.conn.execute("SELECT data FROM profiles WHERE profile_id = ?", (profile_id,)).fetchone()
+                if row is None:
+                    continue
+                profile_data = self._assemble(profile_id, row[0])
+            yield profile_data
+
+    def export_json(self, save_folder="./linkedin"):
+        """
+        Writes every profile to {save_folder}/{filename}.json, same layout as save_to_json.
+
+        Returns: number of files written.
+        """
+        os.makedirs(save_folder, exist_ok=True)
+        count = 0
+        for profile_data in self.iter_profiles():
+            filename = profile_data.get("filename") or extract_and_decode_username(profile_data["profile_url"])
+            save_to_json(profile_data, os.path.join(save_folder, f"{filename}.json"))
+            count += 1
+        return count
+
+    def import_json(self, save_folder="./linkedin"):
+        """
+        Loads {username}.json files written by save_to_json into the store.
+
+        Returns: number of profiles imported.
+        """
+        count = 0
+        for name in sorted(os.listdir(save_folder)):
+            if not name.endswith(".json"):
+                continue
+            file_path = os.path.join(save_folder, name)
+            with open(file_path, "r", encoding="utf-8") as f:
+                profile_data = json.load(f)
+            if not isinstance(profile_data, dict) or not profile_data.get("profile_url"):
+                continue
+            self.save(profile_data, scraped_at=os.path.getmtime(file_path))
+            count += 1
+        return count
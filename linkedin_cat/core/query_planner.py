@@ -0,0 +1,227 @@
+import json
+import itertools
+
+import diskcache
+from colorama import Fore, Style
+
+from linkedin_cat.utils import normalize_url
+
+# generate_linkedin_search_url arguments that change the result set
+QUERY_FIELDS = ("keywords", "company", "title", "school", "first_name", "last_name")
+
+
+def canonicalize_query(params):
+    """
+    Returns the canonical form of a search parameter dict: only result-changing
+    fields, whitespace collapsed, lower-cased, empty values dropped.
+
+    eg: {"keywords": " Data  Scientist", "company": None, "origin": "X"}
+        -> {"keywords": "data scientist"}
+    """
+    canonical = {}
+    for field in QUERY_FIELDS:
+        value = params.get(field)
+        if value is None:
+            continue
+        value = " ".join(str(value).split()).lower()
+        if value:
+            canonical[field] = value
+    return canonical
+
+
+def query_key(params):
+    """
+    Returns the cache key of a search, identical for equivalent parameter dicts.
+    """
+    return json.dumps(canonicalize_query(params), sort_keys=True, ensure_ascii=False)
+
+
+def result_url(result):
+    url = result.get("linkedin_url") if isinstance(result, dict) else result
+    return normalize_url(url) if url else None
+
+
+class SearchQueryPlanner():
+    """
+    Plans families of LinkedIn searches (eg: title x company x school):
+
+    - equivalent queries are deduplicated through their canonical form
+    - result sets are cached on disk with a TTL, keyed by the canonical query,
+      with the number of pages read: a deeper search is not served from them
+    - the marginal yield (share of results not seen before) of every query is
+      recorded per facet value, and expansions using a facet value whose yield
+      stayed below min_yield are pruned
+    """
+    def __init__(self, cache_dir="./cache/search", ttl_days=7, min_yield=0.1, min_runs=2):
+        self.cache = diskcache.Cache(cache_dir)
+        self.ttl_seconds = ttl_days * 24 * 3600
+        self.min_yield = min_yield
+        self.min_runs = min_runs
+
+    def close(self):
+        self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # Result cache
+
+    def get(self, params, max_pages=None):
+        """
+        Returns the cached results of a query, None if missing, expired, or read
+        with fewer than max_pages pages (unless the search had no more pages).
+        """
+        entry = self.cache.get(f"results:{query_key(params)}")
+        if not isinstance(entry, dict):
+            return None
+        exhausted = entry["pages"] < entry["max_pages"]
+        if max_pages is not None and entry["max_pages"] < max_pages and not exhausted:
+            return None
+        return entry["results"]
+
+    def put(self, params, results, pages=1, max_pages=1):
+        """
+        Caches the results of a query read with pages pages out of max_pages.
+        """
+        entry = {"results": list(results), "pages": pages, "max_pages": max_pages}
+        self.cache.set(f"results:{query_key(params)}", entry, expire=self.ttl_seconds)
+
+    # Yield tracking
+
+    @staticmethod
+    def _facets(params):
+        canonical = canonicalize_query(params)
+        return [f"{field}={value}" for field, value in canonical.items() if field != "keywords"]
+
+    def record_yield(self, params, total, new):
+        """
+        Records that a query returned total results of which new were not seen before.
+        """
+        marginal = new / total if total else 0.0
+        with self.cache.transact():
+            key = f"yield:query:{query_key(params)}"
+            self.cache.set(key, {"total": total, "new": new, "yield": marginal})
+            for facet in self._facets(params):
+                facet_key = f"yield:facet:{facet}"
+                stat = self.cache.get(facet_key, {"runs": 0, "total": 0, "new": 0})
+                stat["runs"] += 1
+                stat["total"] += total
+                stat["new"] += new
+                self.cache.set(facet_key, stat)
+
+    def facet_yield(self, facet):
+        """
+        Returns (runs, marginal yield) of a facet value, eg: "company=acme".
+        """
+        stat = self.cache.get(f"yield:facet:{facet}")
+        if not stat or not stat["total"]:
+            return (stat["runs"] if stat else 0, None)
+        return stat["runs"], stat["new"] / stat["total"]
+
+    def should_prune(self, params):
+        """
+        True if one facet value of the query has a low marginal yield over enough runs.
+        """
+        for facet in self._facets(params):
+            runs, marginal = self.facet_yield(facet)
+            if runs >= self.min_runs and marginal is not None and marginal < self.min_yield:
+                return True
+        return False
+
+    def yield_stats(self):
+        """
+        Returns {"queries": {key: stat}, "facets": {facet: stat}}.
+        """
+        stats = {"queries": {}, "facets": {}}
+        for key in self.cache.iterkeys():
+            if key.startswith("yield:query:"):
+                stats["queries"][key[len("yield:query:"):]] = self.cache.get(key)
+            elif key.startswith("yield:facet:"):
+                stats["facets"][key[len("yield:facet:"):]] = self.cache.get(key)
+        return stats
+
+    # Planning
+
+    def expand(self, keywords, titles=None, companies=None, schools=None):
+        """
+        Returns the deduplicated parameter dicts of every title x company x school combination.
+        """
+        plans = []
+        seen = set()
+        for title, company, school in itertools.product(titles or [None], companies or [None], schools or [None]):
+            params = canonicalize_query({"keywords": keywords, "title": title, "company": company, "school": school})
+            key = query_key(params)
+            if key not in seen:
+                seen.add(key)
+                plans.append(params)
+        return plans
+
+    def plan(self, params_list, max_pages=None):
+        """
+        Deduplicates the queries and orders them: cached first (with at least
+        max_pages pages), then by the best known facet yield. Pruned queries are
+        dropped.
+        """
+        planned = {}
+        for params in params_list:
+            key = query_key(params)
+            if key in planned:
+                continue
+            if self.get(params, max_pages) is None and self.should_prune(params):
+                print(Fore.YELLOW + f"Pruned low-yield query: {key}" + Style.RESET_ALL)
+                continue
+            planned[key] = canonicalize_query(params)
+
+        def priority(params):
+            cached = self.get(params, max_pages) is not None
+            yields = [self.facet_yield(facet)[1] for facet in self._facets(params)]
+            known = [y for y in yields if y is not None]
+            return (not cached, -(min(known) if known else 1.0))
+
+        return sorted(planned.values(), key=priority)
+
+    def iter_run(self, searcher, params_list, max_pages=1):
+        """
+        Runs the planned queries with searcher.iter_search, using cached result sets
+        where possible, and yields the results not seen before as pages come in.
+
+        A query is cached and its yield recorded once all its pages were read.
+        Cached results read with fewer than max_pages pages are searched again,
+        and replays from the cache do not count as runs for the facet yields.
+        """
+        seen = set()
+        for params in self.plan(params_list, max_pages):
+            results = self.get(params, max_pages)
+            cached = results is not None
+            if cached:
+                print(Fore.GREEN + f"Using cached results for: {query_key(params)}" + Style.RESET_ALL)
+                pages = [results]
+            else:
+                filters = {k: v for k, v in params.items() if k != "keywords"}
+                pages = searcher.iter_search(params.get("keywords"), filters=filters, max_pages=max_pages)
+
+            collected = []
+            new = 0
+            read = 0
+            for page in pages:
+                read += 1
+                for result in page:
+                    collected.append(result)
+                    url = result_url(result)
+                    if url and url not in seen:
+                        seen.add(url)
+                        new += 1
+                        yield result
+            if not cached:
+                self.put(params, collected, pages=read, max_pages=max_pages)
+                self.record_yield(params, len(collected), new)
+
+    def run(self, searcher, params_list, max_pages=1):
+        """
+        Runs the planned queries (see iter_run) and returns the results
+        deduplicated by profile URL.
+        """
+        return list(self.iter_run(searcher, params_list, max_pages=max_pages))
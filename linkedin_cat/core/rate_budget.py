@@ -0,0 +1,49 @@
+import time
+import threading
+
+
+class RateBudget():
+    """
+    Token bucket shared by threads: at most `rate` calls per second on average,
+    with bursts of up to `burst` calls.
+
+    Usage:
+        budget = RateBudget(rate=2, burst=5)
+        budget.acquire()  # blocks until a call is allowed
+        requests.post(...)
+    """
+    def __init__(self, rate=2.0, burst=5):
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self):
+        """
+        Takes a token without waiting. Returns False if the budget is spent.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def acquire(self):
+        """
+        Takes a token, waiting until one is available.
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
@@ -0,0 +1,267 @@
+import os
+import json
+import time
+import zlib
+import hashlib
+import sqlite3
+import threading
+
+import diskcache
+from colorama import Fore, Style
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key       TEXT PRIMARY KEY,
+    endpoint  TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    data      BLOB NOT NULL
+);
+"""
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Seconds a response is fresh, per endpoint
+DEFAULT_TTLS = {
+    "profile.identity": 7 * DAY,
+    "profile.network": DAY,
+    "profile.contact": 7 * DAY,
+    "profile.resume": 7 * DAY,
+    "profile.top_card": DAY,
+    "company.info": 7 * DAY,
+    "post.stats": HOUR,
+    "event.guests": HOUR,
+}
+
+# Endpoints whose response depends on the account viewing the profile
+# (network distance, following, visible contact info), cached per account
+ACCOUNT_SCOPED_ENDPOINTS = {"profile.network", "profile.contact", "profile.top_card"}
+
+
+def normalize_params(params):
+    """
+    Returns the params of a request in canonical form: None values dropped,
+    strings stripped, keys sorted.
+    """
+    normalized = {}
+    for key in sorted(params):
+        value = params[key]
+        if value is None:
+            continue
+        normalized[key] = value.strip() if isinstance(value, str) else value
+    return normalized
+
+
+def cache_key(endpoint, params, account=None):
+    """
+    Returns the cache key of a request, identical for equivalent params.
+    account (eg: the li_at cookie) scopes the key to one account, only a
+    hash of it is part of the key.
+    """
+    key = [endpoint, normalize_params(params)]
+    if account is not None:
+        key.append(hashlib.sha256(account.encode("utf-8")).hexdigest()[:16])
+    return json.dumps(key, sort_keys=True, ensure_ascii=False)
+
+
+class SqliteBackend():
+    """
+    Responses in one SQLite file, zlib-compressed JSON.
+    """
+    def __init__(self, db_path="./linkedin/responses.db"):
+        folder = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(folder, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def get(self, key):
+        with self._lock:
+            row = self.conn.execute("SELECT stored_at, data FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(zlib.decompress(row[1]).decode("utf-8"))
+
+    def set(self, key, endpoint, stored_at, value):
+        data = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, stored_at, data) VALUES (?, ?, ?, ?)",
+                (key, endpoint, stored_at, data),
+            )
+            self.conn.commit()
+
+    def delete(self, key):
+        with self._lock:
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.conn.commit()
+
+    def clear(self, endpoint=None):
+        with self._lock:
+            if endpoint is None:
+                self.conn.execute("DELETE FROM responses")
+            else:
+                self.conn.execute("DELETE FROM responses WHERE endpoint = ?", (endpoint,))
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class DiskcacheBackend():
+    """
+    Responses in a diskcache directory.
+    """
+    def __init__(self, directory="./cache/responses"):
+        self.cache = diskcache.Cache(directory)
+
+    def get(self, key):
+        entry = self.cache.get(key)
+        return (entry["stored_at"], entry["value"]) if entry else None
+
+    def set(self, key, endpoint, stored_at, value):
+        self.cache.set(key, {"endpoint": endpoint, "stored_at": stored_at, "value": value})
+
+    def delete(self, key):
+        self.cache.delete(key)
+
+    def clear(self, endpoint=None):
+        if endpoint is None:
+            self.cache.clear()
+            return
+        for key in list(self.cache.iterkeys()):
+            entry = self.cache.get(key)
+            if entry and entry["endpoint"] == endpoint:
+                self.cache.delete(key)
+
+    def close(self):
+        self.cache.close()
+
+
+class ResponseCache():
+    """
+    Caches the parsed JSON of read-only LinkedIn requests, keyed by endpoint
+    and normalized params.
+
+    - a response younger than its endpoint TTL is returned without a request
+    - a response at most stale_ttl seconds past its TTL is returned at once and
+      refreshed in a background thread (stale-while-revalidate)
+    - older responses, or calls with bypass, are fetched and stored
+
+    Responses of account_scoped endpoints (default ACCOUNT_SCOPED_ENDPOINTS)
+    are kept per account, the others are shared by every account.
+
+    backend: SqliteBackend, DiskcacheBackend or a SQLite file path.
+
+    Usage:
+        cache = ResponseCache("./linkedin/responses.db", ttls={"post.stats": 600})
+        linkedin = LinkedIn().connect(li_at, jsessionid, response_cache=cache)
+    """
+    def __init__(self, backend="./linkedin/responses.db", ttls=None, default_ttl=DAY, stale_ttl=DAY,
+                 bypass=False, account_scoped=None):
+        self.backend = SqliteBackend(backend) if isinstance(backend, str) else backend
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.account_scoped = set(ACCOUNT_SCOPED_ENDPOINTS if account_scoped is None else account_scoped)
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.bypass = bypass
+        self._lock = threading.Lock()
+        self._revalidating = set()
+        self._counters = {}
+
+    def close(self):
+        self.backend.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _count(self, endpoint, field):
+        with self._lock:
+            counters = self._counters.setdefault(
+                endpoint, {"hits": 0, "misses": 0, "stale": 0, "bypass": 0, "revalidated": 0, "errors": 0}
+            )
+            counters[field] += 1
+
+    def stats(self):
+        """
+        Returns {"total": counters, endpoint: counters}, counters being
+        {"hits", "misses", "stale", "bypass", "revalidated", "errors"}.
+        """
+        with self._lock:
+            stats = {endpoint: dict(counters) for endpoint, counters in self._counters.items()}
+        total = {"hits": 0, "misses": 0, "stale": 0, "bypass": 0, "revalidated": 0, "errors": 0}
+        for counters in stats.values():
+            for field, count in counters.items():
+                total[field] += count
+        stats["total"] = total
+        return stats
+
+    def ttl(self, endpoint):
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def _key(self, endpoint, params, account):
+        return cache_key(endpoint, params, account if endpoint in self.account_scoped else None)
+
+    def _store(self, key, endpoint, value):
+        self.backend.set(key, endpoint, time.time(), value)
+        return value
+
+    def _revalidate(self, key, endpoint, fetch):
+        try:
+            self._store(key, endpoint, fetch())
+            self._count(endpoint, "revalidated")
+        except Exception as e:
+            print(Fore.YELLOW + f"Could not refresh cached {endpoint}: {e}" + Style.RESET_ALL)
+            self._count(endpoint, "errors")
+        finally:
+            with self._lock:
+                self._revalidating.discard(key)
+
+    def fetch(self, endpoint, params, fetch, bypass=False, account=None):
+        """
+        Returns the cached response of endpoint with params, or fetch() it.
+
+        fetch: callable returning the JSON-serializable parsed response.
+        bypass: ignore the cached response, the fresh one is still stored.
+        account: the account making the request (eg: its li_at cookie).
+        """
+        key = self._key(endpoint, params, account)
+        if bypass or self.bypass:
+            self._count(endpoint, "bypass")
+            return self._store(key, endpoint, fetch())
+
+        entry = self.backend.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            age = time.time() - stored_at
+            ttl = self.ttl(endpoint)
+            if age < ttl:
+                self._count(endpoint, "hits")
+                return value
+            if age < ttl + self.stale_ttl:
+                self._count(endpoint, "stale")
+                with self._lock:
+                    start = key not in self._revalidating
+                    self._revalidating.add(key)
+                if start:
+                    threading.Thread(target=self._revalidate, args=(key, endpoint, fetch), daemon=True).start()
+                return value
+
+        self._count(endpoint, "misses")
+        return self._store(key, endpoint, fetch())
+
+    def invalidate(self, endpoint, params, account=None):
+        self.backend.delete(self._key(endpoint, params, account))
+
+    def clear(self, endpoint=None):
+        """
+        Drops every cached response, or only those of one endpoint.
+        """
+        self.backend.clear(endpoint)
@@ -0,0 +1,135 @@
+import pandas as pd
+
+NUMERIC_DTYPES = ("Int64", "Float64", "int64", "float64")
+
+
+def compile_path(path):
+    """
+    Returns a function reading a dotted path in parsed JSON, None as soon as a
+    step is missing. Integer steps index lists, negative ones from the end.
+
+    eg: compile_path("included.0.picture.artifacts.-1.fileIdentifyingUrlPathSegment")
+    """
+    steps = tuple(int(step) if step.lstrip("-").isdigit() else step for step in path.split("."))
+    if len(steps) == 1 and isinstance(steps[0], str):
+        key = steps[0]
+        return lambda obj: obj.get(key) if isinstance(obj, dict) else None
+
+    def get(obj):
+        for step in steps:
+            if isinstance(step, int):
+                if not isinstance(obj, list) or not -len(obj) <= step < len(obj):
+                    return None
+                obj = obj[step]
+            elif isinstance(obj, dict):
+                obj = obj.get(step)
+            else:
+                return None
+        return obj
+
+    return get
+
+
+def _to_boolean(value):
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value != value:
+        return None
+    return str(value).lower() in ("true", "1")
+
+
+def coerce(series, dtype):
+    """
+    Returns series converted to dtype, values that do not convert (including
+    non-integral numbers for integer dtypes) become missing. "object" keeps the
+    values as they are, eg: lists.
+    """
+    if dtype == "object":
+        return series.astype(dtype)
+    if dtype in NUMERIC_DTYPES:
+        series = pd.to_numeric(series, errors="coerce")
+        if dtype in ("Int64", "int64"):
+            series = series.where(series.isna() | (series % 1 == 0))
+        if dtype == "int64":
+            series = series.fillna(0)
+    elif dtype == "boolean":
+        series = series.map(_to_boolean, na_action="ignore")
+    return series.astype(dtype)
+
+
+class Field():
+    """
+    One column of a ResponseSchema.
+
+    - column: name of the DataFrame column
+    - path: dotted path of the value in the response (see compile_path),
+      the column name by default, as in the flat records of LINKEDIN_API
+    - dtype: pandas dtype of the column, "category" for strings repeated across
+      rows (distance, profile type, extract date...), "object" for lists and
+      dicts (tags, links...)
+    - default: value used when the path is missing
+    - transform: function applied to the value found at path
+    """
+    def __init__(self, column, path=None, dtype="string", default=None, transform=None):
+        self.column = column
+        self.path = path or column
+        self.dtype = dtype
+        self.default = default
+        self.transform = transform
+
+
+class ResponseSchema():
+    """
+    Declared columns of an endpoint. Paths are compiled once, extract() turns a
+    response into a row and frame() turns rows into a DataFrame with the
+    declared columns, in order and typed, even when there are no rows.
+
+    Usage:
+        schema = ResponseSchema("profile.network", [
+            Field("DISTANCE", "data.distance.value", "category"),
+            Field("FOLLOWERS_COUNT", "data.followersCount", "Int64"),
+        ])
+        df = schema.frame([schema.extract(res.json())])
+    """
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = list(fields)
+        self.columns = [field.column for field in self.fields]
+        self.dtypes = {field.column: field.dtype for field in self.fields}
+        self._extractors = [
+            (field.column, compile_path(field.path), field.transform, field.default) for field in self.fields
+        ]
+
+    def __repr__(self):
+        return f"ResponseSchema({self.name!r}, {len(self.fields)} fields)"
+
+    def extract(self, obj):
+        """
+        Returns the row of one response: {column: value}.
+        """
+        row = {}
+        for column, get, transform, default in self._extractors:
+            value = get(obj)
+            if value is not None and transform is not None:
+                value = transform(value)
+            row[column] = default if value is None else value
+        return row
+
+    def extract_many(self, objs):
+        return [self.extract(obj) for obj in objs]
+
+    def frame(self, rows):
+        """
+        Returns rows (dicts, or a DataFrame) as a DataFrame: declared columns
+        first, missing ones filled with their default, then any undeclared
+        column as is.
+        """
+        df = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+        extra = [column for column in df.columns if column not in self.dtypes]
+        df = df.reindex(columns=self.columns + extra)
+        for field in self.fields:
+            series = df[field.column]
+            if field.default is not None:
+                series = series.where(series.notna(), field.default)
+            df[field.column] = coerce(series, field.dtype)
+        return df
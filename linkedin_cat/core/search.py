@@ -1,260 +1,635 @@
-import os.path
-
-from colorama import Fore, Style
-from linkedin_cat.core.message import LinkedinMessage
-from linkedin_cat.core.base import LinkedinBase
-from linkedin_cat.core.profile import extract_profile, extract_profile_thread_pool
-from linkedin_cat.core.helper import save_to_json, extract_and_decode_username
-from urllib.parse import urlencode,unquote
-from bs4 import BeautifulSoup
-
-# li_class = "AzUHSIcDpyaLkwSZmBtCoOlWIyexIQYxg"
-# title_div_class = "HfZFuPHGtwgBtEhYPPjErraXxsQikCfmkzcE"
-# location_div_class = "TIPiImOlYjdixdiCAixhFkTwgWSITjWTBPJg"
-# intro_p_class = "PCdOMLNLxbkXwFMvwqcTrwfJdfvlJttYufXLs"
-# link_span_class = "QwrfzQPBYvtFCKlQkDFOMFZpyRFA"
-
-class LinkedinSearch(LinkedinMessage):
-    """
-    Encapsulates the functionality related to interacting with
-    LinkedIn using Selenium.
-    """
-    def __init__(self,linkedin_cookies_json:str,headless = False,**kwargs):
-        super().__init__(linkedin_cookies_json,headless,**kwargs)
-        self.li_class = kwargs.get('li_class')
-        self.title_div_class = kwargs.get('title_div_class')
-        self.location_div_class = kwargs.get('location_div_class')
-        self.intro_p_class = kwargs.get('intro_p_class')
-        self.link_span_class = kwargs.get('link_span_class')
-
-    def extract_username_from_linkedin_url(self,linkedin_url):
-        """
-        从 LinkedIn 个人资料 URL 中提取用户名并将其解码为汉字。
-
-        参数:
-            url (str): LinkedIn 个人资料的 URL。
-
-        返回:
-            str: 解码后的用户名。
-        """
-        # 去除结尾的 "/"
-        linkedin_url = linkedin_url.rstrip('/')
-
-        # 提取用户名部分
-        username_encoded = linkedin_url.split('/')[-1]
-
-        # 解码为汉字
-        username = unquote(username_encoded)
-
-        return username
-
-    def generate_linkedin_search_url(self, keywords, company=None, title=None,school=None,
-                                     first_name=None, last_name=None, origin="SWITCH_SEARCH_VERTICAL",sid=None):
-        base_url = "https://www.linkedin.com/search/results/people/"
-        """
-        Generates a LinkedIn search URL based on the provided parameters.
-
-        Args:
-            base_url (str): The base LinkedIn search URL.
-            keywords (str): Required search keywords.
-            company (str, optional): Company name to filter results.
-            first_name (str, optional): First name of the person to filter results.
-            last_name (str, optional): Last name of the person to filter results.
-            origin (str, optional): Origin of the search (e.g., 'FACETED_SEARCH').
-            school (str, optional): School name or text to filter results.
-            title (str, optional): Job title to filter results.
-            sid (str, optional): Session ID or other identifier for the search context.
-
-        Returns:
-            str: A LinkedIn search URL with all applicable parameters.
-        """
-        # Ensure 'keywords' parameter is provided
-        if not keywords:
-            raise ValueError("The 'keywords' parameter is required.")
-
-        # Initialize parameters with the required 'keywords'
-        params = {
-            'keywords': keywords
-        }
-
-        # Add optional parameters if they are provided
-        if company:
-            params['company'] = company
-        if title:
-            params['titleFreeText'] = title
-
-        if last_name:
-            params['lastName'] = last_name
-        if first_name:
-            params['firstName'] = first_name
-        if school:
-            params['schoolFreetext'] = school
-        if origin:
-            params['origin'] = origin
-        if sid:
-            params['sid'] = sid
-
-        # Encode parameters to URL query format and append to the base URL
-        search_url = f"{base_url}?{urlencode(params)}"
-        return search_url
-
-
-    def parse_linkedin_results(self,html_text):
-        """
-        Parses LinkedIn search results HTML to extract structured information from each profile.
-
-        Parameters:
-        - html_text: str, HTML content of the LinkedIn search results page.
-
-        Returns:
-        - results: list of dictionaries, each containing information of a LinkedIn profile (image, name, position, location, etc.).
-        """
-        soup = BeautifulSoup(html_text, 'html.parser')
-
-        # Initialize an empty list to store all results
-        results = []
-
-        # Find all list items with class `reusable-search__result-container`
-        profiles = soup.find_all('li', class_=f"{self.li_class}")
-
-        for profile in profiles:
-            try:
-                # Initialize a dictionary to hold profile data
-                profile_data = {}
-
-
-
-                # Extract profile name and LinkedIn profile link
-                name_tag = profile.find('span', {'aria-hidden': 'true'})
-                profile_data['name'] = name_tag.get_text(strip=True) if name_tag else None
-
-                # Extract company, location, and title information if available
-                title_tag = profile.find('div', class_=f"{self.title_div_class}")
-                profile_data['title'] = title_tag.get_text(strip=True) if title_tag else None
-
-                location_tag = profile.find('div', class_=f"{self.location_div_class}")
-                profile_data['location'] = location_tag.get_text(strip=True) if location_tag else None
-
-                intro_tag = profile.find('p', class_=f"{self.intro_p_class}")
-                profile_data['introduction'] = intro_tag.get_text() if intro_tag else None
-
-                # 查找具有特定class的<span>标签
-                link_tag = profile.find('span', class_=f"{self.link_span_class}").find('a')
-                profile_data['linkedin_url'] = link_tag["href"] if link_tag else None
-
-                # Extract profile image URL
-                # img_tag = profile.find('img', class_='presence-entity__image')
-                # profile_data['image_url'] = img_tag['src'] if img_tag and img_tag.has_attr('src') else None
-
-                # Add profile data to results list
-                results.append(profile_data)
-            except Exception as e:
-                print(f"Error parsing profile: {e}")
-                continue
-
-        return results
-
-    def open_linkedin_url(self,url,wait=True):
-        try:
-            # Wait for a short duration
-            self.short_wait()
-
-            # Get the URL
-            print(Fore.GREEN + f"Opening Linkedin URL: {url}" + Style.RESET_ALL)
-            self.driver.get(url)
-
-            # Wait for a medium duration
-            self.medium_wait()
-            if wait:
-                # Scroll to the middle of the page
-                print(Fore.GREEN + "Scrolling to the middle of the page" + Style.RESET_ALL)
-                self.scroll_to_middle()
-
-                # Wait for a short duration
-                self.medium_wait()
-
-                # Scroll to a random position
-                print(Fore.GREEN + "Scrolling to a random position" + Style.RESET_ALL)
-                self.scroll_to_random()
-
-                # Wait for a short duration
-                self.medium_wait()
-
-                # Scroll to the bottom of the page
-                print(Fore.GREEN + "Scrolling to the bottom of the page" + Style.RESET_ALL)
-                self.scroll_to_bottom()
-
-                # Wait for a short duration
-                self.medium_wait()
-
-                # Scroll to the top of the page
-                print(Fore.GREEN + "Scrolling to the top of the page" + Style.RESET_ALL)
-                self.scroll_to_top()
-
-                # Wait for a medium duration
-                self.short_wait()
-        except Exception as e:
-            # If an exception occurs, print an error message
-            print(Fore.RED + f'Error: {e}' + Style.RESET_ALL)
-
-        finally:
-            return self.driver.page_source
-
-    def search_keywords(self,keywords,wait=True):
-        try:
-            # Wait for a short duration
-            self.short_wait()
-
-            url = self.generate_linkedin_search_url(keywords)
-
-            html = self.open_linkedin_url(url,wait=wait)
-
-
-            results = self.parse_linkedin_results(html)
-
-            # Wait for a medium duration
-            self.medium_wait()
-
-            return results
-        except Exception as e:
-            print(Fore.RED + f'Error: {e}' + Style.RESET_ALL)
-
-    def search_linkedin_profile(self,url,save_folder='./linkedin',thread_pool=True):
-        # if folder does not exist,create it
-        if not os.path.exists(save_folder):
-            os.mkdir(save_folder)
-
-        filename = extract_and_decode_username(url)
-        if os.path.exists(os.path.join(save_folder,f"{filename}.json")):
-            print(Fore.YELLOW + f"Profile {filename} already exists" + Style.RESET_ALL)
-            return
-
-        try:
-            print(Fore.GREEN + f"Opening LinkedIn URL:{url}" + Style.RESET_ALL)
-            profile_data =  extract_profile_thread_pool(self.driver,url) if thread_pool else extract_profile(self.driver,url)
-            if not profile_data:
-                print(Fore.RED + "Could not extract profile" + Style.RESET_ALL)
-
-            else:
-                print(Fore.GREEN + f"Saving profile data to JSON:{save_folder}/{profile_data['filename']}" + Style.RESET_ALL)
-                file_path = os.path.join(save_folder,f"{profile_data['filename']}.json")
-                save_to_json(profile_data,file_path)
-
-        except Exception as e:
-            print(Fore.RED + f'Error: {e}' + Style.RESET_ALL)
-
-    def search_linkedin_profile_list(self,url_list,save_folder='./linkedin'):
-        for url in url_list:
-            try:
-                self.search_linkedin_profile(url,save_folder)
-            except Exception as e:
-                print(Fore.RED + f'Error: {e}' + Style.RESET_ALL)
-
-
-    def close_driver(self):
-        self.driver.quit()
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close_driver()
-
-
+import os.path
+import time
+from collections import deque
+
+from colorama import Fore, Style
+from linkedin_cat.core.message import LinkedinMessage
+from linkedin_cat.core.base import LinkedinBase
+from linkedin_cat.core.profile import (
+    extract_profile, extract_profile_thread_pool, resolve_sections, TOP_CARD_SECTIONS, EXTRACTOR_VERSION
+)
+from linkedin_cat.core.helper import save_to_json, extract_and_decode_username
+from linkedin_cat.core.voyager import parse_profile_responses, parse_search_responses
+from linkedin_cat.core.selector_registry import registry
+from linkedin_cat.core.html_archive import HtmlArchive, PROFILE, SEARCH
+from linkedin_cat.core.profile_index import ProfileIndex
+from urllib.parse import urlencode,unquote
+from bs4 import BeautifulSoup
+
+# Non-blocking navigation of a reused tab. The flag marks the document being
+# left: until the new navigation commits, the old document still reports
+# readyState "complete", see LinkedinSearch._wait_page_ready.
+NAVIGATE_JS = "window.__linkedinCatStale = true; window.location.href = arguments[0];"
+PAGE_READY_JS = "return window.__linkedinCatStale ? 'stale' : document.readyState;"
+
+# li_class = "AzUHSIcDpyaLkwSZmBtCoOlWIyexIQYxg"
+# title_div_class = "HfZFuPHGtwgBtEhYPPjErraXxsQikCfmkzcE"
+# location_div_class = "TIPiImOlYjdixdiCAixhFkTwgWSITjWTBPJg"
+# intro_p_class = "PCdOMLNLxbkXwFMvwqcTrwfJdfvlJttYufXLs"
+# link_span_class = "QwrfzQPBYvtFCKlQkDFOMFZpyRFA"
+
+def parse_search_html(html_text, selectors=None):
+    """
+    Parses LinkedIn search results HTML to extract structured information from each profile.
+
+    Parameters:
+    - html_text: str, HTML content of the LinkedIn search results page.
+    - selectors: SelectorRegistry, defaults to the shared registry.
+
+    Returns:
+    - results: list of dictionaries, each containing information of a LinkedIn profile (image, name, position, location, etc.).
+    """
+    selectors = selectors or registry
+    soup = BeautifulSoup(html_text, 'html.parser')
+
+    # Initialize an empty list to store all results
+    results = []
+
+    # Find all result items, see selector_registry for the fallback chain
+    profiles = selectors.select(soup, "search.result_item", many=True)
+
+    for profile in profiles:
+        try:
+            # Initialize a dictionary to hold profile data
+            profile_data = {}
+
+
+
+            # Extract profile name and LinkedIn profile link
+            name_tag = profile.find('span', {'aria-hidden': 'true'})
+            profile_data['name'] = name_tag.get_text(strip=True) if name_tag else None
+
+            # Extract company, location, and title information if available
+            title_tag = selectors.select(profile, "search.title")
+            profile_data['title'] = title_tag.get_text(strip=True) if title_tag else None
+
+            location_tag = selectors.select(profile, "search.location")
+            profile_data['location'] = location_tag.get_text(strip=True) if location_tag else None
+
+            intro_tag = selectors.select(profile, "search.introduction")
+            profile_data['introduction'] = intro_tag.get_text() if intro_tag else None
+
+            # 个人主页链接
+            link_tag = selectors.select(profile, "search.link")
+            profile_data['linkedin_url'] = link_tag["href"] if link_tag else None
+
+            # Extract profile image URL
+            # img_tag = profile.find('img', class_='presence-entity__image')
+            # profile_data['image_url'] = img_tag['src'] if img_tag and img_tag.has_attr('src') else None
+
+            # Add profile data to results list
+            results.append(profile_data)
+        except Exception as e:
+            print(f"Error parsing profile: {e}")
+            continue
+
+    return results
+
+
+class LinkedinSearch(LinkedinMessage):
+    """
+    Encapsulates the functionality related to interacting with
+    LinkedIn using Selenium.
+    """
+    html_archive = None
+    profile_index = None
+
+    def __init__(self,linkedin_cookies_json:str,headless = False,**kwargs):
+        super().__init__(linkedin_cookies_json,headless,**kwargs)
+        self.li_class = kwargs.get('li_class')
+        self.title_div_class = kwargs.get('title_div_class')
+        self.location_div_class = kwargs.get('location_div_class')
+        self.intro_p_class = kwargs.get('intro_p_class')
+        self.link_span_class = kwargs.get('link_span_class')
+
+        # Optional raw HTML archive (HtmlArchive or its path), see core.html_archive
+        html_archive = kwargs.get('html_archive')
+        self.html_archive = HtmlArchive(html_archive) if isinstance(html_archive, str) else html_archive
+        # Optional full-text index (ProfileIndex or its path) updated on every save, see core.profile_index
+        profile_index = kwargs.get('profile_index')
+        self.profile_index = ProfileIndex(profile_index) if isinstance(profile_index, str) else profile_index
+        self._last_responses = []
+
+        # User-supplied (hashed) class names are tried before the registry fallbacks
+        for field, template, cls in [
+            ("search.result_item", "li.{}", self.li_class),
+            ("search.title", "div.{}", self.title_div_class),
+            ("search.location", "div.{}", self.location_div_class),
+            ("search.introduction", "p.{}", self.intro_p_class),
+            ("search.link", "span.{} a", self.link_span_class),
+        ]:
+            if cls:
+                self.selectors.override(field, "css", template.format(cls))
+
+    def extract_username_from_linkedin_url(self,linkedin_url):
+        """
+        从 LinkedIn 个人资料 URL 中提取用户名并将其解码为汉字。
+
+        参数:
+            url (str): LinkedIn 个人资料的 URL。
+
+        返回:
+            str: 解码后的用户名。
+        """
+        # 去除结尾的 "/"
+        linkedin_url = linkedin_url.rstrip('/')
+
+        # 提取用户名部分
+        username_encoded = linkedin_url.split('/')[-1]
+
+        # 解码为汉字
+        username = unquote(username_encoded)
+
+        return username
+
+    def generate_linkedin_search_url(self, keywords, company=None, title=None,school=None,
+                                     first_name=None, last_name=None, origin="SWITCH_SEARCH_VERTICAL",sid=None,page=None):
+        base_url = "https://www.linkedin.com/search/results/people/"
+        """
+        Generates a LinkedIn search URL based on the provided parameters.
+
+        Args:
+            base_url (str): The base LinkedIn search URL.
+            keywords (str): Required search keywords.
+            company (str, optional): Company name to filter results.
+            first_name (str, optional): First name of the person to filter results.
+            last_name (str, optional): Last name of the person to filter results.
+            origin (str, optional): Origin of the search (e.g., 'FACETED_SEARCH').
+            school (str, optional): School name or text to filter results.
+            title (str, optional): Job title to filter results.
+            sid (str, optional): Session ID or other identifier for the search context.
+            page (int, optional): Result page number, starting at 1.
+
+        Returns:
+            str: A LinkedIn search URL with all applicable parameters.
+        """
+        # Ensure 'keywords' parameter is provided
+        if not keywords:
+            raise ValueError("The 'keywords' parameter is required.")
+
+        # Initialize parameters with the required 'keywords'
+        params = {
+            'keywords': keywords
+        }
+
+        # Add optional parameters if they are provided
+        if company:
+            params['company'] = company
+        if title:
+            params['titleFreeText'] = title
+
+        if last_name:
+            params['lastName'] = last_name
+        if first_name:
+            params['firstName'] = first_name
+        if school:
+            params['schoolFreetext'] = school
+        if origin:
+            params['origin'] = origin
+        if sid:
+            params['sid'] = sid
+        if page and page > 1:
+            params['page'] = page
+
+        # Encode parameters to URL query format and append to the base URL
+        search_url = f"{base_url}?{urlencode(params)}"
+        return search_url
+
+
+    def parse_linkedin_results(self,html_text):
+        """
+        Parses LinkedIn search results HTML to extract structured information from each profile.
+
+        Parameters:
+        - html_text: str, HTML content of the LinkedIn search results page.
+
+        Returns:
+        - results: list of dictionaries, each containing information of a LinkedIn profile (image, name, position, location, etc.).
+        """
+        return parse_search_html(html_text, self.selectors)
+
+    def open_linkedin_url(self,url,wait=True):
+        try:
+            # Wait for a short duration
+            self.short_wait()
+
+            # Get the URL
+            print(Fore.GREEN + f"Opening Linkedin URL: {url}" + Style.RESET_ALL)
+            self.driver.get(url)
+
+            # Wait for a medium duration
+            self.medium_wait()
+            if wait:
+                # Scroll to the middle of the page
+                print(Fore.GREEN + "Scrolling to the middle of the page" + Style.RESET_ALL)
+                self.scroll_to_middle()
+
+                # Wait for a short duration
+                self.medium_wait()
+
+                # Scroll to a random position
+                print(Fore.GREEN + "Scrolling to a random position" + Style.RESET_ALL)
+                self.scroll_to_random()
+
+                # Wait for a short duration
+                self.medium_wait()
+
+                # Scroll to the bottom of the page
+                print(Fore.GREEN + "Scrolling to the bottom of the page" + Style.RESET_ALL)
+                self.scroll_to_bottom()
+
+                # Wait for a short duration
+                self.medium_wait()
+
+                # Scroll to the top of the page
+                print(Fore.GREEN + "Scrolling to the top of the page" + Style.RESET_ALL)
+                self.scroll_to_top()
+
+                # Wait for a medium duration
+                self.short_wait()
+        except Exception as e:
+            # If an exception occurs, print an error message
+            print(Fore.RED + f'Error: {e}' + Style.RESET_ALL)
+
+        finally:
+            return self.driver.page_source
+
+    def archive_page(self,kind,url,html=None,responses=None):
+        """
+        Saves the current page (or html) to the HTML archive, if one is configured.
+        """
+        if self.html_archive is None:
+            return
+        try:
+            self.html_archive.save(kind, url, html if html is not None else self.driver.page_source, responses)
+        except Exception as e:
+            print(Fore.RED + f'Error archiving {url}: {e}' + Style.RESET_ALL)
+
+    def search_keywords(self,keywords,wait=True):
+        try:
+            # Wait for a short duration
+            self.short_wait()
+
+            url = self.generate_linkedin_search_url(keywords)
+
+            # Drop network log entries of previous pages
+            self.drain_voyager_responses()
+
+            html = self.open_linkedin_url(url,wait=wait)
+
+            # Prefer the Voyager JSON already received by the page, fall back to the DOM
+            responses = self.drain_voyager_responses()
+            self.archive_page(SEARCH,url,html,responses)
+            results = parse_search_responses(responses)
+            if not results:
+                results = self.parse_linkedin_results(html)
+
+            # Wait for a medium duration
+            self.medium_wait()
+
+            return results
+        except Exception as e:
+            print(Fore.RED + f'Error: {e}' + Style.RESET_ALL)
+
+    def extract_profile_from_network(self,url,sections=None):
+        """
+        Opens a profile and builds the extract_profile dict from the Voyager
+        responses captured during navigation, instead of scraping the DOM.
+
+        Returns: the profile dict, or None if capture is disabled or the responses
+        did not contain the profile.
+        """
+        if not self.capture_network:
+            return None
+        sections = resolve_sections(sections)
+        try:
+            self.drain_voyager_responses()
+            self.driver.get(url)
+            self.medium_wait()
+            # Lazy sections are requested when scrolled into view
+            if not set(sections) <= TOP_CARD_SECTIONS:
+                self.scroll_to_bottom()
+                self.short_wait()
+            self._last_responses = self.drain_voyager_responses()
+            profile_data = parse_profile_responses(self._last_responses, url)
+            if profile_data is None:
+                return None
+            filtered = {"filename": profile_data["filename"], "profile_url": profile_data["profile_url"],
+                        "captured_sections": sections}
+            filtered.update((key, profile_data[key]) for key in sections)
+            return filtered
+        except Exception as e:
+            print(Fore.RED + f'Error: {e}' + Style.RESET_ALL)
+            return None
+
+    def _navigate_async(self, url):
+        """
+        Starts loading url in the current tab without waiting, see _wait_page_ready.
+        """
+        self.driver.execute_script(NAVIGATE_JS, url)
+
+    def _wait_page_ready(self, timeout=30):
+        """
+        Waits until the current tab has finished loading a new document: the
+        document left by _navigate_async does not count, even if complete.
+
+        Returns: False on timeout.
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                if self.driver.execute_script(PAGE_READY_JS) == "complete":
+                    return True
+            except Exception:
+                pass
+            time.sleep(0.5)
+        return False
+
+    def iter_search(self, keywords, filters=None, max_pages=10):
+        """
+        Yields the parsed results of a people search page by page.
+
+        While page N is parsed in the current tab, page N+1 is already loading in
+        a second tab. Iteration stops early when a page is empty or only contains
+        results already yielded.
+
+        Parameters:
+        - keywords: str, search keywords.
+        - filters: dict, extra generate_linkedin_search_url arguments
+          (company, title, school, first_name, last_name, ...).
+        - max_pages: int, maximum number of result pages.
+
+        Yields:
+        - list of dicts, the new results of one page (see parse_linkedin_results).
+        """
+        filters = filters or {}
+        urls = [self.generate_linkedin_search_url(keywords, page=page, **filters) for page in range(1, max_pages + 1)]
+        if not urls:
+            return
+
+        main_handle = self.driver.current_window_handle
+        self.driver.switch_to.new_window('tab')
+        prefetch_handle = self.driver.current_window_handle
+        self.driver.switch_to.window(main_handle)
+        handles = [main_handle, prefetch_handle]
+
+        seen = set()
+        try:
+            print(Fore.GREEN + f"Opening Linkedin URL: {urls[0]}" + Style.RESET_ALL)
+            self.driver.get(urls[0])
+
+            for index, url in enumerate(urls):
+                current_handle = handles[index % 2]
+
+                # Start loading the next page in the other tab without blocking
+                if index + 1 < len(urls):
+                    self.driver.switch_to.window(handles[(index + 1) % 2])
+                    self._navigate_async(urls[index + 1])
+
+                self.driver.switch_to.window(current_handle)
+                if not self._wait_page_ready():
+                    # Never parse the previous page under this page's number
+                    print(Fore.YELLOW + f"Page {index + 1} did not load in time, reloading" + Style.RESET_ALL)
+                    self.driver.get(url)
+                # Results are rendered lazily, scroll once to trigger them
+                self.scroll_to_bottom()
+                self.short_wait()
+
+                html = self.driver.page_source
+                self.archive_page(SEARCH,url,html)
+                results = self.parse_linkedin_results(html)
+                new_results = [r for r in results if r.get('linkedin_url') not in seen]
+                if not new_results:
+                    print(Fore.YELLOW + f"No new results on page {index + 1}, stopping" + Style.RESET_ALL)
+                    break
+
+                seen.update(r.get('linkedin_url') for r in new_results)
+                yield new_results
+        finally:
+            try:
+                self.driver.switch_to.window(prefetch_handle)
+                self.driver.close()
+                self.driver.switch_to.window(main_handle)
+            except Exception as e:
+                print(Fore.RED + f'Error closing prefetch tab: {e}' + Style.RESET_ALL)
+
+    def _profile_saved(self,url,save_folder,store,ttl_days,sections):
+        """
+        True if the profile is already saved (and fresh, with every requested section).
+        """
+        if store is not None:
+            return (store.has(url) and (ttl_days is None or store.is_fresh(url, ttl_days))
+                    and store.has_sections(url, sections))
+        return os.path.exists(os.path.join(save_folder,f"{extract_and_decode_username(url)}.json"))
+
+    def _save_profile(self,profile_data,save_folder,store):
+        """
+        Saves a profile to store or to {save_folder}/{filename}.json.
+
+        Returns: the changed-section diff when saving to a store, None otherwise.
+        """
+        if store is not None:
+            print(Fore.GREEN + f"Saving profile data to store:{store.db_path}" + Style.RESET_ALL)
+            diff = store.save_sections(profile_data, extractor_version=EXTRACTOR_VERSION)
+            self.index_profile(profile_data, store)
+            if not diff["new"]:
+                changed = diff["added"] + diff["changed"] + diff["removed"]
+                print(Fore.GREEN + f"Changed sections: {', '.join(changed) or 'none'}" + Style.RESET_ALL)
+            return diff
+
+        print(Fore.GREEN + f"Saving profile data to JSON:{save_folder}/{profile_data['filename']}" + Style.RESET_ALL)
+        file_path = os.path.join(save_folder,f"{profile_data['filename']}.json")
+        save_to_json(profile_data,file_path)
+        self.index_profile(profile_data)
+
+    def index_profile(self,profile_data,store=None):
+        """
+        Updates profile_index with a saved profile. With a store, the stored
+        profile is indexed, so a partial scrape keeps the other sections searchable.
+        """
+        if self.profile_index is None:
+            return
+        if store is not None:
+            profile_data = store.get(profile_data["profile_url"]) or profile_data
+        try:
+            self.profile_index.index(profile_data)
+        except Exception as e:
+            print(Fore.RED + f"Error indexing profile: {e}" + Style.RESET_ALL)
+
+    def search_linkedin_profile(self,url,save_folder='./linkedin',thread_pool=True,store=None,ttl_days=None,sections=None):
+        """
+        Scrapes a profile and saves it to {save_folder}/{username}.json, or to
+        store (a ProfileStore) when given. Profiles already saved are skipped.
+
+        sections limits the scrape to some extract_profile keys, eg: ["intro", "experience"].
+        A stored profile is only skipped if it already holds every requested section.
+
+        With a store and ttl_days, profiles scraped ttl_days ago or more are
+        scraped again and only their changed sections are rewritten.
+
+        Returns: the changed-section diff of ProfileStore.save_sections when
+        saving to a store, None otherwise.
+        """
+        sections = resolve_sections(sections)
+        # if folder does not exist,create it
+        if store is None and not os.path.exists(save_folder):
+            os.mkdir(save_folder)
+
+        if self._profile_saved(url,save_folder,store,ttl_days,sections):
+            print(Fore.YELLOW + f"Profile {extract_and_decode_username(url)} already exists" + Style.RESET_ALL)
+            return
+
+        try:
+            profile_data = self.scrape_profile(url,sections=sections,thread_pool=thread_pool)
+            if not profile_data:
+                print(Fore.RED + "Could not extract profile" + Style.RESET_ALL)
+            else:
+                return self._save_profile(profile_data,save_folder,store)
+
+        except Exception as e:
+            print(Fore.RED + f'Error: {e}' + Style.RESET_ALL)
+
+    def scrape_profile(self,url,sections=None,thread_pool=True):
+        """
+        Opens a profile and extracts it, from captured Voyager responses when
+        network capture is enabled, else from the DOM. Nothing is saved.
+
+        Returns: the profile dict, None if it could not be extracted.
+        """
+        print(Fore.GREEN + f"Opening LinkedIn URL:{url}" + Style.RESET_ALL)
+        self._last_responses = []
+        profile_data = self.extract_profile_from_network(url,sections=sections)
+        if not profile_data:
+            if thread_pool:
+                profile_data = extract_profile_thread_pool(self.driver,url,sections=sections)
+            else:
+                profile_data = extract_profile(self.driver,url,sections=sections)
+        if profile_data:
+            self.archive_page(PROFILE,url,responses=self._last_responses)
+        return profile_data
+
+    def search_linkedin_profile_list(self,url_list,save_folder='./linkedin',store=None,sections=None,tabs=1,ttl_days=None):
+        """
+        Scrapes and saves every profile of url_list. With tabs > 1 the profiles
+        are loaded ahead in background tabs, see iter_profiles_pipelined.
+        """
+        if tabs > 1:
+            for url, profile_data in self.iter_profiles_pipelined(url_list,tabs=tabs,sections=sections,
+                                                                  save_folder=save_folder,store=store,
+                                                                  ttl_days=ttl_days):
+                if profile_data:
+                    self._save_profile(profile_data,save_folder,store)
+            return
+
+        for url in url_list:
+            try:
+                self.search_linkedin_profile(url,save_folder,store=store,sections=sections,ttl_days=ttl_days)
+            except Exception as e:
+                print(Fore.RED + f'Error: {e}' + Style.RESET_ALL)
+
+    def iter_profiles_pipelined(self,url_list,tabs=3,sections=None,save_folder='./linkedin',store=None,ttl_days=None):
+        """
+        Scrapes profiles with up to `tabs` window handles: while one loaded tab is
+        extracted, the next profiles are already loading in the other tabs.
+
+        At most tabs - 1 profiles are loaded ahead, and results are yielded in
+        url_list order. Profiles already saved (see search_linkedin_profile) are
+        skipped. Nothing is saved, the caller decides where results go.
+
+        Yields: (url, profile_data), profile_data is None when extraction failed.
+        """
+        sections = resolve_sections(sections)
+        if store is None and not os.path.exists(save_folder):
+            os.mkdir(save_folder)
+        todo = []
+        for url in url_list:
+            if self._profile_saved(url,save_folder,store,ttl_days,sections):
+                print(Fore.YELLOW + f"Profile {extract_and_decode_username(url)} already exists" + Style.RESET_ALL)
+            else:
+                todo.append(url)
+        if not todo:
+            return
+
+        main_handle = self.driver.current_window_handle
+        free_handles = [main_handle]
+        for _ in range(min(tabs, len(todo)) - 1):
+            self.driver.switch_to.new_window('tab')
+            free_handles.append(self.driver.current_window_handle)
+        extra_handles = free_handles[1:]
+
+        loading = deque()  # (url, handle) in url_list order
+        next_index = 0
+        try:
+            while next_index < len(todo) or loading:
+                # Fill idle tabs, navigation does not block
+                while free_handles and next_index < len(todo):
+                    handle = free_handles.pop(0)
+                    url = todo[next_index]
+                    next_index += 1
+                    print(Fore.GREEN + f"Opening LinkedIn URL:{url}" + Style.RESET_ALL)
+                    self.driver.switch_to.window(handle)
+                    self._navigate_async(url)
+                    loading.append((url, handle))
+
+                url, handle = loading.popleft()
+                self.driver.switch_to.window(handle)
+                profile_data = None
+                try:
+                    if not self._wait_page_ready():
+                        # Never extract the tab's previous profile under this url
+                        print(Fore.YELLOW + f"{url} did not load in time, reloading" + Style.RESET_ALL)
+                        self.driver.get(url)
+                    profile_data = extract_profile(self.driver,url,sections=sections,navigate=False)
+                    if profile_data:
+                        self.archive_page(PROFILE,url)
+                except Exception as e:
+                    print(Fore.RED + f'Error: {e}' + Style.RESET_ALL)
+                if not profile_data:
+                    print(Fore.RED + f"Could not extract profile {url}" + Style.RESET_ALL)
+                free_handles.append(handle)
+                yield url, profile_data
+        finally:
+            for handle in extra_handles:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except Exception as e:
+                    print(Fore.RED + f'Error closing tab: {e}' + Style.RESET_ALL)
+            try:
+                self.driver.switch_to.window(main_handle)
+            except Exception:
+                pass
+
+    def refresh_profiles(self,store,ttl_days=7,url_list=None,limit=None):
+        """
+        Re-scrapes the stale profiles of store (or the stale ones of url_list),
+        rewriting only the sections that changed.
+
+        Returns: {profile_url: {"added": [...], "changed": [...], "removed": [...]}}
+        for every re-scraped profile.
+        """
+        if url_list is None:
+            url_list = store.stale_profiles(ttl_days, limit=limit)
+        else:
+            url_list = [url for url in url_list if not store.is_fresh(url, ttl_days)][:limit]
+        print(Fore.GREEN + f"Refreshing {len(url_list)} stale profiles" + Style.RESET_ALL)
+
+        report = {}
+        for url in url_list:
+            try:
+                diff = self.search_linkedin_profile(url,store=store,ttl_days=ttl_days)
+            except Exception as e:
+                print(Fore.RED + f'Error: {e}' + Style.RESET_ALL)
+                continue
+            if diff:
+                report[url] = {key: diff[key] for key in ("added", "changed", "removed")}
+        return report
+
+
+    def close_driver(self):
+        super().close_driver()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close_driver()
+
+
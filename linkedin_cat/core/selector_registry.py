@@ -0,0 +1,274 @@
+import json
+import os
+import time
+import threading
+
+from selenium.webdriver.common.by import By
+
+from linkedin_cat.core.helper import is_static_dom
+
+# Bump when the default selector chains change, stats recorded against an older
+# version are discarded on load.
+SELECTOR_VERSION = "2025.2"
+
+# Logical field -> ordered fallback chain of (by, selector).
+# "css" entries are used with BeautifulSoup.select on saved HTML.
+# Send-flow buttons are looked up in the profile top card only, the first
+# section of <main>: "People also viewed" and sidebar cards have Connect /
+# Message buttons of other members.
+TOP_CARD = "(//main//section)[1]"
+DEFAULT_SELECTORS = {
+    # Message / send flow
+    "message.distance_badge": [
+        (By.XPATH, f"{TOP_CARD}//span[contains(@class, 'distance-badge')]/span[contains(@class, 'dist-value')]"),
+        (By.XPATH, f"{TOP_CARD}//span[contains(@class, 'dist-value')]"),
+    ],
+    "message.pending_button": [
+        (By.XPATH, f"{TOP_CARD}//button[contains(@aria-label, 'Pending')]"),
+    ],
+    "message.connect_button": [
+        (By.XPATH, f"{TOP_CARD}//button[contains(@aria-label, 'Invite') and contains(@aria-label, 'connect')]"),
+        (By.XPATH, f"{TOP_CARD}//button[contains(@aria-label, 'Invite')]"),
+    ],
+    "message.more_button": [
+        (By.XPATH, f"{TOP_CARD}//button[contains(@aria-label, 'More actions')]"),
+    ],
+    "message.hidden_connect": [
+        (By.XPATH, f"{TOP_CARD}//li//div[contains(@aria-label, 'Invite')]"),
+        (By.XPATH, f"({TOP_CARD}//div[contains(@class, 'artdeco-dropdown__item')]/span[text()='Connect'])[1]"),
+    ],
+    "message.message_button": [
+        (By.XPATH, f"{TOP_CARD}//button[contains(@aria-label, 'Message')]"),
+    ],
+    "message.msg_box_close": [
+        (By.XPATH, "//button[contains(@class,'msg-overlay-bubble-header__control artdeco-button artdeco-button--circle artdeco-button--muted')]"),
+        (By.CSS_SELECTOR, "button.msg-overlay-bubble-header__control"),
+    ],
+    "message.full_name": [
+        (By.XPATH, "//h1[contains(@class, 'inline t-24 v-align-middle break-words')]"),
+        (By.XPATH, "//main//h1[contains(@class, 'text-heading-xlarge')]"),
+        (By.CSS_SELECTOR, "main h1"),
+    ],
+    # Profile
+    "profile.intro": [
+        (By.XPATH, "//div[contains(@class, 'mt2 relative')]"),
+        (By.XPATH, "//main//section[1]//div[.//h1]"),
+    ],
+    "profile.name": [
+        (By.XPATH, ".//h1[contains(@class, 'text-heading-xlarge')]"),
+        (By.XPATH, ".//h1"),
+    ],
+    # Search results (BeautifulSoup CSS)
+    "search.result_item": [
+        ("css", "li.reusable-search__result-container"),
+        ("css", "div[data-view-name='search-entity-result-universal-template']"),
+    ],
+    "search.title": [
+        ("css", "div.entity-result__primary-subtitle"),
+    ],
+    "search.location": [
+        ("css", "div.entity-result__secondary-subtitle"),
+    ],
+    "search.introduction": [
+        ("css", "p.entity-result__summary"),
+        ("css", "p.entity-result__summary--2-lines"),
+    ],
+    "search.link": [
+        ("css", "span.entity-result__title-text a"),
+        ("css", "a[href*='/in/']"),
+    ],
+}
+
+
+class SelectorRegistry():
+    """
+    Central registry of selectors with ordered fallbacks per logical field.
+
+    Every lookup records hits, misses and time-to-match per selector; candidates
+    are reordered so the fastest working selector is tried first and selectors
+    that never match move to the end of the chain. Overrides always come first.
+
+    Drivers use an overlay() of the shared registry, so their overrides stay
+    local while the stats are shared.
+    """
+    def __init__(self, selectors=None, version=SELECTOR_VERSION):
+        self.version = version
+        self._selectors = {field: list(chain) for field, chain in (selectors or DEFAULT_SELECTORS).items()}
+        self._overrides = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def overlay(self):
+        """
+        Returns a registry with a copy of the chains and overrides of this one,
+        sharing its stats: overrides and register() on the overlay do not
+        change this registry.
+        """
+        other = SelectorRegistry({}, version=self.version)
+        other._selectors = {field: list(chain) for field, chain in self._selectors.items()}
+        other._overrides = {field: list(chain) for field, chain in self._overrides.items()}
+        other._stats = self._stats
+        other._lock = self._lock
+        return other
+
+    def register(self, field, candidates):
+        """
+        Replaces the fallback chain of a field, candidates is a list of (by, selector).
+        """
+        self._selectors[field] = list(candidates)
+
+    def override(self, field, by, selector):
+        """
+        Puts a selector at the front of a field's chain, eg: a class name given
+        by the user. Overrides are tried before the ranked chain, the latest first.
+        """
+        if field not in self._selectors:
+            raise KeyError(f"Unknown selector field: {field}")
+        overrides = [c for c in self._overrides.get(field, []) if c != (by, selector)]
+        self._overrides[field] = [(by, selector)] + overrides
+
+    def _stat(self, field, selector):
+        return self._stats.setdefault(field, {}).setdefault(
+            selector, {"hits": 0, "misses": 0, "total_ms": 0.0}
+        )
+
+    def record(self, field, selector, hit, elapsed):
+        """
+        Records one lookup of selector for field, elapsed in seconds.
+        """
+        with self._lock:
+            stat = self._stat(field, selector)
+            if hit:
+                stat["hits"] += 1
+                stat["total_ms"] += elapsed * 1000
+            else:
+                stat["misses"] += 1
+
+    def candidates(self, field):
+        """
+        Returns the fallback chain of a field: overrides, then the fastest
+        working selector first.
+        """
+        chain = self._selectors.get(field)
+        if chain is None:
+            raise KeyError(f"Unknown selector field: {field}")
+        overrides = self._overrides.get(field, [])
+        chain = [c for c in chain if c not in overrides]
+        stats = self._stats.get(field, {})
+
+        def rank(indexed):
+            index, (_, selector) = indexed
+            stat = stats.get(selector)
+            if not stat or (stat["hits"] == 0 and stat["misses"] == 0):
+                return (1, 0, index)  # untried, keep declared order
+            if stat["hits"] == 0:
+                return (2, 0, index)  # never matched
+            hit_rate = stat["hits"] / (stat["hits"] + stat["misses"])
+            avg_ms = stat["total_ms"] / stat["hits"]
+            return (0, -round(hit_rate, 1), avg_ms, index)
+
+        return overrides + [c for _, c in sorted(enumerate(chain), key=rank)]
+
+    def find(self, driver, field, timeout=2, many=False, poll=0.25):
+        """
+        Polls every candidate of field until one matches or timeout expires, so a
+        stale selector costs one find call instead of a full wait timeout.
+
+        Returns: the first matching element (list of elements if many), None
+        ([] if many) when nothing matched.
+        """
+        chain = self.candidates(field)
+        start = time.time()
+        # A static page (helper.static_dom) gets a single pass
+        deadline = start + (0 if is_static_dom() else timeout)
+        while True:
+            for by, selector in chain:
+                try:
+                    elements = driver.find_elements(by, selector)
+                except Exception:
+                    elements = []
+                if elements:
+                    self.record(field, selector, True, time.time() - start)
+                    for other_by, other in chain:
+                        if other == selector:
+                            break
+                        self.record(field, other, False, 0)
+                    return elements if many else elements[0]
+            if time.time() >= deadline:
+                break
+            time.sleep(poll)
+
+        for _, selector in chain:
+            self.record(field, selector, False, 0)
+        return [] if many else None
+
+    def select(self, soup, field, many=False):
+        """
+        BeautifulSoup counterpart of find for "css" candidates.
+        """
+        chain = self.candidates(field)
+        start = time.time()
+        for index, (by, selector) in enumerate(chain):
+            found = soup.select(selector) if many else soup.select_one(selector)
+            if found:
+                self.record(field, selector, True, time.time() - start)
+                for _, other in chain[:index]:
+                    self.record(field, other, False, 0)
+                return found
+        for _, selector in chain:
+            self.record(field, selector, False, 0)
+        return [] if many else None
+
+    def stats(self):
+        """
+        Returns hit/miss counts, hit rate and average time-to-match per selector.
+        """
+        result = {}
+        with self._lock:
+            for field, chain in self._selectors.items():
+                field_stats = []
+                overrides = self._overrides.get(field, [])
+                for by, selector in overrides + [c for c in chain if c not in overrides]:
+                    stat = self._stats.get(field, {}).get(selector, {"hits": 0, "misses": 0, "total_ms": 0.0})
+                    lookups = stat["hits"] + stat["misses"]
+                    field_stats.append({
+                        "by": by,
+                        "selector": selector,
+                        "hits": stat["hits"],
+                        "misses": stat["misses"],
+                        "hit_rate": stat["hits"] / lookups if lookups else None,
+                        "avg_ms": stat["total_ms"] / stat["hits"] if stat["hits"] else None,
+                    })
+                result[field] = field_stats
+        return result
+
+    def export_stats(self, filepath):
+        """
+        Saves the stats to a JSON file, they can be reloaded with load_stats.
+        """
+        with self._lock:
+            data = {"version": self.version, "stats": self._stats}
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def load_stats(self, filepath):
+        """
+        Loads stats saved by export_stats. Stats of another selector version are ignored.
+
+        Returns: True if stats were loaded.
+        """
+        if not os.path.exists(filepath):
+            return False
+        with open(filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != self.version:
+            return False
+        with self._lock:
+            # In place, overlays share this dict
+            self._stats.clear()
+            self._stats.update(data.get("stats", {}))
+        return True
+
+
+# Shared default registry
+registry = SelectorRegistry()
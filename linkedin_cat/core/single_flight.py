@@ -0,0 +1,88 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight():
+    """
+    Coalesces concurrent calls: while a call for a key is in flight, other
+    callers with the same key wait for it and share its result (or exception)
+    instead of calling again. Nothing is cached once the call returns.
+
+    Threads use do(), asyncio tasks use do_async(); both share the same
+    in-flight calls, so a task can wait for a call started by a thread and
+    the other way round.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = {"calls": 0, "executed": 0, "coalesced": 0}
+
+    def _join(self, key):
+        """
+        Returns (future, owner): the in-flight future of key, owner is True if
+        the caller has to run the call.
+        """
+        with self._lock:
+            self._stats["calls"] += 1
+            future = self._calls.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                return future, False
+            future = self._calls[key] = Future()
+            self._stats["executed"] += 1
+            return future, True
+
+    def _finish(self, key, future, result=None, error=None):
+        with self._lock:
+            del self._calls[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(self, key, fn):
+        """
+        Returns fn(), run once for all the threads calling with key at the same time.
+        """
+        future, owner = self._join(key)
+        if not owner:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+
+    async def do_async(self, key, fn):
+        """
+        Returns the result of fn, run once for all the callers with key at the
+        same time. fn is a coroutine function, or a blocking callable run in
+        the default executor.
+        """
+        future, owner = self._join(key)
+        if not owner:
+            return await asyncio.wrap_future(future)
+        try:
+            if asyncio.iscoroutinefunction(fn):
+                result = await fn()
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(None, fn)
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+
+    def stats(self):
+        """
+        Returns {"calls", "executed", "coalesced", "in_flight"}.
+        """
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._calls))
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {"calls": 0, "executed": 0, "coalesced": 0}
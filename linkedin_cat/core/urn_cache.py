@@ -0,0 +1,160 @@
+import os
+import time
+import sqlite3
+import threading
+import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urns (
+    vanity      TEXT PRIMARY KEY,
+    urn         TEXT NOT NULL,
+    resolved_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_urns_urn ON urns (urn);
+"""
+
+
+def normalize_vanity(vanity):
+    """
+    Returns the lookup key of a vanity name: decoded and lower-cased, as LinkedIn
+    public identifiers are case-insensitive.
+
+    eg: John-Doe%C3%A9 -> john-doeé
+    """
+    return urllib.parse.unquote(vanity).strip("/").lower()
+
+
+class UrnCache():
+    """
+    Bidirectional vanity name <-> profile URN map ("florent-ravenel" <->
+    "ACoAABCNSio..."), persisted in SQLite with an in-memory LRU in front.
+
+    resolve() looks a vanity name up and calls fetch on a miss. Concurrent
+    resolve() calls for the same name share one fetch.
+
+    db_path=None keeps the map in memory only.
+    """
+    def __init__(self, db_path="./linkedin/urns.db", lru_size=4096):
+        self.db_path = db_path
+        self.lru_size = lru_size
+        self._lock = threading.Lock()
+        self._urns = OrderedDict()
+        self._vanities = OrderedDict()
+        self._inflight = {}
+        if db_path is None:
+            self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        else:
+            folder = os.path.dirname(os.path.abspath(db_path))
+            os.makedirs(folder, exist_ok=True)
+            self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM urns").fetchone()[0]
+
+    def _remember(self, vanity, urn):
+        for lru, key, value in ((self._urns, vanity, urn), (self._vanities, urn, vanity)):
+            lru[key] = value
+            lru.move_to_end(key)
+            if len(lru) > self.lru_size:
+                lru.popitem(last=False)
+
+    def put(self, vanity, urn):
+        """
+        Records that vanity resolves to urn.
+        """
+        vanity = normalize_vanity(vanity)
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO urns (vanity, urn, resolved_at) VALUES (?, ?, ?)",
+                (vanity, urn, time.time()),
+            )
+            self.conn.commit()
+            self._remember(vanity, urn)
+
+    def get_urn(self, vanity):
+        """
+        Returns the URN of a vanity name, None if unknown.
+        """
+        vanity = normalize_vanity(vanity)
+        with self._lock:
+            if vanity in self._urns:
+                self._urns.move_to_end(vanity)
+                return self._urns[vanity]
+            row = self.conn.execute("SELECT urn FROM urns WHERE vanity = ?", (vanity,)).fetchone()
+            if row is None:
+                return None
+            self._remember(vanity, row[0])
+            return row[0]
+
+    def get_vanity(self, urn):
+        """
+        Returns the vanity name of a URN, None if unknown.
+        """
+        with self._lock:
+            if urn in self._vanities:
+                self._vanities.move_to_end(urn)
+                return self._vanities[urn]
+            row = self.conn.execute(
+                "SELECT vanity FROM urns WHERE urn = ? ORDER BY resolved_at DESC LIMIT 1", (urn,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._remember(row[0], urn)
+            return row[0]
+
+    def resolve(self, vanity, fetch):
+        """
+        Returns the URN of vanity, calling fetch(vanity) on a miss. Only string
+        results are cached. A lookup already in flight in another thread is
+        awaited instead of fetched again.
+        """
+        urn = self.get_urn(vanity)
+        if urn is not None:
+            return urn
+        key = normalize_vanity(vanity)
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            urn = fetch(vanity)
+            if isinstance(urn, str) and urn:
+                self.put(vanity, urn)
+            future.set_result(urn)
+            return urn
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def resolve_many(self, vanities, fetch, workers=8):
+        """
+        Resolves vanity names with `workers` threads, each name at most once.
+
+        Returns: {vanity: urn}, in input order.
+        """
+        vanities = list(dict.fromkeys(vanities))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(vanities, executor.map(lambda vanity: self.resolve(vanity, fetch), vanities)))
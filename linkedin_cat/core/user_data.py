@@ -0,0 +1,201 @@
+import os
+import time
+import shutil
+import hashlib
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from colorama import Fore, Style
+
+LOCK_FILENAME = ".linkedin_cat.lock"
+
+# Chrome sub-directories that only hold re-downloadable cache data.
+# localStorage / IndexedDB / Cookies are kept so warm starts stay warm.
+CACHE_SUBDIRS = [
+    os.path.join("Default", "Cache"),
+    os.path.join("Default", "Code Cache"),
+    os.path.join("Default", "GPUCache"),
+    os.path.join("Default", "Service Worker", "CacheStorage"),
+    os.path.join("Default", "Service Worker", "ScriptCache"),
+    "ShaderCache",
+    "GrShaderCache",
+    "GraphiteDawnCache",
+]
+
+
+def profile_name_for_cookies(linkedin_cookies_json):
+    """
+    Returns a stable directory name for a cookies file, eg: linkedin_cookies-3f2a9c01d4
+    """
+    path = os.path.abspath(linkedin_cookies_json)
+    stem = os.path.splitext(os.path.basename(path))[0] or "profile"
+    digest = hashlib.sha1(path.encode("utf-8")).hexdigest()[:10]
+    return f"{stem}-{digest}"
+
+
+def get_dir_size(path):
+    """
+    Returns the total size in bytes of every file below path.
+    """
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+# Open lock files of this process: lock path -> file descriptor
+_held_locks = {}
+
+
+def _try_lock(fd):
+    """
+    Takes a non-blocking exclusive lock on fd. The OS drops it when the process
+    exits, so a lock file left by a crashed process is simply free again.
+    """
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def acquire_lock(profile_dir):
+    """
+    Takes an exclusive OS lock (flock, msvcrt on Windows) on the lock file in
+    profile_dir and writes our pid in it. The file descriptor stays open until
+    release_lock.
+
+    Returns: the lock file path, or None if another process (or driver) holds it.
+    """
+    os.makedirs(profile_dir, exist_ok=True)
+    lock_path = os.path.join(profile_dir, LOCK_FILENAME)
+    if lock_path in _held_locks:
+        return None
+    for _ in range(3):
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        if not _try_lock(fd):
+            os.close(fd)
+            return None
+        # The holder may have removed the file between our open and lock:
+        # only the lock on the file currently at lock_path counts
+        try:
+            same_file = os.path.samestat(os.fstat(fd), os.stat(lock_path))
+        except OSError:
+            same_file = False
+        if not same_file:
+            os.close(fd)
+            continue
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode("ascii"))
+        _held_locks[lock_path] = fd
+        return lock_path
+    return None
+
+
+def release_lock(lock_path):
+    """
+    Removes a lock file taken by acquire_lock and releases the OS lock.
+    """
+    fd = _held_locks.pop(lock_path, None) if lock_path else None
+    if fd is None:
+        return
+    if fcntl is not None:
+        # Remove while still locked so a waiting process retries on a new file
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+        os.close(fd)
+    else:
+        # Windows cannot remove an open file
+        os.close(fd)
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+
+def prune_profile_dir(profile_dir, max_mb=500):
+    """
+    Deletes Chrome cache sub-directories when profile_dir is larger than max_mb.
+    Storage (cookies, localStorage, IndexedDB) is never touched.
+
+    Returns: number of bytes freed.
+    """
+    if not max_mb or not os.path.isdir(profile_dir):
+        return 0
+
+    size = get_dir_size(profile_dir)
+    if size <= max_mb * 1024 * 1024:
+        return 0
+
+    freed = 0
+    for sub in CACHE_SUBDIRS:
+        target = os.path.join(profile_dir, sub)
+        if os.path.isdir(target):
+            sub_size = get_dir_size(target)
+            shutil.rmtree(target, ignore_errors=True)
+            freed += sub_size
+    print(Fore.YELLOW + f"Pruned {freed / 1024 / 1024:.1f} MB of cache from {profile_dir}" + Style.RESET_ALL)
+    return freed
+
+
+def prune_user_data_root(user_data_root, max_age_days=30):
+    """
+    Removes unlocked profile directories under user_data_root that have not been
+    used for max_age_days.
+
+    Returns: list of removed directories.
+    """
+    removed = []
+    if not os.path.isdir(user_data_root):
+        return removed
+
+    cutoff = time.time() - max_age_days * 86400
+    for name in os.listdir(user_data_root):
+        profile_dir = os.path.join(user_data_root, name)
+        if not os.path.isdir(profile_dir):
+            continue
+        if os.path.getmtime(profile_dir) >= cutoff:
+            continue
+        lock_path = acquire_lock(profile_dir)
+        if lock_path is None:
+            continue
+        shutil.rmtree(profile_dir, ignore_errors=True)
+        release_lock(lock_path)
+        removed.append(profile_dir)
+    return removed
+
+
+def acquire_profile_dir(user_data_root, linkedin_cookies_json, max_slots=4, max_mb=500):
+    """
+    Picks a persistent Chrome user-data-dir for the cookies file and locks it.
+
+    The first slot is `<root>/<name>`; when it is held by another driver the next
+    free slot `<root>/<name>-1`, `<name>-2` ... is used, so two drivers never share
+    one directory.
+
+    Returns: (profile_dir, lock_path), or (None, None) if every slot is busy.
+    """
+    name = profile_name_for_cookies(linkedin_cookies_json)
+    for slot in range(max_slots):
+        profile_dir = os.path.join(user_data_root, name if slot == 0 else f"{name}-{slot}")
+        lock_path = acquire_lock(profile_dir)
+        if lock_path is None:
+            continue
+        prune_profile_dir(profile_dir, max_mb=max_mb)
+        # Touch so prune_user_data_root sees it as recently used
+        os.utime(profile_dir, None)
+        return profile_dir, lock_path
+    return None, None
@@ -0,0 +1,403 @@
+import json
+import calendar
+
+from bs4 import BeautifulSoup
+
+from linkedin_cat.core.helper import extract_and_decode_username
+
+VOYAGER_API = "https://www.linkedin.com/voyager/api"
+
+# extract_profile key -> Voyager identity sub-resource
+PROFILE_SECTION_ENDPOINTS = {
+    "experience": "positions",
+    "education": "educations",
+    "certificate": "certifications",
+    "projects": "projects",
+    "volunteering": "volunteerExperiences",
+    "skills": "skills",
+    "honor": "honors",
+    "organizations": "organizations",
+}
+
+
+def get_elements(res_json):
+    """
+    Returns the list of elements of a Voyager collection response.
+
+    Works for plain JSON ({"elements": [...]}) and for the normalized format
+    ({"data": {"*elements": [urn, ...]}, "included": [...]}).
+    """
+    if not res_json:
+        return []
+    if isinstance(res_json.get("elements"), list):
+        return res_json["elements"]
+
+    data = res_json.get("data", {}) or {}
+    if isinstance(data.get("elements"), list):
+        return data["elements"]
+
+    included = {item.get("entityUrn"): item for item in res_json.get("included", []) if isinstance(item, dict)}
+    urns = data.get("*elements", [])
+    return [included[urn] for urn in urns if urn in included]
+
+
+def format_date(date):
+    """
+    Formats a Voyager date {"month": 1, "year": 2020} as "Jan 2020".
+    """
+    if not date:
+        return None
+    year = date.get("year")
+    month = date.get("month")
+    if year and month:
+        return f"{calendar.month_abbr[month]} {year}"
+    return str(year) if year else None
+
+
+def format_time_period(time_period, ongoing="Present"):
+    """
+    Formats a Voyager timePeriod as "Jan 2020 - Present".
+    """
+    if not time_period:
+        return None
+    start = format_date(time_period.get("startDate"))
+    end = format_date(time_period.get("endDate")) or ongoing
+    if start is None:
+        return end if time_period.get("endDate") else None
+    return f"{start} - {end}"
+
+
+def map_intro(identity, network=None):
+    network = network or {}
+    first_name = identity.get("firstName") or ""
+    last_name = identity.get("lastName") or ""
+    followers = network.get("followersCount")
+    connections = network.get("connectionsCount")
+    return {
+        "name": f"{first_name} {last_name}".strip() or "Not available",
+        "pronouns": None,
+        "works_at": identity.get("headline") or "Not available",
+        "location": identity.get("geoLocationName") or identity.get("locationName") or "Not available",
+        "followers": str(followers) if followers is not None else None,
+        "connections": str(connections) if connections is not None else None,
+    }
+
+
+def map_about(identity):
+    return {"about_description": identity.get("summary") or ""}
+
+
+def map_experience(positions):
+    experience = []
+    for position in positions:
+        employment_type = position.get("employmentType")
+        if isinstance(employment_type, dict):
+            employment_type = employment_type.get("name")
+        experience.append({
+            "company_name": position.get("companyName"),
+            "job_title": position.get("title"),
+            "location": position.get("locationName") or position.get("geoLocationName"),
+            "type": employment_type,
+            "dates": format_time_period(position.get("timePeriod")),
+            "description": position.get("description"),
+        })
+    return experience
+
+
+def map_education(educations):
+    result = []
+    for education in educations:
+        degree_field = ", ".join(
+            part for part in [education.get("degreeName"), education.get("fieldOfStudy")] if part
+        )
+        result.append({
+            "university": education.get("schoolName"),
+            "degree_field": degree_field or None,
+            "graduation_year": format_time_period(education.get("timePeriod"), ongoing=None),
+        })
+    return result
+
+
+def map_certificates(certifications):
+    result = []
+    for certification in certifications:
+        issued = format_date((certification.get("timePeriod") or {}).get("startDate"))
+        result.append({
+            "cert_name": certification.get("name"),
+            "issuer": certification.get("authority"),
+            "issue_date": f"Issued {issued}" if issued else None,
+            "credential_url": certification.get("url"),
+        })
+    return result
+
+
+def map_projects(projects):
+    return [
+        {
+            "project_title": project.get("title"),
+            "dates": format_time_period(project.get("timePeriod")),
+            "organization": None,
+            "description": project.get("description"),
+            "link": project.get("url"),
+        }
+        for project in projects
+    ]
+
+
+def map_volunteering(volunteer_experiences):
+    return [
+        {
+            "role": volunteer.get("role"),
+            "organization": volunteer.get("companyName"),
+            "duration": format_time_period(volunteer.get("timePeriod")),
+            "cause": volunteer.get("cause"),
+            "description": volunteer.get("description"),
+        }
+        for volunteer in volunteer_experiences
+    ]
+
+
+def map_skills(skills):
+    return [
+        {
+            "title": skill.get("name"),
+            "endorsements_by": [],
+            "endorsements": None,
+        }
+        for skill in skills
+    ]
+
+
+def map_honors(honors):
+    return [
+        {
+            "title": honor.get("title"),
+            "issuing_institution": honor.get("issuer"),
+            "issued_date": format_date(honor.get("issueDate")),
+            "media_url": None,
+        }
+        for honor in honors
+    ]
+
+
+def map_organizations(organizations):
+    return [
+        {
+            "organization_name": organization.get("name"),
+            "role": organization.get("position"),
+            "duration": format_time_period(organization.get("timePeriod")),
+            "description": organization.get("description"),
+        }
+        for organization in organizations
+    ]
+
+
+SECTION_MAPPERS = {
+    "experience": map_experience,
+    "education": map_education,
+    "certificate": map_certificates,
+    "projects": map_projects,
+    "volunteering": map_volunteering,
+    "skills": map_skills,
+    "honor": map_honors,
+    "organizations": map_organizations,
+}
+
+
+def build_profile_data(profile_url, identity, network=None, sections=None):
+    """
+    Maps Voyager payloads to the dict produced by extract_profile.
+
+    identity: the identity profile object (data of /identity/profiles/{id})
+    network: the networkinfo object, optional
+    sections: {extract_profile key: list of Voyager elements}, eg: {"experience": positions}
+    """
+    sections = sections or {}
+    profile_data = {
+        "filename": extract_and_decode_username(profile_url),
+        "profile_url": profile_url,
+        "intro": map_intro(identity, network),
+        "about": map_about(identity),
+    }
+    for key, mapper in SECTION_MAPPERS.items():
+        profile_data[key] = mapper(sections.get(key) or [])
+    return profile_data
+
+
+# Parsing of Voyager responses captured from the browser network log
+
+def collect_included(responses):
+    """
+    Merges the normalized "included" entities of captured responses (graphql
+    responses list their entities there too), deduplicated by entityUrn.
+
+    responses: list of {"url", "status", "json"} as returned by
+    LinkedinBase.drain_voyager_responses.
+    """
+    entities = {}
+    for response in responses:
+        payload = response.get("json") or {}
+        for item in payload.get("included", []) or []:
+            if isinstance(item, dict):
+                key = item.get("entityUrn") or id(item)
+                entities[key] = item
+    return list(entities.values())
+
+
+def extract_embedded_responses(html_text):
+    """
+    Returns the Voyager responses embedded by the server in a page, LinkedIn
+    renders them as JSON inside hidden <code> elements. Lets saved HTML be
+    parsed offline with parse_profile_responses / parse_search_responses.
+
+    Returns: list of {"url", "status", "json"}, like drain_voyager_responses.
+    """
+    soup = BeautifulSoup(html_text or "", "html.parser")
+    responses = []
+    for code in soup.find_all("code"):
+        text = code.get_text().strip()
+        if not text.startswith("{"):
+            continue
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            continue
+        if isinstance(payload, dict) and ("included" in payload or "data" in payload):
+            responses.append({"url": None, "status": 200, "json": payload})
+    return responses
+
+
+def _entity_type(entity):
+    return (entity.get("$type") or "").rsplit(".", 1)[-1]
+
+
+def _to_time_period(entity):
+    """
+    Converts a dash dateRange {"start": {...}, "end": {...}} to the legacy
+    timePeriod {"startDate": {...}, "endDate": {...}} used by the mappers.
+    """
+    if entity.get("timePeriod"):
+        return entity["timePeriod"]
+    date_range = entity.get("dateRange") or {}
+    if not date_range:
+        return None
+    return {"startDate": date_range.get("start"), "endDate": date_range.get("end")}
+
+
+def _normalize_entity(entity):
+    entity = dict(entity)
+    time_period = _to_time_period(entity)
+    if time_period:
+        entity["timePeriod"] = time_period
+    if "issuedOn" in entity and "issueDate" not in entity:
+        entity["issueDate"] = entity["issuedOn"]
+    if "employmentType" in entity and isinstance(entity.get("employmentType"), dict):
+        entity["employmentType"] = entity["employmentType"].get("name")
+    if "location" in entity and "locationName" not in entity and isinstance(entity["location"], str):
+        entity["locationName"] = entity["location"]
+    return entity
+
+
+# extract_profile key -> Voyager entity type
+PROFILE_SECTION_TYPES = {
+    "experience": "Position",
+    "education": "Education",
+    "certificate": "Certification",
+    "projects": "Project",
+    "volunteering": "VolunteerExperience",
+    "skills": "Skill",
+    "honor": "Honor",
+    "organizations": "Organization",
+}
+
+
+def _owner_id(entity):
+    """
+    Returns the profile id an entity belongs to: the first member of its URN
+    tuple, eg: ACoAAB for urn:li:fsd_position:(ACoAAB,2419), else the id of
+    its profileUrn.
+    """
+    urn = entity.get("entityUrn") or ""
+    if "(" in urn:
+        return urn.split("(", 1)[1].split(",", 1)[0].rstrip(")").rsplit(":", 1)[-1]
+    profile_urn = entity.get("profileUrn")
+    return profile_urn.rsplit(":", 1)[-1] if isinstance(profile_urn, str) else None
+
+
+def parse_profile_responses(responses, profile_url):
+    """
+    Builds the extract_profile dict from Voyager responses captured while the
+    profile page loaded.
+
+    Only the Profile entity whose publicIdentifier is the one of profile_url is
+    used, and only the section entities belonging to it: the page also loads
+    the viewer's and suggested members' profiles.
+
+    Returns: the profile dict, or None if the responses do not contain the profile.
+    """
+    entities = collect_included(responses)
+    public_id = (extract_and_decode_username(profile_url) or "").lower()
+
+    identity = next((
+        e for e in entities
+        if _entity_type(e) == "Profile" and e.get("firstName")
+        and (e.get("publicIdentifier") or "").lower() == public_id
+    ), None)
+    if identity is None:
+        return None
+    profile_id = (identity.get("entityUrn") or "").rsplit(":", 1)[-1]
+    identity = dict(identity)
+    if not identity.get("geoLocationName"):
+        geo = identity.get("geoLocation") or {}
+        identity["geoLocationName"] = geo.get("defaultLocalizedName") if isinstance(geo, dict) else None
+
+    sections = {key: [] for key in PROFILE_SECTION_TYPES}
+    for entity in entities:
+        if _owner_id(entity) != profile_id:
+            continue
+        for key, entity_type in PROFILE_SECTION_TYPES.items():
+            if _entity_type(entity) == entity_type:
+                sections[key].append(_normalize_entity(entity))
+
+    network = next((e for e in entities if _entity_type(e) in ("FollowingState", "ProfileNetworkInfo")
+                    and profile_id in (e.get("entityUrn") or "")
+                    and e.get("followerCount", e.get("followersCount")) is not None), {})
+    if network and "followersCount" not in network:
+        network = {"followersCount": network.get("followerCount")}
+
+    return build_profile_data(profile_url, identity, network, sections)
+
+
+def _text(value):
+    if isinstance(value, dict):
+        return value.get("text")
+    return value
+
+
+def parse_search_responses(responses):
+    """
+    Builds the LinkedinSearch.parse_linkedin_results structure from Voyager
+    search responses captured while the result page loaded.
+
+    Returns: list of {"name", "title", "location", "introduction", "linkedin_url"}.
+    """
+    results = []
+    seen = set()
+    for entity in collect_included(responses):
+        if _entity_type(entity) != "EntityResultViewModel":
+            continue
+        url = entity.get("navigationUrl")
+        if not url or "/in/" not in url:
+            continue
+        url = url.split("?")[0]
+        if url in seen:
+            continue
+        seen.add(url)
+        results.append({
+            "name": _text(entity.get("title")),
+            "title": _text(entity.get("primarySubtitle")),
+            "location": _text(entity.get("secondarySubtitle")),
+            "introduction": _text(entity.get("summary")),
+            "linkedin_url": url,
+        })
+    return results
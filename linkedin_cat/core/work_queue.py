@@ -0,0 +1,215 @@
+import os
+import time
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue (
+    item          TEXT PRIMARY KEY,
+    status        TEXT NOT NULL DEFAULT 'pending',
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    lease_owner   TEXT,
+    lease_expires REAL,
+    last_error    TEXT,
+    enqueued_at   REAL NOT NULL,
+    updated_at    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_queue_status ON queue (status, enqueued_at);
+"""
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+class WorkQueue():
+    """
+    Durable work queue in a SQLite file, shared by several processes.
+
+    An item is leased by one worker for visibility_timeout seconds. It is acked
+    when done; if the worker crashes, the lease expires and the item is handed
+    out again. Items are unique, enqueuing one twice is a no-op, and an item that
+    failed max_attempts times is parked as failed.
+
+    Every process opens its own WorkQueue on the same path.
+    """
+    def __init__(self, db_path="./linkedin/queue.db", visibility_timeout=600, max_attempts=3):
+        folder = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(folder, exist_ok=True)
+        self.db_path = db_path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        # isolation_level=None: transactions are opened explicitly with BEGIN IMMEDIATE
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _transaction(self):
+        return _ImmediateTransaction(self.conn)
+
+    def enqueue(self, items):
+        """
+        Adds items that are not queued yet.
+
+        Returns: number of items added.
+        """
+        now = time.time()
+        with self._transaction():
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO queue (item, enqueued_at, updated_at) VALUES (?, ?, ?)",
+                [(item, now, now) for item in items],
+            )
+            return self.conn.total_changes - before
+
+    def lease(self, worker_id, visibility_timeout=None):
+        """
+        Leases the oldest available item: pending, or leased with an expired lease.
+
+        Returns: the item, None if nothing is available.
+        """
+        timeout = visibility_timeout or self.visibility_timeout
+        while True:
+            now = time.time()
+            with self._transaction():
+                row = self.conn.execute(
+                    "SELECT item, attempts FROM queue "
+                    "WHERE status = ? OR (status = ? AND lease_expires < ?) "
+                    "ORDER BY enqueued_at LIMIT 1",
+                    (PENDING, LEASED, now),
+                ).fetchone()
+                if row is None:
+                    return None
+                item, attempts = row
+                if attempts >= self.max_attempts:
+                    # Expired lease of an item that already used all its attempts
+                    self.conn.execute(
+                        "UPDATE queue SET status = ?, lease_owner = NULL, updated_at = ?, "
+                        "last_error = COALESCE(last_error, 'lease expired') WHERE item = ?",
+                        (FAILED, now, item),
+                    )
+                    continue
+                self.conn.execute(
+                    "UPDATE queue SET status = ?, attempts = attempts + 1, lease_owner = ?, "
+                    "lease_expires = ?, updated_at = ? WHERE item = ?",
+                    (LEASED, worker_id, now + timeout, now, item),
+                )
+                return item
+
+    def heartbeat(self, item, worker_id, visibility_timeout=None):
+        """
+        Extends the lease of an item still owned by worker_id.
+
+        Returns: False if the lease was lost (expired and handed to another worker).
+        """
+        now = time.time()
+        timeout = visibility_timeout or self.visibility_timeout
+        with self._transaction():
+            cursor = self.conn.execute(
+                "UPDATE queue SET lease_expires = ?, updated_at = ? "
+                "WHERE item = ? AND status = ? AND lease_owner = ?",
+                (now + timeout, now, item, LEASED, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def ack(self, item, worker_id):
+        """
+        Marks an item leased by worker_id as done.
+        """
+        with self._transaction():
+            cursor = self.conn.execute(
+                "UPDATE queue SET status = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE item = ? AND status = ? AND lease_owner = ?",
+                (DONE, time.time(), item, LEASED, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, item, worker_id, error=None):
+        """
+        Releases an item after a failed attempt. It is retried until max_attempts.
+        """
+        with self._transaction():
+            row = self.conn.execute(
+                "SELECT attempts FROM queue WHERE item = ? AND status = ? AND lease_owner = ?",
+                (item, LEASED, worker_id),
+            ).fetchone()
+            if row is None:
+                return False
+            status = FAILED if row[0] >= self.max_attempts else PENDING
+            self.conn.execute(
+                "UPDATE queue SET status = ?, lease_owner = NULL, lease_expires = NULL, "
+                "last_error = ?, updated_at = ? WHERE item = ?",
+                (status, error, time.time(), item),
+            )
+            return True
+
+    def requeue_failed(self):
+        """
+        Puts failed items back to pending with a fresh attempt count.
+
+        Returns: number of items requeued.
+        """
+        with self._transaction():
+            cursor = self.conn.execute(
+                "UPDATE queue SET status = ?, attempts = 0, updated_at = ? WHERE status = ?",
+                (PENDING, time.time(), FAILED),
+            )
+            return cursor.rowcount
+
+    def stats(self):
+        """
+        Returns the number of items per status.
+        """
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        for status, count in self.conn.execute("SELECT status, COUNT(*) FROM queue GROUP BY status"):
+            counts[status] = count
+        return counts
+
+    def available(self):
+        """
+        Returns the number of items that can be leased now.
+        """
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM queue WHERE status = ? OR (status = ? AND lease_expires < ?)",
+            (PENDING, LEASED, time.time()),
+        ).fetchone()[0]
+
+    def remaining(self):
+        """
+        Returns the number of items not done nor failed.
+        """
+        stats = self.stats()
+        return stats[PENDING] + stats[LEASED]
+
+    def failed_items(self):
+        """
+        Returns [(item, attempts, last_error)] of failed items.
+        """
+        return self.conn.execute(
+            "SELECT item, attempts, last_error FROM queue WHERE status = ? ORDER BY item", (FAILED,)
+        ).fetchall()
+
+
+class _ImmediateTransaction():
+    """
+    BEGIN IMMEDIATE ... COMMIT, so read-then-update is atomic across processes.
+    """
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
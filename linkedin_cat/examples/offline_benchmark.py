@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+离线基准测试示例
+使用本地 FixtureServer 代替 LINKEDIN_API 和 Voyager，无需网络和真实 cookies
+"""
+
+import time
+import tracemalloc
+
+from linkedin_cat.core.api import LinkedIn
+from linkedin_cat.core.fixture_server import FixtureServer
+
+
+def example_large_pull(total=100000):
+    """
+    示例 1: 分页拉取 10 万条评论，统计吞吐量与内存峰值
+    """
+    print("=" * 50)
+    print(f"示例 1: 拉取 {total} 条评论")
+    print("=" * 50)
+
+    with FixtureServer(total=total, page_size=100, latency=0.005) as server:
+        linkedin = LinkedIn().connect(li_at="offline", jessionid="offline", base_url=server.url)
+
+        for to in ("pandas", "arrow"):
+            tracemalloc.start()
+            start = time.time()
+            result = linkedin.post.get_comments(activity_id="1", count=100, sleep=False, to=to)
+            elapsed = time.time() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            rows = len(result) if to == "pandas" else result.num_rows
+            print(f"  to={to}: {rows} 行, {elapsed:.1f}s, {rows / elapsed:.0f} 行/秒, 内存峰值 {peak / 1e6:.0f} MB")
+        print(f"  服务端统计: {server.stats()['requests']} 个请求")
+
+
+def example_concurrency(profiles=200):
+    """
+    示例 2: 有延迟和错误率时，批量获取档案的并发效果
+    """
+    print("\n" + "=" * 50)
+    print(f"示例 2: 批量获取 {profiles} 个档案")
+    print("=" * 50)
+
+    urls = [f"https://www.linkedin.com/in/member-{i}" for i in range(profiles)]
+    with FixtureServer(latency=0.2, jitter=0.1, error_rate=0.02, seed=1) as server:
+        linkedin = LinkedIn().connect(li_at="offline", jessionid="offline", base_url=server.url)
+
+        for workers in (1, 4, 8):
+            start = time.time()
+            df = linkedin.profile.get_networks(urls, workers=workers, bypass_cache=True)
+            elapsed = time.time() - start
+            errors = df["ERROR"].notna().sum()
+            print(f"  workers={workers}: {elapsed:.1f}s, 失败 {errors} 个")
+
+
+def example_expired_cookies():
+    """
+    示例 3: 模拟 cookies 过期 (302)
+    """
+    print("\n" + "=" * 50)
+    print("示例 3: cookies 过期")
+    print("=" * 50)
+
+    with FixtureServer(expire_after=3) as server:
+        linkedin = LinkedIn().connect(li_at="offline", jessionid="offline", base_url=server.url)
+        for i in range(5):
+            try:
+                linkedin.post.get_stats(activity_id=str(i))
+                print(f"  请求 {i + 1}: 成功")
+            except Exception as e:
+                print(f"  请求 {i + 1}: {type(e).__name__}")
+
+
+if __name__ == "__main__":
+    example_large_pull()
+    example_concurrency()
+    example_expired_cookies()
@@ -162,6 +162,35 @@ def example_access_raw_searcher():
             # searcher.driver.get(...)
 
 
+def example_streaming_pipeline():
+    """
+    示例 7: 流式管道（搜索 → 去重 → 过滤 → 抓取 → 存储 同时进行）
+    """
+    print("\n" + "=" * 50)
+    print("示例 7: 流式管道")
+    print("=" * 50)
+    
+    from linkedin_cat.core import ProfileStore, Pipeline, Checkpoint
+    from linkedin_cat.core.pipeline import (
+        search_source, dedupe_stage, store_filter_stage, scrape_stage, store_sink
+    )
+    
+    # 搜索与抓取各用一个浏览器会话，两个阶段在不同线程中并行
+    with SearchClient(cookies_path="./cookies.json") as search_client, \
+            SearchClient(cookies_path="./cookies.json") as scrape_client, \
+            ProfileStore("./linkedin/profiles.db") as store:
+        pipeline = Pipeline(
+            search_source(search_client.searcher, ["python developer", "data engineer"], max_pages=5),
+            [dedupe_stage(), store_filter_stage(store, ttl_days=30), scrape_stage(scrape_client.searcher)],
+            sink=store_sink(store),
+            maxsize=10,
+            # 中断后重新运行会跳过已完成的档案
+            checkpoint=Checkpoint("./linkedin/pipeline_checkpoint.json"),
+        )
+        stats = pipeline.run()
+        print(f"新抓取档案: {stats['sink']}")
+
+
 if __name__ == "__main__":
     print("LinkedIn Cat - 搜索功能示例")
     print("注意: 这些示例需要有效的 cookies.json 文件才能运行\n")
@@ -173,5 +202,6 @@ if __name__ == "__main__":
     # example_search_and_save()
     # example_search_with_cache_filter()
     # example_access_raw_searcher()
+    # example_streaming_pipeline()
     
     print("\n提示: 取消注释相应函数调用以运行示例")
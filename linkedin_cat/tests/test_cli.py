@@ -100,6 +100,110 @@ class TestSendCommand:
         mock_client.assert_not_called()
 
 
+class TestScrapeCommand:
+    """scrape 命令测试"""
+    
+    def test_scrape_help(self):
+        """测试 scrape 命令帮助"""
+        from linkedin_cat.cli import app
+        
+        result = runner.invoke(app, ["scrape", "--help"])
+        
+        assert result.exit_code == 0
+    
+    @patch('linkedin_cat.cli.app.SearchClient')
+    def test_scrape_sections(self, mock_client, temp_dir):
+        """测试 scrape --sections 传递到 SearchClient"""
+        from linkedin_cat.cli import app
+        
+        cookies = Path(temp_dir) / "cookies.json"
+        cookies.write_text('[]')
+        urls = Path(temp_dir) / "urls.txt"
+        urls.write_text("https://linkedin.com/in/test-user")
+        
+        client = mock_client.return_value.__enter__.return_value
+        result = runner.invoke(app, [
+            "scrape", str(cookies), str(urls), "--sections", "experience,intro"
+        ])
+        
+        assert result.exit_code == 0
+        assert client.search_profile.call_args[1]["sections"] == ["intro", "experience"]
+    
+    @patch('linkedin_cat.cli.app.SearchClient')
+    def test_scrape_invalid_section(self, mock_client, temp_dir):
+        """测试无效部分名称"""
+        from linkedin_cat.cli import app
+        
+        cookies = Path(temp_dir) / "cookies.json"
+        cookies.write_text('[]')
+        urls = Path(temp_dir) / "urls.txt"
+        urls.write_text("https://linkedin.com/in/test-user")
+        
+        result = runner.invoke(app, ["scrape", str(cookies), str(urls), "--sections", "hobbies"])
+        
+        assert result.exit_code == 1
+        mock_client.assert_not_called()
+
+
+    @patch('linkedin_cat.cli.app.ScrapeOrchestrator')
+    def test_scrape_workers_options(self, mock_orchestrator, temp_dir):
+        """测试 --workers 转发 --ttl-days，拒绝 --tabs / --output"""
+        from linkedin_cat.cli import app
+        
+        cookies = Path(temp_dir) / "cookies.json"
+        cookies.write_text('[]')
+        urls = Path(temp_dir) / "urls.txt"
+        urls.write_text("https://linkedin.com/in/test-user")
+        store = str(Path(temp_dir) / "profiles.db")
+        mock_orchestrator.return_value.run.return_value = {"done": 1, "failed": 0}
+        
+        result = runner.invoke(app, [
+            "scrape", str(cookies), str(urls), "--store", store, "--workers", "2", "--ttl-days", "7"
+        ])
+        assert result.exit_code == 0
+        assert mock_orchestrator.call_args[1]["ttl_days"] == 7
+        assert mock_orchestrator.call_args[1]["skip_saved"] is True
+        
+        for extra in (["--tabs", "3"], ["--output", temp_dir]):
+            result = runner.invoke(app, [
+                "scrape", str(cookies), str(urls), "--store", store, "--workers", "2", *extra
+            ])
+            assert result.exit_code == 1
+        assert mock_orchestrator.call_count == 1
+
+
+class TestFindCommand:
+    """find 命令测试"""
+    
+    def test_find_from_store(self, temp_dir):
+        """测试从档案数据库建立索引并按公司和职位查询"""
+        from linkedin_cat.cli import app
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        store_path = Path(temp_dir) / "profiles.db"
+        with ProfileStore(str(store_path)) as store:
+            store.save({"filename": "jane", "profile_url": "https://www.linkedin.com/in/jane",
+                        "intro": {"name": "Jane Doe", "works_at": "Engineer at Acme"},
+                        "experience": [{"job_title": "Engineer", "company_name": "Acme"}]})
+        output = Path(temp_dir) / "urls.txt"
+        
+        result = runner.invoke(app, [
+            "find", "--index", str(Path(temp_dir) / "index.db"), "--from-store", str(store_path),
+            "--company", "acme", "--title", "engineer", "-o", str(output)
+        ])
+        
+        assert result.exit_code == 0
+        assert output.read_text(encoding='utf-8') == "https://www.linkedin.com/in/jane"
+    
+    def test_find_empty_query(self, temp_dir):
+        """测试没有查询条件时退出"""
+        from linkedin_cat.cli import app
+        
+        result = runner.invoke(app, ["find", "--index", str(Path(temp_dir) / "index.db")])
+        
+        assert result.exit_code == 1
+
+
 class TestStatusCommand:
     """status 命令测试"""
     
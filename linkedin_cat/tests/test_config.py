@@ -89,6 +89,8 @@ class TestBrowserConfig:
         assert config.headless is False
         assert config.timeout == 30
         assert config.window_size == (1920, 1080)
+        assert config.user_data_root is None
+        assert config.profile_max_mb == 500
     
     def test_headless_mode(self):
         """测试无头模式配置"""
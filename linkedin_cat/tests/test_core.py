@@ -161,3 +161,2057 @@ class TestModuleExports:
         assert hasattr(linkedin_cat, "LinkedinSearch")
         assert hasattr(linkedin_cat, "LinkedInClient")
         assert hasattr(linkedin_cat, "ContactCache")
+
+
+class TestUserDataDir:
+    """持久化 Chrome 用户目录测试"""
+    
+    def test_profile_name_is_stable(self, sample_cookies_file):
+        """测试同一 cookies 文件得到相同目录名"""
+        from linkedin_cat.core.user_data import profile_name_for_cookies
+        
+        name1 = profile_name_for_cookies(sample_cookies_file)
+        name2 = profile_name_for_cookies(sample_cookies_file)
+        
+        assert name1 == name2
+        assert name1.startswith("cookies-")
+    
+    def test_two_drivers_never_share_a_dir(self, temp_dir, sample_cookies_file):
+        """测试锁定后第二个驱动使用下一个槽位"""
+        from linkedin_cat.core.user_data import acquire_profile_dir, release_lock
+        
+        root = os.path.join(temp_dir, "profiles")
+        dir1, lock1 = acquire_profile_dir(root, sample_cookies_file)
+        dir2, lock2 = acquire_profile_dir(root, sample_cookies_file)
+        
+        assert dir1 != dir2
+        assert dir2.endswith("-1")
+        
+        release_lock(lock1)
+        dir3, lock3 = acquire_profile_dir(root, sample_cookies_file)
+        assert dir3 == dir1
+        
+        release_lock(lock2)
+        release_lock(lock3)
+    
+    def test_all_slots_busy(self, temp_dir, sample_cookies_file):
+        """测试所有槽位被占用时返回 None"""
+        from linkedin_cat.core.user_data import acquire_profile_dir
+        
+        root = os.path.join(temp_dir, "profiles")
+        acquire_profile_dir(root, sample_cookies_file, max_slots=1)
+        
+        assert acquire_profile_dir(root, sample_cookies_file, max_slots=1) == (None, None)
+    
+    def test_stale_lock_is_taken_over(self, temp_dir):
+        """测试已退出进程留下的锁会被接管"""
+        from linkedin_cat.core.user_data import acquire_lock, LOCK_FILENAME
+        
+        profile_dir = os.path.join(temp_dir, "stale")
+        os.makedirs(profile_dir)
+        with open(os.path.join(profile_dir, LOCK_FILENAME), "w") as f:
+            f.write("999999999")
+        
+        assert acquire_lock(profile_dir) is not None
+    
+    def test_lock_held_by_other_process(self, temp_dir):
+        """测试其他进程持有锁时无法获取, 进程退出后可获取"""
+        import subprocess
+        import sys
+        from linkedin_cat.core.user_data import acquire_lock, release_lock
+        
+        profile_dir = os.path.join(temp_dir, "shared")
+        holder = subprocess.Popen(
+            [sys.executable, "-c",
+             "import sys, time; from linkedin_cat.core.user_data import acquire_lock; "
+             "print(acquire_lock(sys.argv[1]) is not None, flush=True); time.sleep(30)",
+             profile_dir],
+            stdout=subprocess.PIPE, text=True,
+        )
+        try:
+            assert holder.stdout.readline().strip() == "True"
+            assert acquire_lock(profile_dir) is None
+        finally:
+            holder.kill()
+            holder.wait()
+        
+        lock_path = acquire_lock(profile_dir)
+        assert lock_path is not None
+        release_lock(lock_path)
+    
+    def test_prune_removes_cache_only(self, temp_dir):
+        """测试超过上限时只清理缓存目录"""
+        from linkedin_cat.core.user_data import prune_profile_dir
+        
+        profile_dir = os.path.join(temp_dir, "p")
+        cache_dir = os.path.join(profile_dir, "Default", "Cache")
+        storage_dir = os.path.join(profile_dir, "Default", "Local Storage")
+        os.makedirs(cache_dir)
+        os.makedirs(storage_dir)
+        with open(os.path.join(cache_dir, "blob"), "wb") as f:
+            f.write(b"0" * 2 * 1024 * 1024)
+        with open(os.path.join(storage_dir, "leveldb"), "wb") as f:
+            f.write(b"1")
+        
+        freed = prune_profile_dir(profile_dir, max_mb=1)
+        
+        assert freed >= 2 * 1024 * 1024
+        assert not os.path.exists(cache_dir)
+        assert os.path.exists(os.path.join(storage_dir, "leveldb"))
+
+
+class TestBatchExtraction:
+    """批量 JS 提取测试"""
+    
+    def test_extract_fields_single_round_trip(self, mock_selenium_driver):
+        """测试所有字段通过一次 execute_script 获取"""
+        from linkedin_cat.core.helper import extract_fields
+        
+        mock_selenium_driver.execute_script.return_value = {"name": "Jane", "link": "https://x"}
+        
+        result = extract_fields(mock_selenium_driver, {
+            "name": "//h1",
+            "link": ("//a", "href"),
+        })
+        
+        assert result == {"name": "Jane", "link": "https://x"}
+        assert mock_selenium_driver.execute_script.call_count == 1
+        
+        _, root, item_selector, specs, by_css = mock_selenium_driver.execute_script.call_args[0]
+        assert root is None
+        assert item_selector is None
+        assert by_css is False
+        assert specs == [
+            {"name": "name", "selector": "//h1", "attribute": None, "many": False},
+            {"name": "link", "selector": "//a", "attribute": "href", "many": False},
+        ]
+    
+    def test_extract_items_css_and_many(self, mock_selenium_driver):
+        """测试 CSS 选择器和多值字段"""
+        from selenium.webdriver.common.by import By
+        from linkedin_cat.core.helper import extract_items
+        
+        mock_selenium_driver.execute_script.return_value = None
+        
+        result = extract_items(
+            mock_selenium_driver, "li.item", {"tags": ("span", None, True)}, by=By.CSS_SELECTOR
+        )
+        
+        assert result == []
+        _, _, item_selector, specs, by_css = mock_selenium_driver.execute_script.call_args[0]
+        assert item_selector == "li.item"
+        assert specs[0]["many"] is True
+        assert by_css is True
+
+
+class TestSectionProbe:
+    """档案区块探测测试"""
+    
+    def test_absent_sections_are_skipped(self, mock_selenium_driver):
+        """测试缺失的区块不会调用提取函数"""
+        from linkedin_cat.core import profile
+        
+        mock_selenium_driver.execute_script.return_value = {"experience": True, "education": True}
+        called = []
+        
+        def fake(key):
+            def extractor(driver):
+                called.append(key)
+                return [key]
+            return extractor
+        
+        sections = {
+            key: (fake(key), anchor, empty)
+            for key, (_, anchor, empty) in profile.PROFILE_SECTIONS.items()
+        }
+        
+        with patch.object(profile, "PROFILE_SECTIONS", sections), \
+                patch.object(profile, "scroll_and_load"):
+            data = profile.extract_profile(mock_selenium_driver, "https://www.linkedin.com/in/test-user/")
+        
+        assert sorted(called) == ["education", "experience", "intro"]
+        assert data["honor"] == []
+        assert data["about"] == {"about_description": ""}
+        assert data["experience"] == ["experience"]
+    
+    def test_probe_failure_reports_all_present(self, mock_selenium_driver):
+        """测试探测失败时回退为全部存在"""
+        from linkedin_cat.core.helper import probe_sections
+        
+        mock_selenium_driver.execute_script.side_effect = Exception("boom")
+        
+        assert probe_sections(mock_selenium_driver, ["skills", "projects"]) == {
+            "skills": True,
+            "projects": True,
+        }
+
+    
+    def test_static_page_is_not_scrolled_or_waited_on(self, mock_selenium_driver):
+        """测试静态页面 (存档 HTML) 不滚动，缺失元素不等待超时"""
+        import time
+        from linkedin_cat.core import profile
+        from linkedin_cat.core.helper import is_static_dom
+        
+        mock_selenium_driver.find_elements.return_value = []
+        mock_selenium_driver.execute_script.side_effect = lambda script, *args: (
+            {anchor: True for anchor in args[0]} if args else 0
+        )
+        
+        start = time.time()
+        with patch("linkedin_cat.core.helper.time.sleep") as sleep:
+            data = profile.extract_profile(mock_selenium_driver, "https://www.linkedin.com/in/test-user/",
+                                           sections=["intro", "about", "experience"], navigate=False,
+                                           static=True)
+        
+        assert time.time() - start < 1
+        sleep.assert_not_called()
+        assert not is_static_dom()
+        assert data["intro"] is None
+        assert data["about"] == {"about_description": ""}
+        assert data["experience"] == []
+
+class TestSelectorRegistry:
+    """选择器注册表测试"""
+    
+    def test_fallback_and_stats(self, mock_selenium_driver):
+        """测试第一个选择器失效时回退到下一个并记录统计"""
+        from linkedin_cat.core.selector_registry import SelectorRegistry
+        
+        registry = SelectorRegistry({"field": [("xpath", "//stale"), ("xpath", "//fresh")]})
+        element = MagicMock()
+        mock_selenium_driver.find_elements.side_effect = lambda by, sel: [element] if sel == "//fresh" else []
+        
+        assert registry.find(mock_selenium_driver, "field", timeout=0) is element
+        
+        stats = {s["selector"]: s for s in registry.stats()["field"]}
+        assert stats["//stale"]["misses"] == 1
+        assert stats["//fresh"]["hits"] == 1
+        assert stats["//fresh"]["hit_rate"] == 1.0
+    
+    def test_working_selector_is_promoted(self):
+        """测试命中的选择器排到前面，从未命中的排到最后"""
+        from linkedin_cat.core.selector_registry import SelectorRegistry
+        
+        registry = SelectorRegistry({"field": [("css", "a"), ("css", "b"), ("css", "c")]})
+        registry.record("field", "a", False, 0)
+        registry.record("field", "c", True, 0.01)
+        
+        assert [sel for _, sel in registry.candidates("field")] == ["c", "b", "a"]
+    
+    def test_missing_returns_none(self, mock_selenium_driver):
+        """测试全部未命中时返回 None 且不等待"""
+        from linkedin_cat.core.selector_registry import SelectorRegistry
+        
+        registry = SelectorRegistry({"field": [("xpath", "//x")]})
+        mock_selenium_driver.find_elements.return_value = []
+        
+        assert registry.find(mock_selenium_driver, "field", timeout=0) is None
+        assert registry.find(mock_selenium_driver, "field", timeout=0, many=True) == []
+    
+    def test_override_and_soup_select(self):
+        """测试用户覆盖的 class 优先用于 BeautifulSoup 解析"""
+        from bs4 import BeautifulSoup
+        from linkedin_cat.core.selector_registry import SelectorRegistry
+        
+        registry = SelectorRegistry({"search.title": [("css", "div.old")]})
+        registry.override("search.title", "css", "div.hashed")
+        soup = BeautifulSoup('<li><div class="hashed">Engineer</div></li>', "html.parser")
+        
+        assert registry.select(soup, "search.title").get_text() == "Engineer"
+    
+    def test_override_stays_first_and_local(self):
+        """测试覆盖项始终优先, 且只作用于自己的 overlay"""
+        from linkedin_cat.core.selector_registry import SelectorRegistry
+        
+        shared = SelectorRegistry({"field": [("css", "a"), ("css", "b")]})
+        shared.record("field", "b", True, 0.01)
+        overlay = shared.overlay()
+        overlay.override("field", "css", "x")
+        
+        assert [sel for _, sel in overlay.candidates("field")] == ["x", "b", "a"]
+        assert [sel for _, sel in shared.candidates("field")] == ["b", "a"]
+        assert [sel for _, sel in shared.overlay().candidates("field")] == ["b", "a"]
+        
+        overlay.record("field", "a", True, 0.01)
+        assert shared.stats()["field"][0]["hits"] == 1
+    
+    def test_export_and_load_stats(self, temp_dir):
+        """测试统计导出与版本校验"""
+        from linkedin_cat.core.selector_registry import SelectorRegistry
+        
+        path = os.path.join(temp_dir, "selector_stats.json")
+        registry = SelectorRegistry({"field": [("css", "a")]}, version="1")
+        registry.record("field", "a", True, 0.02)
+        registry.export_stats(path)
+        
+        assert SelectorRegistry({"field": [("css", "a")]}, version="1").load_stats(path) is True
+        assert SelectorRegistry({"field": [("css", "a")]}, version="2").load_stats(path) is False
+
+
+class TestPageState:
+    """发送流程页面状态探测测试"""
+    
+    def _bot(self, driver, state):
+        from linkedin_cat.core.message import LinkedinMessage
+        
+        from linkedin_cat.core.selector_registry import SelectorRegistry
+        
+        bot = LinkedinMessage.__new__(LinkedinMessage)
+        bot.driver = driver
+        bot.message_button_class = None
+        bot.selectors = SelectorRegistry()
+        driver.execute_script.return_value = {
+            key: {"selector": None, "value": value, "ms": 0} for key, value in state.items()
+        }
+        bot.open_linkedin_url = MagicMock()
+        return bot
+    
+    def test_pending_uses_single_probe(self, mock_selenium_driver):
+        """测试待确认状态只需一次探测，不调用逐个检查"""
+        state = {"distance": "2nd", "pending": True, "hidden_connect": False,
+                 "msg_box_count": 0, "full_name": "Dr. Jane Doe"}
+        bot = self._bot(mock_selenium_driver, state)
+        bot.is_pending = MagicMock()
+        bot.is_friend = MagicMock()
+        
+        with patch("linkedin_cat.core.message.time.sleep"):
+            result = bot.send_single_request("https://www.linkedin.com/in/jane", "Hi FIRSTNAME")
+        
+        assert result["status"] == "pending"
+        assert mock_selenium_driver.execute_script.call_count == 1
+        bot.is_pending.assert_not_called()
+        bot.is_friend.assert_not_called()
+        mock_selenium_driver.find_element.assert_not_called()
+    
+    def test_friend_gets_message_with_probed_name(self, mock_selenium_driver):
+        """测试好友分支使用探测到的姓名生成消息"""
+        state = {"distance": "1st", "pending": False, "hidden_connect": False,
+                 "msg_box_count": 0, "full_name": "Dr. Jane Doe"}
+        bot = self._bot(mock_selenium_driver, state)
+        bot.send_msg_to_friend = MagicMock()
+        
+        with patch("linkedin_cat.core.message.time.sleep"):
+            result = bot.send_single_request("https://www.linkedin.com/in/jane", "Hi FIRSTNAME")
+        
+        assert result["status"] == "already_friend"
+        bot.send_msg_to_friend.assert_called_once_with("Hi Jane")
+
+
+    def test_probe_uses_registry_candidates(self, mock_selenium_driver):
+        """测试探测使用注册表候选 (含 button_class 子串匹配) 并记录命中"""
+        from linkedin_cat.core.message import PAGE_STATE_JS
+        
+        bot = self._bot(mock_selenium_driver, {})
+        bot.selectors.override(
+            "message.connect_button", "xpath", "//button[contains(@class, 'hashed')]"
+        )
+        mock_selenium_driver.execute_script.return_value = {
+            "connect": {"selector": "//button[contains(@class, 'hashed')]", "value": True, "ms": 5},
+        }
+        
+        state = bot.get_page_state()
+        
+        script, probes = mock_selenium_driver.execute_script.call_args[0]
+        assert script == PAGE_STATE_JS
+        assert probes["connect"]["candidates"][0] == ["xpath", "//button[contains(@class, 'hashed')]"]
+        assert probes["msg_box_count"]["mode"] == "count"
+        assert state["connect"] is True and state["pending"] is None
+        stats = {s["selector"]: s for s in bot.selectors.stats()["message.connect_button"]}
+        assert stats["//button[contains(@class, 'hashed')]"]["hits"] == 1
+
+
+class TestVoyagerProfile:
+    """无浏览器 Voyager 档案映射测试"""
+    
+    def test_get_elements_plain_and_normalized(self):
+        """测试普通与 normalized 两种响应格式"""
+        from linkedin_cat.core.voyager import get_elements
+        
+        plain = {"elements": [{"title": "A"}]}
+        normalized = {
+            "data": {"*elements": ["urn:2", "urn:1"]},
+            "included": [{"entityUrn": "urn:1", "title": "B"}, {"entityUrn": "urn:2", "title": "C"}],
+        }
+        
+        assert get_elements(plain) == [{"title": "A"}]
+        assert [e["title"] for e in get_elements(normalized)] == ["C", "B"]
+        assert get_elements({}) == []
+    
+    def test_build_profile_data_matches_extract_profile_schema(self):
+        """测试输出与 extract_profile 的字段一致"""
+        from linkedin_cat.core.profile import PROFILE_SECTIONS
+        from linkedin_cat.core.voyager import build_profile_data
+        
+        identity = {"firstName": "Jane", "lastName": "Doe", "headline": "Engineer",
+                    "geoLocationName": "Paris", "summary": "Hello"}
+        positions = [{"companyName": "Acme", "title": "CTO",
+                      "timePeriod": {"startDate": {"month": 3, "year": 2020}}}]
+        
+        data = build_profile_data(
+            "https://www.linkedin.com/in/jane-doe/",
+            identity,
+            {"followersCount": 120},
+            {"experience": positions},
+        )
+        
+        assert list(data.keys()) == ["filename", "profile_url"] + list(PROFILE_SECTIONS.keys())
+        assert data["filename"] == "jane-doe"
+        assert data["intro"]["name"] == "Jane Doe"
+        assert data["intro"]["followers"] == "120"
+        assert data["about"] == {"about_description": "Hello"}
+        assert data["experience"][0]["dates"] == "Mar 2020 - Present"
+        assert data["skills"] == []
+
+
+class TestNetworkCapture:
+    """网络日志 Voyager 响应捕获测试"""
+    
+    def _entry(self, method, **params):
+        return {"message": json.dumps({"message": {"method": method, "params": params}})}
+    
+    def test_drain_reads_finished_voyager_bodies(self, mock_selenium_driver):
+        """测试只读取已完成的 Voyager 响应体"""
+        from linkedin_cat.core.base import LinkedinBase
+        
+        base = LinkedinBase.__new__(LinkedinBase)
+        base.driver = mock_selenium_driver
+        base.capture_network = True
+        mock_selenium_driver.get_log.return_value = [
+            self._entry("Network.responseReceived", requestId="1",
+                        response={"url": "https://www.linkedin.com/voyager/api/graphql?x", "status": 200,
+                                  "mimeType": "application/vnd.linkedin.normalized+json+2.1"}),
+            self._entry("Network.responseReceived", requestId="2",
+                        response={"url": "https://static.licdn.com/app.js", "status": 200,
+                                  "mimeType": "application/javascript"}),
+            self._entry("Network.responseReceived", requestId="3",
+                        response={"url": "https://www.linkedin.com/voyager/api/me", "status": 200,
+                                  "mimeType": "application/json"}),
+            self._entry("Network.loadingFinished", requestId="1"),
+        ]
+        mock_selenium_driver.execute_cdp_cmd.return_value = {"body": '{"included": []}', "base64Encoded": False}
+        
+        responses = base.drain_voyager_responses()
+        
+        assert len(responses) == 1
+        assert responses[0]["json"] == {"included": []}
+        mock_selenium_driver.execute_cdp_cmd.assert_called_once_with("Network.getResponseBody", {"requestId": "1"})
+    
+    def test_parse_profile_responses(self):
+        """测试从 dash 实体构建档案"""
+        from linkedin_cat.core.voyager import parse_profile_responses
+        
+        responses = [{"json": {"included": [
+            {"$type": "com.linkedin.voyager.dash.identity.profile.Profile", "entityUrn": "urn:li:fsd_profile:ACoJane",
+             "firstName": "Jane", "lastName": "Doe", "publicIdentifier": "jane-doe", "headline": "CTO"},
+            {"$type": "com.linkedin.voyager.dash.identity.profile.Position",
+             "entityUrn": "urn:li:fsd_position:(ACoJane,1)", "companyName": "Acme", "title": "CTO",
+             "dateRange": {"start": {"month": 1, "year": 2021}, "end": {"month": 6, "year": 2023}}},
+            {"$type": "com.linkedin.voyager.dash.identity.profile.Skill",
+             "entityUrn": "urn:li:fsd_skill:(ACoJane,2)", "name": "Python"},
+            # Logged-in viewer, loaded on every page
+            {"$type": "com.linkedin.voyager.dash.identity.profile.Profile", "entityUrn": "urn:li:fsd_profile:ACoMe",
+             "firstName": "Me", "lastName": "Viewer", "publicIdentifier": "me-viewer"},
+            {"$type": "com.linkedin.voyager.dash.identity.profile.Position",
+             "entityUrn": "urn:li:fsd_position:(ACoMe,3)", "companyName": "Other", "title": "Viewer"},
+        ]}}]
+        
+        data = parse_profile_responses(responses, "https://www.linkedin.com/in/jane-doe/")
+        
+        assert data["intro"]["name"] == "Jane Doe"
+        assert [e["dates"] for e in data["experience"]] == ["Jan 2021 - Jun 2023"]
+        assert data["skills"][0]["title"] == "Python"
+        assert parse_profile_responses([], "https://www.linkedin.com/in/jane-doe/") is None
+        assert parse_profile_responses(responses, "https://www.linkedin.com/in/someone-else/") is None
+    
+    def test_parse_search_responses(self):
+        """测试从搜索实体构建结果列表"""
+        from linkedin_cat.core.voyager import parse_search_responses
+        
+        responses = [{"json": {"included": [
+            {"$type": "com.linkedin.voyager.dash.search.EntityResultViewModel", "entityUrn": "urn:r1",
+             "title": {"text": "Jane Doe"}, "primarySubtitle": {"text": "CTO at Acme"},
+             "secondarySubtitle": {"text": "Paris"},
+             "navigationUrl": "https://www.linkedin.com/in/jane-doe?miniProfileUrn=x"},
+            {"$type": "com.linkedin.voyager.dash.search.EntityResultViewModel", "entityUrn": "urn:r2",
+             "title": {"text": "Acme"}, "navigationUrl": "https://www.linkedin.com/company/acme/"},
+        ]}}]
+        
+        results = parse_search_responses(responses)
+        
+        assert results == [{
+            "name": "Jane Doe",
+            "title": "CTO at Acme",
+            "location": "Paris",
+            "introduction": None,
+            "linkedin_url": "https://www.linkedin.com/in/jane-doe",
+        }]
+
+
+class TestIterSearch:
+    """分页流式搜索测试"""
+    
+    def _searcher(self, driver):
+        from linkedin_cat.core.search import LinkedinSearch
+        
+        searcher = LinkedinSearch.__new__(LinkedinSearch)
+        searcher.driver = driver
+        searcher.short_wait = MagicMock()
+        driver.execute_script.return_value = "complete"
+        return searcher
+    
+    def test_page_param_in_url(self):
+        """测试搜索 URL 包含页码"""
+        from linkedin_cat.core.search import LinkedinSearch
+        
+        searcher = LinkedinSearch.__new__(LinkedinSearch)
+        
+        assert "page=3" in searcher.generate_linkedin_search_url("python", page=3)
+        assert "page=" not in searcher.generate_linkedin_search_url("python", page=1)
+    
+    def test_stops_on_duplicate_page(self, mock_selenium_driver):
+        """测试遇到重复页时提前停止，并预加载下一页"""
+        searcher = self._searcher(mock_selenium_driver)
+        pages = [
+            [{"linkedin_url": "a"}, {"linkedin_url": "b"}],
+            [{"linkedin_url": "c"}],
+            [{"linkedin_url": "c"}],
+            [{"linkedin_url": "d"}],
+        ]
+        searcher.parse_linkedin_results = MagicMock(side_effect=pages)
+        
+        result = list(searcher.iter_search("python", filters={"company": "Acme"}, max_pages=4))
+        
+        assert result == [pages[0], pages[1]]
+        prefetches = [c for c in mock_selenium_driver.execute_script.call_args_list
+                      if "location.href" in c[0][0]]
+        assert "page=2" in prefetches[0][0][1]
+        assert "company=Acme" in prefetches[0][0][1]
+        mock_selenium_driver.close.assert_called_once()
+    
+    def test_previous_document_is_not_ready(self, mock_selenium_driver):
+        """测试复用标签页时, 旧页面 (已完成加载) 不会被当作新页面"""
+        from linkedin_cat.core.search import NAVIGATE_JS, PAGE_READY_JS
+        
+        searcher = self._searcher(mock_selenium_driver)
+        document = {"stale": False}
+        
+        def execute_script(script, *args):
+            if script == NAVIGATE_JS:
+                document["stale"] = True
+            elif script == PAGE_READY_JS:
+                return "stale" if document["stale"] else "complete"
+        
+        mock_selenium_driver.execute_script.side_effect = execute_script
+        searcher._navigate_async("https://www.linkedin.com/search/results/people/?page=2")
+        
+        with patch("linkedin_cat.core.search.time.sleep"), \
+             patch("linkedin_cat.core.search.time.time", side_effect=[0, 1, 2, 31]):
+            assert searcher._wait_page_ready() is False
+        
+        document["stale"] = False  # new document committed
+        assert searcher._wait_page_ready() is True
+
+
+class TestQueryPlanner:
+    """搜索查询规划器测试"""
+    
+    def test_canonicalize_query(self):
+        """测试等价参数规范化为同一查询"""
+        from linkedin_cat.core.query_planner import canonicalize_query, query_key
+        
+        a = {"keywords": " Data  Scientist", "company": "ACME", "title": None, "origin": "X"}
+        b = {"company": "acme", "keywords": "data scientist", "school": ""}
+        
+        assert canonicalize_query(a) == {"keywords": "data scientist", "company": "acme"}
+        assert query_key(a) == query_key(b)
+    
+    def test_expand_dedupes(self, temp_cache_dir):
+        """测试组合展开去重"""
+        from linkedin_cat.core.query_planner import SearchQueryPlanner
+        
+        with SearchQueryPlanner(cache_dir=temp_cache_dir) as planner:
+            plans = planner.expand("python", titles=["Engineer", "engineer "], companies=["Acme", "Globex"])
+        
+        assert len(plans) == 2
+        assert {p["company"] for p in plans} == {"acme", "globex"}
+    
+    def test_run_uses_cache_and_prunes(self, temp_cache_dir):
+        """测试结果缓存命中与低产出扩展剪枝"""
+        from linkedin_cat.core.query_planner import SearchQueryPlanner
+        
+        searcher = MagicMock()
+        searcher.iter_search.side_effect = lambda keywords, filters, max_pages: iter([[
+            {"linkedin_url": "https://www.linkedin.com/in/a/"},
+            {"linkedin_url": "https://www.linkedin.com/in/b"},
+        ]])
+        
+        with SearchQueryPlanner(cache_dir=temp_cache_dir, min_yield=0.1, min_runs=2) as planner:
+            first = planner.run(searcher, [{"keywords": "python", "company": "Acme"}])
+            assert len(first) == 2
+            
+            # Same canonical query is served from cache
+            planner.run(searcher, [{"keywords": "Python ", "company": "acme"}])
+            assert searcher.iter_search.call_count == 1
+            
+            # Overlapping expansion in one run adds nothing new
+            planner.run(searcher, [
+                {"keywords": "python", "company": "Globex"},
+                {"keywords": "python", "company": "Globex", "title": "Engineer"},
+            ])
+            assert planner.facet_yield("title=engineer") == (1, 0.0)
+            planner.record_yield({"keywords": "java", "title": "engineer"}, 10, 0)
+            assert planner.should_prune({"keywords": "go", "title": "Engineer"})
+            assert planner.plan([{"keywords": "go", "title": "Engineer"}]) == []
+            assert not planner.should_prune({"keywords": "go", "company": "acme"})
+            assert "title=engineer" in planner.yield_stats()["facets"]
+    
+    def test_deeper_search_is_not_served_from_cache(self, temp_cache_dir):
+        """测试缓存页数不足时重新搜索, 缓存回放不计入产出统计"""
+        from linkedin_cat.core.query_planner import SearchQueryPlanner
+        
+        searcher = MagicMock()
+        searcher.iter_search.side_effect = lambda keywords, filters, max_pages: iter([
+            [{"linkedin_url": f"https://www.linkedin.com/in/p{page}"}] for page in range(max_pages)
+        ])
+        query = [{"keywords": "python", "company": "Acme"}]
+        
+        with SearchQueryPlanner(cache_dir=temp_cache_dir) as planner:
+            assert len(planner.run(searcher, query, max_pages=1)) == 1
+            assert len(planner.run(searcher, query, max_pages=5)) == 5
+            assert searcher.iter_search.call_count == 2
+            
+            # Fewer pages than cached, or replayed: no search, no extra run
+            assert len(planner.run(searcher, query, max_pages=3)) == 5
+            assert searcher.iter_search.call_count == 2
+            assert planner.facet_yield("company=acme")[0] == 2
+        
+        # A search that ran out of pages is complete for any depth
+        searcher.iter_search.side_effect = lambda keywords, filters, max_pages: iter([
+            [{"linkedin_url": "https://www.linkedin.com/in/only"}]
+        ])
+        with SearchQueryPlanner(cache_dir=temp_cache_dir) as planner:
+            planner.run(searcher, [{"keywords": "rust"}], max_pages=3)
+            planner.run(searcher, [{"keywords": "rust"}], max_pages=10)
+            assert searcher.iter_search.call_count == 3
+
+
+class TestProfileStore:
+    """档案存储测试"""
+    
+    def _profile(self, url="https://www.linkedin.com/in/john-doe/", about="hi"):
+        return {
+            "filename": "john-doe",
+            "profile_url": url,
+            "intro": {"name": "John Doe"},
+            "about": {"about_description": about},
+        }
+    
+    def test_canonical_profile_id(self):
+        """测试规范化档案 ID"""
+        from linkedin_cat.core.profile_store import canonical_profile_id
+        
+        assert canonical_profile_id("https://www.linkedin.com/in/John-Doe/?trk=x") == "john-doe"
+        assert canonical_profile_id("https://www.linkedin.com/in/%E5%BC%A0%E4%B8%89") == "张三"
+    
+    def test_save_get_and_lookup(self, temp_dir):
+        """测试保存、读取与已抓取查询"""
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        with ProfileStore(os.path.join(temp_dir, "profiles.db")) as store:
+            assert not store.has("https://www.linkedin.com/in/john-doe")
+            assert store.save(self._profile()) is True
+            assert store.save(self._profile()) is False
+            assert store.save(self._profile(about="changed")) is True
+            
+            assert "https://www.linkedin.com/in/JOHN-DOE?x=1" in store
+            assert len(store) == 1
+            assert store.get("https://www.linkedin.com/in/john-doe")["about"]["about_description"] == "changed"
+            assert store.metadata("https://www.linkedin.com/in/john-doe")["profile_id"] == "john-doe"
+    
+    def test_export_import_json(self, temp_dir):
+        """测试与 save_to_json 兼容的导入导出"""
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        export_dir = os.path.join(temp_dir, "export")
+        with ProfileStore(os.path.join(temp_dir, "a.db")) as store:
+            store.save(self._profile())
+            assert store.export_json(export_dir) == 1
+        
+        with open(os.path.join(export_dir, "john-doe.json"), encoding="utf-8") as f:
+            assert json.load(f)["intro"]["name"] == "John Doe"
+        
+        with ProfileStore(os.path.join(temp_dir, "b.db")) as store:
+            assert store.import_json(export_dir) == 1
+            assert store.has("https://www.linkedin.com/in/john-doe/")
+    
+    def test_search_profile_skips_stored(self, temp_dir):
+        """测试已存储档案不会重复抓取"""
+        from linkedin_cat.core.search import LinkedinSearch
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        searcher = LinkedinSearch.__new__(LinkedinSearch)
+        searcher.extract_profile_from_network = MagicMock(return_value=self._profile())
+        
+        with ProfileStore(os.path.join(temp_dir, "profiles.db")) as store:
+            searcher.search_linkedin_profile("https://www.linkedin.com/in/john-doe/", store=store)
+            searcher.search_linkedin_profile("https://www.linkedin.com/in/john-doe/", store=store)
+            
+            assert searcher.extract_profile_from_network.call_count == 1
+            assert len(store) == 1
+
+
+class TestIncrementalRefresh:
+    """增量重新抓取测试"""
+    
+    URL = "https://www.linkedin.com/in/john-doe/"
+    
+    def _profile(self, about="hi", skills=None):
+        return {
+            "filename": "john-doe",
+            "profile_url": self.URL,
+            "intro": {"name": "John Doe"},
+            "about": {"about_description": about},
+            "skills": skills or [],
+        }
+    
+    def test_section_diff(self, temp_dir):
+        """测试只重写变化的部分并返回差异"""
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        with ProfileStore(os.path.join(temp_dir, "profiles.db")) as store:
+            first = store.save_sections(self._profile(), scraped_at=100)
+            assert first["new"] and first["added"] == ["intro", "about", "skills"]
+            
+            diff = store.save_sections(self._profile(about="new about"), scraped_at=200)
+            assert diff["changed"] == ["about"]
+            assert diff["unchanged"] == ["intro", "skills"]
+            
+            sections = store.section_metadata(self.URL)
+            assert sections["about"]["updated_at"] == 200
+            assert sections["intro"]["updated_at"] == 100
+            assert list(store.get(self.URL)) == ["filename", "profile_url", "intro", "about", "skills"]
+    
+    def test_stale_profiles(self, temp_dir):
+        """测试按 TTL 判断过期档案"""
+        import time
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        with ProfileStore(os.path.join(temp_dir, "profiles.db")) as store:
+            store.save(self._profile(), scraped_at=time.time() - 10 * 86400)
+            
+            assert not store.is_fresh(self.URL, ttl_days=7)
+            assert store.is_fresh(self.URL, ttl_days=30)
+            assert store.stale_profiles(ttl_days=7) == [self.URL]
+    
+    def test_refresh_profiles(self, temp_dir):
+        """测试刷新仅抓取过期档案并报告变化"""
+        import time
+        from linkedin_cat.core.search import LinkedinSearch
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        searcher = LinkedinSearch.__new__(LinkedinSearch)
+        searcher.extract_profile_from_network = MagicMock(
+            return_value=self._profile(skills=[{"title": "Python"}])
+        )
+        
+        with ProfileStore(os.path.join(temp_dir, "profiles.db")) as store:
+            store.save(self._profile(), scraped_at=time.time() - 10 * 86400)
+            
+            report = searcher.refresh_profiles(store, ttl_days=7)
+            assert report == {self.URL: {"added": [], "changed": ["skills"], "removed": []}}
+            
+            # Now fresh, nothing to do
+            assert searcher.refresh_profiles(store, ttl_days=7) == {}
+            assert searcher.extract_profile_from_network.call_count == 1
+
+
+class TestSelectiveSections:
+    """按需抽取档案部分测试"""
+    
+    def test_resolve_sections(self):
+        """测试部分名称解析与校验"""
+        from linkedin_cat.core.profile import resolve_sections, PROFILE_SECTIONS
+        
+        assert resolve_sections(None) == list(PROFILE_SECTIONS)
+        assert resolve_sections("experience, intro") == ["intro", "experience"]
+        with pytest.raises(ValueError):
+            resolve_sections(["intro", "hobbies"])
+    
+    def test_top_card_only_skips_scroll(self, mock_selenium_driver):
+        """测试只抽取顶部卡片时不滚动页面、不调用其他抽取器"""
+        from linkedin_cat.core import profile
+        
+        intro = {"name": "John Doe"}
+        with patch.object(profile, "scroll_and_load") as scroll, \
+             patch.object(profile, "probe_sections") as probe, \
+             patch.dict(profile.PROFILE_SECTIONS, {
+                 "intro": (MagicMock(return_value=intro), None, None),
+                 "experience": (MagicMock(return_value=[]), "experience", []),
+             }):
+            data = profile.extract_profile(mock_selenium_driver, "https://www.linkedin.com/in/john-doe/",
+                                           sections=["intro"])
+            
+            scroll.assert_not_called()
+            probe.assert_not_called()
+            profile.PROFILE_SECTIONS["experience"][0].assert_not_called()
+        
+        assert data["intro"] == intro
+        assert data["captured_sections"] == ["intro"]
+        assert "experience" not in data
+    
+    def test_partial_save_keeps_other_sections(self, temp_dir):
+        """测试部分抓取只更新抓取到的部分"""
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        url = "https://www.linkedin.com/in/john-doe/"
+        full = {"filename": "john-doe", "profile_url": url,
+                "intro": {"name": "John"}, "experience": [{"job_title": "Dev"}]}
+        partial = {"filename": "john-doe", "profile_url": url,
+                   "captured_sections": ["intro"], "intro": {"name": "John Doe"}}
+        
+        with ProfileStore(os.path.join(temp_dir, "profiles.db")) as store:
+            store.save(full)
+            diff = store.save_sections(partial)
+            
+            assert diff["changed"] == ["intro"] and diff["removed"] == []
+            profile_data = store.get(url)
+            assert profile_data["experience"] == [{"job_title": "Dev"}]
+            assert profile_data["intro"] == {"name": "John Doe"}
+            assert store.has_sections(url, ["intro", "experience"])
+    
+    def test_partial_save_keeps_scrape_time_and_version(self, temp_dir):
+        """测试部分抓取不刷新整个档案的抓取时间，也不清空提取器版本"""
+        import time
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        url = "https://www.linkedin.com/in/john-doe/"
+        full = {"filename": "john-doe", "profile_url": url,
+                "intro": {"name": "John"}, "experience": [{"job_title": "Dev"}]}
+        partial = {"filename": "john-doe", "profile_url": url,
+                   "captured_sections": ["intro"], "intro": {"name": "John Doe"}}
+        old = time.time() - 30 * 86400
+        
+        with ProfileStore(os.path.join(temp_dir, "profiles.db")) as store:
+            store.save(full, scraped_at=old, extractor_version="1")
+            store.save_sections(partial)
+            
+            assert store.stale_profiles(ttl_days=7) == [url]
+            assert not store.is_fresh(url)
+            assert store.metadata(url)["extractor_version"] == "1"
+            assert store.section_metadata(url)["intro"]["updated_at"] > old
+            
+            store.save(full)
+            assert store.stale_profiles(ttl_days=7) == []
+            assert store.metadata(url)["extractor_version"] == "1"
+    
+    def test_stored_partial_profile_rescraped_for_missing_section(self, temp_dir):
+        """测试已存储的部分档案在请求缺失部分时重新抓取"""
+        from linkedin_cat.core.search import LinkedinSearch
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        url = "https://www.linkedin.com/in/john-doe/"
+        searcher = LinkedinSearch.__new__(LinkedinSearch)
+        searcher.extract_profile_from_network = MagicMock(side_effect=lambda u, sections: dict(
+            {"filename": "john-doe", "profile_url": u, "captured_sections": sections},
+            **{key: [] for key in sections}
+        ))
+        
+        with ProfileStore(os.path.join(temp_dir, "profiles.db")) as store:
+            searcher.search_linkedin_profile(url, store=store, sections=["intro"])
+            searcher.search_linkedin_profile(url, store=store, sections=["intro"])
+            searcher.search_linkedin_profile(url, store=store, sections=["intro", "skills"])
+            
+            assert searcher.extract_profile_from_network.call_count == 2
+            assert store.get(url)["captured_sections"] == ["intro", "skills"]
+
+
+class TestPipelinedScrape:
+    """多标签页流水线抓取测试"""
+    
+    def _searcher(self, driver):
+        from linkedin_cat.core.search import LinkedinSearch
+        
+        searcher = LinkedinSearch.__new__(LinkedinSearch)
+        searcher.driver = driver
+        handles = iter(["tab-1", "tab-2", "tab-3"])
+        driver.current_window_handle = "main"
+        driver.switch_to.new_window.side_effect = lambda kind: setattr(
+            driver, "current_window_handle", next(handles)
+        )
+        searcher._wait_page_ready = MagicMock(return_value=True)
+        return searcher
+    
+    def test_bounded_lookahead_and_order(self, mock_selenium_driver, temp_dir):
+        """测试预加载数量受限且结果保持输入顺序"""
+        from linkedin_cat.core import search
+        
+        searcher = self._searcher(mock_selenium_driver)
+        urls = [f"https://www.linkedin.com/in/user-{i}" for i in range(5)]
+        in_flight = []
+        
+        def fake_extract(driver, url, sections=None, navigate=True):
+            assert navigate is False
+            navigated = [c[0][1] for c in mock_selenium_driver.execute_script.call_args_list]
+            in_flight.append(len(navigated) - len(in_flight))
+            return {"filename": url.rsplit("/", 1)[-1], "profile_url": url}
+        
+        with patch.object(search, "extract_profile", side_effect=fake_extract):
+            results = list(searcher.iter_profiles_pipelined(urls, tabs=3, save_folder=temp_dir))
+        
+        assert [url for url, _ in results] == urls
+        assert max(in_flight) == 3
+        # Reused tabs are navigated with the stale-document flag
+        assert {c[0][0] for c in mock_selenium_driver.execute_script.call_args_list} == {search.NAVIGATE_JS}
+        # Extra tabs are closed
+        assert mock_selenium_driver.close.call_count == 2
+    
+    def test_reloads_when_tab_not_ready(self, mock_selenium_driver, temp_dir):
+        """测试新页面未加载完成时重新打开, 不提取旧页面"""
+        from linkedin_cat.core import search
+        
+        searcher = self._searcher(mock_selenium_driver)
+        searcher._wait_page_ready.return_value = False
+        url = "https://www.linkedin.com/in/user-0"
+        
+        with patch.object(search, "extract_profile", return_value={"filename": "user-0"}):
+            results = list(searcher.iter_profiles_pipelined([url], tabs=2, save_folder=temp_dir))
+        
+        mock_selenium_driver.get.assert_called_once_with(url)
+        assert results == [(url, {"filename": "user-0"})]
+    
+    def test_list_saves_with_tabs(self, mock_selenium_driver, temp_dir):
+        """测试 tabs > 1 时批量抓取保存结果并跳过已存在档案"""
+        from linkedin_cat.core import search
+        
+        searcher = self._searcher(mock_selenium_driver)
+        urls = ["https://www.linkedin.com/in/a", "https://www.linkedin.com/in/b"]
+        with open(os.path.join(temp_dir, "a.json"), "w") as f:
+            f.write("{}")
+        
+        with patch.object(search, "extract_profile",
+                          side_effect=lambda d, url, sections=None, navigate=True:
+                          {"filename": url.rsplit("/", 1)[-1], "profile_url": url}) as extract:
+            searcher.search_linkedin_profile_list(urls, save_folder=temp_dir, tabs=2)
+        
+        assert extract.call_count == 1
+        assert os.path.exists(os.path.join(temp_dir, "b.json"))
+
+
+def _crashing_worker(worker_id, cookies_json, queue_path, store_path, options):
+    """ScrapeOrchestrator 测试用 worker：首次处理 crash 项时进程崩溃"""
+    from linkedin_cat.core.work_queue import WorkQueue
+    
+    queue = WorkQueue(queue_path, visibility_timeout=options["visibility_timeout"])
+    marker = os.path.join(os.path.dirname(queue_path), "crashed")
+    while True:
+        item = queue.lease(worker_id)
+        if item is None:
+            break
+        if item == "crash" and not os.path.exists(marker):
+            open(marker, "w").close()
+            os._exit(1)
+        queue.ack(item, worker_id)
+    queue.close()
+
+
+class TestWorkQueue:
+    """持久化工作队列测试"""
+    
+    def test_enqueue_lease_ack(self, temp_dir):
+        """测试入队去重、租约与确认"""
+        from linkedin_cat.core.work_queue import WorkQueue
+        
+        with WorkQueue(os.path.join(temp_dir, "queue.db")) as queue:
+            assert queue.enqueue(["a", "b"]) == 2
+            assert queue.enqueue(["a", "c"]) == 1
+            
+            assert queue.lease("w1") == "a"
+            assert queue.lease("w2") == "b"
+            assert queue.ack("a", "w1")
+            assert not queue.ack("b", "w1")  # not the owner
+            assert queue.stats() == {"pending": 1, "leased": 1, "done": 1, "failed": 0}
+    
+    def test_expired_lease_is_retried(self, temp_dir):
+        """测试租约过期后任务重新分配"""
+        import time
+        from linkedin_cat.core.work_queue import WorkQueue
+        
+        with WorkQueue(os.path.join(temp_dir, "queue.db"), visibility_timeout=0.05) as queue:
+            queue.enqueue(["a"])
+            assert queue.lease("w1") == "a"
+            assert queue.lease("w2") is None
+            time.sleep(0.1)
+            
+            assert queue.available() == 1
+            assert queue.lease("w2") == "a"
+            assert not queue.heartbeat("a", "w1")
+            assert queue.ack("a", "w2")
+    
+    def test_fail_until_max_attempts(self, temp_dir):
+        """测试失败重试达到上限后标记为失败"""
+        from linkedin_cat.core.work_queue import WorkQueue
+        
+        with WorkQueue(os.path.join(temp_dir, "queue.db"), max_attempts=2) as queue:
+            queue.enqueue(["a"])
+            queue.lease("w1")
+            queue.fail("a", "w1", "timeout")
+            assert queue.stats()["pending"] == 1
+            queue.lease("w1")
+            queue.fail("a", "w1", "timeout")
+            
+            assert queue.failed_items() == [("a", 2, "timeout")]
+            assert queue.requeue_failed() == 1
+            assert queue.lease("w1") == "a"
+
+
+class TestScrapeOrchestrator:
+    """多进程抓取调度测试"""
+    
+    def test_crashed_worker_items_are_retried(self, temp_dir):
+        """测试 worker 崩溃后任务不丢失、不重复"""
+        from linkedin_cat.core.orchestrator import ScrapeOrchestrator
+        from linkedin_cat.core.work_queue import WorkQueue
+        
+        queue_path = os.path.join(temp_dir, "queue.db")
+        orchestrator = ScrapeOrchestrator(
+            "cookies.json", workers=2, queue_path=queue_path,
+            store_path=os.path.join(temp_dir, "profiles.db"),
+            visibility_timeout=1, worker=_crashing_worker,
+        )
+        
+        stats = orchestrator.run(["a", "crash", "b", "c"], poll=0.2)
+        
+        assert stats == {"pending": 0, "leased": 0, "done": 4, "failed": 0}
+        with WorkQueue(queue_path) as queue:
+            attempts = dict(queue.conn.execute("SELECT item, attempts FROM queue").fetchall())
+        assert attempts["crash"] == 2
+
+
+    def test_worker_skips_saved_profiles(self, temp_dir):
+        """测试 worker 跳过库中已有的新鲜档案, 不启动浏览器"""
+        from linkedin_cat.core.orchestrator import scrape_worker
+        from linkedin_cat.core.profile_store import ProfileStore
+        from linkedin_cat.core.work_queue import WorkQueue
+        
+        url = "https://www.linkedin.com/in/jane-doe"
+        queue_path = os.path.join(temp_dir, "queue.db")
+        store_path = os.path.join(temp_dir, "profiles.db")
+        with ProfileStore(store_path) as store:
+            store.save({"filename": "jane-doe", "profile_url": url, "intro": {"name": "Jane Doe"}})
+        with WorkQueue(queue_path) as queue:
+            queue.enqueue([url])
+        
+        with patch("linkedin_cat.core.search.LinkedinSearch") as searcher:
+            scrape_worker("worker-0", "cookies.json", queue_path, store_path,
+                          {"skip_saved": True, "ttl_days": 7})
+        
+        searcher.assert_not_called()
+        with WorkQueue(queue_path) as queue:
+            assert queue.stats()["done"] == 1
+
+
+class TestHtmlArchive:
+    """HTML 归档与离线重新解析测试"""
+    
+    URL = "https://www.linkedin.com/in/jane-doe"
+    
+    def _profile_html(self, title="CTO"):
+        from html import escape
+        
+        payload = {"data": {}, "included": [
+            {"$type": "com.linkedin.voyager.dash.identity.profile.Profile", "entityUrn": "urn:li:fsd_profile:ACoJane",
+             "firstName": "Jane", "lastName": "Doe", "publicIdentifier": "jane-doe", "headline": title},
+            {"$type": "com.linkedin.voyager.dash.identity.profile.Position",
+             "entityUrn": "urn:li:fsd_position:(ACoJane,1)", "companyName": "Acme", "title": title},
+        ]}
+        return (f'<html><body><code style="display: none" id="bpr-guid-1">{escape(json.dumps(payload))}</code>'
+                f'<code id="other">not json</code></body></html>')
+    
+    def test_extract_embedded_responses(self):
+        """测试从页面 <code> 元素读取内嵌 Voyager 响应"""
+        from linkedin_cat.core.voyager import extract_embedded_responses
+        
+        responses = extract_embedded_responses(self._profile_html())
+        
+        assert len(responses) == 1
+        assert responses[0]["json"]["included"][0]["firstName"] == "Jane"
+    
+    def test_parse_search_html_offline(self):
+        """测试无浏览器解析搜索结果 HTML"""
+        from linkedin_cat.core.search import parse_search_html
+        
+        html = ('<ul><li class="reusable-search__result-container">'
+                '<span aria-hidden="true">Jane Doe</span>'
+                '<div class="entity-result__primary-subtitle">CTO</div>'
+                '<span class="entity-result__title-text"><a href="https://www.linkedin.com/in/jane-doe">x</a></span>'
+                '</li></ul>')
+        
+        results = parse_search_html(html)
+        
+        assert results[0]["name"] == "Jane Doe"
+        assert results[0]["linkedin_url"] == "https://www.linkedin.com/in/jane-doe"
+    
+    def test_archive_round_trip(self, temp_dir):
+        """测试归档保存与读取"""
+        from linkedin_cat.core.html_archive import HtmlArchive, PROFILE
+        
+        with HtmlArchive(os.path.join(temp_dir, "archive.db")) as archive:
+            archive.save(PROFILE, self.URL, "<html>x</html>", responses=[{"json": {"included": []}}])
+            archive.save(PROFILE, self.URL, "<html>y</html>")
+            
+            assert len(archive) == 1
+            page = archive.get(PROFILE, self.URL)
+            assert page["html"] == "<html>y</html>"
+            assert page["responses"] == []
+            assert archive.urls(PROFILE) == [self.URL]
+    
+    def test_parse_archived_profile_runs_dom_extractors(self):
+        """测试归档页面去掉脚本后加载到浏览器, 用当前 DOM 提取器解析"""
+        from linkedin_cat.core import html_archive
+        
+        driver = _SnapshotDriver()
+        html = '<html><script>location.href = "/login"</script><h1>Jane Doe</h1></html>'
+        page = {"url": self.URL, "html": html}
+        
+        with patch.object(html_archive, "extract_profile", side_effect=_fake_extract_profile) as extract:
+            parsed = html_archive.parse_archived_profile(driver, page)
+        
+        assert "<script" not in driver.html and "Jane Doe" in driver.html
+        assert extract.call_args[1]["navigate"] is False
+        assert extract.call_args[1]["static"] is True
+        assert parsed["intro"] == {"name": "Jane Doe"}
+        # Empty sections of the snapshot are not captured
+        assert parsed["captured_sections"] == ["intro", "about", "experience"]
+        assert "skills" not in parsed
+    
+    def test_reparse_profiles(self, temp_dir):
+        """测试多进程重新解析并标记解析器版本，不覆盖快照中缺失的部分"""
+        from linkedin_cat.core import html_archive
+        from linkedin_cat.core.html_archive import HtmlArchive, PROFILE, reparse_profiles
+        from linkedin_cat.core.profile import EXTRACTOR_VERSION
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        archive_path = os.path.join(temp_dir, "archive.db")
+        store_path = os.path.join(temp_dir, "profiles.db")
+        with HtmlArchive(archive_path) as archive:
+            archive.save(PROFILE, self.URL, "<html><h1>Jane Doe</h1><h2>CEO</h2></html>", fetched_at=1000)
+            archive.save(PROFILE, "https://www.linkedin.com/in/nobody", "<html></html>", fetched_at=1000)
+        with ProfileStore(store_path) as store:
+            store.save({"filename": "jane-doe", "profile_url": self.URL,
+                        "intro": {"name": "Jane Doe"}, "skills": [{"title": "Python"}]}, scraped_at=1000)
+        
+        # Worker processes are forked, they see the patched module
+        with patch.object(html_archive, "snapshot_driver", _SnapshotDriver), \
+             patch.object(html_archive, "extract_profile", _fake_extract_profile):
+            report = reparse_profiles(archive_path, store_path, workers=2)
+            
+            assert report["parsed"] == 1 and report["updated"] == 1
+            assert report["failed"] == ["https://www.linkedin.com/in/nobody"]
+            with ProfileStore(store_path) as store:
+                profile_data = store.get(self.URL)
+                assert profile_data["experience"][0]["job_title"] == "CEO"
+                assert profile_data["skills"] == [{"title": "Python"}]
+                assert store.metadata(self.URL)["extractor_version"] == EXTRACTOR_VERSION
+            
+            # Already at the current version
+            assert reparse_profiles(archive_path, store_path, workers=2)["skipped"] == 1
+
+
+class _SnapshotDriver:
+    """读取 load_snapshot 写入的临时文件的假浏览器"""
+    
+    def __init__(self):
+        self.html = None
+    
+    def get(self, url):
+        with open(url[len("file://"):], encoding="utf-8") as f:
+            self.html = f.read()
+    
+    def quit(self):
+        pass
+
+
+def _fake_extract_profile(driver, profile_url, sections=None, navigate=True, static=False):
+    import re
+    
+    name = re.search(r"<h1>(.*?)</h1>", driver.html)
+    if not name:
+        return {"filename": "x", "profile_url": profile_url, "intro": None}
+    title = re.search(r"<h2>(.*?)</h2>", driver.html)
+    return {
+        "filename": profile_url.rsplit("/", 1)[-1],
+        "profile_url": profile_url,
+        "intro": {"name": name.group(1)},
+        "about": {"about_description": ""},
+        "experience": [{"job_title": title.group(1) if title else "CTO"}],
+        "skills": [],
+    }
+
+
+class TestStreamingPipeline:
+    """流式抓取管道测试"""
+    
+    def test_pipeline_dedupe_filter_and_sink(self, temp_dir):
+        """测试去重、过滤与写入，并统计各阶段数量"""
+        from linkedin_cat.core.pipeline import Pipeline, dedupe_stage, store_filter_stage
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        source = [
+            {"name": "A", "linkedin_url": "https://www.linkedin.com/in/user-a/?trk=x"},
+            "https://www.linkedin.com/in/User-A",
+            {"name": "B", "linkedin_url": "https://www.linkedin.com/in/user-b"},
+            {"name": "C", "linkedin_url": "https://www.linkedin.com/in/user-c"},
+        ]
+        sunk = []
+        with ProfileStore(os.path.join(temp_dir, "profiles.db")) as store:
+            store.save({"filename": "user-b", "profile_url": "https://www.linkedin.com/in/user-b", "intro": {}})
+            stats = Pipeline(source, [dedupe_stage(), store_filter_stage(store)], sink=sunk.append, maxsize=2).run()
+        
+        assert [item["url"] for item in sunk] == ["https://www.linkedin.com/in/user-a",
+                                                  "https://www.linkedin.com/in/user-c"]
+        assert sunk[0]["name"] == "A"
+        assert stats["source"] == 4 and stats["sink"] == 2
+        assert stats["stages"]["dedupe"]["dropped"] == 1
+        assert stats["stages"]["store_filter"]["dropped"] == 1
+    
+    def test_pipeline_backpressure(self):
+        """测试有界队列限制上游领先的数量"""
+        import time
+        from linkedin_cat.core.pipeline import Pipeline
+        
+        produced = []
+        
+        def source():
+            for i in range(1000):
+                produced.append(i)
+                yield f"https://www.linkedin.com/in/user-{i}"
+        
+        items = iter(Pipeline(source(), [lambda item: item], maxsize=2))
+        next(items)
+        time.sleep(0.3)
+        # 2 queues of 2 items, plus one item held by each thread
+        assert len(produced) <= 8
+        items.close()
+    
+    def test_pipeline_stage_errors_and_checkpoint(self, temp_dir):
+        """测试阶段异常不中断管道，检查点让中断的运行可以续跑"""
+        from linkedin_cat.core.pipeline import Pipeline, Checkpoint, Stage
+        
+        urls = [f"https://www.linkedin.com/in/user-{i}" for i in range(6)]
+        path = os.path.join(temp_dir, "checkpoint.json")
+        
+        def flaky(item):
+            if item.endswith("user-3"):
+                raise RuntimeError("boom")
+            return item
+        
+        stats = Pipeline(urls, [Stage("flaky", flaky, workers=2)], sink=lambda item: None,
+                         checkpoint=Checkpoint(path)).run()
+        assert stats["sink"] == 5
+        assert stats["stages"]["flaky"]["errors"] == 1
+        
+        # Resumed run: only the failed item goes through again
+        seen = []
+        stats = Pipeline(urls, [lambda item: item], sink=seen.append, checkpoint=Checkpoint(path)).run()
+        assert seen == ["https://www.linkedin.com/in/user-3"]
+        assert stats["skipped"] == 5
+    
+    def test_pipeline_checkpoint_skips_items_without_url(self, temp_dir):
+        """测试有检查点时没有 URL 的搜索结果被跳过，不中断运行"""
+        from linkedin_cat.core.pipeline import Pipeline, Checkpoint
+        
+        source = [{"name": "Hidden", "linkedin_url": None},
+                  {"name": "A", "linkedin_url": "https://www.linkedin.com/in/user-a"}]
+        seen = []
+        stats = Pipeline(source, sink=seen.append,
+                         checkpoint=Checkpoint(os.path.join(temp_dir, "checkpoint.json"))).run()
+        
+        assert [item["name"] for item in seen] == ["A"]
+        assert stats["source"] == 2 and stats["skipped"] == 1
+    
+    def test_pipeline_search_and_scrape(self, temp_dir):
+        """测试搜索结果流入抓取阶段与存储"""
+        from linkedin_cat.core.pipeline import (
+            Pipeline, search_source, dedupe_stage, scrape_stage, store_sink
+        )
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        searcher = MagicMock()
+        searcher.iter_search.return_value = iter([
+            [{"linkedin_url": "https://www.linkedin.com/in/user-a"}],
+            [{"linkedin_url": "https://www.linkedin.com/in/user-a"},
+             {"linkedin_url": "https://www.linkedin.com/in/user-b"}],
+        ])
+        scraper = MagicMock()
+        scraper.scrape_profile.side_effect = lambda url, **kwargs: (
+            {"filename": url.rsplit("/", 1)[-1], "profile_url": url, "intro": {"name": url}}
+            if url.endswith("user-a") else None
+        )
+        
+        with ProfileStore(os.path.join(temp_dir, "profiles.db")) as store:
+            stats = Pipeline(
+                search_source(searcher, ["engineer"], max_pages=2),
+                [dedupe_stage(), scrape_stage(scraper)],
+                sink=store_sink(store),
+            ).run()
+            assert store.has("https://www.linkedin.com/in/user-a")
+            assert len(store) == 1
+        
+        searcher.iter_search.assert_called_once_with("engineer", filters={}, max_pages=2)
+        assert stats["stages"]["scrape"]["dropped"] == 1
+        assert stats["sink"] == 1
+
+
+class TestProfileIndex:
+    """档案全文索引测试"""
+    
+    JANE = {
+        "filename": "jane-doe",
+        "profile_url": "https://www.linkedin.com/in/jane-doe",
+        "intro": {"name": "Jane Doe", "works_at": "Staff Engineer at Acme", "location": "Berlin"},
+        "about": {"about_description": "Distributed systems"},
+        "experience": [{"job_title": "Staff Engineer", "company_name": "Acme Corp"},
+                       {"job_title": "Intern", "company_name": "Globex"}],
+        "education": [{"university": "TU München", "degree_field": "Informatik"}],
+        "skills": [{"title": "Python"}, {"title": "C++"}],
+    }
+    JOHN = {
+        "filename": "john-roe",
+        "profile_url": "https://www.linkedin.com/in/john-roe",
+        "intro": {"name": "John Roe", "works_at": "Recruiter", "location": "Paris"},
+        "experience": [{"job_title": "Recruiter", "company_name": "Acme Corp"}],
+    }
+    
+    def test_search_by_column(self, temp_dir):
+        """测试按字段过滤、变音符号与特殊字符"""
+        from linkedin_cat.core.profile_index import ProfileIndex
+        
+        with ProfileIndex(os.path.join(temp_dir, "index.db")) as index:
+            assert index.index_many([self.JANE, self.JOHN]) == 2
+            
+            urls = lambda results: [r["profile_url"] for r in results]
+            assert urls(index.search(company="acme")) != []
+            assert urls(index.search(company="acme", title="engineer")) == [self.JANE["profile_url"]]
+            assert urls(index.search(company="globex", title="recruiter")) == []
+            assert urls(index.search(school="munchen")) == [self.JANE["profile_url"]]
+            assert urls(index.search("c++ systems")) == [self.JANE["profile_url"]]
+            assert index.search(location="paris")[0]["name"] == "John Roe"
+            assert urls(index.search(match='companies : "acme" NOT titles : "recruiter"')) == [self.JANE["profile_url"]]
+            
+            with pytest.raises(ValueError):
+                index.search()
+            with pytest.raises(ValueError):
+                index.search(hobby="chess")
+    
+    def test_reindex_only_changed(self, temp_dir):
+        """测试内容未变化时不重写，变化后旧内容不再匹配"""
+        from linkedin_cat.core.profile_index import ProfileIndex
+        
+        with ProfileIndex(os.path.join(temp_dir, "index.db")) as index:
+            assert index.index(self.JANE) is True
+            assert index.index(dict(self.JANE)) is False
+            
+            moved = dict(self.JANE, experience=[{"job_title": "CTO", "company_name": "Initech"}])
+            assert index.index(moved) is True
+            assert len(index) == 1
+            assert index.search(company="acme") == []
+            assert index.search(company="initech")[0]["profile_url"] == self.JANE["profile_url"]
+            
+            index.remove(self.JANE["profile_url"])
+            assert len(index) == 0 and index.search(company="initech") == []
+    
+    def test_index_updated_on_save(self, temp_dir):
+        """测试保存档案时同步更新索引，部分抓取保留其他部分"""
+        from linkedin_cat.core.search import LinkedinSearch
+        from linkedin_cat.core.profile_index import ProfileIndex
+        from linkedin_cat.core.profile_store import ProfileStore
+        
+        searcher = LinkedinSearch.__new__(LinkedinSearch)
+        searcher.profile_index = ProfileIndex(os.path.join(temp_dir, "index.db"))
+        with ProfileStore(os.path.join(temp_dir, "profiles.db")) as store:
+            searcher._save_profile(self.JANE, temp_dir, store)
+            partial = {"filename": "jane-doe", "profile_url": self.JANE["profile_url"],
+                       "captured_sections": ["intro"], "intro": dict(self.JANE["intro"], location="Munich")}
+            searcher._save_profile(partial, temp_dir, store)
+        
+        searcher._save_profile(self.JOHN, temp_dir, None)
+        assert os.path.exists(os.path.join(temp_dir, "john-roe.json"))
+        
+        index = searcher.profile_index
+        assert index.search(location="munich", skill="python")[0]["profile_url"] == self.JANE["profile_url"]
+        assert index.search(title="recruiter")[0]["profile_url"] == self.JOHN["profile_url"]
+        index.close()
+
+
+class TestCompanyPostsViews:
+    """公司动态浏览量批量获取测试"""
+    
+    def _response(self, views):
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"VIEWS": views}
+        return response
+    
+    def test_views_deduped_and_cached(self):
+        """测试重复的动态只请求一次，缓存过期前不再请求"""
+        from linkedin_cat.core.api import Company
+        
+        company = Company({}, {})
+        with patch("linkedin_cat.core.api.requests.post") as mock_post:
+            mock_post.side_effect = lambda url, **kwargs: self._response(int(url.rsplit("=", 1)[-1]) * 10)
+            
+            assert company.get_posts_views(["1", "2", "1"]) == {"1": 10, "2": 20}
+            assert mock_post.call_count == 2
+            assert company.get_posts_views(["1", "3"]) == {"1": 10, "3": 30}
+            assert mock_post.call_count == 3
+            
+            company.views_ttl = 0
+            company.get_posts_views(["1"])
+            assert mock_post.call_count == 4
+    
+    def test_posts_feed_engagement(self):
+        """测试浏览量为 0 时互动率为 0，不再每条动态固定等待"""
+        import time
+        from linkedin_cat.core.api import Company
+        
+        feed = [
+            {"ACTIVITY_ID": "1", "COMMENTS": 1, "LIKES": 9},
+            {"ACTIVITY_ID": "2", "COMMENTS": 0, "LIKES": 3},
+        ]
+        company = Company({}, {})
+        
+        def post(url, **kwargs):
+            if "getPostsViews" in url:
+                return self._response(100 if url.endswith("=1") else None)
+            response = MagicMock(status_code=200)
+            response.json.return_value = feed if "start=0" in url else []
+            return response
+        
+        with patch("linkedin_cat.core.api.requests.post", side_effect=post):
+            started = time.monotonic()
+            df = company.get_posts_feed("https://www.linkedin.com/company/acme/", count=2, sleep=False)
+        
+        assert time.monotonic() - started < 2
+        assert df["VIEWS"].tolist() == [100, 0]
+        assert str(df["VIEWS"].dtype) == "int64"
+        assert df["ENGAGEMENT_SCORE"].tolist() == [0.1, 0.0]
+    
+    def test_rate_budget(self):
+        """测试令牌桶限制调用速率"""
+        import time
+        from linkedin_cat.core.rate_budget import RateBudget
+        
+        budget = RateBudget(rate=20, burst=2)
+        assert budget.try_acquire() and budget.try_acquire()
+        assert not budget.try_acquire()
+        
+        started = time.monotonic()
+        budget.acquire()
+        assert time.monotonic() - started >= 0.03
+
+
+class TestUrnCache:
+    """档案 URN 缓存测试"""
+    
+    def test_bidirectional_persistent(self, temp_dir):
+        """测试双向查询、大小写无关与持久化"""
+        from linkedin_cat.core.urn_cache import UrnCache
+        
+        db_path = os.path.join(temp_dir, "urns.db")
+        with UrnCache(db_path, lru_size=1) as cache:
+            cache.put("Jane-Doe", "ACoAAA1")
+            cache.put("john-roe", "ACoAAA2")
+            assert cache.get_urn("jane-doe") == "ACoAAA1"
+            assert cache.get_vanity("ACoAAA2") == "john-roe"
+        
+        with UrnCache(db_path) as cache:
+            assert cache.get_urn("JANE-DOE") == "ACoAAA1"
+            assert cache.get_vanity("ACoAAA1") == "jane-doe"
+            assert cache.get_urn("nobody") is None
+    
+    def test_resolve_many_dedupes_in_flight(self):
+        """测试并发解析时同一档案只请求一次，错误不缓存"""
+        import threading
+        import time
+        from linkedin_cat.core.urn_cache import UrnCache
+        
+        calls = []
+        lock = threading.Lock()
+        
+        def fetch(vanity):
+            with lock:
+                calls.append(vanity)
+            time.sleep(0.05)
+            return None if vanity == "ghost" else f"urn-{vanity}"
+        
+        cache = UrnCache(None)
+        threads = [threading.Thread(target=cache.resolve, args=("jane", fetch)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert calls == ["jane"]
+        
+        urns = cache.resolve_many(["jane", "john", "john", "ghost"], fetch, workers=4)
+        assert urns == {"jane": "urn-jane", "john": "urn-john", "ghost": None}
+        assert sorted(calls) == ["ghost", "jane", "john"]
+        cache.resolve("ghost", fetch)
+        assert calls.count("ghost") == 2
+    
+    def test_get_profile_urn_cached(self, temp_dir):
+        """测试 get_profile_urn 只请求一次，URN 直接返回"""
+        from linkedin_cat.core.api import LinkedIn
+        
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"data": {"entityUrn": "urn:li:fs_profile:ACoAAA1"}}
+        linkedin = LinkedIn().connect(li_at="x", jessionid="y", urn_cache=os.path.join(temp_dir, "urns.db"))
+        
+        with patch("linkedin_cat.core.api.requests.get", return_value=response) as mock_get:
+            assert linkedin.profile.get_profile_urn("https://www.linkedin.com/in/jane-doe/") == "ACoAAA1"
+            assert linkedin.message.get_profile_urn("https://www.linkedin.com/in/Jane-Doe") == "ACoAAA1"
+            assert linkedin.get_profile_urns(["https://www.linkedin.com/in/jane-doe",
+                                              "https://www.linkedin.com/in/ACoAAA9"]) == {
+                "https://www.linkedin.com/in/jane-doe": "ACoAAA1",
+                "https://www.linkedin.com/in/ACoAAA9": "ACoAAA9",
+            }
+            assert mock_get.call_count == 1
+        assert linkedin.urn_cache.get_vanity("ACoAAA1") == "jane-doe"
+    
+    def test_message_send_resolves_recipients_in_batch(self, temp_dir):
+        """测试发送消息时批量解析收件人，解析失败时返回错误"""
+        import requests
+        from linkedin_cat.core.api import LinkedIn
+        
+        linkedin = LinkedIn().connect(li_at="x", jessionid="y", urn_cache=os.path.join(temp_dir, "urns.db"))
+        urls = ["https://www.linkedin.com/in/jane-doe", "https://www.linkedin.com/in/john-doe"]
+        error = requests.HTTPError("404")
+        
+        with patch.object(linkedin.message, "get_profile_urns",
+                          return_value={urls[0]: "ACoAAA1", urls[1]: "ACoAAA2"}) as resolve, \
+             patch("linkedin_cat.core.api.requests.post", return_value=MagicMock(status_code=201)) as post, \
+             patch("linkedin_cat.core.api.time.sleep"):
+            linkedin.message.send("Hi", recipients_url=urls)
+            resolve.assert_called_once_with(urls)
+            assert post.call_args[1]["json"]["conversationCreate"]["recipients"] == ["ACoAAA1", "ACoAAA2"]
+            
+            resolve.return_value = {urls[0]: "ACoAAA1", urls[1]: error}
+            assert linkedin.message.send("Hi", recipients_url=urls) == [error]
+            assert post.call_count == 1
+
+
+class TestResponseCache:
+    """只读接口响应缓存测试"""
+    
+    @pytest.mark.parametrize("backend_name", ["sqlite", "diskcache"])
+    def test_hit_miss_bypass(self, temp_dir, backend_name):
+        """测试命中、未命中、绕过与按接口统计"""
+        from linkedin_cat.core.response_cache import ResponseCache, SqliteBackend, DiskcacheBackend
+        
+        backend = (SqliteBackend(os.path.join(temp_dir, "responses.db")) if backend_name == "sqlite"
+                   else DiskcacheBackend(os.path.join(temp_dir, "responses")))
+        fetch = MagicMock(side_effect=[{"n": 1}, {"n": 2}])
+        with ResponseCache(backend) as cache:
+            assert cache.fetch("profile.identity", {"profile_id": "jane "}, fetch) == {"n": 1}
+            assert cache.fetch("profile.identity", {"profile_id": "jane", "x": None}, fetch) == {"n": 1}
+            assert cache.fetch("profile.identity", {"profile_id": "jane"}, fetch, bypass=True) == {"n": 2}
+            assert cache.fetch("profile.identity", {"profile_id": "jane"}, fetch) == {"n": 2}
+            
+            stats = cache.stats()
+            assert stats["profile.identity"]["hits"] == 2
+            assert stats["total"]["misses"] == 1 and stats["total"]["bypass"] == 1
+            
+            cache.clear("profile.identity")
+            fetch.side_effect = [{"n": 3}]
+            assert cache.fetch("profile.identity", {"profile_id": "jane"}, fetch) == {"n": 3}
+    
+    def test_stale_while_revalidate(self, temp_dir):
+        """测试过期后先返回旧响应并在后台刷新，超过宽限期重新请求"""
+        import time
+        from linkedin_cat.core.response_cache import ResponseCache
+        
+        cache = ResponseCache(os.path.join(temp_dir, "responses.db"), ttls={"post.stats": 0.05}, stale_ttl=10)
+        fetch = MagicMock(side_effect=[{"n": 1}, {"n": 2}])
+        cache.fetch("post.stats", {"activity_id": "1"}, fetch)
+        time.sleep(0.1)
+        
+        assert cache.fetch("post.stats", {"activity_id": "1"}, fetch) == {"n": 1}
+        for _ in range(50):
+            if cache.stats()["post.stats"]["revalidated"]:
+                break
+            time.sleep(0.02)
+        assert cache.fetch("post.stats", {"activity_id": "1"}, fetch) == {"n": 2}
+        assert fetch.call_count == 2
+        
+        cache.stale_ttl = 0
+        time.sleep(0.1)
+        fetch.side_effect = [{"n": 3}]
+        assert cache.fetch("post.stats", {"activity_id": "1"}, fetch) == {"n": 3}
+        assert cache.stats()["post.stats"]["misses"] == 2
+        cache.close()
+    
+    def test_get_identity_cached(self, temp_dir):
+        """测试 get_identity 重复调用只请求一次且不再等待"""
+        from linkedin_cat.core.api import LinkedIn
+        
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"data": {"entityUrn": "urn:li:fs_profile:ACoAAA1",
+                                               "publicIdentifier": "jane-doe", "firstName": "Jane"}}
+        linkedin = LinkedIn().connect(li_at="x", jessionid="y",
+                                      response_cache=os.path.join(temp_dir, "responses.db"))
+        
+        with patch("linkedin_cat.core.api.requests.get", return_value=response) as mock_get:
+            first = linkedin.profile.get_identity("https://www.linkedin.com/in/jane-doe/", sleep=False)
+            second = linkedin.profile.get_identity("https://www.linkedin.com/in/Jane-Doe")
+            linkedin.profile.get_identity("https://www.linkedin.com/in/jane-doe", sleep=False, bypass_cache=True)
+        
+        assert mock_get.call_count == 2
+        assert first.equals(second)
+        assert second.loc[0, "FIRSTNAME"] == "Jane"
+        assert linkedin.response_cache.stats()["profile.identity"]["hits"] == 1
+    
+    def test_viewer_dependent_responses_cached_per_account(self, temp_dir):
+        """测试与查看者相关的响应按账号缓存，两个账号共用缓存文件也互不串用"""
+        from linkedin_cat.core.api import LinkedIn
+        
+        def get(url, cookies=None, **kwargs):
+            response = MagicMock(status_code=200)
+            distance = "DISTANCE_1" if cookies["li_at"] == "account-a" else "DISTANCE_2"
+            response.json.return_value = {"data": {"entityUrn": "urn:li:fs_profileNetworkInfo:ACoAAA1",
+                                                   "distance": {"value": distance},
+                                                   "publicIdentifier": "jane-doe", "firstName": "Jane"}}
+            return response
+        
+        db_path = os.path.join(temp_dir, "responses.db")
+        first = LinkedIn().connect(li_at="account-a", jessionid="y", response_cache=db_path)
+        second = LinkedIn().connect(li_at="account-b", jessionid="y", response_cache=db_path)
+        url = "https://www.linkedin.com/in/jane-doe/"
+        
+        with patch("linkedin_cat.core.api.requests.get", side_effect=get) as mock_get:
+            assert first.profile.get_network(url, sleep=False).loc[0, "DISTANCE"] == "DISTANCE_1"
+            assert second.profile.get_network(url, sleep=False).loc[0, "DISTANCE"] == "DISTANCE_2"
+            assert first.profile.get_network(url, sleep=False).loc[0, "DISTANCE"] == "DISTANCE_1"
+            assert mock_get.call_count == 2
+            
+            # Identity does not depend on the viewer, the cached response is shared
+            first.profile.get_identity(url, sleep=False)
+            second.profile.get_identity(url, sleep=False)
+            assert mock_get.call_count == 3
+        
+        # Only a hash of the cookie is stored
+        for name in os.listdir(temp_dir):
+            with open(os.path.join(temp_dir, name), "rb") as f:
+                assert b"account-a" not in f.read()
+
+
+class TestBulkProfiles:
+    """批量获取档案信息测试"""
+    
+    def test_get_identities(self):
+        """测试批量获取保持输入顺序、类型统一，失败写入 ERROR 列"""
+        import requests
+        from linkedin_cat.core.api import LinkedIn
+        
+        def get(url, **kwargs):
+            response = MagicMock(status_code=200)
+            vanity = url.rsplit("/", 1)[-1]
+            if vanity == "ghost":
+                response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
+            response.json.return_value = {"data": {"entityUrn": f"urn:li:fs_profile:ACo{vanity}",
+                                                   "publicIdentifier": vanity, "firstName": vanity.title()}}
+            return response
+        
+        linkedin = LinkedIn().connect(li_at="x", jessionid="y")
+        urls = [f"https://www.linkedin.com/in/{name}" for name in ("jane", "ghost", "john")]
+        with patch("linkedin_cat.core.api.requests.get", side_effect=get) as mock_get:
+            df = linkedin.profile.get_identities(urls, workers=3)
+        
+        assert mock_get.call_count == 3
+        assert df["INPUT_URL"].tolist() == urls
+        assert df.loc[0, "FIRSTNAME"] == "Jane" and df.loc[2, "PROFILE_ID"] == "ACojohn"
+        assert df["ERROR"].isna().tolist() == [True, False, True]
+        assert "404" in df.loc[1, "ERROR"]
+        assert str(df["FIRSTNAME"].dtype) == "string"
+    
+    def test_get_networks_typed(self):
+        """测试网络信息的布尔与整数列"""
+        from linkedin_cat.core.api import LinkedIn
+        
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"data": {"entityUrn": "urn:li:fs_profileNetworkInfo:ACo1",
+                                               "distance": {"value": "DISTANCE_2"},
+                                               "following": True, "followersCount": 42}}
+        linkedin = LinkedIn().connect(li_at="x", jessionid="y")
+        with patch("linkedin_cat.core.api.requests.get", return_value=response):
+            df = linkedin.profile.get_networks(["https://www.linkedin.com/in/jane"])
+        
+        assert str(df["FOLLOWERS_COUNT"].dtype) == "Int64"
+        assert str(df["FOLLOWING"].dtype) == "boolean"
+        assert df.loc[0, "FOLLOWERS_COUNT"] == 42
+        assert df["FOLLOWABLE"].isna().all()
+
+
+class TestSingleFlight:
+    """并发相同请求合并测试"""
+    
+    def test_threads_share_one_call(self):
+        """测试多个线程只执行一次并共享结果与异常"""
+        import threading
+        import time
+        from linkedin_cat.core.single_flight import SingleFlight
+        
+        flight = SingleFlight()
+        calls = []
+        
+        def slow(value):
+            def fn():
+                calls.append(value)
+                time.sleep(0.1)
+                if value == "boom":
+                    raise RuntimeError("boom")
+                return {"value": value}
+            return fn
+        
+        results, errors = [], []
+        
+        def call(value):
+            try:
+                results.append(flight.do(value, slow(value)))
+            except RuntimeError as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=call, args=(value,)) for value in ["a"] * 4 + ["boom"] * 2]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert sorted(calls) == ["a", "boom"]
+        assert results == [{"value": "a"}] * 4 and len(errors) == 2
+        assert flight.stats() == {"calls": 6, "executed": 2, "coalesced": 4, "in_flight": 0}
+        
+        # Not cached once finished
+        flight.do("a", slow("a"))
+        assert calls.count("a") == 2
+    
+    def test_asyncio_and_threads(self):
+        """测试 asyncio 任务与线程共享同一次调用"""
+        import asyncio
+        import threading
+        import time
+        from linkedin_cat.core.single_flight import SingleFlight
+        
+        flight = SingleFlight()
+        calls = []
+        
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return 42
+        
+        async def fetch_async():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 7
+        
+        async def main():
+            thread_result = []
+            thread = threading.Thread(target=lambda: thread_result.append(flight.do("k", fetch)))
+            thread.start()
+            await asyncio.sleep(0.02)
+            results = await asyncio.gather(*[flight.do_async("k", fetch) for _ in range(3)])
+            thread.join()
+            other = await asyncio.gather(*[flight.do_async("c", fetch_async) for _ in range(3)])
+            return thread_result + results, other
+        
+        shared, other = asyncio.run(main())
+        assert shared == [42] * 4 and other == [7] * 3
+        assert len(calls) == 2
+        assert flight.stats()["coalesced"] == 5
+    
+    def test_api_requests_coalesced(self):
+        """测试 core.api 中并发的相同请求只发送一次"""
+        import asyncio
+        import time
+        from linkedin_cat.core.api import LinkedIn, SINGLE_FLIGHT
+        
+        def get(url, **kwargs):
+            time.sleep(0.1)
+            response = MagicMock(status_code=200)
+            response.json.return_value = {"data": {"entityUrn": "urn:li:fs_profileNetworkInfo:ACo1",
+                                                   "followersCount": 3}}
+            return response
+        
+        linkedin = LinkedIn().connect(li_at="x", jessionid="y")
+        before = SINGLE_FLIGHT.stats()["coalesced"]
+        
+        async def main():
+            return await asyncio.gather(*[
+                linkedin.profile.run_async("get_network", "https://www.linkedin.com/in/jane", sleep=False)
+                for _ in range(4)
+            ])
+        
+        with patch("linkedin_cat.core.api.requests.get", side_effect=get) as mock_get:
+            frames = asyncio.run(main())
+        
+        assert mock_get.call_count == 1
+        assert all(df.loc[0, "FOLLOWERS_COUNT"] == 3 for df in frames)
+        assert LinkedIn.single_flight_stats()["coalesced"] - before == 3
+
+
+class TestResponseSchema:
+    """声明式响应解析测试"""
+    
+    def test_compile_path(self):
+        """测试路径取值，缺失的键或越界的下标返回 None"""
+        from linkedin_cat.core.response_schema import compile_path
+        
+        obj = {"included": [{"picture": {"artifacts": [{"url": "a"}, {"url": "b"}]}}], "data": None}
+        assert compile_path("included.0.picture.artifacts.-1.url")(obj) == "b"
+        assert compile_path("included.1.picture")(obj) is None
+        assert compile_path("data.firstName")(obj) is None
+        assert compile_path("missing")(obj) is None
+        assert compile_path("missing")([]) is None
+    
+    def test_extract_and_frame(self):
+        """测试提取、默认值、类型转换，以及空结果的稳定列"""
+        from linkedin_cat.core.response_schema import ResponseSchema, Field
+        
+        schema = ResponseSchema("test", [
+            Field("NAME", "data.name"),
+            Field("DISTANCE", "data.distance.value", "category"),
+            Field("COUNT", "data.count", "Int64"),
+            Field("FOLLOWING", "data.following", "boolean"),
+            Field("TAGS", "data.tags", default="", transform=", ".join),
+        ])
+        rows = schema.extract_many([
+            {"data": {"name": "Jane", "distance": {"value": "DISTANCE_1"}, "count": "12", "tags": ["a", "b"]}},
+            {"data": {"name": "John", "distance": {"value": "DISTANCE_1"}, "following": True}},
+        ])
+        assert rows[1] == {"NAME": "John", "DISTANCE": "DISTANCE_1", "COUNT": None, "FOLLOWING": True, "TAGS": ""}
+        
+        df = schema.frame(rows + [{"NAME": "Extra", "OTHER": 1}])
+        assert df.columns.tolist() == ["NAME", "DISTANCE", "COUNT", "FOLLOWING", "TAGS", "OTHER"]
+        assert {column: str(dtype) for column, dtype in df.dtypes.items()} == {
+            "NAME": "string", "DISTANCE": "category", "COUNT": "Int64",
+            "FOLLOWING": "boolean", "TAGS": "string", "OTHER": "float64",
+        }
+        assert df["COUNT"].tolist()[0] == 12 and df.loc[0, "TAGS"] == "a, b" and df.loc[2, "TAGS"] == ""
+        
+        empty = schema.frame([])
+        assert empty.columns.tolist() == schema.columns and len(empty) == 0
+        assert str(empty["DISTANCE"].dtype) == "category"
+    
+    def test_object_lists_and_non_integral_counts(self):
+        """测试列表列保持原对象, Int64 列的非整数值变为缺失值"""
+        import pandas as pd
+        from linkedin_cat.core.api import POST_STATS_SCHEMA
+        
+        df = POST_STATS_SCHEMA.frame([
+            {"TAGS": ["#ai", "#data"], "LIKES": 2.0, "VIEWS": 1.5, "COMMENTS": "3"},
+            {"TAGS": None, "LIKES": "x"},
+        ])
+        
+        assert df.loc[0, "TAGS"] == ["#ai", "#data"] and df["TAGS"].dtype == object
+        assert df.loc[0, "LIKES"] == 2 and df.loc[0, "COMMENTS"] == 3
+        assert pd.isna(df.loc[0, "VIEWS"]) and pd.isna(df.loc[1, "LIKES"])
+    
+    def test_identity_pictures(self):
+        """测试 get_identity 通过 schema 解析头像与背景图"""
+        from linkedin_cat.core.api import LinkedIn
+        
+        image = {"rootUrl": "https://media/", "artifacts": [{"fileIdentifyingUrlPathSegment": "100"},
+                                                            {"fileIdentifyingUrlPathSegment": "800"}]}
+        response = MagicMock(status_code=200)
+        response.json.return_value = {
+            "data": {"entityUrn": "urn:li:fs_profile:ACo1", "publicIdentifier": "jane",
+                     "birthDateOn": {"day": 2, "month": 3}, "geoCountryName": "France"},
+            "included": [{"picture": image, "backgroundImage": {"rootUrl": "https://media/", "artifacts": []}}],
+        }
+        linkedin = LinkedIn().connect(li_at="x", jessionid="y")
+        with patch("linkedin_cat.core.api.requests.get", return_value=response):
+            df = linkedin.profile.get_identity("https://www.linkedin.com/in/jane", sleep=False)
+        
+        row = df.iloc[0]
+        assert row["PROFILE_URL"] == "https://www.linkedin.com/in/ACo1"
+        assert row["PROFILE_PICTURE"] == "https://media/800"
+        assert df["BACKGROUND_PICTURE"].isna().all()
+        assert row["BIRTHDATE"] == "2/3/Year Unknown"
+        assert str(df["COUNTRY"].dtype) == "category"
+    
+    def test_comments_pages_typed(self):
+        """测试分页评论合并为一个有类型的 DataFrame"""
+        from linkedin_cat.core.api import Post
+        
+        pages = [
+            [{"PROFILE_ID": str(i), "COMMENTS": i, "LIKES": 1, "PROFILE_TYPE": "PROFILE",
+              "POST_URL": "https://www.linkedin.com/feed/update/urn:li:activity:1"} for i in range(2)],
+            [{"PROFILE_ID": "2", "COMMENTS": 0, "LIKES": None, "PROFILE_TYPE": "COMPANY",
+              "POST_URL": "https://www.linkedin.com/feed/update/urn:li:activity:1"}],
+            [],
+        ]
+        responses = []
+        for page in pages:
+            response = MagicMock(status_code=200)
+            response.json.return_value = page
+            responses.append(response)
+        
+        with patch("linkedin_cat.core.api.requests.post", side_effect=responses):
+            df = Post({}, {}).get_comments(activity_id="1", count=2, sleep=False)
+        
+        assert df["PROFILE_ID"].tolist() == ["0", "1", "2"]
+        assert str(df["LIKES"].dtype) == "Int64" and df["LIKES"].isna().tolist() == [False, False, True]
+        assert str(df["PROFILE_TYPE"].dtype) == "category" and str(df["POST_URL"].dtype) == "category"
+
+
+class TestColumnarOutput:
+    """Arrow / Parquet 列式输出测试"""
+    
+    def _comments(self, pages):
+        from linkedin_cat.core.api import Post
+        
+        responses = []
+        for page in pages + [[]]:
+            response = MagicMock(status_code=200)
+            response.json.return_value = page
+            responses.append(response)
+        return patch("linkedin_cat.core.api.requests.post", side_effect=responses), Post({}, {})
+    
+    def test_arrow_schema_stable(self):
+        """测试 Arrow 输出的 schema 与数据无关，重复字符串使用字典编码"""
+        pa = pytest.importorskip("pyarrow")
+        
+        page = [{"PROFILE_ID": "1", "LIKES": 2, "PROFILE_TYPE": "PROFILE", "DATE_EXTRACT": "2024-05-01"},
+                {"PROFILE_ID": "2", "LIKES": None, "PROFILE_TYPE": "PROFILE", "DATE_EXTRACT": "2024-05-01"}]
+        mock_post, post = self._comments([page])
+        with mock_post:
+            table = post.get_comments(activity_id="1", sleep=False, to="arrow")
+        mock_post, post = self._comments([])
+        with mock_post:
+            empty = post.get_comments(activity_id="1", sleep=False, to="arrow")
+        
+        assert isinstance(table, pa.Table) and table.num_rows == 2 and empty.num_rows == 0
+        assert table.schema.equals(empty.schema)
+        assert table.schema.metadata[b"endpoint"] == b"post.comments"
+        assert table.schema.field("LIKES").type == pa.int64()
+        assert pa.types.is_dictionary(table.schema.field("PROFILE_TYPE").type)
+        assert table.column("LIKES").to_pylist() == [2, None]
+    
+    def test_parquet_and_dataset(self, temp_dir):
+        """测试写入 Parquet 文件与按列分区的数据集"""
+        pytest.importorskip("pyarrow")
+        import pyarrow.compute as pc
+        from linkedin_cat.core.columnar import write_dataset, read_dataset
+        
+        page = [{"PROFILE_ID": str(i), "LIKES": i, "PROFILE_TYPE": "PROFILE",
+                 "DATE_EXTRACT": f"2024-05-0{i % 2 + 1}"} for i in range(4)]
+        mock_post, post = self._comments([page])
+        path = os.path.join(temp_dir, "comments.parquet")
+        with mock_post:
+            assert post.get_comments(activity_id="1", sleep=False, to="parquet", path=path) == path
+        
+        table = read_dataset(path)
+        assert table.column("PROFILE_ID").to_pylist() == ["0", "1", "2", "3"]
+        
+        folder = os.path.join(temp_dir, "comments")
+        write_dataset(table, folder, partition_by="DATE_EXTRACT")
+        assert sorted(os.listdir(folder)) == ["DATE_EXTRACT=2024-05-01", "DATE_EXTRACT=2024-05-02"]
+        day = read_dataset(folder, columns=["PROFILE_ID"], filter=pc.field("DATE_EXTRACT") == "2024-05-02")
+        assert sorted(day.column("PROFILE_ID").to_pylist()) == ["1", "3"]
+        
+        # Writing a partition again replaces it instead of duplicating rows
+        write_dataset(table, folder, partition_by="DATE_EXTRACT")
+        assert read_dataset(folder).num_rows == 4
+    
+    def test_invalid_output(self):
+        """测试未知输出格式与缺少路径时报错"""
+        import pandas as pd
+        from linkedin_cat.core.api import LinkedIn
+        
+        with pytest.raises(ValueError):
+            LinkedIn.export(pd.DataFrame(), to="csv")
+        with pytest.raises(ValueError):
+            LinkedIn.export(pd.DataFrame(), to="parquet")
+
+
+class TestFixtureServer:
+    """本地模拟 LINKEDIN_API / Voyager 服务测试"""
+    
+    def test_pages_and_profiles(self):
+        """测试通过 base_url 分页拉取与 Voyager 档案解析"""
+        from linkedin_cat.core.api import LinkedIn
+        from linkedin_cat.core.fixture_server import FixtureServer
+        
+        with FixtureServer(total=250, page_size=100) as server:
+            linkedin = LinkedIn().connect(li_at="x", jessionid="y", base_url=server.url)
+            comments = linkedin.post.get_comments(activity_id="1", sleep=False)
+            conversations = linkedin.message.get_conversations(limit=60, sleep=False)
+            identity = linkedin.profile.get_identity("https://www.linkedin.com/in/jane-doe", sleep=False)
+            stats = server.stats()
+        
+        assert len(comments) == 250 and comments["PROFILE_ID"].is_unique
+        assert str(comments["LIKES"].dtype) == "Int64"
+        assert len(conversations) == 60 and conversations["CONVERSATION_ID"].is_unique
+        assert identity.loc[0, "FIRSTNAME"] == "Jane"
+        assert linkedin.profile.get_profile_urn("https://www.linkedin.com/in/jane-doe") == identity.loc[0, "PROFILE_ID"]
+        assert stats["routes"]["/post/getComments"] == 4
+        assert stats["rows"] >= 310
+    
+    def test_recorded_fixtures(self):
+        """测试录制的响应替换合成数据，列表按 start/count 分页"""
+        from linkedin_cat.core.api import LinkedIn
+        from linkedin_cat.core.fixture_server import FixtureServer
+        
+        fixtures = {
+            "/company/getInfo": [{"COMPANY_NAME": "Naas", "STAFF_COUNT": 12}],
+            "/post/getLikes": [{"PROFILE_ID": str(i), "REACTION_TYPE": "LIKE"} for i in range(5)],
+        }
+        with FixtureServer(fixtures=fixtures, page_size=2) as server:
+            linkedin = LinkedIn().connect(li_at="x", jessionid="y", base_url=server.url)
+            info = linkedin.company.get_info()
+            likes = linkedin.post.get_likes(activity_id="1", count=2, sleep=False)
+        
+        assert info.loc[0, "COMPANY_NAME"] == "Naas"
+        assert likes["PROFILE_ID"].tolist() == ["0", "1", "2", "3", "4"]
+    
+    def test_errors_and_expired_cookies(self):
+        """测试错误率与 cookie 过期后的 302"""
+        import requests
+        from linkedin_cat.core.api import LinkedIn
+        from linkedin_cat.core.fixture_server import FixtureServer
+        
+        with FixtureServer(error_rate=1.0, error_status=429) as server:
+            linkedin = LinkedIn().connect(li_at="x", jessionid="y", base_url=server.url)
+            with pytest.raises(requests.HTTPError):
+                linkedin.company.get_info(bypass_cache=True)
+            assert server.stats()["errors"] == 1
+        
+        with FixtureServer(expire_after=1) as server:
+            linkedin = LinkedIn().connect(li_at="x", jessionid="y", base_url=server.url)
+            linkedin.company.get_info()
+            with pytest.raises(requests.TooManyRedirects):
+                linkedin.post.get_stats(activity_id="1")
+            # Voyager redirects to the login page instead of answering JSON
+            with pytest.raises(ValueError):
+                linkedin.profile.get_identity("https://www.linkedin.com/in/jane-doe", sleep=False)
+            stats = server.stats()
+            assert stats["redirects"] == 2 and stats["routes"]["/uas/login"] == 1
+            
+            server.renew()
+            assert len(linkedin.post.get_stats(activity_id="1")) == 1
+    
+    def test_latency(self):
+        """测试延迟设置，并发请求的耗时不累加"""
+        import time
+        from linkedin_cat.core.api import LinkedIn
+        from linkedin_cat.core.rate_budget import RateBudget
+        from linkedin_cat.core.fixture_server import FixtureServer
+        
+        urls = [f"https://www.linkedin.com/in/member-{i}" for i in range(4)]
+        with FixtureServer(latency=0.3) as server, \
+                patch("linkedin_cat.core.api.RATE_BUDGET", RateBudget(rate=100, burst=10)):
+            linkedin = LinkedIn().connect(li_at="x", jessionid="y", base_url=server.url)
+            start = time.time()
+            df = linkedin.profile.get_networks(urls, workers=4)
+            elapsed = time.time() - start
+        
+        assert df["ERROR"].isna().all()
+        assert 0.3 <= elapsed < 1.2
@@ -52,7 +52,9 @@ class LinkedInClient:
         button_class: Optional[str] = None,
         max_retries: int = 2,
         retry_delays: tuple = (3, 7, 15),
-        timeout: int = 30
+        timeout: int = 30,
+        user_data_root: Optional[str] = None,
+        profile_max_mb: int = 500
     ):
         """
         初始化 LinkedIn 客户端
@@ -64,6 +66,8 @@ class LinkedInClient:
             max_retries: 最大重试次数
             retry_delays: 重试延迟时间（秒）
             timeout: 操作超时时间
+            user_data_root: 持久化 Chrome 用户目录（可选），复用磁盘缓存
+            profile_max_mb: 持久化目录大小上限（MB）
         """
         self.cookies_path = cookies_path
         self.headless = headless
@@ -71,6 +75,8 @@ class LinkedInClient:
         self.max_retries = max_retries
         self.retry_delays = retry_delays
         self.timeout = timeout
+        self.user_data_root = user_data_root
+        self.profile_max_mb = profile_max_mb
         
         self._bot: Optional[LinkedinMessage] = None
         self._stats = {"sent": 0, "failed": 0, "retried": 0}
@@ -78,10 +84,15 @@ class LinkedInClient:
     def __enter__(self) -> "LinkedInClient":
         """初始化 linkedin_cat 实例"""
         logger.info(f"Initializing LinkedIn client (headless={self.headless})")
+        # 仅在启用持久化目录时传入相关参数
+        extra = {}
+        if self.user_data_root:
+            extra = {"user_data_root": self.user_data_root, "profile_max_mb": self.profile_max_mb}
         self._bot = LinkedinMessage(
             linkedin_cookies_json=self.cookies_path,
             headless=self.headless,
-            button_class=self.button_class
+            button_class=self.button_class,
+            **extra
         )
         return self
     
@@ -276,13 +287,53 @@ class SearchClient:
         """搜索关键词"""
         return self._searcher.search_keywords(keywords, wait=wait)
     
-    def search_profile(self, url: str, save_folder: str = "./linkedin"):
-        """抓取用户档案"""
-        return self._searcher.search_linkedin_profile(url, save_folder=save_folder)
+    def iter_search(self, keywords: str, filters: Optional[Dict[str, Any]] = None, max_pages: int = 10):
+        """逐页搜索，边解析当前页边预加载下一页"""
+        return self._searcher.iter_search(keywords, filters=filters, max_pages=max_pages)
     
-    def search_profile_list(self, url_list: list, save_folder: str = "./linkedin"):
-        """批量抓取用户档案"""
-        return self._searcher.search_linkedin_profile_list(url_list, save_folder=save_folder)
+    def search_profile(
+        self,
+        url: str,
+        save_folder: str = "./linkedin",
+        store=None,
+        sections: Optional[list] = None,
+        ttl_days: Optional[int] = None
+    ):
+        """
+        抓取用户档案
+        
+        Args:
+            url: LinkedIn 个人主页 URL
+            save_folder: JSON 输出目录
+            store: ProfileStore（可选），写入存储而非 JSON 文件
+            sections: 只抓取指定部分，如 ["intro", "experience"]，None 表示全部
+            ttl_days: 配合 store，超过天数的档案重新抓取
+        """
+        return self._searcher.search_linkedin_profile(
+            url, save_folder=save_folder, store=store, ttl_days=ttl_days, sections=sections
+        )
+    
+    def search_profile_list(
+        self,
+        url_list: list,
+        save_folder: str = "./linkedin",
+        store=None,
+        sections: Optional[list] = None,
+        tabs: int = 1,
+        ttl_days: Optional[int] = None
+    ):
+        """批量抓取用户档案，tabs > 1 时在多个标签页中预加载后续档案"""
+        return self._searcher.search_linkedin_profile_list(
+            url_list, save_folder=save_folder, store=store, sections=sections, tabs=tabs, ttl_days=ttl_days
+        )
+    
+    def iter_profiles(self, url_list: list, tabs: int = 3, sections: Optional[list] = None, store=None):
+        """多标签页流水线抓取，按 url_list 顺序返回 (url, profile_data)，不保存"""
+        return self._searcher.iter_profiles_pipelined(url_list, tabs=tabs, sections=sections, store=store)
+    
+    def refresh_profiles(self, store, ttl_days: int = 7, url_list: Optional[list] = None, limit: Optional[int] = None):
+        """重新抓取过期档案，仅重写变化的部分，返回各档案的变化部分"""
+        return self._searcher.refresh_profiles(store, ttl_days=ttl_days, url_list=url_list, limit=limit)
     
     @property
     def searcher(self) -> Optional[LinkedinSearch]: